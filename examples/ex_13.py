@@ -6,7 +6,7 @@ Created on Fri Nov 27 22:25:30 2020
 @author: arslan
 """
 
-from numpy import (linspace, meshgrid, zeros, )
+from numpy import (linspace, meshgrid, )
 from pyit2fls import (T1FS, T1Mamdani, T1FS_plot, gaussian_mf, )
 from mpl_toolkits import mplot3d
 import matplotlib.pyplot as plt
@@ -64,12 +64,12 @@ SYS.add_rule([("x1", LARGE1), ("x2", MEDIUM2)], [("y1", LOW1), ("y2", LOW2)])
 SYS.add_rule([("x1", LARGE1), ("x2", LARGE2)], [("y1", HIGH1), ("y2", HIGH2)])
 
 X1, X2 = meshgrid(domain1, domain2)
-Z1 = zeros(shape=(len(domain1), len(domain2)))
-Z2 = zeros(shape=(len(domain1), len(domain2)))
-for i, x1 in zip(range(len(domain1)), domain1):
-    for j, x2 in zip(range(len(domain2)), domain2):
-        s, c = SYS.evaluate({"x1":x1, "x2":x2})
-        Z1[i, j], Z2[i, j] = c["y1"], c["y2"]
+# Evaluating the system on all the grid points at once. Z[i, j] is the output 
+# for the inputs x1 = domain1[i] and x2 = domain2[j].
+x1, x2 = meshgrid(domain1, domain2, indexing="ij")
+Y = SYS.evaluate_batch({"x1":x1.ravel(), "x2":x2.ravel()})
+Z1 = Y[:, 0].reshape((len(domain1), len(domain2)))
+Z2 = Y[:, 1].reshape((len(domain1), len(domain2)))
 
 fig = plt.figure()
 ax = fig.add_subplot(111, projection="3d")
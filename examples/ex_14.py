@@ -12,7 +12,7 @@ from mpl_toolkits import mplot3d
 import matplotlib.pyplot as plt
 from matplotlib import cm
 from matplotlib.ticker import LinearLocator, FormatStrFormatter
-from numpy import linspace, meshgrid, zeros
+from numpy import linspace, meshgrid
 from time import time
 
 #%%
@@ -132,15 +132,15 @@ SYS.add_rule([("x1", Big), ("x2", Big)],
 
 # %%
 # The output planes of the fuzzy system are evaluated and plotted here:
-Z1 = zeros(shape=X1.shape)
-Z2 = zeros(shape=X1.shape)
-
-for i, x1 in zip(range(len(domain)), domain):
-    for j, x2 in zip(range(len(domain)), domain):
-        # The params input of the evaluate function indicates the inputs of
-        # the functions given in the consequence part of the rules.
-        z = SYS.evaluate({"x1":x1, "x2":x2}, params=(x1, x2))
-        Z1[i, j], Z2[i, j] = z["y1"], z["y2"]
+# All the grid points are evaluated at once. Z[i, j] is the output for the 
+# inputs x1 = domain[i] and x2 = domain[j]. The params input of the 
+# evaluate_batch function indicates the inputs of the functions given in the 
+# consequence part of the rules, which are called with whole arrays.
+x1, x2 = meshgrid(domain, domain, indexing="ij")
+Z = SYS.evaluate_batch({"x1":x1.ravel(), "x2":x2.ravel()}, 
+                       params=(x1.ravel(), x2.ravel()))
+Z1 = Z[:, 0].reshape(X1.shape)
+Z2 = Z[:, 1].reshape(X1.shape)
 
 
 fig = plt.figure()
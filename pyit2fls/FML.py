@@ -1,16 +1,19 @@
 import xml.etree.ElementTree as ET
 from numpy import (linspace, )
-from pyit2fls import (T1Mamdani, T1TSK, T1FS, tri_mf, ltri_mf, rtri_mf, trapezoid_mf, gaussian_mf, singleton_mf, )
+from pyit2fls import (T1Mamdani, T1TSK, T1FS, tri_mf, ltri_mf, rtri_mf, trapezoid_mf, gaussian_mf, singleton_mf, 
+                      adaptive_domain, )
 
 class FML:
 
     def __init__(self, ):
         pass
 
-    def generate(self, variables, rules):
+    def generate(self, variables, rules, tolerance=None):
         """
         Generates a Type-1 Fuzzy Logic System (Mamdani or TSK) based on 
-        parsed variables and rules.
+        parsed variables and rules. The domain of each variable has 100 
+        points, unless a tolerance is given, in which case the number of 
+        points is chosen by adaptive_domain for its sets.
         """
         # Mapping FML membership function shapes to pyit2fls functions
         MF_MAP = {
@@ -78,6 +81,15 @@ class FML:
                             # Default to 0 constant if shape is not a singleton
                             sets_cache[var_name][term_name] = {"const": 0.0}
 
+                # Resampling the sets of the variable with the target error
+                if tolerance is not None and (rules["type"] == "mamdani" or var_type == "input"):
+                    terms = list(sets_cache[var_name].values())
+                    if terms:
+                        domain = adaptive_domain(terms, var_info["domainleft"], 
+                                                 var_info["domainright"], tolerance)
+                        for term in terms:
+                            term.domain = domain
+
         # 2. Add Rules to the System
         # Iterate through the rules dictionary populated by parse_fml
         rule_data = rules["rules"]
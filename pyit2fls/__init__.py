@@ -3,4 +3,6 @@ from .fuzzymatrix import *
 from .learning import *
 from .FML import *
 from .FCL import *
+from .parallel import *
+from .surface import *
 from designerUI import *
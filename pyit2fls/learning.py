@@ -8,30 +8,501 @@ Created on Sat Mar 30 01:39:58 2024
 
 from numpy import (reshape, exp, array, zeros, zeros_like, asarray, linspace, 
                    concatenate, abs, clip, argsort, argmin, sqrt, sin, 
-                   pi, copy, argmax, vstack, ones, mean, delete, where, append, sort, )
+                   pi, copy, argmax, vstack, ones, mean, delete, where, append, sort, 
+                   array_split, sign, load, memmap, )
+from numpy import sum as npsum
 from numpy.linalg import (norm, )
-from numpy.random import (rand, randint, uniform, normal, choice, )
+from numpy.random import (rand, randint, uniform, normal, choice, permutation, default_rng, )
 from scipy.optimize import (differential_evolution, minimize, )
 from pyit2fls import (T1FS, gaussian_mf, T1Mamdani, T1TSK, 
                       IT2FS_Gaussian_UncertMean, IT2FS_Gaussian_UncertStd, 
-                      IT2Mamdani, IT2TSK, product_t_norm, max_s_norm, crisp, )
+                      IT2Mamdani, IT2TSK, product_t_norm, max_s_norm, crisp, 
+                      gauss_uncert_mean_umf, gauss_uncert_mean_lmf, 
+                      gauss_uncert_std_umf, gauss_uncert_std_lmf, 
+                      algorithm_function, get_precision, precisions, )
 from abc import ABC, abstractmethod
+from concurrent.futures import (ProcessPoolExecutor, )
+from os import (cpu_count, )
+from mmap import (mmap, )
+
+
+def evaluate_population(objective_function, solutions, args=(), vectorized=False):
+    """Evaluates the objective function for a population of solutions.
+
+        .. rubric:: Parameters
+
+        objective_function : function
+
+            Objective function of the minimizing optimization problem.
+
+        solutions : numpy (n_solutions, n_params) shaped array
+
+            The solutions to be evaluated, one per row.
+
+        args : tuple
+
+            The extra arguments that can be passed while calling the objective function, *objective_function*.
+
+        vectorized : bool
+
+            If True, the objective function is called once with the whole matrix of solutions, and 
+            must return a (n_solutions,) shaped array of their fitnesses. Otherwise, it is called once 
+            for each solution.
+
+        .. rubric:: Returns
+
+        numpy (n_solutions,) shaped array:
+
+            The fitness of each solution. The solutions for which the objective function raises an 
+            *IndexError* get an infinite fitness.
+    """
+    fitness = zeros((len(solutions), ))
+    if len(solutions) == 0:
+        return fitness
+    if vectorized:
+        try:
+            return asarray(objective_function(solutions, *args), dtype=float).reshape(len(solutions))
+        except IndexError:
+            # The solutions are evaluated one by one, so only the failing ones get an infinite fitness.
+            pass
+    for i in range(len(solutions)):
+        try:
+            if vectorized:
+                fitness[i] = asarray(objective_function(solutions[i:i + 1], *args)).ravel()[0]
+            else:
+                fitness[i] = objective_function(solutions[i], *args)
+        except IndexError:
+            fitness[i] = float("inf")
+    return fitness
+
+
+# The objective function evaluated by a worker process, which is set once by 
+# the initializer of the pool.
+_objective_state = None
+
+
+def _initialize_objective_worker(objective_function, args, vectorized):
+    global _objective_state
+    _objective_state = (objective_function, args, vectorized)
+
+
+def _evaluate_objective_chunk(solutions):
+    objective_function, args, vectorized = _objective_state
+    return evaluate_population(objective_function, solutions, args, vectorized)
+
+
+class ParallelObjective:
+    """Vectorized objective function, which evaluates a population of solutions using a pool of 
+        worker processes.
+
+        The objective function and its extra arguments, e.g., the training data, are sent to each 
+        worker once, when the pool is started. Each call splits the solutions into one chunk per 
+        worker, and returns the fitnesses in the order of the solutions. An object of this class 
+        can be passed to any optimizer with *vectorized=True*, and the optimizers create one 
+        themselves when their *workers* parameter is more than one.
+
+        .. rubric:: Parameters
+            
+        Parameters of the constructor function:
+
+        objective_function : function
+
+            Objective function of the minimizing optimization problem.
+
+        args : tuple
+
+            The extra arguments that can be passed while calling the objective function, *objective_function*.
+
+        workers : int
+
+            Number of the worker processes. If not given, the number of the CPUs is used. With one 
+            worker, the solutions are evaluated in the current process.
+
+        vectorized : bool
+
+            If True, *objective_function* itself accepts a matrix of solutions.
+    
+        .. rubric:: Functions
+            
+        Functions defined in ParallelObjective class:
+
+        __call__:
+
+            Returns the fitnesses of a (n_solutions, n_params) shaped matrix of solutions.
+
+        close:
+
+            Shuts the pool of worker processes down.
+
+        .. rubric:: Examples
+
+        >>> with ParallelObjective(model.error_batch, (X, y), workers=8, vectorized=True) as objective:
+        >>>     myPSO = PSO(50, model.paramNum, objective, (-1., 1.), vectorized=True)
+        >>>     for i in range(100):
+        >>>         myPSO.iterate()
+    """
+    def __init__(self, objective_function, args=(), workers=None, vectorized=False):
+        self.objective_function = objective_function
+        self.args = tuple(args) if args is not None else ()
+        self.workers = (cpu_count() or 1) if workers is None else workers
+        self.vectorized = vectorized
+        self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def __call__(self, solutions):
+        """Returns the fitnesses of the solutions.
+
+            .. rubric:: Parameters
+
+            solutions : numpy (n_solutions, n_params) shaped array
+
+                The solutions to be evaluated, one per row.
+        """
+        solutions = asarray(solutions, dtype=float).reshape(len(solutions), -1)
+        if self.workers <= 1 or len(solutions) <= 1:
+            return evaluate_population(self.objective_function, solutions, self.args, self.vectorized)
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, 
+                                                initializer=_initialize_objective_worker, 
+                                                initargs=(self.objective_function, self.args, 
+                                                          self.vectorized))
+        chunks = array_split(solutions, min(self.workers, len(solutions)))
+        return concatenate(list(self.executor.map(_evaluate_objective_chunk, chunks)))
+
+    def close(self):
+        """Shuts the pool of worker processes down. The pool is started again by the next call."""
+        if getattr(self, "executor", None) is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def _parallelize(objective_function, args, vectorized, workers):
+    # The objective function, its extra arguments, and the vectorized flag, which are used by an 
+    # optimizer with the given number of the worker processes.
+    if workers is None or workers <= 1:
+        return objective_function, args, vectorized
+    return ParallelObjective(objective_function, args, workers, vectorized), (), True
+
+
+# The mini-batch objective function evaluated by a worker process, which is set once by the 
+# initializer of the pool.
+_minibatch_state = None
+
+
+def _initialize_minibatch_worker(objective):
+    global _minibatch_state
+    _minibatch_state = objective
+
+
+def _evaluate_minibatch_chunk(task):
+    solutions, generation = task
+    _minibatch_state.generation = generation
+    return _minibatch_state.evaluate(solutions)
+
+
+def _evaluate_rows_chunk(task):
+    solutions, start, stop = task
+    return _minibatch_state.squared_errors(solutions, start, stop)
+
+
+def _open_data(data):
+    # The file names are opened as read only memory-mapped arrays.
+    if isinstance(data, str):
+        return load(data, mmap_mode="r")
+    return data
+
+
+def _data_state(data):
+    # A memory-mapped array is pickled by its file, so it is not copied to the worker processes.
+    if isinstance(data, memmap) and isinstance(data.base, mmap):
+        return ("memmap", data.filename, data.dtype, data.shape, data.offset, 
+                "F" if data.flags.f_contiguous and not data.flags.c_contiguous else "C")
+    return ("array", data)
+
+
+def _restore_data(state):
+    if state[0] == "memmap":
+        _, filename, dtype, shape, offset, order = state
+        return memmap(filename, dtype=dtype, mode="r", shape=shape, offset=offset, order=order)
+    return state[1]
+
+
+class MiniBatchObjective:
+    """Vectorized objective function, which evaluates a population of solutions on a random batch of 
+        the training samples instead of the whole data set.
+
+        The batch is fixed during each generation of an optimizer, so the solutions of a generation 
+        are comparable, and the next batch is drawn by the *next_batch* function. The errors of a batch 
+        are scaled by sqrt(n_samples / batch_size), so they estimate the error of the whole data set. 
+        The best solutions evaluated since the last refresh are kept as elites, and every *refresh* 
+        generations they are evaluated again on the whole data set, which is streamed in chunks of 
+        *chunk_size* samples. The best of them is kept in the *best_solution* and *best_fitness* 
+        attributes. The data can be numpy memory-mapped arrays, e.g., opened by numpy.load with 
+        *mmap_mode="r"*, so only the samples of the batches and the chunks are read into the memory.
+
+        The objective function must return the norm of the errors of the samples, as the *error_batch* 
+        functions of the learning classes do.
+
+        .. rubric:: Parameters
+            
+        Parameters of the constructor function:
+
+        objective_function : function
+
+            Vectorized objective function, which is called as *objective_function(solutions, X, y)*, and 
+            returns a (n_solutions,) shaped array of the norms of the errors.
+
+        X : numpy (n_samples, n_inputs) shaped array, numpy memmap, or str
+
+            The input data, or the name of a .npy file which is opened as a memory-mapped array.
+
+        y : numpy (n_samples,) shaped array, numpy memmap, or str
+
+            The desired outputs, or the name of a .npy file which is opened as a memory-mapped array.
+
+        batch_size : int
+
+            Number of the samples in each batch.
+
+        refresh : int
+
+            Number of the generations between the evaluations of the elites on the whole data set.
+
+        elites : int
+
+            Number of the elites evaluated on the whole data set at each refresh.
+
+        chunk_size : int
+
+            Number of the samples read at a time while evaluating the whole data set.
+
+        workers : int
+
+            Number of the worker processes. The data is sent to each worker once, when the pool is 
+            started, and the memory-mapped arrays are opened again by the workers instead of being 
+            copied. With one worker, the solutions are evaluated in the current process.
+    
+        .. rubric:: Functions
+            
+        Functions defined in MiniBatchObjective class:
+
+        __call__:
+
+            Returns the fitnesses of a (n_solutions, n_params) shaped matrix of solutions on the batch 
+            of the current generation.
+
+        next_batch:
+
+            Draws the batch of the next generation, and refreshes the elites periodically.
+
+        update:
+
+            Evaluates the elites on the whole data set.
+
+        full:
+
+            Returns the errors of a matrix of solutions on the whole data set.
+
+        close:
+
+            Shuts the pool of worker processes down.
+
+        .. rubric:: Examples
+
+        >>> X = numpy.load("X.npy", mmap_mode="r")
+        >>> y = numpy.load("y.npy", mmap_mode="r")
+        >>> with MiniBatchObjective(model.error_batch, X, y, 10000, workers=8) as objective:
+        >>>     myPSO = PSO(50, model.paramNum, objective, (-1., 1.), vectorized=True)
+        >>>     for i in range(100):
+        >>>         objective.next_batch()
+        >>>         myPSO.iterate()
+        >>>     objective.update()
+        >>> params = objective.best_solution
+    """
+    def __init__(self, objective_function, X, y, batch_size, refresh=10, elites=5, 
+                 chunk_size=65536, workers=1):
+        self.objective_function = objective_function
+        self.X = _open_data(X)
+        self.y = _open_data(y)
+        if len(self.X) != len(self.y):
+            raise ValueError("The inputs and the outputs must have the same number of samples.")
+        if batch_size < 1 or refresh < 1 or elites < 1 or chunk_size < 1:
+            raise ValueError("The batch size, refresh period, elites number, and chunk size " + 
+                             "must be positive integers.")
+        self.batch_size = min(batch_size, len(self.X))
+        self.refresh = refresh
+        self.elites = elites
+        self.chunk_size = chunk_size
+        self.workers = (cpu_count() or 1) if workers is None else workers
+        # The batches are drawn from the seed and the generation number, so the workers draw the 
+        # same batches without receiving them.
+        self.seed = randint(2 ** 31)
+        self.generation = 0
+        self.elite_solutions = zeros((0, 0, ))
+        self.elite_fitness = zeros((0, ))
+        self.best_solution = None
+        self.best_fitness = float("inf")
+        self.batch = None
+        self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["X"] = _data_state(self.X)
+        state["y"] = _data_state(self.y)
+        state["batch"] = None
+        state["executor"] = None
+        state["workers"] = 1
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.X = _restore_data(self.X)
+        self.y = _restore_data(self.y)
+
+    def indices(self):
+        """Returns the sorted indices of the samples in the batch of the current generation."""
+        rng = default_rng([self.seed, self.generation])
+        return sort(rng.choice(len(self.X), self.batch_size, replace=False))
+
+    def evaluate(self, solutions):
+        """Returns the scaled errors of the solutions on the batch of the current generation."""
+        if self.batch is None or self.batch[0] != self.generation:
+            indices = self.indices()
+            self.batch = (self.generation, asarray(self.X[indices], dtype=float), 
+                          asarray(self.y[indices], dtype=float))
+        fitness = evaluate_population(self.objective_function, solutions, self.batch[1:], True)
+        return fitness * sqrt(len(self.X) / self.batch_size)
+
+    def squared_errors(self, solutions, start, stop):
+        """Returns the squared errors of the solutions on the samples from *start* to *stop*."""
+        errors = evaluate_population(self.objective_function, solutions, 
+                                     (asarray(self.X[start:stop], dtype=float), 
+                                      asarray(self.y[start:stop], dtype=float), ), True)
+        return errors ** 2
+
+    def __pool(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, 
+                                                initializer=_initialize_minibatch_worker, 
+                                                initargs=(self, ))
+        return self.executor
+
+    def __call__(self, solutions):
+        """Returns the fitnesses of the solutions on the batch of the current generation.
+
+            .. rubric:: Parameters
+
+            solutions : numpy (n_solutions, n_params) shaped array
+
+                The solutions to be evaluated, one per row.
+        """
+        solutions = asarray(solutions, dtype=float).reshape(len(solutions), -1)
+        if self.workers <= 1 or len(solutions) <= 1:
+            fitness = self.evaluate(solutions)
+        else:
+            chunks = array_split(solutions, min(self.workers, len(solutions)))
+            fitness = concatenate(list(self.__pool().map(_evaluate_minibatch_chunk, 
+                                                         [(chunk, self.generation) for chunk in chunks])))
+        # The best solutions are kept as the elites of the next refresh.
+        if len(self.elite_solutions) == 0:
+            self.elite_solutions = zeros((0, solutions.shape[1], ))
+        candidates = concatenate([self.elite_fitness, fitness])
+        keep = argsort(candidates)[:self.elites]
+        keep = keep[candidates[keep] < float("inf")]
+        self.elite_solutions = vstack([self.elite_solutions, solutions])[keep]
+        self.elite_fitness = candidates[keep]
+        return fitness
+
+    def full(self, solutions):
+        """Returns the errors of the solutions on the whole data set.
+
+            .. rubric:: Parameters
+
+            solutions : numpy (n_solutions, n_params) shaped array
+
+                The solutions to be evaluated, one per row.
+        """
+        solutions = asarray(solutions, dtype=float).reshape(len(solutions), -1)
+        tasks = [(solutions, start, min(start + self.chunk_size, len(self.X))) 
+                 for start in range(0, len(self.X), self.chunk_size)]
+        if self.workers <= 1 or len(tasks) <= 1:
+            return sqrt(npsum([self.squared_errors(*task) for task in tasks], axis=0))
+        return sqrt(npsum(list(self.__pool().map(_evaluate_rows_chunk, tasks)), axis=0))
+
+    def update(self):
+        """Evaluates the elites on the whole data set, and keeps the best of them and the best solution 
+            found before. The elites are cleared afterwards."""
+        if len(self.elite_solutions) > 0:
+            fitness = self.full(self.elite_solutions)
+            best = argmin(fitness)
+            if fitness[best] < self.best_fitness:
+                self.best_solution = self.elite_solutions[best].copy()
+                self.best_fitness = fitness[best]
+        self.elite_solutions = zeros((0, self.elite_solutions.shape[1], ))
+        self.elite_fitness = zeros((0, ))
+        return self.best_fitness
+
+    def next_batch(self):
+        """Draws the batch of the next generation. The elites are evaluated on the whole data set every 
+            *refresh* generations."""
+        self.generation += 1
+        if self.generation % self.refresh == 0:
+            self.update()
+
+    def close(self):
+        """Shuts the pool of worker processes down. The pool is started again by the next call."""
+        if getattr(self, "executor", None) is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def _next_generation(objective):
+    # Draws the batch of the next generation, if the objective function is evaluated on mini-batches.
+    if isinstance(objective, MiniBatchObjective):
+        objective.next_batch()
 
 
 class Optimizer(ABC):
     """
     Abstract base class for optimizers.
+
+    The population of a subclass can be evaluated at once by the *evaluate* function, which supports 
+    both the vectorized and the one solution per call objective functions.
     """
 
-    def __init__(self, population_size, solution_size, objective_function, bounds, args=None):
+    def __init__(self, population_size, solution_size, objective_function, bounds, args=None, 
+                 vectorized=False, workers=1):
+        objective_function, args, vectorized = _parallelize(objective_function, args, vectorized, workers)
         self.population_size = population_size
         self.solution_size = solution_size
         self.objective_function = objective_function
         self.bounds = bounds
         self.args = args if args is not None else {}
+        self.vectorized = vectorized
         super().__init__()
         self.best_solution = zeros((self.solution_size, ), )
-        self.best_fitness = self.objective_function(self.best_solution, *args)
+        self.best_fitness = self.evaluate(self.best_solution[None])[0]
+
+    def evaluate(self, solutions):
+        """Returns the fitnesses of the rows of the (n_solutions, n_params) shaped matrix *solutions*."""
+        return evaluate_population(self.objective_function, solutions, self.args, self.vectorized)
 
     @abstractmethod
     def iterate(self, algorithm_parameters):
@@ -64,6 +535,18 @@ class ICA:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *objective_function*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
     
         .. rubric:: Functions
             
@@ -77,7 +560,8 @@ class ICA:
 
             Finds the best solution (country) in the current population.
     """
-    def __init__(self, population_size, solution_size, objective_function, bounds, args=None):
+    def __init__(self, population_size, solution_size, objective_function, bounds, args=None, 
+                 vectorized=False, workers=1):
         """
         Initializes the ICA class with the given parameters.
 
@@ -102,23 +586,32 @@ class ICA:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *objective_function*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
         """
+        objective_function, args, vectorized = _parallelize(objective_function, args, vectorized, workers)
         self.population_size = population_size
         self.solution_size = solution_size
         self.objective_function = objective_function
         self.bounds = bounds
         self.args = args if args is not None else {}
+        self.vectorized = vectorized
 
         # Initialize countries (solutions) randomly within bounds
         self.countries = zeros((self.population_size, self.solution_size, ), )
-        self.fitness = zeros((self.population_size, ), )
-        
         for i in range(self.population_size):
             self.countries[i] = uniform(low=self.bounds[0], high=self.bounds[1], size=(self.solution_size, ), )
-            try:
-                self.fitness[i] = self.objective_function(self.countries[i], *self.args)
-            except IndexError:
-                self.fitness[i] = float("inf")
+        self.fitness = self.evaluate(self.countries)
 
         # Select imperialists and colonies
         self.imperialist_indices = argsort(self.fitness)[:self.population_size // 3]  # Example: 1/3 are imperialists
@@ -144,19 +637,15 @@ class ICA:
             imperialist_index = self.imperialist_indices[colony_index % len(self.imperialist_indices)]  # Assign to an imperialist
             difference = self.countries[imperialist_index] - self.countries[colony_index]
             self.countries[colony_index] += uniform(0, assimilation_coefficient) * difference
-            try:
-                self.fitness[colony_index] = self.objective_function(self.countries[colony_index], *self.args)
-            except IndexError:
-                self.fitness[colony_index] = float("inf")
+        self.fitness[self.colony_indices] = self.evaluate(self.countries[self.colony_indices])
 
         # Revolution: Some colonies randomly change their position
+        revolted = []
         for colony_index in self.colony_indices:
             if rand() < revolution_rate:
                 self.countries[colony_index] = uniform(low=self.bounds[0], high=self.bounds[1], size=self.solution_size)
-                try:
-                    self.fitness[colony_index] = self.objective_function(self.countries[colony_index], *self.args)
-                except IndexError:
-                    self.fitness[colony_index] = float("inf")
+                revolted.append(colony_index)
+        self.fitness[revolted] = self.evaluate(self.countries[revolted])
 
         # Imperialistic Competition: Select the weakest empire
         weakest_empire_index = argmax([mean(self.fitness[self.colony_indices[self.colony_indices % len(self.imperialist_indices) == i]]) for i in range(len(self.imperialist_indices))])
@@ -173,17 +662,17 @@ class ICA:
             self.colony_indices = sort(self.colony_indices)
 
         # Update fitness and re-sort
-        for i in range(self.population_size):
-            try:
-                self.fitness[i] = self.objective_function(self.countries[i], *self.args)
-            except IndexError:
-                self.fitness[i] = float("inf")
+        self.fitness = self.evaluate(self.countries)
         self.imperialist_indices = argsort(self.fitness)[:len(self.imperialist_indices)]
         self.colony_indices = argsort(self.fitness)[len(self.imperialist_indices):]
 
         self.get_best_solution()
         return self.best_fitness
 
+    def evaluate(self, countries):
+        """Returns the fitnesses of the rows of the matrix *countries*."""
+        return evaluate_population(self.objective_function, countries, self.args, self.vectorized)
+
     def get_best_solution(self):
         """Finds the best solution (country) in the current population."""
         best_index = argmin(self.fitness)
@@ -217,6 +706,18 @@ class CuckooSearch:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *objective_function*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
     
         .. rubric:: Functions
             
@@ -226,7 +727,8 @@ class CuckooSearch:
 
             Advances the Cuckoo Search by one iteration.
     """
-    def __init__(self, population_size, solution_size, objective_function, bounds, args=None):
+    def __init__(self, population_size, solution_size, objective_function, bounds, args=None, 
+                 vectorized=False, workers=1):
         """
         Initializes the CuckooSearch class with the given parameters.
 
@@ -251,22 +753,32 @@ class CuckooSearch:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *objective_function*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
         """
+        objective_function, args, vectorized = _parallelize(objective_function, args, vectorized, workers)
         self.population_size = population_size
         self.solution_size = solution_size
         self.objective_function = objective_function
         self.bounds = bounds
         self.args = args if args is not None else {}  # Handle cases with no extra arguments
+        self.vectorized = vectorized
 
         # Initialize nests (solutions) randomly within bounds
         self.nests = zeros((self.population_size, self.solution_size, ), )
-        self.fitness = zeros((self.population_size, ), )
         for i in range(self.population_size):
             self.nests[i] = uniform(low=self.bounds[0], high=self.bounds[1], size=(self.solution_size, ))
-            try:
-                self.fitness[i] = self.objective_function(self.nests[i], *args)
-            except IndexError:
-                self.fitness[i] = float("inf")
+        self.fitness = self.evaluate(self.nests)
         
         self.get_best_solution()
 
@@ -284,25 +796,35 @@ class CuckooSearch:
 
                 Step size factor for Levy flight.
         """
-        # Cuckoo search process
+        # Cuckoo search process: if the objective function is vectorized, the new nests of all the 
+        # cuckoos are evaluated together, otherwise one by one, so the later cuckoos fly from the 
+        # nests replaced earlier in the iteration.
+        new_nests = zeros_like(self.nests)
+        targets = []
         for i in range(self.population_size):
             new_nest = self.get_cuckoo(self.nests[i], step_size_factor)
-            try:
-                new_fitness = self.objective_function(new_nest, *self.args)
-            except IndexError:
-                new_fitness = float("inf")
             j = randint(0, self.population_size)
+            if self.vectorized:
+                new_nests[i] = new_nest
+                targets.append(j)
+                continue
+            new_fitness = self.evaluate(new_nest[None])[0]
             if new_fitness < self.fitness[j]:
                 self.nests[j] = new_nest
                 self.fitness[j] = new_fitness
-                
+        if self.vectorized:
+            new_fitness = self.evaluate(new_nests)
+            for i, j in enumerate(targets):
+                if new_fitness[i] < self.fitness[j]:
+                    self.nests[j] = new_nests[i]
+                    self.fitness[j] = new_fitness[i]
+        
+        abandoned = []
         for i in range(self.population_size):
             if rand() < pa:
                 self.nests[i] = uniform(low=self.bounds[0], high=self.bounds[1], size=self.solution_size)
-                try:
-                    self.fitness[i] = self.objective_function(self.nests[i], *self.args)  # Recalculate fitness
-                except IndexError:
-                    self.fitness[i] = float("inf")
+                abandoned.append(i)
+        self.fitness[abandoned] = self.evaluate(self.nests[abandoned])  # Recalculate fitness
         
         self.get_best_solution()
         return self.best_fitness
@@ -328,6 +850,10 @@ class CuckooSearch:
         new_nest = nest + step_size
         return new_nest
 
+    def evaluate(self, nests):
+        """Returns the fitnesses of the rows of the matrix *nests*."""
+        return evaluate_population(self.objective_function, nests, self.args, self.vectorized)
+
     def get_best_solution(self):
         """Finds the best solution (nest) in the current population."""
         best_index = argmin(self.fitness)
@@ -361,6 +887,18 @@ class FFA:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *obj_func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
     
         .. rubric:: Functions
             
@@ -370,7 +908,7 @@ class FFA:
 
             Advances the FFA by one iteration.
     """
-    def __init__(self, population, param_num, obj_func, bounds, args=()):
+    def __init__(self, population, param_num, obj_func, bounds, args=(), vectorized=False, workers=1):
         """
         Initializes the FFA class with the given parameters.
 
@@ -395,20 +933,29 @@ class FFA:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *obj_func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
         """
+        obj_func, args, vectorized = _parallelize(obj_func, args, vectorized, workers)
         self.population = population
         self.param_num = param_num
         self.bounds = bounds
         self.obj_func = obj_func
         self.args = args
+        self.vectorized = vectorized
         self.fireflies = uniform(bounds[0], bounds[1], (population, param_num))
         
-        self.fitness = []
-        for firefly in self.fireflies:
-            try:
-                self.fitness.append(self.obj_func(firefly, *args))
-            except IndexError:
-                self.fitness.append(float("inf"))
+        self.fitness = list(evaluate_population(self.obj_func, self.fireflies, args, vectorized))
         
         best_index = argmin(self.fitness)
         self.best_firefly = self.fireflies[best_index]
@@ -439,10 +986,9 @@ class FFA:
                     new_position = self.fireflies[i] + beta * (self.fireflies[j] - self.fireflies[i]) + \
                                    alpha * (rand(self.param_num) - 0.5)
                     
-                    try:
-                        fitness = self.obj_func(new_position, *self.args)
-                    except IndexError:
-                        fitness = float("inf")
+                    # Each move depends on the previous ones, so the fireflies are evaluated one by one.
+                    fitness = evaluate_population(self.obj_func, new_position[None], 
+                                                  self.args, self.vectorized)[0]
                     
                     if fitness < self.fitness[i]:
                         self.fireflies[i] = new_position
@@ -479,6 +1025,18 @@ class WOA:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *obj_func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
     
         .. rubric:: Functions
             
@@ -488,7 +1046,7 @@ class WOA:
 
             Advances the WOA by one iteration.
     """
-    def __init__(self, population, param_num, obj_func, bounds, args=()):
+    def __init__(self, population, param_num, obj_func, bounds, args=(), vectorized=False, workers=1):
         """
         Initializes the WOA class with the given parameters.
 
@@ -513,20 +1071,30 @@ class WOA:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *obj_func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
         """
+        obj_func, args, vectorized = _parallelize(obj_func, args, vectorized, workers)
         self.population = population
         self.param_num = param_num
         self.bounds = bounds
         self.obj_func = obj_func
         self.args = args
+        self.vectorized = vectorized
         self.whales = zeros((population, param_num, ), )
-        self.fitness = zeros((population, ))
         for i in range(self.population):
             self.whales[i] = uniform(self.bounds[0], self.bounds[1], self.param_num)
-            try:
-                self.fitness[i] = self.obj_func(self.whales[i], *args)
-            except IndexError:
-                self.fitness[i] = float("inf")
+        self.fitness = evaluate_population(self.obj_func, self.whales, args, vectorized)
 
         best_index = argmin(self.fitness)
         self.best_whale = self.whales[best_index]
@@ -546,6 +1114,9 @@ class WOA:
                 Maximum number of iterations.
         """
         a = 2 - 2 * t / max_iter  # Linearly decreasing from 2 to 0
+        # If the objective function is vectorized, the new positions of all the whales are evaluated 
+        # together, otherwise one by one, so the later whales move in the updated population.
+        new_positions = zeros_like(self.whales)
         for i in range(self.population):
             r1, r2 = rand(), rand()
             A = 2 * a * r1 - a
@@ -563,16 +1134,21 @@ class WOA:
             else:
                 l = uniform(-1, 1)
                 new_position = self.best_whale + l * abs(self.best_whale - self.whales[i])
+            if self.vectorized:
+                new_positions[i] = new_position
+                continue
 
-            try:
-                fitness = self.obj_func(new_position, *self.args)
-            except IndexError:
-                fitness = float("inf")
-            
+            fitness = evaluate_population(self.obj_func, new_position[None], self.args)[0]
             if fitness < self.fitness[i]:
                 self.whales[i] = new_position
                 self.fitness[i] = fitness
 
+        if self.vectorized:
+            fitness = evaluate_population(self.obj_func, new_positions, self.args, True)
+            better = fitness < self.fitness
+            self.whales[better] = new_positions[better]
+            self.fitness[better] = fitness[better]
+
         best_index = argmin(self.fitness)
         self.best_whale = self.whales[best_index]
         self.best_fitness = self.fitness[best_index]
@@ -605,6 +1181,18 @@ class GWO:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *obj_func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
     
         .. rubric:: Functions
             
@@ -614,7 +1202,7 @@ class GWO:
 
             Advances the GWO by one iteration.
     """
-    def __init__(self, population, param_num, obj_func, bounds, args=()):
+    def __init__(self, population, param_num, obj_func, bounds, args=(), vectorized=False, workers=1):
         """
         Initializes the GWO class with the given parameters.
 
@@ -639,7 +1227,20 @@ class GWO:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *obj_func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
         """
+        obj_func, args, vectorized = _parallelize(obj_func, args, vectorized, workers)
         self.population = population
         self.param_num = param_num
         self.bounds = bounds
@@ -647,14 +1248,11 @@ class GWO:
         self.args = args
         self.alpha, self.beta, self.delta = None, None, None
         self.alpha_fitness, self.beta_fitness, self.delta_fitness = float("inf"), float("inf"), float("inf")
+        self.vectorized = vectorized
         self.wolves = zeros((self.population, self.param_num, ), )
-        self.fitness = zeros((self.population, ))
         for i in range(self.population):
             self.wolves[i] = uniform(self.bounds[0], self.bounds[1], self.param_num)
-            try:
-                self.fitness[i] = self.obj_func(self.wolves[i], *args)
-            except IndexError:
-                self.fitness[i] = float("inf")
+        self.fitness = evaluate_population(self.obj_func, self.wolves, args, vectorized)
         self._update_leaders()
 
     def _update_leaders(self):
@@ -683,6 +1281,9 @@ class GWO:
                 Maximum number of iterations.
         """
         a = 2 - 2 * (t + 1) / max_iter  # Linearly decreasing from 2 to 0
+        # If the objective function is vectorized, the new positions of all the wolves are evaluated 
+        # together, otherwise one by one, so the later wolves follow the updated leaders.
+        new_positions = zeros_like(self.wolves)
         for i in range(self.population):
             A1, A2, A3 = a * (2 * rand(self.param_num) - 1), \
                          a * (2 * rand(self.param_num) - 1), \
@@ -694,16 +1295,21 @@ class GWO:
             X3 = self.delta - A3 * abs(C3 * self.delta - self.wolves[i])
 
             newPosition = (X1 + X2 + X3) / 3
-            
-            try:
-                fitness = self.obj_func(newPosition, *self.args)
-            except IndexError:
-                fitness = float("inf")
+            if self.vectorized:
+                new_positions[i] = newPosition
+                continue
 
+            fitness = evaluate_population(self.obj_func, newPosition[None], self.args)[0]
             if fitness < self.fitness[i]:
                 self.wolves[i] = newPosition
                 self.fitness[i] = fitness
 
+        if self.vectorized:
+            fitness = evaluate_population(self.obj_func, new_positions, self.args, True)
+            better = fitness < self.fitness
+            self.wolves[better] = new_positions[better]
+            self.fitness[better] = fitness[better]
+
         self._update_leaders()
         return self.alpha_fitness
 
@@ -735,6 +1341,18 @@ class PSO:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
     
         .. rubric:: Functions
             
@@ -744,7 +1362,7 @@ class PSO:
 
             Advances the PSO by one iteration.
     """
-    def __init__(self, N, M, func, bounds, args=()):
+    def __init__(self, N, M, func, bounds, args=(), vectorized=False, workers=1):
         """
         Initializes the PSO class with the given parameters.
 
@@ -769,7 +1387,20 @@ class PSO:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
         """
+        func, args, vectorized = _parallelize(func, args, vectorized, workers)
         self.func = func
         self.args = args
         self.N  = N
@@ -777,28 +1408,15 @@ class PSO:
         self.bounds = bounds
         self.X  = self.bounds[0] + (self.bounds[1] - self.bounds[0]) * rand(self.N, self.M)
         self.V  = 4.0 * (self.bounds[1] - self.bounds[0]) * (rand(self.N, self.M) - 0.5)
+        self.vectorized = vectorized
+        self.Fb = evaluate_population(self.func, self.X, self.args, self.vectorized)
         self.Xb = self.X.copy()
-        self.Fb = zeros(shape=(self.N, ))
         
-        try:
-            self.Fb[0] = self.func(self.X[0], *self.args)
-        except IndexError:
-            self.Fb[0] = float("inf")
-        
-        self.xb = self.X[0].copy()
-        self.fb = self.Fb[0]
+        best = argmin(self.Fb)
+        self.xb = self.X[best].copy()
+        self.fb = self.Fb[best]
         
         self.iterNum = 0
-        
-        for i in range(1, self.N):
-            try:
-                self.Fb[i] = self.func(self.X[i], *self.args)
-            except IndexError:
-                self.Fb[i] = float("inf")
-                
-            if self.Fb[i] < self.fb:
-                self.fb = self.Fb[i]
-                self.xb = self.X[i].copy()
     
     
     def iterate(self, omega=0.3, phi_p=0.3, phi_g=2.1):
@@ -826,11 +1444,9 @@ class PSO:
                  phi_g * r_g * (self.xb - self.X)
         self.X = self.X + self.V
         
+        fitness = evaluate_population(self.func, self.X, self.args, self.vectorized)
         for i in range(self.N):
-            try:
-                tmp = self.func(self.X[i], *self.args)
-            except IndexError:
-                continue
+            tmp = fitness[i]
             if tmp < self.Fb[i]:
                 self.Xb[i] = self.X[i].copy()
                 self.Fb[i] = tmp
@@ -840,14 +1456,102 @@ class PSO:
         return self.fb
             
 
+class Adam:
+    """Adam optimizer for determining optimal parameters of the fuzzy models with analytic gradients.
+
+        Each iteration takes one step along the bias corrected first and second moments of the 
+        gradients, which are usually computed on a mini-batch of the data.
+
+        .. rubric:: Parameters
+            
+        Parameters of the constructor function:
+
+        params : numpy (n,) shaped array
+
+            The initial parameters of the model.
+
+        gradient : function
+
+            Returns the tuple (error, gradient) of the error function and its gradient with respect 
+            to the parameters, for the parameters and the extra arguments passed to *iterate*.
+
+        learning_rate : float
+
+            Step size of the optimizer.
+
+        beta1 : float
+
+            Decay rate of the first moment of the gradients.
+
+        beta2 : float
+
+            Decay rate of the second moment of the gradients.
+
+        epsilon : float
+
+            Small constant preventing the division by zero.
+
+        bounds : iterable
+
+            Lower and upper bounds of the parameters. If not given, the parameters are not bounded.
+    
+        .. rubric:: Functions
+            
+        Functions defined in Adam class:
+
+        iterate:
+
+            Advances the Adam optimizer by one step.
+    """
+    def __init__(self, params, gradient, learning_rate=0.01, beta1=0.9, beta2=0.999, 
+                 epsilon=1e-8, bounds=None):
+        self.params = array(params, dtype=float)
+        self.gradient = gradient
+        self.learning_rate = learning_rate
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+        self.bounds = bounds
+        self.m = zeros_like(self.params)
+        self.v = zeros_like(self.params)
+        self.iterNum = 0
+
+    def iterate(self, *args):
+        """Advances the Adam optimizer by one step, and returns the error before the step.
+
+            .. rubric:: Parameters
+
+            args : tuple
+
+                The extra arguments passed to the gradient function, e.g., a mini-batch of the data.
+        """
+        error, g = self.gradient(self.params, *args)
+        self.iterNum += 1
+        self.m = self.beta1 * self.m + (1. - self.beta1) * g
+        self.v = self.beta2 * self.v + (1. - self.beta2) * g ** 2
+        m = self.m / (1. - self.beta1 ** self.iterNum)
+        v = self.v / (1. - self.beta2 ** self.iterNum)
+        self.params = self.params - self.learning_rate * m / (sqrt(v) + self.epsilon)
+        if self.bounds is not None:
+            self.params = clip(self.params, self.bounds[0], self.bounds[1])
+        return error
+
+
 class solution:
     
-    def __init__(self, M, func, bounds, args=()):
-        self.solution = bounds[0] + (bounds[1] - bounds[0]) * rand(M, )
-        try:
-            self.fitness = func(self.solution, *args)
-        except IndexError:
-            self.fitness = float("inf")
+    def __init__(self, M, func, bounds, args=(), vector=None, fitness=None):
+        # The vector and its fitness can be given, if they are already evaluated.
+        if vector is None:
+            self.solution = bounds[0] + (bounds[1] - bounds[0]) * rand(M, )
+        else:
+            self.solution = vector
+        if fitness is not None:
+            self.fitness = fitness
+        else:
+            try:
+                self.fitness = func(self.solution, *args)
+            except IndexError:
+                self.fitness = float("inf")
 
 class GA:
     """Genetic Algorithm (GA) for determining optimal parameters of the fuzzy models.
@@ -875,6 +1579,18 @@ class GA:
         args : tuple
 
             The extra arguments that can be passed while calling the objective function, *func*.
+
+        vectorized : bool
+
+            If True, the objective function is called with a (n_solutions, n_params) shaped matrix of 
+            solutions, and must return a (n_solutions,) shaped array of their fitnesses. By default, it 
+            is called once for each solution.
+
+        workers : int
+
+            Number of the worker processes evaluating the solutions of each iteration in parallel, 
+            as in the *ParallelObjective* class. By default, the solutions are evaluated in the 
+            current process.
     
         .. rubric:: Functions
             
@@ -897,15 +1613,20 @@ class GA:
 
             Advances the GA by one iteration.
     """
-    def __init__(self, N, M, func, bounds, args=()):
+    def __init__(self, N, M, func, bounds, args=(), vectorized=False, workers=1):
+        func, args, vectorized = _parallelize(func, args, vectorized, workers)
         self.func = func
         self.args = args
         self.N  = N
         self.M  = M
         self.bounds = bounds
+        self.vectorized = vectorized
+        vectors = bounds[0] + (bounds[1] - bounds[0]) * rand(self.N, self.M)
+        fitness = evaluate_population(self.func, vectors, args, vectorized)
         self.population = []
         for i in range(self.N):
-            self.population.append(solution(self.M, self.func, self.bounds, args))
+            self.population.append(solution(self.M, self.func, self.bounds, args, 
+                                            vectors[i], fitness[i]))
 
         self.population = sorted(self.population, key=lambda solution:solution.fitness)
         self.iterNum = 0
@@ -979,13 +1700,46 @@ class GA:
                 solutions. The parameter *tp* defines the elite group as the fraction 0 < *tp* < 1 
                 of the population comprising individuals with superior fitness.
         """
+        if self.vectorized:
+            self._iterate_vectorized(mutation_num, crossover_num, tp)
+        else:
+            parent_list = self.tournament_selection(2 * crossover_num, 1.0)
+            for i, j in zip(parent_list[::2], parent_list[1::2]):
+                child_solution = self.crossover(self.population[i], self.population[j])
+                try:
+                    tmp = self.func(child_solution, *self.args)
+                except IndexError:
+                    continue
+                if tmp < self.population[i].fitness:
+                    self.population[i].solution = child_solution.copy()
+                    self.population[i].fitness = tmp
+                elif tmp < self.population[j].fitness:
+                    self.population[j].solution = child_solution.copy()
+                    self.population[j].fitness = tmp
+            parent_list = self.tournament_selection(mutation_num, tp)
+            for i in parent_list:
+                mutated_solution = self.mutate(self.population[i])
+                try:
+                    tmp = self.func(mutated_solution, *self.args)
+                except IndexError:
+                    continue
+                if tmp < self.population[i].fitness:
+                    self.population[i].solution = mutated_solution.copy()
+                    self.population[i].fitness = tmp
+        
+        self.population = sorted(self.population, key=lambda solution:solution.fitness)
+        self.iterNum += 1
+        return self.population[0].fitness
+
+    def _iterate_vectorized(self, mutation_num, crossover_num, tp):
+        # The offspring of each operator are evaluated together, so they are all produced from the 
+        # population at the start of the operator.
         parent_list = self.tournament_selection(2 * crossover_num, 1.0)
-        for i, j in zip(parent_list[::2], parent_list[1::2]):
-            child_solution = self.crossover(self.population[i], self.population[j])
-            try:
-                tmp = self.func(child_solution, *self.args)
-            except IndexError:
-                continue
+        pairs = list(zip(parent_list[::2], parent_list[1::2]))
+        children = array([self.crossover(self.population[i], self.population[j]) 
+                          for i, j in pairs]).reshape(-1, self.M)
+        fitness = evaluate_population(self.func, children, self.args, True)
+        for (i, j), child_solution, tmp in zip(pairs, children, fitness):
             if tmp < self.population[i].fitness:
                 self.population[i].solution = child_solution.copy()
                 self.population[i].fitness = tmp
@@ -993,19 +1747,13 @@ class GA:
                 self.population[j].solution = child_solution.copy()
                 self.population[j].fitness = tmp
         parent_list = self.tournament_selection(mutation_num, tp)
-        for i in parent_list:
-            mutated_solution = self.mutate(self.population[i])
-            try:
-                tmp = self.func(mutated_solution, *self.args)
-            except IndexError:
-                continue
+        mutants = array([self.mutate(self.population[i]) 
+                         for i in parent_list]).reshape(-1, self.M)
+        fitness = evaluate_population(self.func, mutants, self.args, True)
+        for i, mutated_solution, tmp in zip(parent_list, mutants, fitness):
             if tmp < self.population[i].fitness:
                 self.population[i].solution = mutated_solution.copy()
                 self.population[i].fitness = tmp
-        
-        self.population = sorted(self.population, key=lambda solution:solution.fitness)
-        self.iterNum += 1
-        return self.population[0].fitness
 
 
 class gaussian_mf_learning:
@@ -1024,12 +1772,13 @@ class T1Fuzzy_ML_Model:
     P: Model parameters (a vector of size M * (2 * N + 1))
     mf: List of membership functions for each input in each rule
     c: Output scaling factor
+
+    The d0 function accepts a single input vector of size N, or an 
+    (n_samples, N) shaped matrix of inputs, which is evaluated at once.
     """
     def __init__(self, P, N, M, mf, c=1.0):
         self.p = reshape(P[:-M], (M, N, 2, ))
-        for i in range(M):
-            for j in range(N):
-                self.p[i][j][1] = abs(self.p[i][j][1])
+        self.p[:, :, 1] = abs(self.p[:, :, 1])
 
         self.q = P[-M:]
         self.N = N
@@ -1037,17 +1786,26 @@ class T1Fuzzy_ML_Model:
         self.mf = mf
         self.c = c
     
-    def d0(self, d0x):
-        s = 1.
-        d = 0.
-        n = 0.
+    def activations(self, X):
+        """
+        Firing strengths of the rules as a numpy (n_samples, M) shaped 
+        array, for an (n_samples, N) shaped matrix of inputs.
+        """
+        mf = self.mf[0][0]
+        if all(f is mf for row in self.mf for f in row):
+            # All the memberships are evaluated by one broadcast call.
+            return mf.d0(X[:, None, :], self.p[:, :, 0], self.p[:, :, 1]).prod(axis=2)
+        s = ones((len(X), self.M))
         for l in range(self.M):
-            s = 1.
             for i in range(self.N):
-                s *= self.mf[l][i].d0(d0x[i], self.p[l][i][0], self.p[l][i][1])
-            n += self.q[l] * s
-            d += s
-        return self.c * n / d
+                s[:, l] *= self.mf[l][i].d0(X[:, i], self.p[l][i][0], self.p[l][i][1])
+        return s
+
+    def d0(self, d0x):
+        d0x = asarray(d0x, dtype=float)
+        s = self.activations(d0x.reshape(-1, self.N))
+        o = self.c * (s @ self.q) / s.sum(axis=1)
+        return o if d0x.ndim == 2 else o[0]
     
     def d1(self, d0x, d1x):
         s1 = 0.
@@ -1105,8 +1863,11 @@ class T1Fuzzy_ML:
     algorithm : str
 
         Indicates the algorithm to be used for determining the model parameters. It should be one 
-        of the strings "DE", "Nelder-Mead", "Powell", "CG", "PSO", "GA", "GWO", "WOA", "FFA", "CSO", "ICA". 
-        The first four algorithms, which are based on scipy, are not computationally efficient. 
+        of the strings "DE", "Nelder-Mead", "Powell", "CG", "L-BFGS-B", "Adam", "PSO", "GA", "GWO", "WOA", 
+        "FFA", "CSO", "ICA". The "L-BFGS-B" and "Adam" algorithms use the analytic gradients of the 
+        error function. The parameters of "Adam" are [epochs, batch_size, learning_rate, beta1, beta2], 
+        where the last three are optional. The first four algorithms, which are based on scipy, are 
+        not computationally efficient. 
         So, we have provided embedded GA and PSO algorithms for calculating model parameters by 
         optimizing an error function. The users can write their own heuristic optimization solvers as 
         a subclass of Optimizer class.
@@ -1121,6 +1882,12 @@ class T1Fuzzy_ML:
 
         error : The error function utilized for parameter optimization of the model.
 
+        error_batch : The error function for a population of parameter vectors at once, which is used by 
+        the built-in population based optimizers.
+
+        error_gradient : The error function and its analytic gradient, which are used by the gradient 
+        based algorithms.
+
         fit : Fits the model based on the given input output data.
 
         score : Evaluates the model for desired input data.
@@ -1159,12 +1926,101 @@ class T1Fuzzy_ML:
         """
         model = T1Fuzzy_ML_Model(P, self.N, self.M, 
                                  [[self.mf, ] * self.N, ] * self.M)
-        o = zeros_like(y)
-        for i, x in zip(range(len(y)), X):
-            o[i] = model.d0(x)
-        return norm(y - o)
+        y = asarray(y, dtype=float)
+        return norm(y - model.d0(asarray(X, dtype=float).reshape(-1, self.N)).reshape(y.shape))
+
+    def error_batch(self, Ps, X, y):
+        """
+        The error function for a population of parameter vectors, which evaluates the model of all 
+        the vectors for all the samples with broadcast calls.
+
+        .. rubric:: Parameters
+
+        Ps : numpy (n_solutions, n) shaped array
+
+            Each row provides a list of parameters which the model error would be evaluated based on it.
+
+        X : list of 1D numpy array or 2D numpy array
+
+            X is the set of data which the model error would be evaluated for them.
+        
+        y : list of float or numpy (n,) shaped array
+
+            y is the set of desired outputs which the model error would be evaluated based on them.
 
-    def fit(self, X, y):
+        .. rubric:: Returns
+
+        numpy (n_solutions,) shaped array:
+
+            The error of each parameter vector, as returned by the error function.
+        """
+        Ps = asarray(Ps, dtype=float).reshape(-1, self.paramNum)
+        X = asarray(X, dtype=float).reshape(-1, self.N)
+        y = asarray(y, dtype=float).ravel()
+        p = reshape(Ps[:, :-self.M], (len(Ps), self.M, self.N, 2, ))
+        q = Ps[:, -self.M:]
+        errors = zeros((len(Ps), ))
+        # The population is split into chunks, which bounds the memory used by the 
+        # (solutions, samples, rules, inputs) shaped arrays.
+        size = max(1, 2 ** 22 // max(1, len(X) * self.M * self.N))
+        for start in range(0, len(Ps), size):
+            stop = min(start + size, len(Ps))
+            s = self.mf.d0(X[None, :, None, :], p[start:stop, None, :, :, 0], 
+                           abs(p[start:stop, None, :, :, 1])).prod(axis=3)
+            o = (s @ q[start:stop, :, None])[..., 0] / s.sum(axis=2)
+            errors[start:stop] = norm(y - o, axis=1)
+        return errors
+
+    def error_gradient(self, P, X, y):
+        """
+        The error function and its analytic gradient with respect to the model parameters, which 
+        are used by the "L-BFGS-B" and "Adam" algorithms.
+
+        .. rubric:: Parameters
+
+        P : list of float or numpy (n,) shaped array
+
+            P provides the list of parameters which the model error would be evaluated based on it.
+
+        X : list of 1D numpy array or 2D numpy array
+
+            X is the set of data which the model error would be evaluated for them.
+        
+        y : list of float or numpy (n,) shaped array
+
+            y is the set of desired outputs which the model error would be evaluated based on them.
+
+        .. rubric:: Returns
+
+        tuple (float, numpy (n,) shaped array):
+
+            The error, as returned by the error function, and its gradient in the layout of P.
+        """
+        P = asarray(P, dtype=float)
+        X = asarray(X, dtype=float).reshape(-1, self.N)
+        y = asarray(y, dtype=float).ravel()
+        p = reshape(P[:-self.M], (self.M, self.N, 2, ))
+        q = P[-self.M:]
+        c = p[:, :, 0]
+        v = abs(p[:, :, 1])
+        D = X[:, None, :] - c
+        s = self.mf.d0(X[:, None, :], c, v).prod(axis=2)
+        w = s.sum(axis=1)
+        o = (s @ q) / w
+        r = y - o
+        error = norm(r)
+        if error == 0.:
+            return error, zeros_like(P)
+        # The derivative of the error with respect to the firing strength of each rule, which 
+        # is scaled by the derivatives of the Gaussian memberships.
+        a = - (r / (error * w))[:, None] * (q - o[:, None]) * s
+        gradient = zeros((self.M, self.N, 2, ))
+        gradient[:, :, 0] = npsum(a[:, :, None] * 2. * D / v ** 2, axis=0)
+        gradient[:, :, 1] = npsum(a[:, :, None] * 2. * D ** 2 / v ** 3, axis=0) * sign(p[:, :, 1])
+        gradient_q = - ((r / (error * w)) @ s)
+        return error, concatenate([gradient.ravel(), gradient_q])
+
+    def fit(self, X, y, workers=1, batch_size=None, refresh=10):
         """
         Function for finding the best set of parameters fitting the pair of input and output data.
 
@@ -1178,100 +2034,175 @@ class T1Fuzzy_ML:
 
             y is the set of desired outputs which the model error would be evaluated based on them.
 
+        workers : int
+
+            Number of the worker processes evaluating the candidate parameters in parallel. The data 
+            is sent to each worker once. It is used by the DE algorithm, the built-in population 
+            based optimizers, and the *Optimizer* subclasses, which are then given a vectorized 
+            objective function. The worker processes are shut down when the fitting ends.
+
+        batch_size : int
+
+            If given, the fitness of the candidate parameters is evaluated on a random batch of 
+            *batch_size* samples, which is drawn again at each generation, as in the *MiniBatchObjective* 
+            class. X and y can then be numpy memory-mapped arrays or the names of .npy files, which are 
+            streamed from the disk. It is supported by the built-in population based optimizers.
+
+        refresh : int
+
+            Number of the generations between the evaluations of the elite parameters on the whole 
+            data set, when *batch_size* is given. The best parameters on the whole data set are returned.
+
         """
         convergence = []
-        if self.algorithm == "DE":
-            self.params = differential_evolution(self.error, bounds=self.Bounds, 
-                                            args=(X, y), disp=True).x
-        elif self.algorithm == "Nelder-Mead":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, bounds=self.Bounds, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "Powell":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, bounds=self.Bounds, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "CG":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "PSO":
-            myPSO = PSO(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myPSO.iterate(self.algorithm_params[2], 
-                              self.algorithm_params[3], 
-                              self.algorithm_params[4]))
-                print(f"Iteration {i+1}", myPSO.fb)
-            self.params = myPSO.xb
-        elif self.algorithm == "GA":
-            myGA = GA(self.algorithm_params[0], self.paramNum, self.error, 
-                      self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myGA.iterate(self.algorithm_params[2], 
-                             self.algorithm_params[3], 
-                             self.algorithm_params[4], ))
-                print(f"Iteration {i+1}.", myGA.population[0].fitness)
-            self.params = myGA.population[0].solution
-        elif self.algorithm == "GWO":
-            myGWO = GWO(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myGWO.iterate(i, self.algorithm_params[1], ))
-                print("Iteration ", i+1, ".", myGWO.alpha_fitness)
-            self.params = myGWO.alpha
-        elif self.algorithm == "WOA":
-            myWOA = WOA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myWOA.iterate(i, self.algorithm_params[1], ))
-                print("Iteration ", i+1, ".", myWOA.best_fitness)
-            self.params = myWOA.best_whale
-        elif self.algorithm == "FFA":
-            myFFA = FFA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myFFA.iterate(self.algorithm_params[2], self.algorithm_params[3], self.algorithm_params[4]))
-                print("Iteration ", i+1, ".", myFFA.best_fitness)
-            self.params = myFFA.best_firefly
-        elif self.algorithm == "CSO":
-            myCSO = CuckooSearch(self.algorithm_params[0], self.paramNum, self.error, 
-                                 self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myCSO.iterate(self.algorithm_params[2], self.algorithm_params[3], ))
-                print("Iteration ", i+1, ".", myCSO.best_fitness)
-            self.params = myCSO.best_nest
-        elif self.algorithm == "ICA":
-            myICA = ICA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myICA.iterate(self.algorithm_params[2], self.algorithm_params[3]))
-                print("Iteration ", i+1, ".", myICA.best_fitness)
-            self.params = myICA.best_country
-        elif issubclass(self.algorithm, Optimizer):
-            myOpt = self.algorithm(self.algorithm_params[0], self.paramNum, self.error, 
-                                   self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myOpt.iterate(self.algorithm_params))
-                print("Iteration ", i+1, ".", myOpt.best_fitness)
-            self.params = myOpt.best_solution
-        else:
-            raise ValueError(self.algorithm + " algorithm is not supported!")
+        objective, args = self.error_batch, (X, y, )
+        if batch_size is not None:
+            if self.algorithm not in ["PSO", "GA", "GWO", "WOA", "FFA", "CSO", "ICA", ]:
+                raise ValueError("The mini-batch fitness is not supported by the " + str(self.algorithm) + 
+                                 " algorithm!")
+            objective = MiniBatchObjective(self.error_batch, X, y, batch_size, refresh, workers=workers)
+            args, workers = (), 1
+        elif self.algorithm in ["PSO", "GA", "GWO", "WOA", "FFA", "CSO", "ICA", ]:
+            # The worker processes are started once for all the generations.
+            (objective, args, _), workers = _parallelize(objective, args, True, workers), 1
+        try:
+            if self.algorithm == "DE":
+                self.params = differential_evolution(self.error, bounds=self.Bounds, 
+                                                args=(X, y), disp=True, workers=workers, 
+                                                updating="immediate" if workers == 1 else "deferred").x
+            elif self.algorithm == "Nelder-Mead":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, bounds=self.Bounds, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "Powell":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, bounds=self.Bounds, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "CG":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "L-BFGS-B":
+                self.params = minimize(self.error_gradient, self.params, args=(X, y), jac=True, 
+                                  method=self.algorithm, 
+                                  bounds=None if self.Bounds[0] is None else self.Bounds, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "Adam":
+                X = asarray(X, dtype=float).reshape(-1, self.N)
+                y = asarray(y, dtype=float).ravel()
+                batches = max(1, len(X) // self.algorithm_params[1])
+                myAdam = Adam(self.params, self.error_gradient, *self.algorithm_params[2:], 
+                              bounds=self.Bounds[0])
+                for i in range(self.algorithm_params[0]):
+                    for batch in array_split(permutation(len(X)), batches):
+                        myAdam.iterate(X[batch], y[batch])
+                    convergence.append(self.error(myAdam.params.copy(), X, y))
+                    print(f"Epoch {i+1}.", convergence[-1])
+                self.params = myAdam.params
+            elif self.algorithm == "PSO":
+                myPSO = PSO(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myPSO.iterate(self.algorithm_params[2], 
+                                  self.algorithm_params[3], 
+                                  self.algorithm_params[4]))
+                    print(f"Iteration {i+1}", myPSO.fb)
+                self.params = myPSO.xb
+            elif self.algorithm == "GA":
+                myGA = GA(self.algorithm_params[0], self.paramNum, objective, 
+                          self.Bounds[0], args=args, vectorized=True, 
+                          workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myGA.iterate(self.algorithm_params[2], 
+                                 self.algorithm_params[3], 
+                                 self.algorithm_params[4], ))
+                    print(f"Iteration {i+1}.", myGA.population[0].fitness)
+                self.params = myGA.population[0].solution
+            elif self.algorithm == "GWO":
+                myGWO = GWO(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myGWO.iterate(i, self.algorithm_params[1], ))
+                    print("Iteration ", i+1, ".", myGWO.alpha_fitness)
+                self.params = myGWO.alpha
+            elif self.algorithm == "WOA":
+                myWOA = WOA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myWOA.iterate(i, self.algorithm_params[1], ))
+                    print("Iteration ", i+1, ".", myWOA.best_fitness)
+                self.params = myWOA.best_whale
+            elif self.algorithm == "FFA":
+                myFFA = FFA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myFFA.iterate(self.algorithm_params[2], self.algorithm_params[3], self.algorithm_params[4]))
+                    print("Iteration ", i+1, ".", myFFA.best_fitness)
+                self.params = myFFA.best_firefly
+            elif self.algorithm == "CSO":
+                myCSO = CuckooSearch(self.algorithm_params[0], self.paramNum, objective, 
+                                     self.Bounds[0], args=args, vectorized=True, 
+                                     workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myCSO.iterate(self.algorithm_params[2], self.algorithm_params[3], ))
+                    print("Iteration ", i+1, ".", myCSO.best_fitness)
+                self.params = myCSO.best_nest
+            elif self.algorithm == "ICA":
+                myICA = ICA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myICA.iterate(self.algorithm_params[2], self.algorithm_params[3]))
+                    print("Iteration ", i+1, ".", myICA.best_fitness)
+                self.params = myICA.best_country
+            elif issubclass(self.algorithm, Optimizer):
+                # The candidates are evaluated by a pool of worker processes if workers > 1, which 
+                # needs an optimizer evaluating its population by the evaluate function.
+                objective, args, vectorized = _parallelize(self.error, (X, y, ), False, workers)
+                options = {"vectorized": True, } if vectorized else {}
+                myOpt = self.algorithm(self.algorithm_params[0], self.paramNum, objective, 
+                                       self.Bounds[0], args=args, **options)
+                for i in range(self.algorithm_params[1]):
+                    convergence.append(
+                    myOpt.iterate(self.algorithm_params))
+                    print("Iteration ", i+1, ".", myOpt.best_fitness)
+                self.params = myOpt.best_solution
+            else:
+                raise ValueError(self.algorithm + " algorithm is not supported!")
+            if batch_size is not None:
+                error = objective.full([self.params, ])[0]
+                if objective.update() < error:
+                    self.params, error = objective.best_solution, objective.best_fitness
+            else:
+                error = self.error(self.params, X, y)
+        finally:
+            if isinstance(objective, (ParallelObjective, MiniBatchObjective, )):
+                objective.close()
         
         self.model = T1Fuzzy_ML_Model(self.params, self.N, self.M, 
                                       [[self.mf, ] * self.N, ] * self.M)
         if len(convergence) > 0:
-            return self.error(self.params, X, y), convergence
+            return error, convergence
         else:
-            return self.error(self.params, X, y)
+            return error
 
     def score(self, X):
         """
@@ -1281,17 +2212,14 @@ class T1Fuzzy_ML:
 
         X : 
         
-            X is the set of data which the model would be evaluated for them.
+            X is the set of data which the model would be evaluated for them. A 1D 
+            array is a single input vector, and the rows of a 2D array are evaluated 
+            at once.
 
         """
         X = asarray(X)
-        if X.ndim == 1:
+        if X.ndim == 1 or X.ndim == 2:
             return self.model.d0(X)
-        elif X.ndim == 2:
-            o = []
-            for x in X:
-                o.append(self.model.d0(x))
-            return array(o)
         else:
             raise ValueError("Input must be a 1D or 2D NumPy array!")
 
@@ -1319,7 +2247,7 @@ class T1Mamdani_ML(T1Fuzzy_ML):
         
         algorithm : str
 
-            The optimization algorithm to be used for parameter learning. Supported algorithms include "DE", "Nelder-Mead", "Powell", "CG", "PSO", and "GA", "GWO", "WOA", "FFA", "CSO", "ICA". 
+            The optimization algorithm to be used for parameter learning. Supported algorithms include "DE", "Nelder-Mead", "Powell", "CG", "L-BFGS-B", "Adam", "PSO", and "GA", "GWO", "WOA", "FFA", "CSO", "ICA". 
         
         algorithm_params : list of numbers
 
@@ -1353,7 +2281,7 @@ class T1Mamdani_ML(T1Fuzzy_ML):
         
         algorithm : str
 
-            The optimization algorithm to be used for parameter learning. Supported algorithms include "DE", "Nelder-Mead", "Powell", "CG", "PSO", and "GA", "GWO", "WOA", "FFA", "CSO", "ICA". 
+            The optimization algorithm to be used for parameter learning. Supported algorithms include "DE", "Nelder-Mead", "Powell", "CG", "L-BFGS-B", "Adam", "PSO", and "GA", "GWO", "WOA", "FFA", "CSO", "ICA". 
         
         algorithm_params : list of numbers
 
@@ -1429,7 +2357,7 @@ class T1TSK_ML(T1Fuzzy_ML):
         algorithm : str
 
             The optimization algorithm to be used for parameter learning. Supported algorithms include 
-            "DE", "Nelder-Mead", "Powell", "CG", "PSO", "GA", "GWO", "WOA", "FFA", "CSO", and "ICA".
+            "DE", "Nelder-Mead", "Powell", "CG", "L-BFGS-B", "Adam", "PSO", "GA", "GWO", "WOA", "FFA", "CSO", and "ICA".
         
         algorithm_params : list of numbers
 
@@ -1463,7 +2391,7 @@ class T1TSK_ML(T1Fuzzy_ML):
         
         algorithm : str
 
-            The optimization algorithm to be used for parameter learning. Supported algorithms include "DE", "Nelder-Mead", "Powell", "CG", "PSO", "GA", "GWO", "WOA", "FFA", "CSO", and "ICA".
+            The optimization algorithm to be used for parameter learning. Supported algorithms include "DE", "Nelder-Mead", "Powell", "CG", "L-BFGS-B", "Adam", "PSO", "GA", "GWO", "WOA", "FFA", "CSO", and "ICA".
         
         algorithm_params : list of numbers
 
@@ -1906,6 +2834,9 @@ class IT2TSK_ML_Model:
     """Interval Type-2 TSK Model for representing and evaluating interval type-2 fuzzy TSK systems in machine learning applications.
 
         This class implements an interval type-2 fuzzy TSK model using Gaussian membership functions with uncertainty in either the mean or the standard deviation.
+        The model is kept as arrays of the antecedent and consequent parameters, and the firing intervals of all 
+        the rules are computed for all the samples at once. So, creating a model for each candidate parameter 
+        vector is cheap. The equivalent IT2TSK system is built only when the *it2tsk* attribute is used.
 
         .. rubric:: Parameters
             
@@ -1937,7 +2868,11 @@ class IT2TSK_ML_Model:
 
         __call__:
 
-            Evaluates the fuzzy system for a given input.
+            Evaluates the fuzzy system for a given input, or for a set of inputs.
+
+        firing:
+
+            Returns the lower and upper firing strengths of the rules for a set of inputs.
     """
     def __init__(self, P, N, M, it2fs, c=1.0):
         """
@@ -1967,63 +2902,112 @@ class IT2TSK_ML_Model:
         """
         self.N = N
         self.M = M
-        self.p = reshape(P[:-M], (M, N, 3, ))
-        for i in range(M):
-            for j in range(N):
-                self.p[i][j][1] = abs(self.p[i][j][1])
-                self.p[i][j][2] = abs(self.p[i][j][2])
+        P = asarray(P, dtype=float)
+        self.p = reshape(P[:-M], (M, N, 3, )).copy()
+        self.p[:, :, 1:] = abs(self.p[:, :, 1:])
         self.q = P[-M:]
 
-        self.it2tsk = IT2TSK(product_t_norm, max_s_norm)
-        for i in range(N):
-            self.it2tsk.add_input_variable(f"X{i + 1}")
-        self.it2tsk.add_output_variable("Y")
-
         self.it2fs = it2fs
         self.c = c
-        
-        for i in range(M):
-            antecedent = []
-            consequentDict = {"const":self.q[i], }
-            for j in range(N):
-                if it2fs == IT2FS_Gaussian_UncertMean:
-                    std = max(self.p[i][j][1], self.p[i][j][2])
-                elif it2fs == IT2FS_Gaussian_UncertStd:
-                    std = self.p[i][j][1]
-                else:
-                    raise ValueError("You can use only IT2FS_Gaussian_UncertMean or IT2FS_Gaussian_UncertStd!")
-                
-                domain = linspace(self.p[i][j][0] - 5. * std, # 5 x std before mean
-                                  self.p[i][j][0] + 5. * std, # 5 x std after mean
-                                  max(100, int(10. * std * 10))) # 10 points for each unit
-                antecedent.append((f"X{j + 1}", 
-                                   it2fs(domain, params=[self.p[i][j][0], 
-                                                         self.p[i][j][1], 
-                                                         self.p[i][j][2], 
-                                                         1.0]), ), )
-                consequentDict[f"X{j + 1}"] = 0.
-            
-            consequent = [("Y", consequentDict)]
-            self.it2tsk.add_rule(antecedent, consequent)
+        self.__it2tsk = None
+
+        # The parameters of the upper and lower membership functions, as they are set by the 
+        # IT2FS_Gaussian_UncertMean and IT2FS_Gaussian_UncertStd functions.
+        if it2fs == IT2FS_Gaussian_UncertMean:
+            self.umf, self.lmf = gauss_uncert_mean_umf, gauss_uncert_mean_lmf
+            self.mf_params = [self.p[:, :, 0] - self.p[:, :, 1] / 2., 
+                              self.p[:, :, 0] + self.p[:, :, 1] / 2., 
+                              self.p[:, :, 2], 1.0]
+        elif it2fs == IT2FS_Gaussian_UncertStd:
+            self.umf, self.lmf = gauss_uncert_std_umf, gauss_uncert_std_lmf
+            self.mf_params = [self.p[:, :, 0], 
+                              self.p[:, :, 1] - self.p[:, :, 2] / 2, 
+                              self.p[:, :, 1] + self.p[:, :, 2] / 2, 1.0]
+        else:
+            raise ValueError("You can use only IT2FS_Gaussian_UncertMean or IT2FS_Gaussian_UncertStd!")
+
+    @property
+    def it2tsk(self):
+        """The IT2TSK system equivalent to the model, which is built on the first use."""
+        if self.__it2tsk is None:
+            self.__it2tsk = IT2TSK(product_t_norm, max_s_norm)
+            for i in range(self.N):
+                self.__it2tsk.add_input_variable(f"X{i + 1}")
+            self.__it2tsk.add_output_variable("Y")
+            for i in range(self.M):
+                antecedent = []
+                consequentDict = {"const":self.q[i], }
+                for j in range(self.N):
+                    if self.it2fs == IT2FS_Gaussian_UncertMean:
+                        std = max(self.p[i][j][1], self.p[i][j][2])
+                    else:
+                        std = self.p[i][j][1]
+                    domain = linspace(self.p[i][j][0] - 5. * std, # 5 x std before mean
+                                      self.p[i][j][0] + 5. * std, # 5 x std after mean
+                                      max(100, int(10. * std * 10))) # 10 points for each unit
+                    antecedent.append((f"X{j + 1}", 
+                                       self.it2fs(domain, params=[self.p[i][j][0], 
+                                                                  self.p[i][j][1], 
+                                                                  self.p[i][j][2], 
+                                                                  1.0]), ), )
+                    consequentDict[f"X{j + 1}"] = 0.
+                consequent = [("Y", consequentDict)]
+                self.__it2tsk.add_rule(antecedent, consequent)
+        return self.__it2tsk
+
+    def firing(self, X):
+        """
+        Returns the lower and upper firing strengths of the rules, which are calculated by the product t-norm.
+
+        .. rubric:: Parameters
+
+        X : numpy (n_samples, N) shaped array
+
+            The input data, one sample per row.
+
+        .. rubric:: Returns
+
+        tuple (l, u):
+
+            Two numpy (n_samples, M) shaped arrays of the lower and upper firing strengths.
+        """
+        X = asarray(X, dtype=precisions[get_precision()])[:, None, :]
+        U = self.umf(X, self.mf_params)
+        L = self.lmf(X, self.mf_params)
+        u = ones(U.shape[:2], dtype=X.dtype)
+        l = ones(L.shape[:2], dtype=X.dtype)
+        for j in range(self.N):
+            u = u * U[:, :, j]
+            l = l * L[:, :, j]
+        return l, u
 
     def __call__(self, X):
         """
-        Evaluates the fuzzy system for a given input.
+        Evaluates the fuzzy system for a given input, or for a set of inputs.
 
         .. rubric:: Parameters
 
         X : numpy array
 
-            The input data for which the fuzzy system will be evaluated.
+            The input data for which the fuzzy system will be evaluated. A 1D array is a single input 
+            vector, and the rows of a 2D array are evaluated at once.
 
         .. rubric:: Returns
 
-        float:
+        float or numpy (n_samples,) shaped array:
 
             The output of the fuzzy system for the given input.
         """
-        _X = {f"X{i + 1}":X[i] for i in range(self.N)}
-        return self.it2tsk.evaluate(_X)["Y"]
+        X = asarray(X, dtype=float)
+        l, u = self.firing(X.reshape(-1, self.N))
+        intervals = ones(l.shape + (4, ), dtype=l.dtype)
+        intervals[:, :, 0] = self.q
+        intervals[:, :, 1] = self.q
+        intervals[:, :, 2] = l
+        intervals[:, :, 3] = u
+        tr = algorithm_function("EIASC", batch=True)(intervals)
+        o = (tr[:, 0] + tr[:, 1]) / 2
+        return o[0] if X.ndim == 1 else o
 
 
 class IT2TSK_ML:
@@ -2073,6 +3057,11 @@ class IT2TSK_ML:
 
             The error function used for optimizing the model parameters.
 
+        error_batch:
+
+            The error function for a population of parameter vectors, used by the built-in population 
+            based optimizers.
+
         fit:
 
             Fits the model to the given input-output data.
@@ -2151,12 +3140,44 @@ class IT2TSK_ML:
             The desired outputs for which the model error will be evaluated.
         """
         model = IT2TSK_ML_Model(P, self.N, self.M, self.it2fs, self.c)
-        o = zeros_like(y)
-        for i, x in zip(range(len(y)), X):
-            o[i] = model(x)
-        return norm(y - o)
+        y = asarray(y, dtype=float)
+        return norm(y - model(asarray(X, dtype=float).reshape(-1, self.N)).reshape(y.shape))
+
+    def error_batch(self, Ps, X, y):
+        """
+        The error function for a population of parameter vectors, as used by the built-in population 
+        based optimizers.
+
+        .. rubric:: Parameters
+
+        Ps : numpy (n_solutions, n) shaped array
+
+            Each row is a list of parameters for which the model error will be evaluated.
+
+        X : list of 1D numpy arrays or 2D numpy array
 
-    def fit(self, X, y):
+            The input data for which the model error will be evaluated.
+        
+        y : list of float or numpy (n,) shaped array
+
+            The desired outputs for which the model error will be evaluated.
+
+        .. rubric:: Returns
+
+        numpy (n_solutions,) shaped array:
+
+            The error of each parameter vector. The vectors for which the model can not be evaluated 
+            get an infinite error.
+        """
+        errors = zeros((len(Ps), ))
+        for i, P in enumerate(Ps):
+            try:
+                errors[i] = self.error(P, X, y)
+            except IndexError:
+                errors[i] = float("inf")
+        return errors
+
+    def fit(self, X, y, workers=1, batch_size=None, refresh=10):
         """
         Fits the model to the given input-output data.
 
@@ -2169,99 +3190,157 @@ class IT2TSK_ML:
         y : list of float or numpy (n,) shaped array
 
             The desired outputs for training the model.
+
+        workers : int
+
+            Number of the worker processes evaluating the candidate parameters in parallel. The data 
+            is sent to each worker once. It is used by the DE algorithm, the built-in population 
+            based optimizers, and the *Optimizer* subclasses, which are then given a vectorized 
+            objective function. The worker processes are shut down when the fitting ends.
+
+        batch_size : int
+
+            If given, the fitness of the candidate parameters is evaluated on a random batch of 
+            *batch_size* samples, which is drawn again at each generation, as in the *MiniBatchObjective* 
+            class. X and y can then be numpy memory-mapped arrays or the names of .npy files, which are 
+            streamed from the disk. It is supported by the built-in population based optimizers.
+
+        refresh : int
+
+            Number of the generations between the evaluations of the elite parameters on the whole 
+            data set, when *batch_size* is given. The best parameters on the whole data set are returned.
         """
         convergence = []
-        if self.algorithm == "DE":
-            self.params = differential_evolution(self.error, bounds=self.Bounds, 
-                                            args=(X, y), disp=True).x
-        elif self.algorithm == "Nelder-Mead":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, bounds=self.Bounds, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "Powell":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, bounds=self.Bounds, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "CG":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "PSO":
-            myPSO = PSO(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myPSO.iterate(self.algorithm_params[2], 
-                              self.algorithm_params[3], 
-                              self.algorithm_params[4]))
-                print(f"Iteration {i+1}", myPSO.fb)
-            self.params = myPSO.xb
-        elif self.algorithm == "GA":
-            myGA = GA(self.algorithm_params[0], self.paramNum, self.error, 
-                      self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myGA.iterate(self.algorithm_params[2], 
-                             self.algorithm_params[3], 
-                             self.algorithm_params[4], ))
-                print(f"Iteration {i+1}.", myGA.population[0].fitness)
-            self.params = myGA.population[0].solution
-        elif self.algorithm == "GWO":
-            myGWO = GWO(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myGWO.iterate(i, self.algorithm_params[1], ))
-                print("Iteration ", i+1, ".", myGWO.alpha_fitness)
-            self.params = myGWO.alpha
-        elif self.algorithm == "WOA":
-            myWOA = WOA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myWOA.iterate(i, self.algorithm_params[1], ))
-                print("Iteration ", i+1, ".", myWOA.best_fitness)
-            self.params = myWOA.best_whale
-        elif self.algorithm == "FFA":
-            myFFA = FFA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myFFA.iterate(self.algorithm_params[2], self.algorithm_params[3], self.algorithm_params[4]))
-                print("Iteration ", i+1, ".", myFFA.best_fitness)
-            self.params = myFFA.best_firefly
-        elif self.algorithm == "CSO":
-            myCSO = CuckooSearch(self.algorithm_params[0], self.paramNum, self.error, 
-                                 self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myCSO.iterate(self.algorithm_params[2], self.algorithm_params[3], ))
-                print("Iteration ", i+1, ".", myCSO.best_fitness)
-            self.params = myCSO.best_nest
-        elif self.algorithm == "ICA":
-            myICA = ICA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myICA.iterate(self.algorithm_params[2], self.algorithm_params[3]))
-                print("Iteration ", i+1, ".", myICA.best_fitness)
-            self.params = myICA.best_country
-        elif issubclass(self.algorithm, Optimizer):
-            myOpt = self.algorithm(self.algorithm_params[0], self.paramNum, self.error, 
-                                   self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myOpt.iterate(self.algorithm_params))
-                print("Iteration ", i+1, ".", myOpt.best_fitness)
-            self.params = myOpt.best_solution
-        else:
-            raise ValueError(self.algorithm + " algorithm is not supported!")
+        objective, args = self.error_batch, (X, y, )
+        if batch_size is not None:
+            if self.algorithm not in ["PSO", "GA", "GWO", "WOA", "FFA", "CSO", "ICA", ]:
+                raise ValueError("The mini-batch fitness is not supported by the " + str(self.algorithm) + 
+                                 " algorithm!")
+            objective = MiniBatchObjective(self.error_batch, X, y, batch_size, refresh, workers=workers)
+            args, workers = (), 1
+        elif self.algorithm in ["PSO", "GA", "GWO", "WOA", "FFA", "CSO", "ICA", ]:
+            # The worker processes are started once for all the generations.
+            (objective, args, _), workers = _parallelize(objective, args, True, workers), 1
+        try:
+            if self.algorithm == "DE":
+                self.params = differential_evolution(self.error, bounds=self.Bounds, 
+                                                args=(X, y), disp=True, workers=workers, 
+                                                updating="immediate" if workers == 1 else "deferred").x
+            elif self.algorithm == "Nelder-Mead":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, bounds=self.Bounds, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "Powell":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, bounds=self.Bounds, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "CG":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "PSO":
+                myPSO = PSO(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myPSO.iterate(self.algorithm_params[2], 
+                                  self.algorithm_params[3], 
+                                  self.algorithm_params[4]))
+                    print(f"Iteration {i+1}", myPSO.fb)
+                self.params = myPSO.xb
+            elif self.algorithm == "GA":
+                myGA = GA(self.algorithm_params[0], self.paramNum, objective, 
+                          self.Bounds[0], args=args, vectorized=True, 
+                          workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myGA.iterate(self.algorithm_params[2], 
+                                 self.algorithm_params[3], 
+                                 self.algorithm_params[4], ))
+                    print(f"Iteration {i+1}.", myGA.population[0].fitness)
+                self.params = myGA.population[0].solution
+            elif self.algorithm == "GWO":
+                myGWO = GWO(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myGWO.iterate(i, self.algorithm_params[1], ))
+                    print("Iteration ", i+1, ".", myGWO.alpha_fitness)
+                self.params = myGWO.alpha
+            elif self.algorithm == "WOA":
+                myWOA = WOA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myWOA.iterate(i, self.algorithm_params[1], ))
+                    print("Iteration ", i+1, ".", myWOA.best_fitness)
+                self.params = myWOA.best_whale
+            elif self.algorithm == "FFA":
+                myFFA = FFA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myFFA.iterate(self.algorithm_params[2], self.algorithm_params[3], self.algorithm_params[4]))
+                    print("Iteration ", i+1, ".", myFFA.best_fitness)
+                self.params = myFFA.best_firefly
+            elif self.algorithm == "CSO":
+                myCSO = CuckooSearch(self.algorithm_params[0], self.paramNum, objective, 
+                                     self.Bounds[0], args=args, vectorized=True, 
+                                     workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myCSO.iterate(self.algorithm_params[2], self.algorithm_params[3], ))
+                    print("Iteration ", i+1, ".", myCSO.best_fitness)
+                self.params = myCSO.best_nest
+            elif self.algorithm == "ICA":
+                myICA = ICA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myICA.iterate(self.algorithm_params[2], self.algorithm_params[3]))
+                    print("Iteration ", i+1, ".", myICA.best_fitness)
+                self.params = myICA.best_country
+            elif issubclass(self.algorithm, Optimizer):
+                # The candidates are evaluated by a pool of worker processes if workers > 1, which 
+                # needs an optimizer evaluating its population by the evaluate function.
+                objective, args, vectorized = _parallelize(self.error, (X, y, ), False, workers)
+                options = {"vectorized": True, } if vectorized else {}
+                myOpt = self.algorithm(self.algorithm_params[0], self.paramNum, objective, 
+                                       self.Bounds[0], args=args, **options)
+                for i in range(self.algorithm_params[1]):
+                    convergence.append(
+                    myOpt.iterate(self.algorithm_params))
+                    print("Iteration ", i+1, ".", myOpt.best_fitness)
+                self.params = myOpt.best_solution
+            else:
+                raise ValueError(self.algorithm + " algorithm is not supported!")
+            if batch_size is not None:
+                error = objective.full([self.params, ])[0]
+                if objective.update() < error:
+                    self.params, error = objective.best_solution, objective.best_fitness
+            else:
+                error = self.error(self.params, X, y)
+        finally:
+            if isinstance(objective, (ParallelObjective, MiniBatchObjective, )):
+                objective.close()
         
         self.model = IT2TSK_ML_Model(self.params, self.N, self.M, self.it2fs, self.c)
         if len(convergence) > 0:
-            return self.error(self.params, X, y), convergence
+            return error, convergence
         else:
-            return self.error(self.params, X, y)
+            return error
 
     def score(self, X):
         """
@@ -2274,13 +3353,8 @@ class IT2TSK_ML:
             The input data for which the model will be evaluated.
         """
         X = asarray(X)
-        if X.ndim == 1:
+        if X.ndim == 1 or X.ndim == 2:
             return self.model(X)
-        elif X.ndim == 2:
-            o = []
-            for x in X:
-                o.append(self.model(x))
-            return array(o)
         else:
             raise ValueError("Input must be a 1D or 2D NumPy array!")
 
@@ -2473,6 +3547,11 @@ class IT2Mamdani_ML:
 
             The error function used for optimizing the model parameters.
 
+        error_batch:
+
+            The error function for a population of parameter vectors, used by the built-in population 
+            based optimizers.
+
         fit:
 
             Fits the model to the given input-output data.
@@ -2560,7 +3639,42 @@ class IT2Mamdani_ML:
         return norm(y - o)
     
 
-    def fit(self, X, y):
+    def error_batch(self, Ps, X, y):
+        """
+        The error function for a population of parameter vectors, as used by the built-in population 
+        based optimizers.
+
+        .. rubric:: Parameters
+
+        Ps : numpy (n_solutions, n) shaped array
+
+            Each row is a list of parameters for which the model error will be evaluated.
+
+        X : list of 1D numpy arrays or 2D numpy array
+
+            The input data for which the model error will be evaluated.
+        
+        y : list of float or numpy (n,) shaped array
+
+            The desired outputs for which the model error will be evaluated.
+
+        .. rubric:: Returns
+
+        numpy (n_solutions,) shaped array:
+
+            The error of each parameter vector. The vectors for which the model can not be evaluated 
+            get an infinite error.
+        """
+        errors = zeros((len(Ps), ))
+        for i, P in enumerate(Ps):
+            try:
+                # The model is built from a copy, so the rows of Ps are not changed.
+                errors[i] = self.error(array(P, dtype=float), X, y)
+            except IndexError:
+                errors[i] = float("inf")
+        return errors
+
+    def fit(self, X, y, workers=1, batch_size=None, refresh=10):
         """
         Fits the model to the given input-output data using the selected optimization algorithm.
 
@@ -2574,6 +3688,25 @@ class IT2Mamdani_ML:
 
             The desired outputs for training the model.
 
+        workers : int
+
+            Number of the worker processes evaluating the candidate parameters in parallel. The data 
+            is sent to each worker once. It is used by the DE algorithm, the built-in population 
+            based optimizers, and the *Optimizer* subclasses, which are then given a vectorized 
+            objective function. The worker processes are shut down when the fitting ends.
+
+        batch_size : int
+
+            If given, the fitness of the candidate parameters is evaluated on a random batch of 
+            *batch_size* samples, which is drawn again at each generation, as in the *MiniBatchObjective* 
+            class. X and y can then be numpy memory-mapped arrays or the names of .npy files, which are 
+            streamed from the disk. It is supported by the built-in population based optimizers.
+
+        refresh : int
+
+            Number of the generations between the evaluations of the elite parameters on the whole 
+            data set, when *batch_size* is given. The best parameters on the whole data set are returned.
+
         .. rubric:: Returns
 
         float or tuple:
@@ -2581,97 +3714,136 @@ class IT2Mamdani_ML:
             The final error value after optimization, and optionally the convergence history.
         """
         convergence = []
-        if self.algorithm == "DE":
-            self.params = differential_evolution(self.error, bounds=self.Bounds, 
-                                            args=(X, y), disp=True).x
-        elif self.algorithm == "Nelder-Mead":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, bounds=self.Bounds, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "Powell":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, bounds=self.Bounds, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "CG":
-            self.params = minimize(self.error, self.params, args=(X, y), 
-                              method=self.algorithm, 
-                              options={"disp":True, }).x
-        elif self.algorithm == "PSO":
-            myPSO = PSO(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myPSO.iterate(self.algorithm_params[2], 
-                              self.algorithm_params[3], 
-                              self.algorithm_params[4]))
-                print(f"Iteration {i+1}", myPSO.fb)
-            self.params = myPSO.xb
-        elif self.algorithm == "GA":
-            myGA = GA(self.algorithm_params[0], self.paramNum, self.error, 
-                      self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myGA.iterate(self.algorithm_params[2], 
-                             self.algorithm_params[3], 
-                             self.algorithm_params[4], ))
-                print(f"Iteration {i+1}.", myGA.population[0].fitness)
-            self.params = myGA.population[0].solution
-        elif self.algorithm == "GWO":
-            myGWO = GWO(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myGWO.iterate(i, self.algorithm_params[1], ))
-                print("Iteration ", i+1, ".", myGWO.alpha_fitness)
-            self.params = myGWO.alpha
-        elif self.algorithm == "WOA":
-            myWOA = WOA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myWOA.iterate(i, self.algorithm_params[1], ))
-                print("Iteration ", i+1, ".", myWOA.best_fitness)
-            self.params = myWOA.best_whale
-        elif self.algorithm == "FFA":
-            myFFA = FFA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myFFA.iterate(self.algorithm_params[2], self.algorithm_params[3], self.algorithm_params[4]))
-                print("Iteration ", i+1, ".", myFFA.best_fitness)
-            self.params = myFFA.best_firefly
-        elif self.algorithm == "CSO":
-            myCSO = CuckooSearch(self.algorithm_params[0], self.paramNum, self.error, 
-                                 self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myCSO.iterate(self.algorithm_params[2], self.algorithm_params[3], ))
-                print("Iteration ", i+1, ".", myCSO.best_fitness)
-            self.params = myCSO.best_nest
-        elif self.algorithm == "ICA":
-            myICA = ICA(self.algorithm_params[0], self.paramNum, self.error, 
-                        self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myICA.iterate(self.algorithm_params[2], self.algorithm_params[3]))
-                print("Iteration ", i+1, ".", myICA.best_fitness)
-            self.params = myICA.best_country
-        elif issubclass(self.algorithm, Optimizer):
-            myOpt = self.algorithm(self.algorithm_params[0], self.paramNum, self.error, 
-                                   self.Bounds[0], args=(X, y, ))
-            for i in range(self.algorithm_params[1]):
-                convergence.append(
-                myOpt.iterate(self.algorithm_params))
-                print("Iteration ", i+1, ".", myOpt.best_fitness)
-            self.params = myOpt.best_solution
-        else:
-            raise ValueError(self.algorithm + " algorithm is not supported!")
+        objective, args = self.error_batch, (X, y, )
+        if batch_size is not None:
+            if self.algorithm not in ["PSO", "GA", "GWO", "WOA", "FFA", "CSO", "ICA", ]:
+                raise ValueError("The mini-batch fitness is not supported by the " + str(self.algorithm) + 
+                                 " algorithm!")
+            objective = MiniBatchObjective(self.error_batch, X, y, batch_size, refresh, workers=workers)
+            args, workers = (), 1
+        elif self.algorithm in ["PSO", "GA", "GWO", "WOA", "FFA", "CSO", "ICA", ]:
+            # The worker processes are started once for all the generations.
+            (objective, args, _), workers = _parallelize(objective, args, True, workers), 1
+        try:
+            if self.algorithm == "DE":
+                self.params = differential_evolution(self.error, bounds=self.Bounds, 
+                                                args=(X, y), disp=True, workers=workers, 
+                                                updating="immediate" if workers == 1 else "deferred").x
+            elif self.algorithm == "Nelder-Mead":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, bounds=self.Bounds, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "Powell":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, bounds=self.Bounds, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "CG":
+                self.params = minimize(self.error, self.params, args=(X, y), 
+                                  method=self.algorithm, 
+                                  options={"disp":True, }).x
+            elif self.algorithm == "PSO":
+                myPSO = PSO(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myPSO.iterate(self.algorithm_params[2], 
+                                  self.algorithm_params[3], 
+                                  self.algorithm_params[4]))
+                    print(f"Iteration {i+1}", myPSO.fb)
+                self.params = myPSO.xb
+            elif self.algorithm == "GA":
+                myGA = GA(self.algorithm_params[0], self.paramNum, objective, 
+                          self.Bounds[0], args=args, vectorized=True, 
+                          workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myGA.iterate(self.algorithm_params[2], 
+                                 self.algorithm_params[3], 
+                                 self.algorithm_params[4], ))
+                    print(f"Iteration {i+1}.", myGA.population[0].fitness)
+                self.params = myGA.population[0].solution
+            elif self.algorithm == "GWO":
+                myGWO = GWO(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myGWO.iterate(i, self.algorithm_params[1], ))
+                    print("Iteration ", i+1, ".", myGWO.alpha_fitness)
+                self.params = myGWO.alpha
+            elif self.algorithm == "WOA":
+                myWOA = WOA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myWOA.iterate(i, self.algorithm_params[1], ))
+                    print("Iteration ", i+1, ".", myWOA.best_fitness)
+                self.params = myWOA.best_whale
+            elif self.algorithm == "FFA":
+                myFFA = FFA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myFFA.iterate(self.algorithm_params[2], self.algorithm_params[3], self.algorithm_params[4]))
+                    print("Iteration ", i+1, ".", myFFA.best_fitness)
+                self.params = myFFA.best_firefly
+            elif self.algorithm == "CSO":
+                myCSO = CuckooSearch(self.algorithm_params[0], self.paramNum, objective, 
+                                     self.Bounds[0], args=args, vectorized=True, 
+                                     workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myCSO.iterate(self.algorithm_params[2], self.algorithm_params[3], ))
+                    print("Iteration ", i+1, ".", myCSO.best_fitness)
+                self.params = myCSO.best_nest
+            elif self.algorithm == "ICA":
+                myICA = ICA(self.algorithm_params[0], self.paramNum, objective, 
+                            self.Bounds[0], args=args, vectorized=True, 
+                            workers=workers)
+                for i in range(self.algorithm_params[1]):
+                    _next_generation(objective)
+                    convergence.append(
+                    myICA.iterate(self.algorithm_params[2], self.algorithm_params[3]))
+                    print("Iteration ", i+1, ".", myICA.best_fitness)
+                self.params = myICA.best_country
+            elif issubclass(self.algorithm, Optimizer):
+                # The candidates are evaluated by a pool of worker processes if workers > 1, which 
+                # needs an optimizer evaluating its population by the evaluate function.
+                objective, args, vectorized = _parallelize(self.error, (X, y, ), False, workers)
+                options = {"vectorized": True, } if vectorized else {}
+                myOpt = self.algorithm(self.algorithm_params[0], self.paramNum, objective, 
+                                       self.Bounds[0], args=args, **options)
+                for i in range(self.algorithm_params[1]):
+                    convergence.append(
+                    myOpt.iterate(self.algorithm_params))
+                    print("Iteration ", i+1, ".", myOpt.best_fitness)
+                self.params = myOpt.best_solution
+            else:
+                raise ValueError(self.algorithm + " algorithm is not supported!")
+            if batch_size is not None:
+                error = objective.full([self.params, ])[0]
+                if objective.update() < error:
+                    self.params, error = objective.best_solution, objective.best_fitness
+            else:
+                error = self.error(self.params, X, y)
+        finally:
+            if isinstance(objective, (ParallelObjective, MiniBatchObjective, )):
+                objective.close()
         
         self.model = IT2Mamdani_ML_Model(self.params, self.N, self.M, self.it2fs, self.c)
         if len(convergence) > 0:
-            return self.error(self.params, X, y), convergence
+            return error, convergence
         else:
-            return self.error(self.params, X, y)
+            return error
     
 
     def score(self, X):
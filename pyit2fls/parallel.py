@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Multi-process chunked evaluation of the fuzzy logic systems.
+"""
+
+from numpy import (asarray, concatenate, ndarray, )
+from concurrent.futures import (ProcessPoolExecutor, )
+from os import (cpu_count, )
+
+
+# The system evaluated by a worker process, which is set once by the
+# initializer of the pool.
+_worker_state = None
+
+
+def _initialize_worker(system, function, args, kwargs):
+    global _worker_state
+    _worker_state = (getattr(system, function), args, kwargs)
+
+
+def _evaluate_chunk(chunk):
+    function, args, kwargs = _worker_state
+    return function(chunk, *args, **kwargs)
+
+
+def _size(inputs):
+    if isinstance(inputs, dict):
+        return len(next(iter(inputs.values()), []))
+    return len(inputs)
+
+
+def _chunks(inputs, chunk_size):
+    for start in range(0, _size(inputs), chunk_size):
+        if isinstance(inputs, dict):
+            yield {key: asarray(value)[start:start + chunk_size]
+                   for key, value in inputs.items()}
+        else:
+            yield inputs[start:start + chunk_size]
+
+
+def _join(outputs):
+    first = outputs[0]
+    if isinstance(first, ndarray):
+        return concatenate(outputs)
+    elif isinstance(first, tuple):
+        return tuple(_join([output[i] for output in outputs])
+                     for i in range(len(first)))
+    elif isinstance(first, dict):
+        return {key: _join([output[key] for output in outputs])
+                for key in first.keys()}
+    elif isinstance(first, list):
+        return [item for output in outputs for item in output]
+    else:
+        raise ValueError("The outputs of type " + type(first).__name__ +
+                         " can not be joined.")
+
+
+class ParallelEvaluator:
+    """
+    Evaluates a fuzzy logic system for large batches of crisp inputs using
+    a pool of worker processes. The inputs are split into chunks of
+    samples, which are evaluated by the batch evaluation function of the
+    system, and the outputs are joined in the order of the samples. The
+    system is shipped to each worker once, when the pool is started, and
+    the pool is kept until the close function is called, so it can be
+    reused for several batches.
+
+    .. rubric:: Parameters
+
+    system : IT2FLS, IT2TSK, IT2Mamdani, or any object with a batch evaluation function
+
+        The fuzzy logic system to be evaluated.
+
+    function="evaluate_batch" : str
+
+        Name of the function of the system which is called for each chunk.
+        Its first argument must be the chunk of inputs, given as a numpy
+        (n_samples, n_inputs) shaped array, or as a dictionary of input
+        columns for the evaluate_list function of the IT2FLS. Its outputs
+        must be numpy arrays, or tuples, dictionaries, or lists of them.
+
+    args=() : tuple
+
+        Other positional arguments of the function.
+
+    kwargs=None : dict
+
+        Keyword arguments of the function.
+
+    workers=None : int
+
+        Number of the worker processes. If not given, the number of the
+        CPUs is used.
+
+    chunk_size=4096 : int
+
+        Number of samples which are sent to a worker at a time.
+
+    min_size=None : int
+
+        The inputs with at most min_size samples are evaluated serially
+        in the current process. If not given, the chunk_size is used.
+
+    .. rubric:: Functions
+
+    __call__:
+
+        Evaluates the system for a batch of inputs.
+
+    close:
+
+        Shuts the pool of worker processes down.
+
+    .. rubric:: Examples
+
+    >>> with ParallelEvaluator(myIT2FLS, "evaluate_batch",
+    >>>                        (min_t_norm, max_s_norm, domain), workers=8) as evaluator:
+    >>>     y, l, r = evaluator(random.rand(1000000, 2))
+    """
+    def __init__(self, system, function="evaluate_batch", args=(), kwargs=None,
+                 workers=None, chunk_size=4096, min_size=None):
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be a positive integer.")
+        self.system = system
+        self.function = function
+        self.args = tuple(args)
+        self.kwargs = {} if kwargs is None else dict(kwargs)
+        self.workers = (cpu_count() or 1) if workers is None else workers
+        self.chunk_size = chunk_size
+        self.min_size = chunk_size if min_size is None else min_size
+        self.__executor = None
+        if not callable(getattr(system, function, None)):
+            raise ValueError("The system has no " + function + " function.")
+        # The rule base is compiled before shipping the system, so the
+        # workers do not compile it again.
+        if callable(getattr(system, "compile", None)):
+            system.compile()
+
+    def __repr__(self):
+        return "Parallel evaluator with " + str(self.workers) + " workers!"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __call__(self, inputs):
+        """
+        Evaluates the system for a batch of crisp inputs.
+
+        .. rubric:: Parameters
+
+        inputs : numpy (n_samples, n_inputs) shaped array or dictionary
+
+            Crisp value of the inputs, as expected by the function of the
+            system.
+
+        .. rubric:: Returns
+
+        output :
+
+            The output of the function of the system for all the samples.
+        """
+        if self.workers <= 1 or _size(inputs) <= self.min_size:
+            return getattr(self.system, self.function)(inputs, *self.args, **self.kwargs)
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                  initializer=_initialize_worker,
+                                                  initargs=(self.system, self.function,
+                                                            self.args, self.kwargs))
+        return _join(list(self.__executor.map(_evaluate_chunk,
+                                              _chunks(inputs, self.chunk_size))))
+
+    def close(self):
+        """
+        Shuts the pool of worker processes down. The pool is started again
+        by the next call of a large batch.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+
+def parallel_evaluate(system, inputs, function="evaluate_batch", args=(), kwargs=None,
+                      workers=None, chunk_size=4096, min_size=None):
+    """
+    Evaluates a fuzzy logic system for a large batch of crisp inputs using
+    a pool of worker processes, which is closed after the evaluation. The
+    ParallelEvaluator class must be used for keeping the pool between the
+    batches.
+
+    .. rubric:: Parameters
+
+    system : IT2FLS, IT2TSK, IT2Mamdani, or any object with a batch evaluation function
+
+        The fuzzy logic system to be evaluated.
+
+    inputs : numpy (n_samples, n_inputs) shaped array or dictionary
+
+        Crisp value of the inputs, as expected by the function of the system.
+
+    function="evaluate_batch" : str
+
+        Name of the function of the system which is called for each chunk.
+
+    args=() : tuple
+
+        Other positional arguments of the function.
+
+    kwargs=None : dict
+
+        Keyword arguments of the function.
+
+    workers=None : int
+
+        Number of the worker processes. If not given, the number of the
+        CPUs is used.
+
+    chunk_size=4096 : int
+
+        Number of samples which are sent to a worker at a time.
+
+    min_size=None : int
+
+        The inputs with at most min_size samples are evaluated serially.
+        If not given, the chunk_size is used.
+
+    .. rubric:: Returns
+
+    output :
+
+        The output of the function of the system for all the samples.
+
+    .. rubric:: Examples
+
+    >>> it2out, tr = parallel_evaluate(myIT2FLS, {"x1":x1, "x2":x2}, "evaluate_list",
+    >>>                                (min_t_norm, max_s_norm, domain))
+    >>> y1 = crisp_list(tr, "y1")
+    """
+    with ParallelEvaluator(system, function, args, kwargs,
+                           workers, chunk_size, min_size) as evaluator:
+        return evaluator(inputs)
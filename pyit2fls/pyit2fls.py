@@ -1,6 +1,9 @@
 from numpy import (exp, ones_like, zeros_like, arange, multiply, 
-     subtract, add, minimum, maximum, sign, c_, argmax, 
-     array, where, hstack, logical_not, sqrt, clip, )
+     subtract, add, minimum, maximum, c_, argmax, 
+     array, where, logical_not, sqrt, clip, 
+     ones, full, asarray, nan, shape, zeros, take_along_axis, ndarray, interp, 
+     concatenate, cumsum, inf, argsort, errstate, linspace, isnan, 
+     flatnonzero, moveaxis, float32, float64, )
 
 from numpy import sum as npsum
 from numpy import abs as npabs
@@ -12,14 +15,23 @@ except ImportError:
     from scipy.integrate import trapezoid as trapz
 
 import matplotlib.pyplot as plt
-from math import isclose
+from math import (isclose, erfc, pi, )
+from math import exp as mexp
+from math import sqrt as msqrt
+from bisect import (bisect_left, )
+from functools import (reduce, )
 
 try:
     import typereduction
     isThereTypereduction = True
-except:
+except (ImportError, OSError):
     isThereTypereduction = False
 
+_backend = "c" if isThereTypereduction else "python"
+
+precisions = {"float64": float64, "float32": float32, }
+_precision = float64
+
 
 def zero_mf(x, params=[]):
     """
@@ -707,6 +719,217 @@ def gbell_mf(x, params):
     return params[3] / (1 + npabs((x - params[2]) / params[0]) ** (2 * params[1]))
 
 
+def _ordered(*values):
+    return all(a <= b for a, b in zip(values[:-1], values[1:]))
+
+
+# Closed intervals out of which the membership functions are zero, as
+# functions of their parameters. The user defined membership functions
+# with compact supports are added by the register_mf function.
+mf_supports = {
+    singleton_mf: lambda params: (params[0], params[0]),
+    tri_mf: lambda params: (params[0], params[2])
+        if _ordered(params[0], params[1], params[2]) else None,
+    rtri_mf: lambda params: (-inf, params[0])
+        if _ordered(params[1], params[0]) else None,
+    ltri_mf: lambda params: (params[0], inf)
+        if _ordered(params[0], params[1]) else None,
+    trapezoid_mf: lambda params: (params[0], params[3])
+        if _ordered(params[0], params[1], params[2], params[3]) else None,
+    elliptic_mf: lambda params: (params[0] - abs(params[1]), params[0] + abs(params[1])),
+    semi_elliptic_mf: lambda params: (params[0] - abs(params[1]), params[0] + abs(params[1])),
+}
+
+
+def mf_support(mf, params):
+    """
+    Returns the support of a membership function, which is the closed
+    interval out of which the function is zero.
+
+    .. rubric:: Parameters
+
+    mf : function
+
+        The membership function.
+
+    params : List
+
+        Parameters of the membership function.
+
+    .. rubric:: Returns
+
+    output : tuple (low, high) or None
+
+        The ends of the support, which can be infinite. None shows that
+        the support is unknown or unbounded, e.g., for the Gaussian
+        membership functions.
+
+    .. rubric:: Examples
+
+    >>> mf_support(tri_mf, [0.1, 0.3, 0.5, 1.])
+    (0.1, 0.5)
+    """
+    support = mf_supports.get(mf)
+    if support is None:
+        return None
+    support = support(params)
+    if support is None or not support[0] <= support[1]:
+        return None
+    return float(support[0]), float(support[1])
+
+
+def _tri_mf(x, params):
+    # The degenerate sides are handled row by row, as the branches of tri_mf.
+    flat_left = params[0] == params[1]
+    flat_right = params[1] == params[2]
+    left = params[3] * (x - params[0]) / where(flat_left, 1., params[1] - params[0])
+    right = params[3] * ((params[2] - x) / where(flat_right, 1., params[2] - params[1]))
+    return minimum(1, maximum(0, where(x <= params[1], where(flat_left, 0., left), 
+                                       where(flat_right, 0., right))))
+
+
+# Vectorized implementations of the membership functions, which take a list
+# of parameter arrays broadcast against x instead of a list of numbers. The
+# built-in functions with no branches on their parameters are their own 
+# vectorized implementations.
+vectorized_mfs = {
+    zero_mf: zero_mf,
+    singleton_mf: singleton_mf,
+    const_mf: const_mf,
+    tri_mf: _tri_mf,
+    rtri_mf: rtri_mf,
+    ltri_mf: ltri_mf,
+    trapezoid_mf: trapezoid_mf,
+    gaussian_mf: gaussian_mf,
+    rgaussian_mf: rgaussian_mf,
+    lgaussian_mf: lgaussian_mf,
+    gauss_uncert_mean_umf: gauss_uncert_mean_umf,
+    gauss_uncert_mean_lmf: gauss_uncert_mean_lmf,
+    gauss_uncert_std_umf: gauss_uncert_std_umf,
+    gauss_uncert_std_lmf: gauss_uncert_std_lmf,
+    rgauss_uncert_std_umf: rgauss_uncert_std_umf,
+    rgauss_uncert_std_lmf: rgauss_uncert_std_lmf,
+    lgauss_uncert_std_umf: lgauss_uncert_std_umf,
+    lgauss_uncert_std_lmf: lgauss_uncert_std_lmf,
+    elliptic_mf: elliptic_mf,
+    semi_elliptic_mf: semi_elliptic_mf,
+    gbell_mf: gbell_mf,
+}
+
+
+def register_mf(mf, vectorized=None, support=None):
+    """
+    Registers a user defined membership function, so it is evaluated for 
+    many parameter sets in one call by the evaluate_mf function and the 
+    compiled rule bases.
+
+    .. rubric:: Parameters
+
+    mf : function
+
+        The membership function, called as mf(x, params).
+
+    vectorized=None : function
+
+        Vectorized implementation of the membership function, called as 
+        vectorized(x, params), where params is a list of numpy arrays 
+        which broadcast against x. If not given, the membership function 
+        itself must work with such parameters.
+
+    support=None : function
+
+        Returns the (low, high) interval out of which the membership 
+        function is zero for a list of parameters, or None if it is not 
+        bounded. It is used for finding the rules which can fire.
+
+    .. rubric:: Examples
+
+    >>> def cos_mf(x, params):
+    >>>     return params[1] * (npabs(x - params[0]) < pi / 2) * cos(x - params[0])
+    >>> register_mf(cos_mf, support=lambda params: (params[0] - pi / 2, params[0] + pi / 2))
+    """
+    vectorized_mfs[mf] = mf if vectorized is None else vectorized
+    if support is not None:
+        mf_supports[mf] = support
+
+
+def _stack_params(params_list):
+    # The parameter lists of different lengths are padded with nan.
+    width = max([len(params) for params in params_list], default=0)
+    output = full((len(params_list), width), nan)
+    for i, params in enumerate(params_list):
+        output[i, :len(params)] = params
+    return output
+
+
+def evaluate_mf(mf, x, params, aligned=False):
+    """
+    Evaluates a membership function for k parameter sets in one call, by 
+    its vectorized implementation. The membership functions which are not 
+    registered are called once for each parameter set.
+
+    .. rubric:: Parameters
+
+    mf : function
+
+        The membership function, e.g., gaussian_mf.
+
+    x : float or numpy array
+
+        Points at which the membership function is evaluated.
+
+    params : numpy (k, n_params) shaped array or List of k lists
+
+        The parameter sets, one per row. The shorter lists are padded 
+        with nan.
+
+    aligned=False : bool
+
+        If False, each parameter set is evaluated at all the points of x. 
+        If True, x must be a (k, ...) shaped array, and each parameter set 
+        is evaluated at its own row of x.
+
+    .. rubric:: Returns
+
+    output : numpy array
+
+        Membership values of (k, ) + x.shape shape, or x.shape if aligned 
+        is True.
+
+    .. rubric:: Examples
+
+    >>> x = linspace(0., 1., 101)
+    >>> values = evaluate_mf(gaussian_mf, x, [[0.2, 0.1, 1.], [0.8, 0.1, 1.]])
+    >>> values.shape
+    (2, 101)
+    """
+    if not isinstance(params, ndarray):
+        params = _stack_params(params)
+    params = asarray(params, dtype=_precision)
+    x = asarray(x, dtype=_precision)
+    if params.ndim != 2:
+        raise ValueError("The parameters must be a (k, n_params) shaped array.")
+    if aligned:
+        if x.ndim == 0 or x.shape[0] != params.shape[0]:
+            raise ValueError("The points must be a (" + str(params.shape[0]) + 
+                             ", ...) shaped array.")
+        output_shape = x.shape
+    else:
+        output_shape = (params.shape[0], ) + x.shape
+    vectorized = vectorized_mfs.get(mf)
+    if vectorized is None:
+        points = x if aligned else [x, ] * params.shape[0]
+        return array([mf(point, list(row)) * ones(shape(point)) 
+                      for point, row in zip(points, params)], 
+                     dtype=_precision).reshape(output_shape)
+    column_shape = (params.shape[0], ) + (1, ) * (len(output_shape) - 1)
+    output = asarray(vectorized(x, [params[:, i].reshape(column_shape) 
+                                    for i in range(params.shape[1])]), dtype=_precision)
+    if output.shape != output_shape:
+        output = output * ones(output_shape, dtype=_precision)
+    return output
+
+
 class T1FS:
     """ Type 1 Fuzzy Set (T1FS).
        
@@ -730,6 +953,8 @@ class T1FS:
 
             plot : Plots the T1FS.
 
+            sample : Returns the cached membership values on the domain.
+
             defuzzify : Defuzzifies the set.
 
             negation operator - : Returns the negated T1FS.
@@ -744,6 +969,7 @@ class T1FS:
         self.domain = domain
         self.mf = mf
         self.params = params
+        self.__sampled = None
     
     def repr(self):
         return "Type 1 fuzzy set with " + self.mf.__name__ + " as membership function " + \
@@ -768,33 +994,144 @@ class T1FS:
         mf = lambda x, params: subtract(1, self.mf(x, params))
         return T1FS(self.domain, mf, params=self.params)
 
+    def sample(self):
+        """
+        Returns the membership values of the T1FS on its domain. The values 
+        are computed once, and reused until the domain, the membership 
+        function, or the parameters of the set are changed.
+        
+        .. rubric:: Returns
+        
+        output : numpy (n,) shaped array
+        
+        .. rubric:: Notes
+        
+        The sets whose membership function depends on other sets, like the 
+        outputs of T1FS_AND and T1FS_OR, are not sampled again if the other 
+        sets are changed.
+        """
+        return self.__defuzzification()[0]
+
+    def __defuzzification(self):
+        params = tuple(self.params)
+        if self.__sampled is None or self.__sampled[0] is not self.domain or \
+           self.__sampled[1] is not self.mf or self.__sampled[2] != params or \
+           self.__sampled[3].dtype != _precision:
+            self.__sampled = (self.domain, self.mf, params, 
+                              asarray(self.mf(self.domain, self.params) * 
+                                      ones_like(self.domain, dtype=float), dtype=_precision), 
+                              None)
+        if self.__sampled[4] is None:
+            values = self.__closed_form()
+            if values is None:
+                values = self.__sampled_defuzzification(self.__sampled[3])
+            self.__sampled = self.__sampled[:4] + (values, )
+        return self.__sampled[3:]
+
+    def __closed_form(self):
+        # The exact results for the triangular, trapezoidal, and Gaussian 
+        # sets lying in the domain, or None for the other sets.
+        low, high = self.domain[0], self.domain[-1]
+        if self.mf is tri_mf:
+            a, b, c, h = self.params[:4]
+            if not (low <= a <= b <= c <= high and a < c and 0. < h <= 1.):
+                return None
+            d = c
+            c = b
+        elif self.mf is trapezoid_mf:
+            a, b, c, d, h = self.params[:5]
+            if not (low <= a < b <= c < d <= high and 0. < h <= 1.):
+                return None
+        elif self.mf is gaussian_mf:
+            m, s, h = self.params[:3]
+            if not (s != 0. and h > 0. and low <= m - 6. * abs(s) and m + 6. * abs(s) <= high):
+                return None
+            return {"CoG": m, "Bisector": m, "MoM": m, "SoM": m, "LoM": m, "Height": h, }
+        else:
+            return None
+        # The set is a trapezoid (a triangle when b == c) with the corners 
+        # a, b, c, and d, and the height h.
+        left = h * (b - a) / 2.
+        core = h * (c - b)
+        right = h * (d - c) / 2.
+        half = (left + core + right) / 2.
+        if half <= left:
+            bisector = a + sqrt(2. * half * (b - a) / h)
+        elif half <= left + core:
+            bisector = b + (half - left) / h
+        else:
+            bisector = d - sqrt(2. * half * (d - c) / h)
+        return {"CoG": ((c ** 2 + c * d + d ** 2) - (a ** 2 + a * b + b ** 2)) / 
+                       (3. * (c + d - a - b)), 
+                "Bisector": bisector, 
+                "MoM": (b + c) / 2., "SoM": b, "LoM": c, "Height": h, }
+
+    def __sampled_defuzzification(self, y):
+        x = self.domain
+        areas = cumsum((y[1:] + y[:-1]) * (x[1:] - x[:-1]) / 2.)
+        height = y.max()
+        maxima = x[y == height]
+        with errstate(divide="ignore", invalid="ignore"):
+            centroid = trapz(x * y, x) / areas[-1]
+        # The sets with nan membership values have no maxima, and their 
+        # maxima based results are nan, as the other results.
+        if len(maxima) == 0:
+            maxima = array([nan, ])
+        return {"CoG": centroid, 
+                "Bisector": interp(areas[-1] / 2., concatenate([[0.], areas]), x), 
+                "MoM": maxima.mean(), "SoM": maxima[0], "LoM": maxima[-1], 
+                "Height": height, }
+
     def _CoG(self):
-        int1 = trapz(self.domain * self(self.domain), self.domain)
-        int2 = trapz(self(self.domain), self.domain)
-        return int1 / int2
+        return self.__defuzzification()[1]["CoG"]
 
     def defuzzify(self, method="CoG"):
         """
-        Defuzzifies the type 1 fuzzy set.
+        Defuzzifies the type 1 fuzzy set. The membership function is 
+        evaluated once on the domain, and all the methods are calculated 
+        from the same cached values. For the triangular, trapezoidal, and 
+        Gaussian sets lying in the domain, the exact results are returned.
 
         .. rubric:: Parameters
         
-        method : str
+        method : str or List of str
 
-            Must be one of the methods listed below:
+            Must be one of the methods listed below, or a list of them:
             
             1. CoG: Center of gravity
+            
+            2. Bisector: The point dividing the area under the set into two equal parts
+            
+            3. MoM: Mean of the maxima
+            
+            4. SoM: Smallest of the maxima
+            
+            5. LoM: Largest of the maxima
+            
+            6. Height: Height of the set
         
         .. rubric:: Returns
         
-        output : float
+        output : float or dictionary
+        
+        Defuzzified crisp output, or a dictionary with the method names as 
+        keys if a list of the methods is given.
         
-        Defuzzified crisp output.
+        .. rubric:: Examples
+        
+        >>> mySet = T1FS(linspace(0., 1., 100), 
+                         trapezoid_mf, [0, 0.4, 0.6, 1., 1.])
+        >>> print(mySet.defuzzify(["CoG", "Bisector", "MoM"]))
         """
-        if method == "CoG":
-            return self._CoG()
-        else:
-            raise ValueError("The method" + method + " is not implemented yet!")
+        values = self.__defuzzification()[1]
+        if isinstance(method, str):
+            if method not in values:
+                raise ValueError("The method" + method + " is not implemented yet!")
+            return values[method]
+        for name in method:
+            if name not in values:
+                raise ValueError("The method" + name + " is not implemented yet!")
+        return {name: values[name] for name in method}
 
     def plot(self, title=None, legends=None, filename=None, 
              ext="pdf", grid=True, xlabel="Domain", 
@@ -1047,2069 +1384,2859 @@ def T1FS_OR(domain, t1fs1, t1fs2, s_norm):
     return T1FS(domain, mf)
 
 
-class T1Mamdani:
+class ActiveRuleIndex:
     """
-    Type 1 Mamdani Fuzzy Logic System.
+    Interval index of the rules which can fire for a crisp input.
+
+    An antecedent statement whose membership function has a compact support
+    is zero out of an interval of its input variable, and so is the firing
+    strength of its rule. The ends of these intervals split each input
+    variable into slots, which are the breakpoints and the open gaps between
+    them, and the rules allowed by the statements in each slot are stored
+    as a boolean mask. The candidate rules for an input vector are found by
+    a binary search for each input variable, and the AND of the masks.
 
     .. rubric:: Parameters
-    
-    Parameters of the constructor function:
 
-    engine="Product": str
+    size : int
 
-        Inference engine of the type 1 Mamdani fuzzy logic system. 
-        This parameters is a string an can be one of the following items: 
-        Product, Minimum, Lukasiewicz, Zadeh, and Dienes-Rescher.
-    
-    defuzzification="CoG": str
+        Number of the rules.
 
-        Defuzzification method of the system. When Lukasiewicz, Zadeh, and Dienes-Rescher 
-        inference engines are selected, the defuzzification method is center of the 
-        gravity by default. But for Product and Minimum inference engines, defuzzification 
-        can be selected among the methods CoG and CoA.
+    statements : List of tuples (rule, input, low, high)
 
-    .. rubric:: Members
-    
-    inputs : list of str
+        The supports of the antecedent statements, given by the index of
+        the rule, the index of the input variable, and the closed interval
+        out of which the statement is zero.
 
-        List of the inputs names as strings.
-    
-    outputs : list of str
+    .. rubric:: Members
 
-        List of the outputs names as strings.
+    inputs : List of int
 
-    rules : list of tuples (antacedent, consequent)
+        Indices of the input variables having at least one statement.
 
-        List of rules, which each rule is defined as a tuple (antecedent, consequent).
-        Both antacedent and consequent are lists of tuples. Each tuple 
-        of this list represents the assignement of a variable to a T1FS. 
-        The first element of the tuple must be the variable name (input or output) 
-        as a string, and the second element must be a T1FS.
+    breakpoints : List of lists
 
-    engine : str
+        Sorted ends of the supports on each of these input variables.
 
-        Indicates the engine selected by the user.
-    
-    defuzzification : str
+    masks : List of numpy (2 * k + 1, r) shaped arrays
 
-        Indicates the defuzzification method selected by the user.
+        Rules allowed in each slot of each of these input variables. The
+        slot 2 * i + 1 is the i-th breakpoint, and the even slots are the
+        gaps before, between, and after the breakpoints.
 
     .. rubric:: Functions
-    
-    add_input_variable:
-        
-        Adds an input variable to the inputs list of the T1FLS.
-    
-    add_output_variable:
-        
-        Adds an output variable to the outputs list of the T1FLS.
-    
-    add_rule:
-        
-        Adds a rule to the rules list of the T1FLS.
-    
-    copy:
-        
-        Returns a copy of the type 1 Mamdani fuzzy logic system.
-    
-    evaluate:
-        
-        Evaluates the T1 Mamdani FLS's output for the specified crisp input.
-        The only input of the evaluate function is a dictionary in which the 
-        keys are input variable names as strings and the values are the crisp 
-        value of inputs to be evaluated.
-        The output of the evaluate function depends on the method selected 
-        while constructing the class. For more information, please refer to 
-        the examples.
-    """
-    def __init__(self, engine="Product", defuzzification="CoG"):
-        self.inputs = []
-        self.outputs = []
-        self.rules = []
-        self.engine = engine
-        if engine == "Product":
-            self.evaluate = self._product_evaluate
-            self.defuzzification = defuzzification
-        elif engine == "Minimum":
-            self.evaluate = self._minimum_evaluate
-            self.defuzzification = defuzzification
-        elif engine == "Lukasiewicz":
-            self.evaluate = self._lukasiewicz_evaluate
-        elif engine == "Zadeh":
-            self.evaluate = self._zadeh_evaluate
-        elif engine == "Dienes-Rescher":
-            self.evaluate = self._dienes_rescher_evaluate
-        else:
-            raise ValueError("The " + engine + " fuzzy inference engine is not implemented yet!")
-    
-    def __repr__(self):
-        return "Type 1 Mamadani fuzzy logic system with " + self.engine + " inference engine" + \
-            "and " + self.defuzzification + " defuzzification!"
 
-    def copy(self):
-        o = T1Mamdani(self.engine, self.defuzzification)
-        o.inputs = self.inputs.copy()
-        o.outputs = self.outputs.copy()
-        o.rules = self.rules.copy()
-        return o
-    
-    def add_input_variable(self, name):
-        """
-        Adds a new input variable by name.
-        
-        .. rubric:: Parameters
-        
-        name : str
-            
-            Name of the new input variable as a string.
-        """
-        self.inputs.append(name)
-    
-    def add_output_variable(self, name):
-        """
-        Adds a new output variable by name.
-        
-        .. rubric:: Parameters
+    active:
 
-        name : str
-            
-            Name of the new output variable as a string.
-        """
-        self.outputs.append(name)
+        Returns the candidate rules for a crisp input vector.
 
-    def add_rule(self, antecedent, consequent):
+    .. rubric:: Examples
+
+    >>> index = ActiveRuleIndex(3, [(0, 0, 0., 1.), (1, 0, 1., 2.), (2, 0, 2., 3.)])
+    >>> index.active([0.5])
+    array([ True, False, False])
+    """
+    def __init__(self, size, statements):
+        self.size = size
+        statements = [(r, j, low, high) for r, j, low, high in statements
+                      if low > -inf or high < inf]
+        self.inputs = sorted(set(j for r, j, low, high in statements))
+        self.breakpoints = []
+        self.masks = []
+        for j in self.inputs:
+            items = [(r, low, high) for r, k, low, high in statements if k == j]
+            points = array(sorted(set(value for r, low, high in items
+                                      for value in (low, high) if -inf < value < inf)))
+            # A point of each slot, which is tested against the supports.
+            centers = zeros((2 * len(points) + 1, ))
+            centers[1::2] = points
+            centers[2:-1:2] = (points[1:] + points[:-1]) / 2.
+            centers[0] = points[0] - 1.
+            centers[-1] = points[-1] + 1.
+            rules = array([r for r, low, high in items], dtype=int)
+            low = array([low for r, low, high in items], dtype=float)
+            high = array([high for r, low, high in items], dtype=float)
+            outside = (centers[:, None] < low) | (high < centers[:, None])
+            count = zeros((self.size, len(centers)), dtype=int)
+            add.at(count, rules, outside.T.astype(int))
+            self.breakpoints.append(points.tolist())
+            self.masks.append((count == 0).T.copy())
+
+    def __repr__(self):
+        return "Active rule index of " + str(self.size) + " rules on " + \
+               str(len(self.inputs)) + " input variables"
+
+    def active(self, x):
         """
-        Adds a new rule to the rule base of the T1 Mamdani FLS.
-        
+        Returns the candidate rules for a crisp input vector.
+
         .. rubric:: Parameters
 
-        antecedent : list of tuples
-            
-            Antecedent is a list of tuples in which each tuple indicates 
-            assignment of a variable to a T1FS. The first element of the 
-            tuple must be the input variable name as a string, and the second 
-            element of the tuple must be a T1FS.
-            
-        consequent : list of tuples
-            
-            Consequent is a list of tuples in which each tuple indicates 
-            assignment of a variable to a T1FS. The first element of the 
-            tuple must be the output variable name as a string, and the second 
-            element of the tuple must be a T1FS.
-        """
-        self.rules.append((antecedent, consequent))
+        x : numpy (n,) shaped array
 
-    def _CoG(self, B):
-        C = {}
-        D = {}
-        for out in self.outputs:
-            C[out] = T1FS(B[out][0].domain)
-            for B_l in B[out]:
-                C[out] = T1FS_OR(B_l.domain, C[out], B_l, max_s_norm)
-            D[out] = C[out].defuzzify()
-        return C, D
+            Crisp value of the inputs, ordered as the input variables.
 
-    def _CoA(self, B):
-        D = {}
-        for out in self.outputs:
-            a = 0.
-            b = 0.
-            for B_l in B[out]:
-                tmp = B_l.defuzzify()
-                a += tmp * B_l(tmp)
-                b += B_l(tmp)
-            D[out] = a / b
-        return D
+        .. rubric:: Returns
 
-    def _product_evaluate(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            f = 1.
-            for input_statement in rule[0]:
-                f = f * input_statement[1].mf(inputs[input_statement[0]], input_statement[1].params)
-            for consequent in rule[1]:
-                B_l = T1FS_AND(consequent[1].domain, 
-                               T1FS(consequent[1].domain, const_mf, [f]), 
-                               consequent[1], product_t_norm)
-                B[consequent[0]].append(B_l)
-        if self.defuzzification == "CoG":
-            return self._CoG(B)
-        elif self.defuzzification == "CoA":
-            return self._CoA(B)
-        else:
-            raise ValueError("The " + self.defuzzification + \
-                " defuzzification method is not implemented yet!")
+        output : numpy (r,) shaped array of bool or None
 
-    def _minimum_evaluate(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            f = 1.
-            for input_statement in rule[0]:
-                f = min_t_norm(f, input_statement[1].mf(inputs[input_statement[0]], input_statement[1].params))
-            for consequent in rule[1]:
-                B_l = T1FS_AND(consequent[1].domain, 
-                               T1FS(consequent[1].domain, const_mf, [f]), 
-                               consequent[1], min_t_norm)
-                B[consequent[0]].append(B_l)
-        if self.defuzzification == "CoG":
-            return self._CoG(B)
-        elif self.defuzzification == "CoA":
-            return self._CoA(B)
+            True for the rules which can fire. None shows that no input
+            variable narrows the rules, or an input is nan.
+        """
+        mask = None
+        for j, points, masks in zip(self.inputs, self.breakpoints, self.masks):
+            value = x[j]
+            if value != value:
+                return None
+            i = bisect_left(points, value)
+            slot = 2 * i + 1 if i < len(points) and points[i] == value else 2 * i
+            mask = masks[slot] if mask is None else mask & masks[slot]
+        return mask
+
+
+def _evaluate_terms(output, X, terms):
+    # Sets output[t] to the values of the (t, input, mf, params) terms at 
+    # their input variables, with one call for all the terms sharing a 
+    # membership function which has a vectorized implementation. For a 
+    # single sample, a few terms are evaluated faster one by one, since 
+    # the NumPy calls on small arrays cost more than the work they do.
+    groups = {}
+    for t, j, mf, params in terms:
+        if mf in vectorized_mfs:
+            groups.setdefault(mf, []).append((t, j, params))
         else:
-            raise ValueError("The " + self.defuzzification + \
-                " defuzzification method is not implemented yet!")
+            output[t] = mf(X[..., j], params)
+    for mf, group in groups.items():
+        if X.ndim == 1 and len(group) < 8:
+            for t, j, params in group:
+                output[t] = mf(X[j], params)
+            continue
+        x = moveaxis(X[..., [j for t, j, params in group]], -1, 0)
+        columns = _stack_params([params for t, j, params in group]).T.astype(X.dtype)
+        columns = columns.reshape((len(columns), len(group)) + (1, ) * (X.ndim - 1))
+        output[[t for t, j, params in group]] = vectorized_mfs[mf](x, list(columns))
+
+
+def _support_statements(terms, antecedents):
+    # The supports of the antecedent statements of the rules, for the
+    # (input, mf, params) tuples of the terms, and the terms used for them.
+    statements = []
+    bounded = []
+    for t, (j, mf, params) in enumerate(terms):
+        support = mf_support(mf, params)
+        if support is not None:
+            bounded.append(t)
+            for r in flatnonzero((antecedents == t).any(axis=1)):
+                statements.append((r, j, support[0], support[1]))
+    return statements, bounded
+
+
+class T1RuleBase:
+    """
+    Compiled, array-backed form of a type 1 rule base.
+
+    The T1RuleBase freezes the (antecedent, consequent) rules list of a 
+    type 1 FLS into dense NumPy arrays, so that the firing strengths of 
+    all the rules are computed with a few vectorized calls, for one or 
+    many samples. Each distinct antecedent term (an input variable paired 
+    with a T1FS) is evaluated only once, no matter how many rules share it,
+    and the terms sharing a membership function are evaluated together by
+    one call of its vectorized implementation (see evaluate_mf).
 
-    def _lukasiewicz_evaluate(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            f = 1.
-            for input_statement in rule[0]:
-                f = min_t_norm(f, input_statement[1].mf(inputs[input_statement[0]], input_statement[1].params))
-            for consequent in rule[1]:
-                mf = lambda x, params: 1. - f + consequent[1].mf(x, consequent[1].params)
-                B_l = T1FS(consequent[1].domain, mf)
-                B[consequent[0]].append(B_l)
-        C = {}
-        D = {}
-        for out in self.outputs:
-            C[out] = T1FS(B[out][0].domain, const_mf, [1])
-            for B_l in B[out]:
-                C[out] = T1FS_AND(B_l.domain, C[out], B_l, min_t_norm)
-            D[out] = C[out].defuzzify()
-        return C, D
+    .. rubric:: Parameters
 
-    def _zadeh_evaluate(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            f = 1.
-            for input_statement in rule[0]:
-                f = min_t_norm(f, input_statement[1].mf(inputs[input_statement[0]], input_statement[1].params))
-            for consequent in rule[1]:
-                mf = lambda x, params: min_t_norm(f, consequent[1].mf(x, consequent[1].params))
-                B_l = T1FS_OR(consequent[1].domain, 
-                              T1FS(consequent[1].domain, const_mf, [1 - f]), 
-                              T1FS(consequent[1].domain, mf), 
-                              max_s_norm)
-                B[consequent[0]].append(B_l)
-        C = {}
-        D = {}
-        for out in self.outputs:
-            C[out] = T1FS(B[out][0].domain, const_mf, [1])
-            for B_l in B[out]:
-                C[out] = T1FS_AND(B_l.domain, C[out], B_l, min_t_norm)
-            D[out] = C[out].defuzzify()
-        return C, D
+    Parameters of the constructor function:
 
-    def _dienes_rescher_evaluate(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            f = 1.
-            for input_statement in rule[0]:
-                f = min_t_norm(f, input_statement[1].mf(inputs[input_statement[0]], input_statement[1].params))
-            for consequent in rule[1]:
-                B_l = T1FS_OR(consequent[1].domain, 
-                              T1FS(consequent[1].domain, const_mf, [1 - f]), 
-                              consequent[1], max_s_norm)
-                B[consequent[0]].append(B_l)
-        C = {}
-        D = {}
-        for out in self.outputs:
-            C[out] = T1FS(B[out][0].domain, const_mf, [1])
-            for B_l in B[out]:
-                C[out] = T1FS_AND(B_l.domain, C[out], B_l, min_t_norm)
-            D[out] = C[out].defuzzify()
-        return C, D
+    inputs : List of str
 
+        List of the inputs name as str.
 
-class T1TSK:
-    """
-    Type 1 TSK Fuzzy Logic System.
+    outputs : List of str
 
-    .. rubric:: Parameters
-    
-    Parameters of the constructor function:
+        List of the outputs name as str.
 
-    The constructor function of the T1TSK class has no parameters.
+    rules : List of tuples (antecedent, consequent)
+
+        The rule base to be compiled, in the same format used by T1Mamdani 
+        and T1TSK. Consequents can be T1FSs (Mamdani) or any other object, 
+        like the consequent functions of T1TSK.
 
     .. rubric:: Members
-    
-    inputs : list of str
 
-        List of the inputs names as str.
-    
-    outputs : list of str
+    terms : List of tuples (int, T1FS)
 
-        List of the outputs names as str.
+        Distinct antecedent terms of the rule base. Each term is a tuple
+        of the input variable index and the T1FS assigned to it.
 
-    rules : list of tuples (antacedent, consequent)
+    antecedents : numpy (r, w) shaped array
+
+        Term indices of the antecedent statements of each rule, where w 
+        is the largest number of the statements in a rule. The value -1 
+        fills the rest of the rows.
+
+    used_inputs : numpy (n,) shaped array
+
+        Shows which input variables are used by the rules.
+
+    consequent_terms : dictionary
+
+        The keys are output variable names and the values are lists of
+        the distinct consequents assigned to each output.
+
+    consequent_index : numpy (r, m) shaped array
+
+        Rule by output matrix of indices into the consequent_terms list of
+        each output. The value -1 shows that the output variable is not
+        used in the consequent of the rule.
 
-        List of rules, which each rule is defined as a 
-        tuple (antecedent, consequent)
-        
     .. rubric:: Functions
-    
-    add_input_variable:
-        
-        Adds an input variable to the inputs list of the T1 TSK FLS.
-    
-    add_output_variable:
-        
-        Adds an output variable to the outputs list of the T1 TSK FLS.
-    
-    add_rule:
-        
-        Adds a rule to the rules list of the T1 TSK FLS.
-    
-    copy:
-        
-        Returns a copy of the T1 TSK FLS.
-    
-    evaluate:
 
-        Evaluates the T1 TSK FLS based on the crisp inputs given by the user.
-    """
-    def __init__(self, default=0.):
-        self.inputs = []
-        self.outputs = []
-        self.rules = []
-        self.default = default
-    
+    is_valid:
+
+        Checks if the compiled rule base still represents a rule list.
+
+    input_vector:
+
+        Converts a dictionary of crisp inputs to an input vector.
+
+    input_matrix:
+
+        Converts a dictionary of crisp input columns to an input matrix.
+
+    check_batch:
+
+        Verifies the shape of a batch of crisp inputs.
+
+    active_rules:
+
+        Returns the rules which can fire for a crisp input vector.
+
+    firing:
+
+        Calculates the firing strengths of all the rules.
+
+    consequent_rules:
+
+        Returns the indices of the rules having a consequent for an output.
+
+    active_rows:
+
+        Selects the active rules among the rules having a consequent for 
+        an output.
+
+    consequent_sets:
+
+        Returns the consequents of an output in the order of the rules.
+
+    consequent_domains:
+
+        Returns the domains of the T1FS consequents of an output.
+
+    sample_consequents:
+
+        Returns the membership values of the T1FS consequents of an output.
+
+    consequent_values:
+
+        Evaluates the consequent of each rule at its own points.
+
+    coefficients:
+
+        Returns the coefficients of the linear consequents of an output.
+
+    .. rubric:: Notes
+
+    The compiled rule base keeps a reference to the rules list it was made
+    from. Adding rules through the add_rule function of the engines makes
+    them compile the rule base again, but modifying a rule in place does not
+    and needs an explicit call to the compile function of the engine.
+    """
+    def __init__(self, inputs, outputs, rules):
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.rules = rules
+        self.size = len(rules)
+
+        self.terms = []
+        term_index = {}
+        width = max([len(rule[0]) for rule in rules], default=0)
+        self.antecedents = full((self.size, width), -1, dtype=int)
+        for r, rule in enumerate(rules):
+            for s, input_statement in enumerate(rule[0]):
+                if input_statement[0] not in self.inputs:
+                    raise ValueError("The input variable, " + str(input_statement[0]) +
+                                     ", used in the rule " + str(r) + " is not defined!")
+                key = (self.inputs.index(input_statement[0]), id(input_statement[1]))
+                if key not in term_index:
+                    term_index[key] = len(self.terms)
+                    self.terms.append((key[0], input_statement[1]))
+                self.antecedents[r, s] = term_index[key]
+        self.used_inputs = zeros((len(self.inputs), ), dtype=bool)
+        self.used_inputs[[j for j, t1fs in self.terms]] = True
+
+        self.consequent_terms = {out: [] for out in self.outputs}
+        consequent_index = {out: {} for out in self.outputs}
+        self.consequent_index = full((self.size, len(self.outputs)), -1, dtype=int)
+        for r, rule in enumerate(rules):
+            for consequent in rule[1]:
+                if consequent[0] not in self.outputs:
+                    raise ValueError("The output variable, " + str(consequent[0]) +
+                                     ", used in the rule " + str(r) + " is not defined!")
+                k = self.outputs.index(consequent[0])
+                index = consequent_index[consequent[0]]
+                if id(consequent[1]) not in index:
+                    index[id(consequent[1])] = len(self.consequent_terms[consequent[0]])
+                    self.consequent_terms[consequent[0]].append(consequent[1])
+                self.consequent_index[r, k] = index[id(consequent[1])]
+                if isinstance(consequent[1], dict):
+                    # Linear (TSK) consequents are functions of all the inputs.
+                    self.used_inputs[:] = True
+        self.__samples = {}
+        self.__index = None
+
     def __repr__(self):
-        return "Type 1 TSK fuzzy logic system!"
+        return "Compiled type 1 rule base with " + str(self.size) + \
+               " rules, and " + str(len(self.terms)) + " antecedent terms"
 
-    def copy(self):
+    def is_valid(self, inputs, outputs, rules):
         """
-        Returns a copy of the IT2FLS.
+        Checks if the compiled rule base still represents the rules list,
+        and the input and output variables of an engine.
+
+        .. rubric:: Parameters
+
+        inputs : List of str
+
+            List of the inputs name as str.
+
+        outputs : List of str
+
+            List of the outputs name as str.
+
+        rules : List of tuples (antecedent, consequent)
+
+            The rules list of the engine.
+
+        .. rubric:: Returns
+
+        output : bool
+
+            False if the rule base must be compiled again.
         """
-        o = T1TSK()
-        o.inputs = self.inputs.copy()
-        o.outputs = self.outputs.copy()
-        o.rules = self.rules.copy()
-        return o
+        return rules is self.rules and len(rules) == self.size and \
+               inputs == self.inputs and outputs == self.outputs
 
-    def add_input_variable(self, name):
+    def input_vector(self, inputs):
         """
-        Adds new input variable name.
-        
+        Converts a dictionary of crisp inputs to an input vector ordered
+        as the input variables. The input variables which are not used by
+        any rule are not required to be in the dictionary.
+
         .. rubric:: Parameters
 
-        name : str
-            
-            Name of the new input variable as a str.
+        inputs : dictionary
+
+            The keys are input variable names as str and the values are
+            the crisp value of the inputs.
+
+        .. rubric:: Returns
+
+        output : numpy (n,) shaped array
         """
-        self.inputs.append(name)
-    
-    def add_output_variable(self, name):
+        return array([inputs[name] if used else 0.
+                      for name, used in zip(self.inputs, self.used_inputs)], dtype=float)
+
+    def input_matrix(self, inputs):
         """
-        Adds new output variable name.
-        
+        Converts a dictionary of crisp input columns to an input matrix
+        with one sample per row and the columns ordered as the input
+        variables. The input variables which are not used by any rule are
+        not required to be in the dictionary.
+
         .. rubric:: Parameters
-        
-        name : str
-            
-            Name of the new output variable as a str.
+
+        inputs : dictionary
+
+            The keys are input variable names as str and the values are
+            lists or numpy (s,) shaped arrays of the crisp value of the
+            inputs.
+
+        .. rubric:: Returns
+
+        output : numpy (s, n) shaped array
         """
-        self.outputs.append(name)
-    
-    def add_rule(self, antecedent, consequent):
+        sizes = [len(column) for column in inputs.values()]
+        if sizes.count(sizes[0]) != len(sizes):
+            raise ValueError("All input lists must contain same number of values.")
+        X = zeros((sizes[0], len(self.inputs)))
+        for j, (name, used) in enumerate(zip(self.inputs, self.used_inputs)):
+            if used:
+                X[:, j] = inputs[name]
+        return X
+
+    def check_batch(self, X):
         """
-        Adds new rule to the rule base of the T1 TSK FLS.
+        Verifies the shape of a batch of crisp inputs.
 
         .. rubric:: Parameters
-        
-        antecedent : list of tuples
-            
-            Antecedent is a list of tuples in which each tuple indicates 
-            assignement of a variable to a T1FS. The first element of the 
-            tuple must be the input variable name as a string, and the second 
-            element of the tuple must be a T1FS.
-        
-        consequent : list of tuples
 
-            Consequent is a list of tuples in which each tuple indicates 
-            assignement of a variable to an output state. The first element of the 
-            tuple must be the output vriable name as a string, and the second element 
-            of the tuple must be a callable object.
+        X : numpy (s, n) shaped array
+
+            Crisp value of the inputs for s samples.
+
+        .. rubric:: Returns
+
+        output : numpy (s, n) shaped array of float
         """
-        self.rules.append((antecedent, consequent))
+        X = asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != len(self.inputs):
+            raise ValueError("The inputs must be a (n_samples, " + str(len(self.inputs)) + 
+                             ") shaped array.")
+        return X
 
-    def evaluate(self, inputs, params):
+    def active_rules(self, x):
         """
-        Evaluates the T1 TSK FLS based on the crisp inputs given by the user.
+        Returns the rules which can fire for a crisp input vector, found by 
+        an ActiveRuleIndex of the supports of the antecedent terms. The 
+        index is built on the first call, and again if the membership 
+        function or the parameters of a term with a compact support change.
 
         .. rubric:: Parameters
-        
-        inputs : dictionary
-
-            Inputs is a dictionary, where the keys are input variable 
-            names as strings and the corresponded values are the crisp values 
-            of the inputs to be evaluated.
 
-        params : tuple
+        x : numpy (n,) shaped array
 
-            This tuple contains the parameters of the functions assigned to the 
-            consequents of the system rules.
+            Crisp value of the inputs, ordered as the input variables.
 
         .. rubric:: Returns
-        
-        Output : dict
 
-            The output is a dictionary, where the keys are output variable 
-            names as strings and the corresponded values are the crisp outputs 
-            of the system.
-        """
-        F = []
-        B = {out: 0. for out in self.outputs}
-        for rule in self.rules:
-            f = 1.
-            for input_statement in rule[0]:
-                f *= input_statement[1].mf(inputs[input_statement[0]], input_statement[1].params)
-            F.append(f)
-            for consequent in rule[1]:
-                B[consequent[0]] += f * consequent[1](*params)
-        f = npsum(F)
-        if f == 0:
-            for out in self.outputs:
-                B[out] = self.default
-        else:
-            for out in self.outputs:
-                B[out] /= f
-        return B
+        output : numpy (r,) shaped array of bool or None
 
+            True for the rules which can fire, or None if the rules can 
+            not be narrowed.
+        """
+        if self.__index is None or \
+           [(t1fs.mf, list(t1fs.params)) for t1fs in self.__index[0]] != self.__index[1]:
+            statements, bounded = _support_statements([(j, t1fs.mf, t1fs.params) 
+                                                       for j, t1fs in self.terms], 
+                                                      self.antecedents)
+            terms = [self.terms[t][1] for t in bounded]
+            self.__index = (terms, [(t1fs.mf, list(t1fs.params)) for t1fs in terms], 
+                            ActiveRuleIndex(self.size, statements))
+        return self.__index[2].active(x)
+
+    def firing(self, X, t_norm, active=None):
+        """
+        Calculates the firing strengths of all the rules.
 
-class IT2FS:
-    """Interval Type 2 Fuzzy Set (IT2FS).
-       
         .. rubric:: Parameters
-        
-        Parameters of the constructor function:
-        
-        domain : numpy (n,) shaped array
-            
-            Indicates the universe of discourse dedicated to the IT2FS.
-        
-        umf : Upper membership function
-        
-        umf_params : list 
-        
-            Parameters of the upper membership function
-        
-        lmf : Lower membership function
-        
-        lmf_params : list 
-        
-            Parameters of lower membership function
-        
-        check_set : bool
-        
-            If True, then a function named check_set in IT2FS will 
-            verify the condition LMF(x) < UMF(x) for any x in the domain. If the 
-            user is sure that they have selected the parameters of the membership 
-            functions correctly, then calling this time-consuming function 
-            is not needed. By default the parameter check_set is False.
-            
-        .. rubric:: Functions
-        
-        Functions defined in IT2FS class:
-        
-            copy:
 
-                Returns a copy of the IT2FS.
-            
-            plot:
-                
-                Plots the IT2FS.
-            
-            negation operator -:
-                
-                Returns the negated IT2FS.
-        
-        .. rubric:: Examples
-        
-        >>> mySet = IT2FS(linspace(0., 1., 100), 
-                          trapezoid_mf, [0, 0.4, 0.6, 1., 1.], 
-                          tri_mf, [0.25, 0.5, 0.75, 0.6])
-        >>> mySet.plot(filename="mySet")
-        """
+        X : numpy (n,) or (s, n) shaped array
 
-    def __init__(self, domain, umf=zero_mf, umf_params=[], lmf=zero_mf, lmf_params=[], check_set=False):
-        self.umf = umf
-        self.lmf = lmf
-        self.umf_params = umf_params
-        self.lmf_params = lmf_params
+            Crisp value of the inputs for one or s samples, ordered as the
+            input variables.
 
-        self.domain = domain
-        # self.upper = maximum(minimum(umf(domain, umf_params), 1), 0)
-        # self.lower = maximum(minimum(lmf(domain, lmf_params), 1), 0)
-        if check_set:
-            self.check_set()
+        t_norm : function
 
-    def __repr__(self):
-        return "Interval type 2 fuzzy set with " + \
-               self.umf.__name__ + " UMF function with " + \
-               str(list(map(float, self.umf_params))) + " parameters, and " + \
-               self.lmf.__name__ + " LMF function with " + \
-               str(list(map(float, self.lmf_params))) + " parameters"
+            T-norm operator used for combining the antecedents.
 
-    @property
-    def upper(self):
-        return maximum(minimum(self.umf(self.domain, self.umf_params), 1), 0)
-    
-    @property
-    def lower(self):
-        return maximum(minimum(self.lmf(self.domain, self.lmf_params), 1), 0)
+        active=None : numpy (r,) shaped array of bool
 
-    def check_set(self):
+            The rules which can fire, as returned by the active_rules 
+            function. Only the terms used by these rules are evaluated, 
+            and the other rules get zero firing strengths.
+
+        .. rubric:: Returns
+
+        output : numpy (r,) or (r, s) shaped array
         """
-        Verifies the condition LMF(x) < UMF(x) for any x in the domain.
+        X = asarray(X, dtype=_precision)
+        antecedents = self.antecedents
+        if active is not None:
+            rules = flatnonzero(active)
+            antecedents = antecedents[rules]
+        # The extra last row is used by the -1 entries of the antecedents
+        # matrix, so the absent statements do not change the result.
+        M = ones((len(self.terms) + 1, ) + X.shape[:-1], dtype=X.dtype)
+        used = zeros((len(self.terms) + 1, ), dtype=bool)
+        used[antecedents] = True
+        _evaluate_terms(M, X, [(t, j, t1fs.mf, t1fs.params) 
+                               for t, (j, t1fs) in enumerate(self.terms) if used[t]])
+        f = _reduce_norm(t_norm, 1., [M[antecedents[:, s]] for s in range(antecedents.shape[1])])
+        f = f * ones((len(antecedents), ) + X.shape[:-1], dtype=X.dtype)
+        if active is None:
+            return f
+        output = zeros((self.size, ) + X.shape[:-1], dtype=X.dtype)
+        output[rules] = f
+        return output
+
+    def consequent_rules(self, out):
         """
-        for l, u in zip(self.lower, self.upper):
-            if l > u:
-                raise ValueError("LMF in some points in domain is larger than UMF.")
+        Returns the indices of the rules having a consequent for an output
+        variable, in the order of the rules.
 
-    def copy(self):
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        .. rubric:: Returns
+
+        output : numpy (k,) shaped array
         """
-        Copies the IT2FS.
-        
+        rows, = where(self.consequent_index[:, self.outputs.index(out)] != -1)
+        return rows
+
+    def active_rows(self, out, active):
+        """
+        Selects the active rules among the rules having a consequent for 
+        an output variable.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        active : numpy (r,) shaped array of bool or None
+
+            The rules which can fire, as returned by the active_rules 
+            function.
+
         .. rubric:: Returns
-        
-        output : IT2FS
-        
-        Returns a copy of the IT2FS.
+
+        output : numpy (k,) shaped array of bool or None
+
+            True for the active rows of the consequent_rules output. None 
+            shows that all the rows are kept, which is also the case if 
+            none of them is active.
+        """
+        if active is None:
+            return None
+        keep = active[self.consequent_rules(out)]
+        if keep.all() or not keep.any():
+            return None
+        return keep
+
+    def consequent_sets(self, out):
         """
-        return IT2FS(self.domain, umf=self.umf, umf_params=self.umf_params, lmf=self.lmf, lmf_params=self.lmf_params)
+        Returns the consequents assigned to an output variable, in the
+        order of the rules.
 
-    def plot(self, title=None, legends=None, filename=None, 
-             ext="pdf", grid=True, xlabel="Domain", 
-             ylabel="Membership degree", legendloc="best", 
-             bbox_to_anchor=None, alpha=0.5, ):
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        .. rubric:: Returns
+
+        output : List
         """
-        Plots the IT2FS.
-        
+        index = self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]
+        return [self.consequent_terms[out][i] for i in index]
+
+    def coefficients(self, out):
+        """
+        Returns the coefficients of the linear (TSK) consequents of an 
+        output variable, in the order of the rules. Each linear consequent 
+        is a dictionary like {"const":5., "x1":2., "x2":4.}. The rows of the 
+        other consequents are filled with nan.
+
         .. rubric:: Parameters
-        
-        title : str
-            
-            If set, it indicates the title to be 
-            represented in the plot. If not set, the plot will not 
-            have a title.
-        
-        legend_text : str
-            
-            If set, it indicates the legend text to 
-            be represented in the plot. If not set, the plot will 
-            not contain a legend.
-        
-        filename : str
-        
-            If set, the plot will be saved as a filename.ext file.
-            
-        ext : str
 
-            Extension of the output file, with 'pdf' as the default value.
-        
-        grid : bool
+        out : str
 
-            Determines whether the grid is displayed in the plot.
-        
-        xlabel : str
+            Name of the output variable.
 
-            Label of the x-axis.
-        
-        ylabel : str
+        .. rubric:: Returns
 
-            Label of the y-axis.
-        
-        .. rubric:: Examples
-        
-        >>> mySet = IT2FS(linspace(0., 1., 100), 
-                          trapezoid_mf, [0, 0.4, 0.6, 1., 1.], 
-                          tri_mf, [0.25, 0.5, 0.75, 0.6])
-        >>> mySet.plot(filename="mySet")
+        output : numpy (k, n + 1) shaped array
+
+            The first column holds the constant terms and the other columns 
+            hold the coefficients of the input variables.
         """
-        plt.figure()
-        plt.fill_between(self.domain, self.upper, self.lower, alpha=alpha)
-        if legends is not None:
-            if bbox_to_anchor is None:
-                plt.legend(legends, loc=legendloc)
-            else:
-                plt.legend(legends, loc=legendloc, bbox_to_anchor=bbox_to_anchor)
+        terms = array([[term["const"]] + [term[name] for name in self.inputs] 
+                       if isinstance(term, dict) else [nan] * (len(self.inputs) + 1) 
+                       for term in self.consequent_terms[out]], dtype=float)
+        terms = terms.reshape((len(self.consequent_terms[out]), len(self.inputs) + 1))
+        return terms[self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]]
+
+    def __own_domains(self, out):
+        # The domains are padded by repeating their last point, which adds
+        # nothing to the integrals taken over them.
+        terms = self.consequent_terms[out]
+        width = max([len(term.domain) for term in terms], default=0)
+        domains = zeros((len(terms), width))
+        for i, term in enumerate(terms):
+            domains[i, :len(term.domain)] = term.domain
+            domains[i, len(term.domain):] = term.domain[-1]
+        return domains
+
+    def consequent_domains(self, out):
+        """
+        Returns the domains of the T1FS consequents of an output variable,
+        with one row for each rule having a consequent for the output 
+        variable. The shorter domains are padded by repeating their last 
+        point.
 
-        if title is not None:
-            plt.title(title)
-        plt.plot(self.domain, self.upper, color="black", alpha=alpha)
-        plt.plot(self.domain, self.lower, color="black", alpha=alpha)
-        if grid == True:
-            plt.grid(which="major", linestyle="-", linewidth=0.75, color="gray", alpha=0.7)
-            plt.minorticks_on() 
-            plt.grid(which="minor", linestyle=":", linewidth=0.5, color="lightgray", alpha=0.7)
-    
-        plt.xlabel(xlabel)
-        plt.ylabel(ylabel)
-        plt.ylim((-0.05, 1.05))
-        if filename is not None:
-            plt.savefig(filename + "." + ext, format=ext, dpi=300, bbox_inches="tight")
-        plt.show()
+        .. rubric:: Parameters
 
-    def __neg__(self):
+        out : str
+
+            Name of the output variable.
+
+        .. rubric:: Returns
+
+        output : numpy (k, n) shaped array
         """
-        Negates the IT2FS.
-        
+        index = self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]
+        return self.__own_domains(out)[index]
+
+    def sample_consequents(self, out, domain=None, cache=True):
+        """
+        Returns the membership values of the T1FS consequents of an output
+        variable. Each distinct consequent is evaluated once, and the values
+        are stored for the later calls with the same domain.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        domain=None : numpy (n,) shaped array
+
+            Points at which the consequents are evaluated. If not given, 
+            each consequent is evaluated on its own domain, as returned by 
+            the consequent_domains function.
+
+        cache=True : bool
+
+            If False, the values are neither stored nor read from the store.
+
         .. rubric:: Returns
-        
-        output : IT2FS
-        
-            Returns a negated copy of the IT2FS.
+
+        output : numpy (k, n) shaped array
+
+            One row for each rule having a consequent for the output variable.
         """
-        umf = lambda x, params: subtract(1, self.umf(x, params))
-        lmf = lambda x, params: subtract(1, self.lmf(x, params))
-        neg_it2fs = IT2FS(self.domain, lmf, self.lmf_params, umf, self.umf_params)
-        return neg_it2fs
+        key = (out, None if domain is None else id(domain), _precision)
+        if cache and key in self.__samples:
+            return self.__samples[key][1]
+        terms = self.consequent_terms[out]
+        if domain is None:
+            points = self.__own_domains(out)
+            values = array([term.mf(x, term.params) * ones_like(x) 
+                            for term, x in zip(terms, points)], 
+                           dtype=_precision).reshape(points.shape)
+        else:
+            values = array([term.mf(domain, term.params) * ones_like(domain, dtype=float)
+                            for term in terms], 
+                           dtype=_precision).reshape((len(terms), ) + shape(domain))
+        values = values[self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]]
+        if cache:
+            self.__samples[key] = (domain, values)
+        return values
+
+    def consequent_values(self, out, x):
+        """
+        Evaluates the consequent of each rule having a consequent for an 
+        output variable at its own points.
 
+        .. rubric:: Parameters
 
-def IT2FS_Emphasize(it2fs, m=2.):
+        out : str
+
+            Name of the output variable.
+
+        x : numpy (k, ...) shaped array
+
+            The row x[i] holds the points at which the consequent of the 
+            i-th rule is evaluated.
+
+        .. rubric:: Returns
+
+        output : numpy (k, ...) shaped array
+        """
+        x = asarray(x, dtype=float)
+        index = self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]
+        values = zeros(x.shape)
+        for i, term in enumerate(self.consequent_terms[out]):
+            rows = index == i
+            values[rows] = term.mf(x[rows], term.params)
+        return values
+
+
+class T1Mamdani:
     """
-    Function for creating emphasized IT2FSs.
-    
+    Type 1 Mamdani Fuzzy Logic System.
+
     .. rubric:: Parameters
     
-    it2fs : IT2FS
-        
-        Interval type 2 fuzzy set to be emphasized.
-        
-    m : float, optional
-        
-        Emphasis degree. The default value is 2.
+    Parameters of the constructor function:
 
-    .. rubric:: Returns
+    engine="Product": str
+
+        Inference engine of the type 1 Mamdani fuzzy logic system. 
+        This parameters is a string an can be one of the following items: 
+        Product, Minimum, Lukasiewicz, Zadeh, and Dienes-Rescher.
     
-    emphasized : IT2FS
-        
-        Emphasized interval type 2 fuzzy set.
-    """
-    lmf = lambda x, params : it2fs.lmf(x, it2fs.lmf_params) ** m
-    umf = lambda x, params : it2fs.umf(x, it2fs.umf_params) ** m
-    emphasized = IT2FS(it2fs.domain, 
-                       umf, it2fs.umf_params, 
-                       lmf, it2fs.lmf_params)
-    return emphasized
+    defuzzification="CoG": str
+
+        Defuzzification method of the system. When Lukasiewicz, Zadeh, and Dienes-Rescher 
+        inference engines are selected, the defuzzification method is center of the 
+        gravity by default. But for Product and Minimum inference engines, defuzzification 
+        can be selected among the methods CoG and CoA.
 
+    .. rubric:: Members
+    
+    inputs : list of str
 
-def IT2FS_Elliptic(domain, params, check_set=False):
-    """
-    Creates an elliptic IT2FS.
+        List of the inputs names as strings.
     
-    .. rubric:: Parameters
+    outputs : list of str
+
+        List of the outputs names as strings.
+
+    rules : list of tuples (antacedent, consequent)
+
+        List of rules, which each rule is defined as a tuple (antecedent, consequent).
+        Both antacedent and consequent are lists of tuples. Each tuple 
+        of this list represents the assignement of a variable to a T1FS. 
+        The first element of the tuple must be the variable name (input or output) 
+        as a string, and the second element must be a T1FS.
+
+    engine : str
+
+        Indicates the engine selected by the user.
     
-    domain : numpy (n,) shaped array
+    defuzzification : str
+
+        Indicates the defuzzification method selected by the user.
+
+    .. rubric:: Functions
+    
+    add_input_variable:
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        Adds an input variable to the inputs list of the T1FLS.
     
-    params : list
+    add_output_variable:
         
-        The parameters of the elliptic IT2FS. The center, width, UMF's exponent, 
-        LMF's exponent, and height are indicated by params[0], params[1], params[2], 
-        params[3], and params[4], respectively.
+        Adds an output variable to the outputs list of the T1FLS.
     
-    .. rubric:: Returns
+    add_rule:
+        
+        Adds a rule to the rules list of the T1FLS.
     
-    output : IT2FS
+    copy:
         
-        Returns an elliptic IT2FS with specified parameters.
+        Returns a copy of the type 1 Mamdani fuzzy logic system.
     
-    .. rubric:: Examples
+    evaluate:
+        
+        Evaluates the T1 Mamdani FLS's output for the specified crisp input.
+        The only input of the evaluate function is a dictionary in which the 
+        keys are input variable names as strings and the values are the crisp 
+        value of inputs to be evaluated.
+        The output of the evaluate function depends on the method selected 
+        while constructing the class. For more information, please refer to 
+        the examples.
     
-    >>> domain = linspace(0., 1., 100)
-    >>> mySet = IT2FS_Elliptic(domain, [0.5, 0.25, 1.3, 0.7, 0.8])
-    >>> mySet.plot()
-    """
-    return IT2FS(domain, 
-                 elliptic_mf, [params[0], params[1], params[2], params[4]], 
-                 elliptic_mf, [params[0], params[1], params[3], params[4]], check_set=check_set)
-
-
-def IT2FS_Semi_Elliptic(domain, params, check_set=False):
-    """
-    Creates a semi-elliptic IT2FS.
-    
-    .. rubric:: Parameters
-    
-    domain : numpy (n,) shaped array
+    evaluate_batch:
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        Evaluates the T1 Mamdani FLS's crisp outputs for a batch of crisp 
+        inputs given as an array with one sample per row.
     
-    params : list
+    compile:
         
-        The parameters of the semi-elliptic IT2FS. The center, UMF's width, 
-        LMF's width, and height are indicated by params[0], params[1], params[2], 
-        and params[3], respectively.
+        Compiles the rule base into dense arrays used by the evaluate functions.
+    """
+    def __init__(self, engine="Product", defuzzification="CoG"):
+        self.inputs = []
+        self.outputs = []
+        self.rules = []
+        self.rulebase = None
+        self.engine = engine
+        if engine == "Product":
+            self.evaluate = self._product_evaluate
+            self.defuzzification = defuzzification
+        elif engine == "Minimum":
+            self.evaluate = self._minimum_evaluate
+            self.defuzzification = defuzzification
+        elif engine == "Lukasiewicz":
+            self.evaluate = self._lukasiewicz_evaluate
+            self.defuzzification = "CoG"
+        elif engine == "Zadeh":
+            self.evaluate = self._zadeh_evaluate
+            self.defuzzification = "CoG"
+        elif engine == "Dienes-Rescher":
+            self.evaluate = self._dienes_rescher_evaluate
+            self.defuzzification = "CoG"
+        else:
+            raise ValueError("The " + engine + " fuzzy inference engine is not implemented yet!")
     
-    .. rubric:: Returns
+    def __repr__(self):
+        return "Type 1 Mamadani fuzzy logic system with " + self.engine + " inference engine" + \
+            "and " + self.defuzzification + " defuzzification!"
+
+    def copy(self):
+        o = T1Mamdani(self.engine, self.defuzzification)
+        o.inputs = self.inputs.copy()
+        o.outputs = self.outputs.copy()
+        o.rules = self.rules.copy()
+        return o
     
-    output : IT2FS
+    def add_input_variable(self, name):
+        """
+        Adds a new input variable by name.
         
-        Returns a semi-elliptic IT2FS with specified parameters.
-    
-    .. rubric:: Examples
+        .. rubric:: Parameters
+        
+        name : str
+            
+            Name of the new input variable as a string.
+        """
+        self.inputs.append(name)
     
-    >>> domain = linspace(0., 1., 100)
-    >>> mySet = IT2FS_Semi_Elliptic(domain, [0.5, 0.15, 0.05, 0.6])
-    >>> mySet.plot()
-    """
-    return IT2FS(domain, 
-                 semi_elliptic_mf, [params[0], params[1], params[3]], 
-                 semi_elliptic_mf, [params[0], params[2], params[3]], check_set=check_set)
+    def add_output_variable(self, name):
+        """
+        Adds a new output variable by name.
+        
+        .. rubric:: Parameters
 
+        name : str
+            
+            Name of the new output variable as a string.
+        """
+        self.outputs.append(name)
 
-def IT2FS_Gaussian_UncertMean(domain, params, check_set=False):
-    """
-    Creates a Gaussian IT2FS with uncertain mean value.
-    
-    .. rubric:: Parameters
-    
-    domain : numpy (n,) shaped array
+    def add_rule(self, antecedent, consequent):
+        """
+        Adds a new rule to the rule base of the T1 Mamdani FLS.
         
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    params : list
+        .. rubric:: Parameters
+
+        antecedent : list of tuples
+            
+            Antecedent is a list of tuples in which each tuple indicates 
+            assignment of a variable to a T1FS. The first element of the 
+            tuple must be the input variable name as a string, and the second 
+            element of the tuple must be a T1FS.
+            
+        consequent : list of tuples
+            
+            Consequent is a list of tuples in which each tuple indicates 
+            assignment of a variable to a T1FS. The first element of the 
+            tuple must be the output variable name as a string, and the second 
+            element of the tuple must be a T1FS.
+        """
+        self.rules.append((antecedent, consequent))
+        self.rulebase = None
+
+    def compile(self):
+        """
+        Compiles the rule base into an array-backed T1RuleBase, which is 
+        used by the evaluate functions. The rule base is compiled 
+        automatically after adding new rules, so this function needs to be 
+        called explicitly only if the rules are modified in place.
         
-        The parameters of the Gaussian IT2FS with uncertain mean value. 
-        The mean center, mean spread, standard deviation, and height are 
-        indicated by params[0], params[1], params[2], and params[3], respectively.
-    
-    .. rubric:: Returns
-    
-    output : IT2FS
+        .. rubric:: Returns
         
-        Returns a Gaussian IT2FS with uncertain mean value with specified parameters.
-    
-    .. rubric:: Examples
-    
-    >>> domain = linspace(0., 1., 100)
-    >>> mySet = IT2FS_Gaussian_UncertMean(domain, [0., 0.25, 0.2])
-    >>> mySet.plot()
-    """
-    ml = params[0] - params[1] / 2.
-    mr = params[0] + params[1] / 2.
-    return IT2FS(domain, 
-                 gauss_uncert_mean_umf, [ml, mr, params[2], params[3]], 
-                 gauss_uncert_mean_lmf, [ml, mr, params[2], params[3]], check_set=check_set)
+        output : T1RuleBase
+            
+            The compiled rule base.
+        """
+        self.rulebase = T1RuleBase(self.inputs, self.outputs, self.rules)
+        return self.rulebase
+
+    def _rulebase(self):
+        if self.rulebase is None or \
+           not self.rulebase.is_valid(self.inputs, self.outputs, self.rules):
+            self.compile()
+        return self.rulebase
+
+    @staticmethod
+    def _implication(engine, f, values):
+        # Membership values of the rule outputs, for the firing strengths 
+        # f broadcast against the consequent values.
+        if engine == "Product":
+            return product_t_norm(f, values)
+        elif engine == "Minimum":
+            return min_t_norm(f, values)
+        elif engine == "Lukasiewicz":
+            return 1. - f + values
+        elif engine == "Zadeh":
+            return max_s_norm(1. - f, min_t_norm(f, values))
+        elif engine == "Dienes-Rescher":
+            return max_s_norm(1. - f, values)
+        else:
+            raise ValueError("The " + engine + " fuzzy inference engine is not implemented yet!")
+
+    @staticmethod
+    def _aggregation(engine, B):
+        # The rule outputs of the Product and Minimum engines are joined, 
+        # and the ones of the implication based engines are met.
+        if engine in ("Product", "Minimum"):
+            return maximum(0., B.max(axis=0))
+        return minimum(1., B.min(axis=0))
+
+    def _infer(self, f, engine, defuzzification, sets=False, active=None):
+        rulebase = self._rulebase()
+        if defuzzification not in ("CoG", "CoA"):
+            raise ValueError("The " + defuzzification + \
+                " defuzzification method is not implemented yet!")
+        C = {}
+        D = {}
+        for out in self.outputs:
+            rows = rulebase.consequent_rules(out)
+            if len(rows) == 0:
+                raise ValueError("No rule has a consequent for the output variable " + 
+                                 out + "!")
+            firing = f[rows][..., None]
+            if defuzzification == "CoA":
+                # Each rule output is defuzzified on the domain of its own 
+                # consequent, and weighted by its membership at the center.
+                points = rulebase.consequent_domains(out)
+                samples = rulebase.sample_consequents(out)
+                domains, values = points, samples
+                if f.ndim == 2:
+                    domains = domains[:, None, :]
+                    values = values[:, None, :]
+                B = self._implication(engine, firing, values)
+                # The rule outputs and the samples with zero area or weight 
+                # are defuzzified to nan, without warnings.
+                with errstate(divide="ignore", invalid="ignore"):
+                    centers = trapz(domains * B, domains) / trapz(B, domains)
+                    # The memberships at the centers are interpolated from 
+                    # the cached samples of the consequents.
+                    memberships = array([interp(center, x, y) 
+                                         for center, x, y in zip(centers, points, samples)])
+                    heights = self._implication(engine, f[rows], memberships)
+                    D[out] = npsum(centers * heights, axis=0) / npsum(heights, axis=0)
+            else:
+                domain = rulebase.consequent_sets(out)[-1].domain
+                values = rulebase.sample_consequents(out, domain)
+                # The rules not firing give the neutral element of the 
+                # aggregation, so only the active ones are joined or met.
+                keep = rulebase.active_rows(out, active)
+                if keep is not None:
+                    firing = firing[keep]
+                    values = values[keep]
+                if f.ndim == 2:
+                    values = values[:, None, :]
+                C[out] = self._aggregation(engine, self._implication(engine, firing, values))
+                # The domain is integrated in the precision of the sets. The 
+                # samples for which no rule fires give nan, without warnings.
+                points = asarray(domain, dtype=C[out].dtype)
+                with errstate(divide="ignore", invalid="ignore"):
+                    D[out] = trapz(points * C[out], points) / trapz(C[out], points)
+                if sets:
+                    C[out] = self._aggregated_set(rulebase, out, domain, f[rows], 
+                                                  engine, C[out])
+        if defuzzification == "CoA":
+            return D
+        return C, D
 
+    def _aggregated_set(self, rulebase, out, domain, f, engine, values):
+        # The aggregated set keeps its values on the domain, and evaluates 
+        # the consequents at other points.
+        def mf(x, params):
+            if x is domain:
+                return values
+            x = asarray(x, dtype=float)
+            samples = rulebase.sample_consequents(out, x, cache=False)
+            return self._aggregation(engine, 
+                                     self._implication(engine, 
+                                                       f.reshape((-1, ) + (1, ) * x.ndim), 
+                                                       samples))
+        return T1FS(domain, mf)
+
+    def _evaluate(self, inputs, engine):
+        rulebase = self._rulebase()
+        X = rulebase.input_vector(inputs)
+        active = rulebase.active_rules(X)
+        f = rulebase.firing(X, product_t_norm if engine == "Product" else min_t_norm, active)
+        return self._infer(f, engine, self.defuzzification, sets=True, active=active)
 
-def IT2FS_Gaussian_UncertStd(domain, params, check_set=False):
-    """
-    Creates a Gaussian IT2FS with uncertain standard deviation value.
-    
-    .. rubric:: Parameters
+    def _product_evaluate(self, inputs):
+        return self._evaluate(inputs, "Product")
 
-    domain : numpy (n,) shaped array
+    def _minimum_evaluate(self, inputs):
+        return self._evaluate(inputs, "Minimum")
+
+    def _lukasiewicz_evaluate(self, inputs):
+        return self._evaluate(inputs, "Lukasiewicz")
+
+    def _zadeh_evaluate(self, inputs):
+        return self._evaluate(inputs, "Zadeh")
+
+    def _dienes_rescher_evaluate(self, inputs):
+        return self._evaluate(inputs, "Dienes-Rescher")
+
+    def evaluate_batch(self, X, batch_size=1024):
+        """
+        Evaluates the T1 Mamdani FLS for a batch of crisp inputs. The firing 
+        strengths, the implication, the aggregation, and the defuzzification 
+        are computed for batch_size samples at a time with vectorized calls.
         
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    params : list
+        .. rubric:: Parameters
         
-        The parameters of the Gaussian IT2FS with uncertain standard deviation 
-        value, the mean, standard deviation center, standard deviation spread, 
-        and height are indicated by params[0], params[1], params[2], and 
-        params[3], respectively.
-    
-    .. rubric:: Returns
+        X : numpy (n_samples, n_inputs) shaped array or dictionary
+            
+            Crisp value of the inputs, one sample per row, with the columns 
+            ordered as the inputs list. It can also be given as a dictionary 
+            in which the keys are input variable names and the values are 
+            the lists (or numpy arrays) of the crisp values of the inputs.
+        
+        batch_size=1024 : int
+            
+            Number of samples which are processed together, which bounds the 
+            memory used by the (rules, samples, domain) shaped arrays.
+        
+        .. rubric:: Returns
+        
+        output : numpy (n_samples, n_outputs) shaped array
+            
+            The crisp outputs, with the columns ordered as the outputs list.
+        
+        .. rubric:: Examples
+        
+        >>> X1, X2 = meshgrid(domain1, domain2)
+        >>> Y = SYS.evaluate_batch(c_[X1.ravel(), X2.ravel()])
+        >>> Z1 = Y[:, 0].reshape(X1.shape)
+        """
+        rulebase = self._rulebase()
+        if isinstance(X, dict):
+            X = rulebase.input_matrix(X)
+        else:
+            X = rulebase.check_batch(X)
+        t_norm = product_t_norm if self.engine == "Product" else min_t_norm
+        output = zeros((X.shape[0], len(self.outputs)), dtype=_precision)
+        for start in range(0, X.shape[0], batch_size):
+            stop = min(start + batch_size, X.shape[0])
+            D = self._infer(rulebase.firing(X[start:stop], t_norm), 
+                            self.engine, self.defuzzification)
+            if self.defuzzification != "CoA":
+                D = D[1]
+            for k, out in enumerate(self.outputs):
+                output[start:stop, k] = D[out]
+        return output
+
+
+class T1TSK:
+    """
+    Type 1 TSK Fuzzy Logic System.
+
+    .. rubric:: Parameters
     
-    output : IT2FS
+    Parameters of the constructor function:
 
-        Returns a Gaussian IT2FS with uncertain standard deviation value 
-        with specified parameters.
+    The constructor function of the T1TSK class has no parameters.
+
+    .. rubric:: Members
     
-    .. rubric:: Examples
+    inputs : list of str
+
+        List of the inputs names as str.
     
-    >>> domain = linspace(0., 1., 100)
-    >>> mySet = IT2FS_Gaussian_UncertStd(domain, [0.5, 0.2, 0.05, 1.])
-    >>> mySet.plot()
-    """
-    stdl = params[1] - params[2] / 2
-    stdr = params[1] + params[2] / 2
-    return IT2FS(domain, 
-                 gauss_uncert_std_umf, [params[0], stdl, stdr, params[3]], 
-                 gauss_uncert_std_lmf, [params[0], stdl, stdr, params[3]], check_set=check_set)
+    outputs : list of str
 
+        List of the outputs names as str.
 
-def IT2FS_RGaussian_UncertStd(domain, params, check_set=False):
-    """
-    Creates a Right Gaussian IT2FS with uncertain standard deviation value.
+    rules : list of tuples (antacedent, consequent)
+
+        List of rules, which each rule is defined as a 
+        tuple (antecedent, consequent)
+        
+    .. rubric:: Functions
     
-    .. rubric:: Parameters
+    add_input_variable:
+        
+        Adds an input variable to the inputs list of the T1 TSK FLS.
     
-    domain : numpy (n,) shaped array
+    add_output_variable:
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        Adds an output variable to the outputs list of the T1 TSK FLS.
     
-    params : list
+    add_rule:
         
-        The parameters of the Gaussian IT2FS with uncertain standard 
-        deviation value, the mean, standard deviation center, standard deviation 
-        spread, and height are indicated by params[0], params[1], params[2], 
-        and params[3], respectively.
+        Adds a rule to the rules list of the T1 TSK FLS.
     
-    .. rubric:: Returns
+    copy:
+        
+        Returns a copy of the T1 TSK FLS.
     
-    output : IT2FS
+    evaluate:
 
-        Returns a Gaussian IT2FS with uncertain standard deviation value 
-        with specified parameters.
-    
-    .. rubric:: Examples
-    
-    >>> domain = linspace(0., 1., 100)
-    >>> mySet = R_IT2FS_Gaussian_UncertStd(domain, [0.5, 0.2, 0.05, 1.])
-    >>> mySet.plot()
-    """
-    stdl = params[1] - params[2] / 2
-    stdr = params[1] + params[2] / 2
-    return IT2FS(domain, 
-                  rgauss_uncert_std_umf, 
-                  [params[0], stdl, stdr, params[3]],
-                  rgauss_uncert_std_lmf, 
-                  [params[0], stdl, stdr, params[3]], check_set=check_set)
+        Evaluates the T1 TSK FLS based on the crisp inputs given by the user.
 
+    evaluate_batch:
 
-R_IT2FS_Gaussian_UncertStd = IT2FS_RGaussian_UncertStd
+        Evaluates the T1 TSK FLS for a batch of crisp inputs given as an 
+        array with one sample per row.
 
+    compile:
 
-def IT2FS_LGaussian_UncertStd(domain, params, check_set=False):
+        Compiles the rule base into dense arrays used by the evaluate functions.
     """
-    Creates a Left Gaussian IT2FS with uncertain standard deviation value.
-    
-    .. rubric:: Parameters
+    def __init__(self, default=0.):
+        self.inputs = []
+        self.outputs = []
+        self.rules = []
+        self.rulebase = None
+        self.default = default
     
-    domain : numpy (n,) shaped array
+    def __repr__(self):
+        return "Type 1 TSK fuzzy logic system!"
+
+    def copy(self):
+        """
+        Returns a copy of the IT2FLS.
+        """
+        o = T1TSK()
+        o.inputs = self.inputs.copy()
+        o.outputs = self.outputs.copy()
+        o.rules = self.rules.copy()
+        return o
+
+    def add_input_variable(self, name):
+        """
+        Adds new input variable name.
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        .. rubric:: Parameters
+
+        name : str
+            
+            Name of the new input variable as a str.
+        """
+        self.inputs.append(name)
     
-    params : list
+    def add_output_variable(self, name):
+        """
+        Adds new output variable name.
         
-        The parameters of the Gaussian IT2FS with uncertain standard deviation 
-        value, the mean, standard deviation center, standard deviation spread, 
-        and height are indicated by params[0], params[1], params[2], and 
-        params[3], respectively.
-    
-    .. rubric:: Returns
-    
-    output : IT2FS
-        Returns a Gaussian IT2FS with uncertain standard deviation value 
-        with specified parameters.
-    
-    .. rubric:: Examples
+        .. rubric:: Parameters
+        
+        name : str
+            
+            Name of the new output variable as a str.
+        """
+        self.outputs.append(name)
     
-    >>> domain = linspace(0., 1., 100)
-    >>> mySet = L_IT2FS_Gaussian_UncertStd(domain, [0.5, 0.2, 0.05, 1.])
-    >>> mySet.plot()
-    """
-    stdl = params[1] - params[2] / 2
-    stdr = params[1] + params[2] / 2
-    return IT2FS(domain, 
-                  lgauss_uncert_std_umf, 
-                  [params[0], stdl, stdr, params[3]],
-                  lgauss_uncert_std_lmf, 
-                  [params[0], stdl, stdr, params[3]], check_set=check_set)
-
+    def add_rule(self, antecedent, consequent):
+        """
+        Adds new rule to the rule base of the T1 TSK FLS.
 
-L_IT2FS_Gaussian_UncertStd = IT2FS_LGaussian_UncertStd
+        .. rubric:: Parameters
+        
+        antecedent : list of tuples
+            
+            Antecedent is a list of tuples in which each tuple indicates 
+            assignement of a variable to a T1FS. The first element of the 
+            tuple must be the input variable name as a string, and the second 
+            element of the tuple must be a T1FS.
+        
+        consequent : list of tuples
 
+            Consequent is a list of tuples in which each tuple indicates 
+            assignement of a variable to an output state. The first element of the 
+            tuple must be the output vriable name as a string, and the second element 
+            of the tuple must be a callable object, or a dictionary of the 
+            coefficients of a linear function of the inputs. For example, 
+            the dictionary {"const":5., "x1":2., "x2":4.} represents the 
+            function 2 x1 + 4 x2 + 5.
+        """
+        self.rules.append((antecedent, consequent))
+        self.rulebase = None
 
-def IT2FS_plot(*sets, title=None, legends=None, filename=None, 
-               ext="pdf", grid=True, xlabel="Domain", 
-               ylabel="Membership degree", legendloc="best", 
-               bbox_to_anchor=None, alpha=0.5, ):
-    """
-    Plots multiple IT2FSs together in the same figure.
-    
-    .. rubric:: Parameters
-    
-    \*sets:
+    def evaluate(self, inputs, params=None):
+        """
+        Evaluates the T1 TSK FLS based on the crisp inputs given by the user.
 
-        Multiple number of IT2FSs which will be plotted.
-    
-    title : str
-        
-        If set, it indicates the title to be represented in the plot. 
-        If not set, the plot will not have a title.
+        .. rubric:: Parameters
         
-    legends : list of strs
+        inputs : dictionary
+
+            Inputs is a dictionary, where the keys are input variable 
+            names as strings and the corresponded values are the crisp values 
+            of the inputs to be evaluated.
+
+        params : tuple
+
+            This tuple contains the parameters of the functions assigned to the 
+            consequents of the system rules. If not given, the crisp values 
+            of the inputs, ordered as the inputs list, are used.
+
+        .. rubric:: Returns
         
-        List of legend texts to be presented in plot. If not 
-        set, no legend will be in plot.
+        Output : dict
+
+            The output is a dictionary, where the keys are output variable 
+            names as strings and the corresponded values are the crisp outputs 
+            of the system.
+        """
+        if params is None:
+            params = tuple(inputs[name] for name in self.inputs)
+        rulebase = self._rulebase()
+        active = rulebase.active_rules(rulebase.input_vector(inputs))
+        rules = self.rules
+        if active is not None and active.any():
+            # The rules not firing add nothing to the weighted sums.
+            rules = [self.rules[r] for r in flatnonzero(active)]
+        F = []
+        B = {out: 0. for out in self.outputs}
+        for rule in rules:
+            f = 1.
+            for input_statement in rule[0]:
+                f *= input_statement[1].mf(inputs[input_statement[0]], input_statement[1].params)
+            F.append(f)
+            for consequent in rule[1]:
+                if isinstance(consequent[1], dict):
+                    B[consequent[0]] += f * (consequent[1]["const"] + 
+                                             sum(consequent[1][name] * inputs[name] 
+                                                 for name in self.inputs))
+                else:
+                    B[consequent[0]] += f * consequent[1](*params)
+        f = npsum(F)
+        if f == 0:
+            for out in self.outputs:
+                B[out] = self.default
+        else:
+            for out in self.outputs:
+                B[out] /= f
+        return B
+
+    def compile(self):
+        """
+        Compiles the rule base into an array-backed T1RuleBase, which is 
+        used by the evaluate functions. The rule base is compiled 
+        automatically after adding new rules, so this function needs to be 
+        called explicitly only if the rules are modified in place.
         
-    filename : str
+        .. rubric:: Returns
         
-        If set, the plot will be saved as a filename.ext file.
+        output : T1RuleBase
+            
+            The compiled rule base.
+        """
+        self.rulebase = T1RuleBase(self.inputs, self.outputs, self.rules)
+        return self.rulebase
+
+    def _rulebase(self):
+        if self.rulebase is None or \
+           not self.rulebase.is_valid(self.inputs, self.outputs, self.rules):
+            self.compile()
+        return self.rulebase
+
+    def _weighted_sum(self, rulebase, out, f, X, params):
+        # Sum of the rule outputs weighted by the firing strengths, for one 
+        # (f is (r,) shaped) or many (f is (r, s) shaped) samples.
+        rows = rulebase.consequent_rules(out)
+        index = rulebase.consequent_index[rows, self.outputs.index(out)]
+        terms = rulebase.consequent_terms[out]
+        linear = array([isinstance(term, dict) for term in terms], dtype=bool)[index]
+        output = zeros(X.shape[:-1], dtype=f.dtype)
+        if linear.any():
+            # The linear consequents are evaluated by a matrix product, in 
+            # the precision of the firing strengths.
+            coefficients = rulebase.coefficients(out)[linear].astype(f.dtype)
+            output = output + npsum((f[rows[linear]].T @ coefficients) * 
+                                    concatenate([ones(X.shape[:-1] + (1, ), dtype=f.dtype), 
+                                                 X.astype(f.dtype)], axis=-1), 
+                                    axis=-1)
+        if not linear.all():
+            # Each other consequent is called once, with the whole arrays.
+            values = {}
+            for i in set(index[~linear]):
+                values[i] = terms[i](*params) * ones(X.shape[:-1], dtype=f.dtype)
+            for r, i in zip(rows[~linear], index[~linear]):
+                output = output + f[r] * values[i]
+        return output
+
+    def evaluate_batch(self, X, params=None, batch_size=1024):
+        """
+        Evaluates the T1 TSK FLS for a batch of crisp inputs. The firing 
+        strengths of all the rules are computed for batch_size samples at a 
+        time, the linear consequents are evaluated by a matrix product, and 
+        each other consequent function is called once with whole arrays.
+
+        .. rubric:: Parameters
         
-    ext : str
+        X : numpy (n_samples, n_inputs) shaped array or dictionary
 
-        Extension of the output file with pdf as the default value.
-    
-    grid : bool
+            Crisp value of the inputs, one sample per row, with the columns 
+            ordered as the inputs list. It can also be given as a dictionary 
+            in which the keys are input variable names and the values are 
+            the lists (or numpy arrays) of the crisp values of the inputs.
 
-        Determines whether the grid is displayed in the plot.
-    
-    xlabel : str
+        params : tuple
 
-        Label of the x axis.
-    
-    ylabel : str
+            The parameters of the functions assigned to the consequents of 
+            the rules, as numpy (n_samples, ) shaped arrays (or constants). 
+            If not given, the columns of X are used.
 
-        Label of the y axis.
+        batch_size=1024 : int
+
+            Number of samples which are processed together.
+
+        .. rubric:: Returns
         
-    .. rubric:: Examples
-    
-    >>> domain = linspace(0., 1., 100)
-    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05])
-    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05])
-    >>> IT2FS_plot(it2fs1, it2fs2, title="Plotting IT2FSs", 
-                   legends=["First set", "Second set"])
-    """
-    plt.figure()
-    for it2fs in sets:
-        plt.fill_between(it2fs.domain, it2fs.upper, it2fs.lower, alpha=alpha)
-    if legends is not None:
-        if bbox_to_anchor is None:
-            plt.legend(legends, loc=legendloc)
-        else:
-            plt.legend(legends, loc=legendloc, bbox_to_anchor=bbox_to_anchor)
+        output : numpy (n_samples, n_outputs) shaped array
 
-    for it2fs in sets:
-        plt.plot(it2fs.domain, it2fs.lower, color="black", alpha=alpha)
-        plt.plot(it2fs.domain, it2fs.upper, color="black", alpha=alpha)
-    if title is not None:
-        plt.title(title)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.ylim((-0.05, 1.05))
-    if grid == True:
-        plt.grid(which="major", linestyle="-", linewidth=0.75, color="gray", alpha=0.7)
-        plt.minorticks_on() 
-        plt.grid(which="minor", linestyle=":", linewidth=0.5, color="lightgray", alpha=0.7)
-    
-    if filename is not None:
-        plt.savefig(filename + "." + ext, format=ext, dpi=300, bbox_inches="tight")
-    plt.show()
+            The crisp outputs, with the columns ordered as the outputs list.
 
+        .. rubric:: Examples
 
-def TR_plot(domain, tr, title=None, legend=None, filename=None, 
-            ext="pdf", grid=True, xlabel="Domain", ylabel="Membership degree"):
-    """
-    Plots a type reduced IT2FS.
-    
-    .. rubric:: Parameters
-    
-    domain : numpy (n,) shaped array
+        >>> X1, X2 = meshgrid(domain, domain)
+        >>> Y = SYS.evaluate_batch(c_[X1.ravel(), X2.ravel()])
+        >>> Z1 = Y[:, 0].reshape(X1.shape)
+        """
+        rulebase = self._rulebase()
+        if isinstance(X, dict):
+            X = rulebase.input_matrix(X)
+        else:
+            X = rulebase.check_batch(X)
+        output = zeros((X.shape[0], len(self.outputs)), dtype=_precision)
+        for start in range(0, X.shape[0], batch_size):
+            stop = min(start + batch_size, X.shape[0])
+            if params is None:
+                batch_params = tuple(X[start:stop].T)
+            else:
+                batch_params = tuple(param[start:stop] if shape(param) else param 
+                                     for param in params)
+            f = rulebase.firing(X[start:stop], product_t_norm)
+            total = npsum(f, axis=0)
+            for k, out in enumerate(self.outputs):
+                with errstate(divide="ignore", invalid="ignore"):
+                    y = self._weighted_sum(rulebase, out, f, X[start:stop], batch_params) / total
+                output[start:stop, k] = where(total == 0, self.default, y)
+        return output
+
+
+class IT2FS:
+    """Interval Type 2 Fuzzy Set (IT2FS).
+       
+        .. rubric:: Parameters
         
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    tr : Tuple (l, r)
+        Parameters of the constructor function:
         
-        Indicates the type reduced set to be plotted.
-    
-    title : str
+        domain : numpy (n,) shaped array
+            
+            Indicates the universe of discourse dedicated to the IT2FS.
         
-        If set, it indicates the title which will be represented in the plot. 
-        If not set, the plot will not have a title.
+        umf : Upper membership function
         
-    legend : str
+        umf_params : list 
         
-        If set, it indicates the legend text which will be represented in the plot. 
-        If not set, the plot will not contain a legend.
+            Parameters of the upper membership function
         
-    filename : str
+        lmf : Lower membership function
         
-        If set, the plot will be saved as a filename.ext file.
+        lmf_params : list 
         
-    ext : str
-
-        Extension of the output file with 'pdf' as the default value.
-    
-    grid : bool
+            Parameters of lower membership function
+        
+        check_set : bool
+        
+            If True, then a function named check_set in IT2FS will 
+            verify the condition LMF(x) < UMF(x) for any x in the domain. If the 
+            user is sure that they have selected the parameters of the membership 
+            functions correctly, then calling this time-consuming function 
+            is not needed. By default the parameter check_set is False.
+        
+        cache : bool
+        
+            If True, the upper and lower membership values on the domain 
+            are computed once and stored as read-only arrays. They are 
+            computed again when the domain, the membership functions, or 
+            their parameters (including in-place changes of the parameter 
+            lists) change. Set it to False if the membership functions 
+            depend on a state which is changed outside of the IT2FS, like a 
+            mutable closure. By default the parameter cache is True.
+            
+        .. rubric:: Functions
+        
+        Functions defined in IT2FS class:
+        
+            copy:
 
-        Determines whether the grid is displayed in the plot.
-    
-    xlabel : str
+                Returns a copy of the IT2FS.
+            
+            plot:
+                
+                Plots the IT2FS.
+            
+            negation operator -:
+                
+                Returns the negated IT2FS.
+        
+        .. rubric:: Examples
+        
+        >>> mySet = IT2FS(linspace(0., 1., 100), 
+                          trapezoid_mf, [0, 0.4, 0.6, 1., 1.], 
+                          tri_mf, [0.25, 0.5, 0.75, 0.6])
+        >>> mySet.plot(filename="mySet")
+        """
 
-        Label of the x axis.
-    
-    ylabel : str
+    def __init__(self, domain, umf=zero_mf, umf_params=[], lmf=zero_mf, lmf_params=[], 
+                 check_set=False, cache=True):
+        self.umf = umf
+        self.lmf = lmf
+        self.cache = cache
+        self.umf_params = umf_params
+        self.lmf_params = lmf_params
 
-        Label of the y axis.
-        
-    .. rubric:: Examples
-    
-    >>> tr1 = (0.2, 0.3)
-    >>> TR_plot(linspace(0., 1., 100), tr1)
-    """
-    plt.figure()
-    plt.plot([min(domain), tr[0], tr[0], tr[1], tr[1], max(domain)], 
-              [0, 0, 1, 1, 0, 0], linewidth=2)
-    plt.xlim((min(domain), max(domain)))
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    if title is not None:
-        plt.title(title)
-    if legend is not None:
-        plt.legend([legend])
-    plt.grid(grid)
-    if filename is not None:
-        plt.savefig(filename + "." + ext, format=ext, dpi=300, bbox_inches="tight")
-    plt.show()
+        self.domain = domain
+        if check_set:
+            self.check_set()
 
+    def __repr__(self):
+        return "Interval type 2 fuzzy set with " + \
+               self.umf.__name__ + " UMF function with " + \
+               str(list(map(float, self.umf_params))) + " parameters, and " + \
+               self.lmf.__name__ + " LMF function with " + \
+               str(list(map(float, self.lmf_params))) + " parameters"
 
-def crisp(tr):
-    """
-    Calculates the crisp number obtained from type reduced IT2FS.
+    @property
+    def domain(self):
+        """
+        Universe of discourse of the IT2FS. Setting a new domain clears 
+        the sampled upper and lower membership values.
+        """
+        return self.__domain
     
-    .. rubric:: Parameters
+    @domain.setter
+    def domain(self, domain):
+        self.__domain = domain
+        self.__upper = None
+        self.__lower = None
     
-    tr : Tuple (l, r)
-        
-        A tuple (l, r) representing the type-reduced Interval Type-2 Fuzzy Set (IT2FS).
+    @property
+    def umf_params(self):
+        """
+        Parameters of the upper membership function. Setting new parameters 
+        clears the sampled upper membership values.
+        """
+        return self.__umf_params
     
-    .. rubric:: Returns
+    @umf_params.setter
+    def umf_params(self, umf_params):
+        self.__umf_params = umf_params
+        self.__upper = None
     
-    output : float
+    @property
+    def lmf_params(self):
+        """
+        Parameters of the lower membership function. Setting new parameters 
+        clears the sampled lower membership values.
+        """
+        return self.__lmf_params
+    
+    @lmf_params.setter
+    def lmf_params(self, lmf_params):
+        self.__lmf_params = lmf_params
+        self.__lower = None
+    
+    @staticmethod
+    def __key(mf, params):
+        try:
+            return (mf, tuple(map(float, params)))
+        except (TypeError, ValueError):
+            return None
+    
+    def __sample(self, mf, params, cached):
+        if not self.cache:
+            return asarray(maximum(minimum(mf(self.domain, params), 1), 0), dtype=_precision), None
+        key = self.__key(mf, params)
+        if cached is not None and key is not None and cached[0] == key and \
+           cached[1].dtype == _precision:
+            return cached[1], cached
+        values = asarray(maximum(minimum(mf(self.domain, params), 1), 0), dtype=_precision)
+        if isinstance(values, ndarray):
+            values.flags.writeable = False
+        return values, (key, values)
     
-        The crisp number resulting from the type-reduced IT2FS.
+    @property
+    def upper(self):
+        """
+        Upper membership values of the IT2FS on its domain, clipped to 
+        the interval [0, 1]. The values are computed once and stored as a 
+        read-only array until the domain, the UMF, or its parameters change.
+        """
+        values, self.__upper = self.__sample(self.umf, self.umf_params, self.__upper)
+        return values
     
-    .. rubric:: Examples
+    @property
+    def lower(self):
+        """
+        Lower membership values of the IT2FS on its domain, clipped to 
+        the interval [0, 1]. The values are computed once and stored as a 
+        read-only array until the domain, the LMF, or its parameters change.
+        """
+        values, self.__lower = self.__sample(self.lmf, self.lmf_params, self.__lower)
+        return values
+
+    def check_set(self):
+        """
+        Verifies the condition LMF(x) < UMF(x) for any x in the domain.
+        """
+        for l, u in zip(self.lower, self.upper):
+            if l > u:
+                raise ValueError("LMF in some points in domain is larger than UMF.")
+
+    def copy(self):
+        """
+        Copies the IT2FS.
+        
+        .. rubric:: Returns
+        
+        output : IT2FS
+        
+        Returns a copy of the IT2FS.
+        """
+        return IT2FS(self.domain, umf=self.umf, umf_params=self.umf_params, lmf=self.lmf, lmf_params=self.lmf_params, 
+                     cache=self.cache)
+
+    def plot(self, title=None, legends=None, filename=None, 
+             ext="pdf", grid=True, xlabel="Domain", 
+             ylabel="Membership degree", legendloc="best", 
+             bbox_to_anchor=None, alpha=0.5, ):
+        """
+        Plots the IT2FS.
+        
+        .. rubric:: Parameters
+        
+        title : str
+            
+            If set, it indicates the title to be 
+            represented in the plot. If not set, the plot will not 
+            have a title.
+        
+        legend_text : str
+            
+            If set, it indicates the legend text to 
+            be represented in the plot. If not set, the plot will 
+            not contain a legend.
+        
+        filename : str
+        
+            If set, the plot will be saved as a filename.ext file.
+            
+        ext : str
+
+            Extension of the output file, with 'pdf' as the default value.
+        
+        grid : bool
+
+            Determines whether the grid is displayed in the plot.
+        
+        xlabel : str
+
+            Label of the x-axis.
+        
+        ylabel : str
+
+            Label of the y-axis.
+        
+        .. rubric:: Examples
+        
+        >>> mySet = IT2FS(linspace(0., 1., 100), 
+                          trapezoid_mf, [0, 0.4, 0.6, 1., 1.], 
+                          tri_mf, [0.25, 0.5, 0.75, 0.6])
+        >>> mySet.plot(filename="mySet")
+        """
+        plt.figure()
+        plt.fill_between(self.domain, self.upper, self.lower, alpha=alpha)
+        if legends is not None:
+            if bbox_to_anchor is None:
+                plt.legend(legends, loc=legendloc)
+            else:
+                plt.legend(legends, loc=legendloc, bbox_to_anchor=bbox_to_anchor)
+
+        if title is not None:
+            plt.title(title)
+        plt.plot(self.domain, self.upper, color="black", alpha=alpha)
+        plt.plot(self.domain, self.lower, color="black", alpha=alpha)
+        if grid == True:
+            plt.grid(which="major", linestyle="-", linewidth=0.75, color="gray", alpha=0.7)
+            plt.minorticks_on() 
+            plt.grid(which="minor", linestyle=":", linewidth=0.5, color="lightgray", alpha=0.7)
     
-    >>> tr1 = (0.1, 0.3)
-    >>> print(crisp(tr1))
-    """
-    return (tr[0] + tr[1]) / 2
+        plt.xlabel(xlabel)
+        plt.ylabel(ylabel)
+        plt.ylim((-0.05, 1.05))
+        if filename is not None:
+            plt.savefig(filename + "." + ext, format=ext, dpi=300, bbox_inches="tight")
+        plt.show()
+
+    def __neg__(self):
+        """
+        Negates the IT2FS.
+        
+        .. rubric:: Returns
+        
+        output : IT2FS
+        
+            Returns a negated copy of the IT2FS.
+        """
+        umf = lambda x, params: subtract(1, self.umf(x, params))
+        lmf = lambda x, params: subtract(1, self.lmf(x, params))
+        neg_it2fs = IT2FS(self.domain, lmf, self.lmf_params, umf, self.umf_params)
+        return neg_it2fs
 
 
-def crisp_list(trs, o=None):
+class SampledIT2FS(IT2FS):
     """
-    Calculates the crisp outputs obtained by calling the evaluate_list 
-    function from IT2FLS class.
+    Interval Type 2 Fuzzy Set (IT2FS) represented by the values of its upper 
+    and lower membership functions sampled on the domain.
+    
+    The results of meet, join, MEET, and JOIN, and the outputs of the IT2 
+    Mamdani FLSs, are built from many other sets. Representing them with 
+    nested membership function closures makes each evaluation walk the 
+    whole chain. A SampledIT2FS keeps the membership values as arrays, so 
+    its UMF and LMF on the domain are read instead of computed.
     
     .. rubric:: Parameters
     
-    trs : List of Tuples (l, r)
+    Parameters of the constructor function:
+    
+    domain : numpy (n,) shaped array
         
-        A list of tuples (l, r) representing the type-reduced Interval Type-2 Fuzzy Sets.
+        Indicates the universe of discourse dedicated to the IT2FS.
     
-    o : str
+    umf_values : numpy (n,) shaped array
         
-        The name of the output variable to be processed. If not given, 
-        the crisp outputs are calculated for all output variables.
+        Values of the upper membership function at the points of the domain.
     
-    .. rubric:: Returns
+    lmf_values : numpy (n,) shaped array
+        
+        Values of the lower membership function at the points of the domain.
     
-    output : List of floats or Dictionary of {str: List of float}
+    umf=None : function
+        
+        If set, it is used as the upper membership function at the points 
+        which are not the domain. Otherwise, the upper membership values 
+        are linearly interpolated from umf_values (and held constant out of 
+        the domain range).
+    
+    lmf=None : function
+        
+        If set, it is used as the lower membership function at the points 
+        which are not the domain. Otherwise, the lower membership values 
+        are linearly interpolated from lmf_values.
+    
+    check_set : bool
+        
+        If True, then a function named check_set in IT2FS will 
+        verify the condition LMF(x) < UMF(x) for any x in the domain.
+    
+    .. rubric:: Examples
     
-        List of floats (or Dictionary of Lists of float with output variable names as keys).
+    >>> domain = linspace(0., 1., 100)
+    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
+    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
+    >>> it2fs3 = SampledIT2FS(domain, maximum(it2fs1.upper, it2fs2.upper), 
+                              maximum(it2fs1.lower, it2fs2.lower))
+    >>> it2fs3.plot()
     """
-    if o is None:
-        output = {}
-        for key in trs[0].keys():
-            output[key] = []
-        for tr in trs:
-            for key in trs[0].keys():
-                output[key].append(crisp(tr[key]))
-        return output
-            
-    else:
-        output = []
-        for tr in trs:
-            output.append(crisp(tr[o]))
-        return output
+    def __init__(self, domain, umf_values, lmf_values, umf=None, lmf=None, check_set=False):
+        self.umf_values = asarray(umf_values, dtype=float)
+        self.lmf_values = asarray(lmf_values, dtype=float)
+        self.__domain = domain
+        self.__umf = umf
+        self.__lmf = lmf
+        IT2FS.__init__(self, domain, self.__sampled_umf, [], self.__sampled_lmf, [], 
+                       check_set=check_set)
+    
+    def __repr__(self):
+        return "Interval type 2 fuzzy set sampled on " + \
+               str(len(self.umf_values)) + " points"
+    
+    def __sampled_umf(self, x, params=[]):
+        if x is self.__domain:
+            return self.umf_values
+        if self.__umf is not None:
+            return self.__umf(x, params)
+        return interp(x, self.__domain, self.umf_values)
+    
+    def __sampled_lmf(self, x, params=[]):
+        if x is self.__domain:
+            return self.lmf_values
+        if self.__lmf is not None:
+            return self.__lmf(x, params)
+        return interp(x, self.__domain, self.lmf_values)
+    
+    def copy(self):
+        """
+        Copies the sampled IT2FS.
+        
+        .. rubric:: Returns
+        
+        output : SampledIT2FS
+        
+        Returns a copy of the sampled IT2FS.
+        """
+        return SampledIT2FS(self.__domain, self.umf_values.copy(), self.lmf_values.copy(), 
+                            self.__umf, self.__lmf)
 
 
-def min_t_norm(a, *others):
+def IT2FS_Emphasize(it2fs, m=2.):
     """
-    Minimum t-norm function.
+    Function for creating emphasized IT2FSs.
     
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
-    
-    others : numpy (n,) shaped arrays
-    
-    .. rubric:: Returns
-    
-    output : numpy (n,) shaped array
+    it2fs : IT2FS
+        
+        Interval type 2 fuzzy set to be emphasized.
+        
+    m : float, optional
+        
+        Emphasis degree. The default value is 2.
 
-        Returns minimum t-norm of a and other inputs.
-    
-    .. rubric:: Examples
+    .. rubric:: Returns
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = min_t_norm(a, b)
+    emphasized : IT2FS
+        
+        Emphasized interval type 2 fuzzy set.
     """
-    result = a
-    for other in others:
-        result = minimum(result, other)
-    return result
+    lmf = lambda x, params : it2fs.lmf(x, it2fs.lmf_params) ** m
+    umf = lambda x, params : it2fs.umf(x, it2fs.umf_params) ** m
+    emphasized = IT2FS(it2fs.domain, 
+                       umf, it2fs.umf_params, 
+                       lmf, it2fs.lmf_params)
+    return emphasized
 
 
-def product_t_norm(a, *others):
+def IT2FS_Elliptic(domain, params, check_set=False):
     """
-    Product t-norm function.
+    Creates an elliptic IT2FS.
     
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
     
-    others : numpy (n,) shaped arrays
+    params : list
+        
+        The parameters of the elliptic IT2FS. The center, width, UMF's exponent, 
+        LMF's exponent, and height are indicated by params[0], params[1], params[2], 
+        params[3], and params[4], respectively.
     
     .. rubric:: Returns
-
-    output : numpy (n,) shaped array
     
-        Returns product t-norm of a and other inputs.
+    output : IT2FS
+        
+        Returns an elliptic IT2FS with specified parameters.
     
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = product_t_norm(a, b)
+    >>> domain = linspace(0., 1., 100)
+    >>> mySet = IT2FS_Elliptic(domain, [0.5, 0.25, 1.3, 0.7, 0.8])
+    >>> mySet.plot()
     """
-    result = a
-    for other in others:
-        result = multiply(result, other)
-    return result
+    return IT2FS(domain, 
+                 elliptic_mf, [params[0], params[1], params[2], params[4]], 
+                 elliptic_mf, [params[0], params[1], params[3], params[4]], check_set=check_set)
 
 
-def lukasiewicz_t_norm(a, *others):
+def IT2FS_Semi_Elliptic(domain, params, check_set=False):
     """
-    Lukasiewicz t-norm function.
+    Creates a semi-elliptic IT2FS.
     
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
     
-    others : numpy (n,) shaped arrays
+    params : list
+        
+        The parameters of the semi-elliptic IT2FS. The center, UMF's width, 
+        LMF's width, and height are indicated by params[0], params[1], params[2], 
+        and params[3], respectively.
     
     .. rubric:: Returns
-
-    output : numpy (n,) shaped array
     
-        Returns Lukasiewicz t-norm of a and other inputs.
+    output : IT2FS
+        
+        Returns a semi-elliptic IT2FS with specified parameters.
     
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = lukasiewicz_t_norm(a, b)
+    >>> domain = linspace(0., 1., 100)
+    >>> mySet = IT2FS_Semi_Elliptic(domain, [0.5, 0.15, 0.05, 0.6])
+    >>> mySet.plot()
     """
-    result = a
-    for other in others:
-        result = maximum(0, result + other - 1)
-    return result
+    return IT2FS(domain, 
+                 semi_elliptic_mf, [params[0], params[1], params[3]], 
+                 semi_elliptic_mf, [params[0], params[2], params[3]], check_set=check_set)
 
 
-def drastic_t_norm(a, *others):
+def IT2FS_Gaussian_UncertMean(domain, params, check_set=False):
     """
-    Drastic t-norm function.
+    Creates a Gaussian IT2FS with uncertain mean value.
     
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
     
-    others : numpy (n,) shaped arrays
+    params : list
+        
+        The parameters of the Gaussian IT2FS with uncertain mean value. 
+        The mean center, mean spread, standard deviation, and height are 
+        indicated by params[0], params[1], params[2], and params[3], respectively.
     
     .. rubric:: Returns
-
-    output : numpy (n,) shaped array
     
-        Returns drastic t-norm of a and other inputs.
+    output : IT2FS
+        
+        Returns a Gaussian IT2FS with uncertain mean value with specified parameters.
     
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = drastic_t_norm(a, b)
+    >>> domain = linspace(0., 1., 100)
+    >>> mySet = IT2FS_Gaussian_UncertMean(domain, [0., 0.25, 0.2])
+    >>> mySet.plot()
     """
-    result = a
-    for other in others:
-        result = other * (result == 1) + result * (other == 1)
-    return result
+    ml = params[0] - params[1] / 2.
+    mr = params[0] + params[1] / 2.
+    return IT2FS(domain, 
+                 gauss_uncert_mean_umf, [ml, mr, params[2], params[3]], 
+                 gauss_uncert_mean_lmf, [ml, mr, params[2], params[3]], check_set=check_set)
 
 
-def nilpotent_minimum_t_norm(a, *others):
+def IT2FS_Gaussian_UncertStd(domain, params, check_set=False):
     """
-    Nilpotent minimum t-norm function.
+    Creates a Gaussian IT2FS with uncertain standard deviation value.
     
     .. rubric:: Parameters
+
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
     
-    a : numpy (n,) shaped array
-    
-    others : numpy (n,) shaped array
+    params : list
+        
+        The parameters of the Gaussian IT2FS with uncertain standard deviation 
+        value, the mean, standard deviation center, standard deviation spread, 
+        and height are indicated by params[0], params[1], params[2], and 
+        params[3], respectively.
     
     .. rubric:: Returns
-
-    output : numpy (n,) shaped array
     
-        Returns nilpotent minimum t-norm of a and other inputs.
+    output : IT2FS
+
+        Returns a Gaussian IT2FS with uncertain standard deviation value 
+        with specified parameters.
     
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = nilpotent_minimum_t_norm(a, b)
+    >>> domain = linspace(0., 1., 100)
+    >>> mySet = IT2FS_Gaussian_UncertStd(domain, [0.5, 0.2, 0.05, 1.])
+    >>> mySet.plot()
     """
-    result = a
-    for other in others:
-        result = minimum(result, other) * (result + other > 1)
-    return result
+    stdl = params[1] - params[2] / 2
+    stdr = params[1] + params[2] / 2
+    return IT2FS(domain, 
+                 gauss_uncert_std_umf, [params[0], stdl, stdr, params[3]], 
+                 gauss_uncert_std_lmf, [params[0], stdl, stdr, params[3]], check_set=check_set)
 
 
-def hamacher_product_t_norm(a, *others):
+def IT2FS_RGaussian_UncertStd(domain, params, check_set=False):
     """
-    Hamacher product t-norm function.
+    Creates a Right Gaussian IT2FS with uncertain standard deviation value.
     
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
     
-    others : numpy (n,) shaped arrays
+    params : list
+        
+        The parameters of the Gaussian IT2FS with uncertain standard 
+        deviation value, the mean, standard deviation center, standard deviation 
+        spread, and height are indicated by params[0], params[1], params[2], 
+        and params[3], respectively.
     
     .. rubric:: Returns
-
-    output : numpy (n,) shaped array
     
-        Returns hamacher product t-norm of a and other inputs.
+    output : IT2FS
+
+        Returns a Gaussian IT2FS with uncertain standard deviation value 
+        with specified parameters.
     
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = hamacher_product_t_norm(a, b)
+    >>> domain = linspace(0., 1., 100)
+    >>> mySet = R_IT2FS_Gaussian_UncertStd(domain, [0.5, 0.2, 0.05, 1.])
+    >>> mySet.plot()
     """
-    result = a
-    for other in others:
-        result = ((result * other) / (result + other - result * other)) * \
-            logical_not((result == 0) * (other == 0))
-    return result
+    stdl = params[1] - params[2] / 2
+    stdr = params[1] + params[2] / 2
+    return IT2FS(domain, 
+                  rgauss_uncert_std_umf, 
+                  [params[0], stdl, stdr, params[3]],
+                  rgauss_uncert_std_lmf, 
+                  [params[0], stdl, stdr, params[3]], check_set=check_set)
 
 
-def max_s_norm(a, *others):
+R_IT2FS_Gaussian_UncertStd = IT2FS_RGaussian_UncertStd
+
+
+def IT2FS_LGaussian_UncertStd(domain, params, check_set=False):
     """
-    Maximum s-norm function.
+    Creates a Left Gaussian IT2FS with uncertain standard deviation value.
     
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
     
-    others : numpy (n,) shaped arrays
+    params : list
+        
+        The parameters of the Gaussian IT2FS with uncertain standard deviation 
+        value, the mean, standard deviation center, standard deviation spread, 
+        and height are indicated by params[0], params[1], params[2], and 
+        params[3], respectively.
     
     .. rubric:: Returns
-
-    output : numpy (n,) shaped array
     
-        Returns maximum s-norm of a and other inputs.
+    output : IT2FS
+        Returns a Gaussian IT2FS with uncertain standard deviation value 
+        with specified parameters.
     
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = max_s_norm(a, b)
+    >>> domain = linspace(0., 1., 100)
+    >>> mySet = L_IT2FS_Gaussian_UncertStd(domain, [0.5, 0.2, 0.05, 1.])
+    >>> mySet.plot()
     """
-    result = a
-    for other in others:
-        result = maximum(result, other)
-    return result
+    stdl = params[1] - params[2] / 2
+    stdr = params[1] + params[2] / 2
+    return IT2FS(domain, 
+                  lgauss_uncert_std_umf, 
+                  [params[0], stdl, stdr, params[3]],
+                  lgauss_uncert_std_lmf, 
+                  [params[0], stdl, stdr, params[3]], check_set=check_set)
 
 
-def probabilistic_sum_s_norm(a, *others):
-    """
-    Probabilistic sum s-norm function.
+L_IT2FS_Gaussian_UncertStd = IT2FS_LGaussian_UncertStd
+
 
+def IT2FS_plot(*sets, title=None, legends=None, filename=None, 
+               ext="pdf", grid=True, xlabel="Domain", 
+               ylabel="Membership degree", legendloc="best", 
+               bbox_to_anchor=None, alpha=0.5, ):
+    """
+    Plots multiple IT2FSs together in the same figure.
+    
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    \*sets:
 
-    others : numpy (n,) shaped arrays
+        Multiple number of IT2FSs which will be plotted.
+    
+    title : str
+        
+        If set, it indicates the title to be represented in the plot. 
+        If not set, the plot will not have a title.
+        
+    legends : list of strs
+        
+        List of legend texts to be presented in plot. If not 
+        set, no legend will be in plot.
+        
+    filename : str
+        
+        If set, the plot will be saved as a filename.ext file.
+        
+    ext : str
 
-    .. rubric:: Returns
+        Extension of the output file with pdf as the default value.
+    
+    grid : bool
 
-    output : numpy (n,) shaped array
+        Determines whether the grid is displayed in the plot.
     
-        Returns probabilistic sum s-norm of a and other inputs.
+    xlabel : str
+
+        Label of the x axis.
+    
+    ylabel : str
 
+        Label of the y axis.
+        
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = probabilistic_sum_s_norm(a, b)
+    >>> domain = linspace(0., 1., 100)
+    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05])
+    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05])
+    >>> IT2FS_plot(it2fs1, it2fs2, title="Plotting IT2FSs", 
+                   legends=["First set", "Second set"])
     """
-    result = a
-    for other in others:
-        result = result + other - result * other
-    return result
+    plt.figure()
+    for it2fs in sets:
+        plt.fill_between(it2fs.domain, it2fs.upper, it2fs.lower, alpha=alpha)
+    if legends is not None:
+        if bbox_to_anchor is None:
+            plt.legend(legends, loc=legendloc)
+        else:
+            plt.legend(legends, loc=legendloc, bbox_to_anchor=bbox_to_anchor)
+
+    for it2fs in sets:
+        plt.plot(it2fs.domain, it2fs.lower, color="black", alpha=alpha)
+        plt.plot(it2fs.domain, it2fs.upper, color="black", alpha=alpha)
+    if title is not None:
+        plt.title(title)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.ylim((-0.05, 1.05))
+    if grid == True:
+        plt.grid(which="major", linestyle="-", linewidth=0.75, color="gray", alpha=0.7)
+        plt.minorticks_on() 
+        plt.grid(which="minor", linestyle=":", linewidth=0.5, color="lightgray", alpha=0.7)
+    
+    if filename is not None:
+        plt.savefig(filename + "." + ext, format=ext, dpi=300, bbox_inches="tight")
+    plt.show()
 
 
-def bounded_sum_s_norm(a, *others):
+def TR_plot(domain, tr, title=None, legend=None, filename=None, 
+            ext="pdf", grid=True, xlabel="Domain", ylabel="Membership degree"):
     """
-    Bounded sum s-norm function.
-
+    Plots a type reduced IT2FS.
+    
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    tr : Tuple (l, r)
+        
+        Indicates the type reduced set to be plotted.
+    
+    title : str
+        
+        If set, it indicates the title which will be represented in the plot. 
+        If not set, the plot will not have a title.
+        
+    legend : str
+        
+        If set, it indicates the legend text which will be represented in the plot. 
+        If not set, the plot will not contain a legend.
+        
+    filename : str
+        
+        If set, the plot will be saved as a filename.ext file.
+        
+    ext : str
 
-    others : numpy (n,) shaped arrays
+        Extension of the output file with 'pdf' as the default value.
+    
+    grid : bool
 
-    .. rubric:: Returns
+        Determines whether the grid is displayed in the plot.
+    
+    xlabel : str
 
-    output : numpy (n,) shaped array
+        Label of the x axis.
     
-        Returns bounded sum s-norm of a and other inputs.
+    ylabel : str
 
+        Label of the y axis.
+        
     .. rubric:: Examples
     
-    >>> a = random.random(10,)
-    >>> b = random.random(10,)
-    >>> c = bounded_sum_s_norm(a, b)
+    >>> tr1 = (0.2, 0.3)
+    >>> TR_plot(linspace(0., 1., 100), tr1)
     """
-    result = a
-    for other in others:
-        result = minimum(result + other, 1)
-    return result
+    plt.figure()
+    plt.plot([min(domain), tr[0], tr[0], tr[1], tr[1], max(domain)], 
+              [0, 0, 1, 1, 0, 0], linewidth=2)
+    plt.xlim((min(domain), max(domain)))
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    if title is not None:
+        plt.title(title)
+    if legend is not None:
+        plt.legend([legend])
+    plt.grid(grid)
+    if filename is not None:
+        plt.savefig(filename + "." + ext, format=ext, dpi=300, bbox_inches="tight")
+    plt.show()
 
 
-def drastic_s_norm(a, *others):
+def crisp(tr):
     """
-    Drastic s-norm function.
-
+    Calculates the crisp number obtained from type reduced IT2FS.
+    
     .. rubric:: Parameters
     
-    a : numpy (n,) shaped array
+    tr : Tuple (l, r)
+        
+        A tuple (l, r) representing the type-reduced Interval Type-2 Fuzzy Set (IT2FS).
+    
+    .. rubric:: Returns
+    
+    output : float
+    
+        The crisp number resulting from the type-reduced IT2FS.
+    
+    .. rubric:: Examples
+    
+    >>> tr1 = (0.1, 0.3)
+    >>> print(crisp(tr1))
+    """
+    return (tr[0] + tr[1]) / 2
 
-    others : numpy (n,) shaped arrays
 
+def crisp_list(trs, o=None):
+    """
+    Calculates the crisp outputs obtained by calling the evaluate_list 
+    function from IT2FLS class.
+    
+    .. rubric:: Parameters
+    
+    trs : Dictionary of {str: numpy (n_samples, 2) shaped array}
+        
+        The type-reduced Interval Type-2 Fuzzy Sets as returned by the 
+        evaluate_list function, with output variable names as keys and 
+        one (l, r) row for each sample. The values can also be numpy 
+        (n_samples, ) shaped arrays of crisp numbers, which are returned 
+        unchanged. A list of dictionaries of tuples (l, r), one for each 
+        sample, is accepted as well.
+    
+    o : str
+        
+        The name of the output variable to be processed. If not given, 
+        the crisp outputs are calculated for all output variables.
+    
     .. rubric:: Returns
+    
+    output : numpy (n_samples, ) shaped array or Dictionary of {str: numpy (n_samples, ) shaped array}
+    
+        The crisp outputs (or Dictionary of crisp outputs with output variable names as keys).
+    
+    .. rubric:: Examples
+    
+    >>> trs = {"y1": array([[0.1, 0.3], [0.2, 0.6]])}
+    >>> print(crisp_list(trs, "y1"))
+    """
+    if not isinstance(trs, dict):
+        trs = {key: array([tr[key] for tr in trs]) for key in (trs[0].keys() if trs else [])}
+    
+    def _crisp(tr):
+        tr = asarray(tr, dtype=float)
+        if tr.ndim == 2:
+            return (tr[:, 0] + tr[:, -1]) / 2
+        return tr
+    
+    if o is None:
+        return {key: _crisp(tr) for key, tr in trs.items()}
+    else:
+        return _crisp(trs[o])
 
-    output : numpy (n,) shaped array
+
+def min_t_norm(a, *others):
+    """
+    Minimum t-norm function.
     
-        Returns drastic s-norm of a and other inputs.
+    .. rubric:: Parameters
+    
+    a : numpy (n,) shaped array
+    
+    others : numpy (n,) shaped arrays
+    
+    .. rubric:: Returns
+    
+    output : numpy (n,) shaped array
 
+        Returns minimum t-norm of a and other inputs.
+    
     .. rubric:: Examples
     
     >>> a = random.random(10,)
     >>> b = random.random(10,)
-    >>> c = drastic_s_norm(a, b)
+    >>> c = min_t_norm(a, b)
     """
     result = a
     for other in others:
-        result = other * (result == 0) + result * (other == 0) + 1. * (result != 0.) * (other != 0.)
+        result = minimum(result, other)
     return result
 
 
-def nilpotent_maximum_s_norm(a, *others):
+def product_t_norm(a, *others):
     """
-    Nilpotent maximum s-norm function.
-
+    Product t-norm function.
+    
     .. rubric:: Parameters
     
     a : numpy (n,) shaped array
-
+    
     others : numpy (n,) shaped arrays
-
+    
     .. rubric:: Returns
 
     output : numpy (n,) shaped array
     
-        Returns nilpotent maximum s-norm of a and others.
-
+        Returns product t-norm of a and other inputs.
+    
     .. rubric:: Examples
     
     >>> a = random.random(10,)
     >>> b = random.random(10,)
-    >>> c = nilpotent_maximum_s_norm(a, b)
+    >>> c = product_t_norm(a, b)
     """
     result = a
     for other in others:
-        result = maximum(result, other) * (result + other < 1) + 1. * (result + other >= 1)
+        result = multiply(result, other)
     return result
 
 
-def einstein_sum_s_norm(a, *others):
+def lukasiewicz_t_norm(a, *others):
     """
-    Einstein sum s-norm function.
-
+    Lukasiewicz t-norm function.
+    
     .. rubric:: Parameters
     
     a : numpy (n,) shaped array
-
+    
     others : numpy (n,) shaped arrays
-
+    
     .. rubric:: Returns
 
     output : numpy (n,) shaped array
     
-        Returns einstein sum s-norm of a and other inputs.
-
+        Returns Lukasiewicz t-norm of a and other inputs.
+    
     .. rubric:: Examples
     
     >>> a = random.random(10,)
     >>> b = random.random(10,)
-    >>> c = einstein_sum_s_norm(a, b)
+    >>> c = lukasiewicz_t_norm(a, b)
     """
     result = a
     for other in others:
-        result = (result + other) / (1 + result * other)
+        result = maximum(0, result + other - 1)
     return result
 
 
-def meet(domain, it2fs1, it2fs2, t_norm):
+def drastic_t_norm(a, *others):
     """
-    Meet operator for IT2FSs.
+    Drastic t-norm function.
     
     .. rubric:: Parameters
     
-    domain : numpy (n,) shaped array
-        
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    it2fs1 : IT2FS
-        
-        First input of the meet operator.
-        
-    it2fs2 : IT2FS
-        
-        Second input of the meet operator.
+    a : numpy (n,) shaped array
     
-    t_norm : function
-        
-        The t-norm function to be used.
+    others : numpy (n,) shaped arrays
     
     .. rubric:: Returns
+
+    output : numpy (n,) shaped array
     
-    output : IT2FS
-    
-        Returns the meet of the two input IT2FSs.
+        Returns drastic t-norm of a and other inputs.
     
     .. rubric:: Examples
     
-    >>> domain = linspace(0., 1., 100)
-    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
-    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
-    >>> it2fs3 = meet(domain, it2fs1, it2fs2, min_t_norm)
-    >>> it2fs3.plot()
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = drastic_t_norm(a, b)
     """
-    umf = lambda x, params: t_norm(it2fs1.umf(x, it2fs1.umf_params), 
-                                   it2fs2.umf(x, it2fs2.umf_params))
-    lmf = lambda x, params: t_norm(it2fs1.lmf(x, it2fs1.lmf_params), 
-                                   it2fs2.lmf(x, it2fs2.lmf_params))
-    it2fs = IT2FS(domain, umf, [], lmf, [])
-    return it2fs
+    result = a
+    for other in others:
+        result = other * (result == 1) + result * (other == 1)
+    return result
 
 
-def MEET(domain, t_norm, it2fs, *others):
+def nilpotent_minimum_t_norm(a, *others):
     """
-    Meet operator for IT2FSs.
+    Nilpotent minimum t-norm function.
     
     .. rubric:: Parameters
     
-    domain : numpy (n,) shaped array
-        
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    t_norm : function
-        
-        The t-norm function to be used.
-
-    it2fs : IT2FS
-        
-        An interval type 2 fuzzy set as the first input of the meet operator.
-        
-    others : IT2FS
-        
-        Other interval type 2 fuzzy sets.
+    a : numpy (n,) shaped array
     
+    others : numpy (n,) shaped array
     
     .. rubric:: Returns
+
+    output : numpy (n,) shaped array
     
-    output : IT2FS
-    
-        Returns the meet of the input IT2FSs.
+        Returns nilpotent minimum t-norm of a and other inputs.
     
     .. rubric:: Examples
     
-    >>> domain = linspace(0., 1., 100)
-    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
-    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
-    >>> it2fs3 = MEET(domain, min_t_norm, it2fs1, it2fs2)
-    >>> it2fs3.plot()
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = nilpotent_minimum_t_norm(a, b)
     """
-    result = it2fs
+    result = a
     for other in others:
-        result = meet(domain, result, other, t_norm)
+        result = minimum(result, other) * (result + other > 1)
     return result
 
 
-def join(domain, it2fs1, it2fs2, s_norm):
+def hamacher_product_t_norm(a, *others):
     """
-    Join operator for IT2FSs.
+    Hamacher product t-norm function.
     
     .. rubric:: Parameters
     
-    domain : numpy (n,) shaped array
-        
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    it2fs1 : IT2FS
-        
-        First input of the join operator.
-        
-    it2fs2 : IT2FS
-        
-        Second input of the join operator.
+    a : numpy (n,) shaped array
     
-    s_norm : function
-        
-        The s-norm function to be used.
+    others : numpy (n,) shaped arrays
     
     .. rubric:: Returns
+
+    output : numpy (n,) shaped array
     
-    output : IT2FS
-    
-        Returns the join of the two input IT2FSs.
+        Returns hamacher product t-norm of a and other inputs.
     
     .. rubric:: Examples
     
-    >>> domain = linspace(0., 1., 100)
-    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
-    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
-    >>> it2fs3 = join(domain, it2fs1, it2fs2, max_s_norm)
-    >>> it2fs3.plot()
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = hamacher_product_t_norm(a, b)
     """
-    umf = lambda x, params: s_norm(it2fs1.umf(x, it2fs1.umf_params), 
-                                   it2fs2.umf(x, it2fs2.umf_params))
-    lmf = lambda x, params: s_norm(it2fs1.lmf(x, it2fs1.lmf_params), 
-                                   it2fs2.lmf(x, it2fs2.lmf_params))
-    it2fs = IT2FS(domain, umf, [], lmf, [])
-    return it2fs
+    result = a
+    for other in others:
+        result = ((result * other) / (result + other - result * other)) * \
+            logical_not((result == 0) * (other == 0))
+    return result
 
 
-def JOIN(domain, s_norm, it2fs, *others):
+def max_s_norm(a, *others):
     """
-    Join operator for IT2FSs.
+    Maximum s-norm function.
     
     .. rubric:: Parameters
     
-    domain : numpy (n,) shaped array
-        
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    s_norm : function
-        
-        The s-norm function to be used.
-
-    it2fs : IT2FS
-        
-        An interval type 2 fuzzy set as the first input of the meet operator.
-        
-    others : IT2FS
-        
-        Other interval type 2 fuzzy sets.
+    a : numpy (n,) shaped array
     
+    others : numpy (n,) shaped arrays
     
     .. rubric:: Returns
+
+    output : numpy (n,) shaped array
     
-    output : IT2FS
-    
-        Returns the join of the input IT2FSs.
+        Returns maximum s-norm of a and other inputs.
     
     .. rubric:: Examples
     
-    >>> domain = linspace(0., 1., 100)
-    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
-    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
-    >>> it2fs3 = JOIN(domain, max_s_norm, it2fs1, it2fs2)
-    >>> it2fs3.plot()
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = max_s_norm(a, b)
     """
-    result = it2fs
+    result = a
     for other in others:
-        result = join(domain, result, other, s_norm)
+        result = maximum(result, other)
     return result
 
 
-def trim(intervals):
-    v = intervals[:, 3]
-    i, = where(v > 0)
-    if i.size == 0:
-        return False
-    else:
-        min1 = i[0]
-        max1 = i[-1] + 1
-    
-        v = intervals[:, 2]
-        i, = where(v > 0)
-        if i.size == 0:
-            min2 = min1
-            max2 = max1
-        else:
-            min2 = i[0]
-            max2 = i[-1] + 1
-        return intervals[min(min1, min2):max(max1, max2), :]
-
-
-def KM_algorithm(intervals, params=[]):  # intervals = [[a1, b1, c1, d1], [a2, b2, c2, d2], ...]
+def probabilistic_sum_s_norm(a, *others):
     """
-    KM algorithm
-    
+    Probabilistic sum s-norm function.
+
     .. rubric:: Parameters
     
-    intervals : numpy (n, 4) array
-        
-        Y = intervals[:, 0:2]
-        
-        F = intervals[:, 2:4]
-    
-    params : List
-        
-        List of parameters of algorithm, if it is needed.
-    
+    a : numpy (n,) shaped array
+
+    others : numpy (n,) shaped arrays
+
     .. rubric:: Returns
-    
-    output : Tuple (l, r)
-    """
-    # left calculations
-    intervals = trim(intervals)
-    
-    if intervals is False:
-        return 0., 0.
-    
-    w = (intervals[:, 2] + intervals[:, 3]) / 2.
-    w_l = w[:]
 
-    N = len(intervals)
-    intervals = intervals[intervals[:,0].argsort()]
-    y_l_prime_num = npsum(intervals[:, 0] * w_l)
-    y_prime_den = npsum(w_l)
-    y_l_prime = y_l_prime_num / y_prime_den
+    output : numpy (n,) shaped array
     
-    while True:
-        k_l = 0
-        for i in range(0, N-1):
-            if (intervals[i, 0] <= y_l_prime <= intervals[i+1, 0]) or \
-                isclose(intervals[i, 0], y_l_prime) or \
-                isclose(y_l_prime, intervals[i+1, 0]):
-                k_l = i
-                break
-        
-        ii = arange(N)
-        w_l = (ii <= k_l) * intervals[:, 3] + (ii > k_l) * intervals[:, 2]
-        y_l_num = npsum(intervals[:, 0] * w_l)
-        y_l_den = npsum(w_l)
-        y_l = y_l_num / y_l_den
-        if isclose(y_l, y_l_prime, abs_tol=1.0e-6):
-            break
-        else:
-            y_l_prime = y_l
-    # right calculations
-    w_r = w[:]
+        Returns probabilistic sum s-norm of a and other inputs.
+
+    .. rubric:: Examples
     
-    intervals = intervals[intervals[:, 1].argsort()]
-    y_r_prime_num = npsum(intervals[:, 1] * w_r)
-    y_r_prime = y_r_prime_num / y_prime_den
-    while True:
-        k_r = 0
-        for i in range(0, N-1):
-            if (intervals[i, 1] <= y_r_prime <= intervals[i+1, 1]) or \
-                isclose(intervals[i, 1], y_r_prime) or \
-                isclose(y_r_prime, intervals[i+1, 1]):
-                k_r = i
-                break
-        
-        ii = arange(N)
-        w_r = (ii <= k_r) * intervals[:, 2] + (ii > k_r) * intervals[:, 3]
-        y_r_num = npsum(intervals[:, 1] * w_r)
-        y_r_den = npsum(w_r)
-        y_r = y_r_num / y_r_den
-        if isclose(y_r, y_r_prime, abs_tol=1.0e-6):
-            break
-        else:
-            y_r_prime = y_r
-    return y_l, y_r
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = probabilistic_sum_s_norm(a, b)
+    """
+    result = a
+    for other in others:
+        result = result + other - result * other
+    return result
 
 
-def EKM_algorithm(intervals, params=[]):
+def bounded_sum_s_norm(a, *others):
     """
-    EKM algorithm
-    
+    Bounded sum s-norm function.
+
     .. rubric:: Parameters
     
-    intervals : numpy (n, 4) array
-        
-        Y = intervals[:, 0:2]
-        
-        F = intervals[:, 2:4]
-    
-    params : List
-        
-        List of parameters of algorithm, if it is needed.
-    
+    a : numpy (n,) shaped array
+
+    others : numpy (n,) shaped arrays
+
     .. rubric:: Returns
+
+    output : numpy (n,) shaped array
     
-    output : Tuple (l, r)
-    """
-    
-    # Left calculations
-    
-    intervals = trim(intervals)
-    
-    if intervals is False:
-        return 0, 0
+        Returns bounded sum s-norm of a and other inputs.
+
+    .. rubric:: Examples
     
-    N = len(intervals)
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = bounded_sum_s_norm(a, b)
+    """
+    result = a
+    for other in others:
+        result = minimum(result + other, 1)
+    return result
+
+
+def drastic_s_norm(a, *others):
+    """
+    Drastic s-norm function.
+
+    .. rubric:: Parameters
     
-    k_l = round(N / 2.4)
+    a : numpy (n,) shaped array
 
-    intervals = intervals[intervals[:, 0].argsort()]
-    a_l = npsum(intervals[:k_l, 0] * intervals[:k_l, 3]) + \
-          npsum(intervals[k_l:, 0] * intervals[k_l:, 2])
-    b_l = npsum(intervals[:k_l, 3]) + npsum(intervals[k_l:, 2])
-    y_l_prime = a_l / b_l
-    while True:
-        k_l_prime = 0
-        for i in range(0, N-1):
-            if (intervals[i, 0] <= y_l_prime <= intervals[i+1, 0]) or \
-                isclose(intervals[i, 0], y_l_prime, abs_tol=1.0e-6) or \
-                isclose(y_l_prime, intervals[i+1, 0], abs_tol=1.0e-6):
-                k_l_prime = i
-                break
-        if k_l_prime == k_l:
-            y_l = y_l_prime
-            break
-        s_l = sign(k_l_prime - k_l)
-        imin = min(k_l, k_l_prime) + 1
-        imax = max(k_l, k_l_prime)
-        
-        a_l_prime = a_l + s_l * npsum(intervals[imin:imax, 0] * \
-                    (intervals[imin:imax, 3] - intervals[imin:imax, 2]))
-        b_l_prime = b_l + s_l * \
-                    npsum(intervals[imin:imax, 3] - intervals[imin:imax, 2])
-        y_l_second = a_l_prime / b_l_prime
-        
-        k_l = k_l_prime
-        y_l_prime = y_l_second
-        a_l = a_l_prime
-        b_l = b_l_prime
-    # Right calculations
-    intervals = intervals[intervals[:, 1].argsort()]
-    k_r = round(N / 1.7)
-    a_r = npsum(intervals[:k_r, 1] * intervals[:k_r, 2]) + \
-          npsum(intervals[k_r:, 1] * intervals[k_r:, 3])
-    b_r = npsum(intervals[:k_r, 2]) + npsum(intervals[k_r:, 3])
+    others : numpy (n,) shaped arrays
 
-    y_r_prime = a_r / b_r
+    .. rubric:: Returns
 
-    while True:
-        k_r_prime = 0
-        for i in range(0, N-1):
-            if (intervals[i, 1] <= y_r_prime <= intervals[i+1, 1]) or \
-                isclose(intervals[i, 1], y_r_prime, abs_tol=1.0e-6) or \
-                isclose(y_r_prime, intervals[i+1, 1], abs_tol=1.0e-6):
-                k_r_prime = i
-                break
-        if k_r_prime == k_r:
-            y_r = y_r_prime
-            break
-        
-        s_r = sign(k_r_prime - k_r)
-        
-        imin = min(k_r, k_r_prime) + 1
-        imax = max(k_r, k_r_prime)
-        a_r_prime = npsum(intervals[imin:imax, 1] * (intervals[imin:imax, 3] - 
-                          intervals[imin:imax, 2]))
-        b_r_prime = npsum(intervals[imin:imax, 3] - intervals[imin:imax, 2])
-        
-        a_r_prime = a_r - s_r * a_r_prime
-        b_r_prime = b_r - s_r * b_r_prime
-        y_r_second = a_r_prime / b_r_prime
-        k_r = k_r_prime
-        y_r_prime = y_r_second
-        a_r = a_r_prime
-        b_r = b_r_prime
-    return y_l, y_r
+    output : numpy (n,) shaped array
+    
+        Returns drastic s-norm of a and other inputs.
+
+    .. rubric:: Examples
+    
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = drastic_s_norm(a, b)
+    """
+    result = a
+    for other in others:
+        result = other * (result == 0) + result * (other == 0) + 1. * (result != 0.) * (other != 0.)
+    return result
 
 
-def WEKM_algorithm(intervals, params=[]):
+def nilpotent_maximum_s_norm(a, *others):
     """
-    WEKM algorithm
-    
+    Nilpotent maximum s-norm function.
+
     .. rubric:: Parameters
     
-    intervals : numpy (n, 4) array
-        
-        Y = intervals[:, 0:2]
-        
-        F = intervals[:, 2:4]
-    
-    params : List
-        
-        List of parameters of algorithm, if it is needed.
-    
+    a : numpy (n,) shaped array
+
+    others : numpy (n,) shaped arrays
+
     .. rubric:: Returns
+
+    output : numpy (n,) shaped array
     
-    output : Tuple (l, r)
-    """
+        Returns nilpotent maximum s-norm of a and others.
+
+    .. rubric:: Examples
     
-    # Left calculations
-    intervals = intervals[intervals[:,0].argsort()]
-    intervals = trim(intervals)
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = nilpotent_maximum_s_norm(a, b)
+    """
+    result = a
+    for other in others:
+        result = maximum(result, other) * (result + other < 1) + 1. * (result + other >= 1)
+    return result
+
+
+def einstein_sum_s_norm(a, *others):
+    """
+    Einstein sum s-norm function.
+
+    .. rubric:: Parameters
     
-    if intervals is False:
-        return 0, 0
+    a : numpy (n,) shaped array
+
+    others : numpy (n,) shaped arrays
+
+    .. rubric:: Returns
+
+    output : numpy (n,) shaped array
     
-    N = len(intervals)
+        Returns einstein sum s-norm of a and other inputs.
+
+    .. rubric:: Examples
     
-    k_l = round(N / 2.4)
-    a_l = 0
-    b_l = 0
-    for i in range(k_l):
-        a_l += params[i] * intervals[i, 0] * intervals[i, 3]
-        b_l += params[i] * intervals[i, 3]
-    for i in range(k_l, N):
-        a_l += params[i] * intervals[i, 0] * intervals[i, 2]
-        b_l += params[i] * intervals[i, 2]
-    y_l_prime = a_l / b_l
-    while True:
-        k_l_prime = 0
-        for i in range(1, N):
-            if (intervals[i - 1, 0] <= y_l_prime <= intervals[i, 0]) or \
-                isclose(intervals[i - 1, 0], y_l_prime) or \
-                isclose(y_l_prime, intervals[i, 0]):
-                k_l_prime = i - 1
-                break
-        if k_l_prime == k_l:
-            y_l = y_l_prime
-            break
-        s_l = sign(k_l_prime - k_l)
-        a_l_prime = 0
-        b_l_prime = 0
-        for i in range(min(k_l, k_l_prime) + 1, max(k_l, k_l_prime)):
-            a_l_prime += params[i] * intervals[i, 0] * (intervals[i, 3] - intervals[i, 2])
-            b_l_prime += params[i] * (intervals[i, 3] - intervals[i, 2])
-        a_l_prime = a_l + s_l * a_l_prime
-        b_l_prime = b_l + s_l * b_l_prime
-        y_l_second = a_l_prime / b_l_prime
-        k_l = k_l_prime
-        y_l_prime = y_l_second
-        a_l = a_l_prime
-        b_l = b_l_prime
-    # Right calculations
-    intervals = intervals[intervals[:,1].argsort()]
-    k_r = round(N / 1.7)
-    a_r = 0
-    b_r = 0
-    for i in range(k_r):
-        a_r += params[i] * intervals[i, 1] * intervals[i, 2]
-        b_r += params[i] * intervals[i, 2]
-    for i in range(k_r, N):
-        a_r += params[i] * intervals[i, 1] * intervals[i, 3]
-        b_r += params[i] * intervals[i, 3]
-    y_r_prime = a_r / b_r
-    while True:
-        k_r_prime = 0
-        for i in range(1, N):
-            if (intervals[i - 1, 1] <= y_r_prime <= intervals[i, 1]) or \
-                isclose(intervals[i - 1, 1], y_r_prime) or \
-                isclose(y_r_prime, intervals[i, 1]):
-                k_r_prime = i - 1
-                break
-        if k_r_prime == k_r:
-            y_r = y_r_prime
-            break
-        s_r = sign(k_r_prime - k_r)
-        a_r_prime = 0
-        b_r_prime = 0
-        for i in range(min(k_r, k_r_prime) + 1, max(k_r, k_r_prime)):
-            a_r_prime += params[i] * intervals[i, 1] * (intervals[i, 3] - intervals[i, 2])
-            b_r_prime += params[i] * (intervals[i, 3] - intervals[i, 2])
-        a_r_prime = a_r - s_r * a_r_prime
-        b_r_prime = b_r - s_r * b_r_prime
-        y_r_second = a_r_prime / b_r_prime
-        k_r = k_r_prime
-        y_r_prime = y_r_second
-        a_r = a_r_prime
-        b_r = b_r_prime
-    return y_l, y_r
+    >>> a = random.random(10,)
+    >>> b = random.random(10,)
+    >>> c = einstein_sum_s_norm(a, b)
+    """
+    result = a
+    for other in others:
+        result = (result + other) / (1 + result * other)
+    return result
 
 
-def TWEKM_algorithm(intervals, params):
+# The built-in t-norms and s-norms, which accept any number of arguments.
+variadic_norms = [min_t_norm, product_t_norm, lukasiewicz_t_norm, drastic_t_norm, 
+                  nilpotent_minimum_t_norm, hamacher_product_t_norm, max_s_norm, 
+                  probabilistic_sum_s_norm, bounded_sum_s_norm, drastic_s_norm, 
+                  nilpotent_maximum_s_norm, einstein_sum_s_norm, ]
+
+
+def _reduce_norm(norm, first, others):
+    # Combines first with each of the others by a t-norm or s-norm. The user 
+    # defined norms may accept only two arguments, so they are applied two 
+    # at a time.
+    if norm in variadic_norms:
+        return norm(first, *others)
+    return reduce(norm, others, first)
+
+
+def meet(domain, it2fs1, it2fs2, t_norm, sampled=False):
     """
-    TWEKM algorithm
+    Meet operator for IT2FSs.
     
     .. rubric:: Parameters
     
-    intervals : numpy (n, 4) array
+    domain : numpy (n,) shaped array
         
-        Y = intervals[:, 0:2]
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    it2fs1 : IT2FS
         
-        F = intervals[:, 2:4]
+        First input of the meet operator.
+        
+    it2fs2 : IT2FS
+        
+        Second input of the meet operator.
     
-    params : List
+    t_norm : function
         
-        List of parameters of algorithm, if it is needed.
+        The t-norm function to be used.
+    
+    sampled : bool
+        
+        If True, the meet is computed once on the domain and returned as a 
+        SampledIT2FS. Otherwise, the membership functions of the output 
+        are evaluated from the input IT2FSs whenever they are needed. By 
+        default the parameter sampled is False.
     
     .. rubric:: Returns
     
-    output : Tuple (l, r)
+    output : IT2FS
+    
+        Returns the meet of the two input IT2FSs.
+    
+    .. rubric:: Examples
+    
+    >>> domain = linspace(0., 1., 100)
+    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
+    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
+    >>> it2fs3 = meet(domain, it2fs1, it2fs2, min_t_norm)
+    >>> it2fs3.plot()
     """
-    params = []
-    N = len(intervals)
-    for i in range(N):
-        if i == 0 or i == N-1:
-            params.append(0.5)
-        else:
-            params.append(1)
-    return WEKM_algorithm(intervals, params)
+    if sampled:
+        return SampledIT2FS(domain, 
+                            t_norm(it2fs1.umf(domain, it2fs1.umf_params), 
+                               it2fs2.umf(domain, it2fs2.umf_params)), 
+                            t_norm(it2fs1.lmf(domain, it2fs1.lmf_params), 
+                               it2fs2.lmf(domain, it2fs2.lmf_params)))
+    umf = lambda x, params: t_norm(it2fs1.umf(x, it2fs1.umf_params), 
+                                   it2fs2.umf(x, it2fs2.umf_params))
+    lmf = lambda x, params: t_norm(it2fs1.lmf(x, it2fs1.lmf_params), 
+                                   it2fs2.lmf(x, it2fs2.lmf_params))
+    it2fs = IT2FS(domain, umf, [], lmf, [], cache=False)
+    return it2fs
 
 
-def EIASC_algorithm(intervals, params=[]):
+def MEET(domain, t_norm, it2fs, *others, sampled=False):
     """
-    EIASC algorithm
+    Meet operator for IT2FSs.
     
     .. rubric:: Parameters
     
-    intervals : numpy (n, 4) array
+    domain : numpy (n,) shaped array
         
-        Y = intervals[:, 0:2]
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    t_norm : function
         
-        F = intervals[:, 2:4]
+        The t-norm function to be used.
+
+    it2fs : IT2FS
+        
+        An interval type 2 fuzzy set as the first input of the meet operator.
+        
+    others : IT2FS
+        
+        Other interval type 2 fuzzy sets.
     
-    params : List
+    sampled : bool
         
-        List of parameters of algorithm, if it is needed.
+        If True, the meet is computed once on the domain and returned as a 
+        SampledIT2FS. By default the parameter sampled is False.
     
     .. rubric:: Returns
     
-    output : Tuple (l, r)
-    """
-    
-    # Left calculations
-    
-    intervals = trim(intervals)
+    output : IT2FS
     
-    if intervals is False:
-        return 0, 0
+        Returns the meet of the input IT2FSs.
     
-    N = len(intervals)
+    .. rubric:: Examples
     
-    intervals = intervals[intervals[:, 0].argsort()]
-    a_l = npsum(intervals[:, 0] * intervals[:, 2])
-    b_l = npsum(intervals[:, 2])
-    L = 0
-    while True:
-        d = intervals[L, 3] - intervals[L, 2]
-        a_l += intervals[L, 0] * d
-        b_l += d
-        y_l = a_l / b_l
-        L += 1
-        if (y_l <= intervals[L, 0]) or isclose(y_l, intervals[L, 0]):
-            break 
-    # Right calculations
-    intervals = intervals[intervals[:, 1].argsort()]
-    a_r = npsum(intervals[:, 1] * intervals[:, 2])
-    b_r = npsum(intervals[:, 2])
-    R = N - 1
-    while True:
-        d = intervals[R, 3] - intervals[R, 2]
-        a_r += intervals[R, 1] * d
-        b_r += d
-        y_r = a_r / b_r
-        R -= 1
-        if (y_r >= intervals[R, 1]) or isclose(y_r, intervals[R, 1]):
-            break  
-    return y_l, y_r
+    >>> domain = linspace(0., 1., 100)
+    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
+    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
+    >>> it2fs3 = MEET(domain, min_t_norm, it2fs1, it2fs2)
+    >>> it2fs3.plot()
+    """
+    if not others:
+        return it2fs
+    if sampled:
+        return SampledIT2FS(domain, 
+                            _reduce_norm(t_norm, it2fs.umf(domain, it2fs.umf_params), 
+                                         [s.umf(domain, s.umf_params) for s in others]), 
+                            _reduce_norm(t_norm, it2fs.lmf(domain, it2fs.lmf_params), 
+                                         [s.lmf(domain, s.lmf_params) for s in others]))
+    umf = lambda x, params: _reduce_norm(t_norm, it2fs.umf(x, it2fs.umf_params), 
+                                           [s.umf(x, s.umf_params) for s in others])
+    lmf = lambda x, params: _reduce_norm(t_norm, it2fs.lmf(x, it2fs.lmf_params), 
+                                           [s.lmf(x, s.lmf_params) for s in others])
+    return IT2FS(domain, umf, [], lmf, [], cache=False)
 
 
-def WM_algorithm(intervals, params=[]):
+def join(domain, it2fs1, it2fs2, s_norm, sampled=False):
     """
-    WM algorithm
+    Join operator for IT2FSs.
     
     .. rubric:: Parameters
     
-    intervals : numpy (n, 4) array
+    domain : numpy (n,) shaped array
         
-        Y = intervals[:, 0:2]
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    it2fs1 : IT2FS
         
-        F = intervals[:, 2:4]
+        First input of the join operator.
+        
+    it2fs2 : IT2FS
+        
+        Second input of the join operator.
     
-    params : List
+    s_norm : function
         
-        List of parameters of algorithm, if it is needed.
+        The s-norm function to be used.
+    
+    sampled : bool
+        
+        If True, the join is computed once on the domain and returned as a 
+        SampledIT2FS. Otherwise, the membership functions of the output 
+        are evaluated from the input IT2FSs whenever they are needed. By 
+        default the parameter sampled is False.
     
     .. rubric:: Returns
-
-    output : Tuple (l, r)
-    """
-    intervals = intervals[intervals[:,0].argsort()]
-    intervals = trim(intervals)
     
-    if intervals is False:
-        return 0, 0
+    output : IT2FS
     
-    F = intervals[:, 2:4]
-    Y = intervals[:, 0:2]
-    y_l_sup = min(npsum(F[:, 0] * Y[:, 0]) / npsum(F[:, 0]), 
-                  npsum(F[:, 1] * Y[:, 0]) / npsum(F[:, 1]))
-    y_r_inf = min(npsum(F[:, 1] * Y[:, 1]) / npsum(F[:, 1]), 
-                  npsum(F[:, 0] * Y[:, 1]) / npsum(F[:, 0]))
-    c = npsum(F[:, 1] - F[:, 0]) / (npsum(F[:, 0]) * npsum(F[:, 1]))
-    y_l_inf = y_l_sup - c * (npsum(F[:, 0] * (Y[:, 0] - Y[0, 0])) * 
-                             npsum(F[:, 1] * (Y[-1, 0] - Y[:, 0]))) / (npsum(F[:, 0] * (Y[:, 0] - Y[0, 0])) + npsum(F[:, 1] * (Y[-1, 0] - Y[:, 0])))
-    y_r_sup = y_r_inf + c * (npsum(F[:, 1] * (Y[:, 1] - Y[0, 1])) * 
-                             npsum(F[:, 0] * (Y[-1, 1] - Y[:, 1]))) / (npsum(F[:, 1] * (Y[:, 1] - Y[0, 1])) + npsum(F[:, 0] * (Y[-1, 1] - Y[:, 1])))
-    y_l = (y_l_sup + y_l_inf) / 2
-    y_r = (y_r_sup + y_r_inf) / 2
-    return y_l, y_r
+        Returns the join of the two input IT2FSs.
+    
+    .. rubric:: Examples
+    
+    >>> domain = linspace(0., 1., 100)
+    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
+    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
+    >>> it2fs3 = join(domain, it2fs1, it2fs2, max_s_norm)
+    >>> it2fs3.plot()
+    """
+    if sampled:
+        return SampledIT2FS(domain, 
+                            s_norm(it2fs1.umf(domain, it2fs1.umf_params), 
+                               it2fs2.umf(domain, it2fs2.umf_params)), 
+                            s_norm(it2fs1.lmf(domain, it2fs1.lmf_params), 
+                               it2fs2.lmf(domain, it2fs2.lmf_params)))
+    umf = lambda x, params: s_norm(it2fs1.umf(x, it2fs1.umf_params), 
+                                   it2fs2.umf(x, it2fs2.umf_params))
+    lmf = lambda x, params: s_norm(it2fs1.lmf(x, it2fs1.lmf_params), 
+                                   it2fs2.lmf(x, it2fs2.lmf_params))
+    it2fs = IT2FS(domain, umf, [], lmf, [], cache=False)
+    return it2fs
 
 
-def BMM_algorithm(intervals, params):
+def JOIN(domain, s_norm, it2fs, *others, sampled=False):
     """
-    BMM algorithm
+    Join operator for IT2FSs.
     
     .. rubric:: Parameters
     
-    intervals : numpy (n, 4) array
+    domain : numpy (n,) shaped array
         
-        Y = intervals[:, 0:2]
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    s_norm : function
         
-        F = intervals[:, 2:4]
+        The s-norm function to be used.
+
+    it2fs : IT2FS
+        
+        An interval type 2 fuzzy set as the first input of the meet operator.
+        
+    others : IT2FS
+        
+        Other interval type 2 fuzzy sets.
     
-    params : List
+    sampled : bool
         
-        List of parameters of algorithm, if it is needed.
+        If True, the join is computed once on the domain and returned as a 
+        SampledIT2FS. By default the parameter sampled is False.
     
     .. rubric:: Returns
     
-    output : float
+    output : IT2FS
     
-        Crisp output
+        Returns the join of the input IT2FSs.
+    
+    .. rubric:: Examples
+    
+    >>> domain = linspace(0., 1., 100)
+    >>> it2fs1 = IT2FS_Gaussian_UncertStd(domain, [0.33, 0.2, 0.05, 1.])
+    >>> it2fs2 = IT2FS_Gaussian_UncertStd(domain, [0.66, 0.2, 0.05, 1.])
+    >>> it2fs3 = JOIN(domain, max_s_norm, it2fs1, it2fs2)
+    >>> it2fs3.plot()
     """
-    intervals = intervals[intervals[:,0].argsort()]
-    intervals = trim(intervals)
+    if not others:
+        return it2fs
+    if sampled:
+        return SampledIT2FS(domain, 
+                            _reduce_norm(s_norm, it2fs.umf(domain, it2fs.umf_params), 
+                                         [s.umf(domain, s.umf_params) for s in others]), 
+                            _reduce_norm(s_norm, it2fs.lmf(domain, it2fs.lmf_params), 
+                                         [s.lmf(domain, s.lmf_params) for s in others]))
+    umf = lambda x, params: _reduce_norm(s_norm, it2fs.umf(x, it2fs.umf_params), 
+                                           [s.umf(x, s.umf_params) for s in others])
+    lmf = lambda x, params: _reduce_norm(s_norm, it2fs.lmf(x, it2fs.lmf_params), 
+                                           [s.lmf(x, s.lmf_params) for s in others])
+    return IT2FS(domain, umf, [], lmf, [], cache=False)
+
+
+def trim(intervals):
+    # The intervals are widened to float64, so the sums of the type 
+    # reduction algorithms are accumulated in double precision.
+    intervals = asarray(intervals, dtype=float)
+    v = intervals[:, 3]
+    i, = where(v > 0)
+    if i.size == 0:
+        return False
+    else:
+        min1 = i[0]
+        max1 = i[-1] + 1
     
-    if intervals is False:
-        return 0
+        v = intervals[:, 2]
+        i, = where(v > 0)
+        if i.size == 0:
+            min2 = min1
+            max2 = max1
+        else:
+            min2 = i[0]
+            max2 = i[-1] + 1
+        return intervals[min(min1, min2):max(max1, max2), :]
+
+
+def switch_point_sums(y, first, second):
+    """
+    Calculates the numerators and denominators of the weighted averages 
+    of y, in which the first weights are used for the k first points and 
+    the second weights are used for the other points, for all switch 
+    points k = 0, 1, ..., n at once using cumulative sums.
     
-    F = intervals[:, 2:4]
-    Y = (intervals[:, 0] + intervals[:, 1]) / 2.
-    m = params[0]
-    n = params[1]
-    #Y = Y.reshape((Y.size,))
-    return m * npsum(F[:, 0] * Y) / npsum(F[:, 0]) + n * npsum(F[:, 1] * Y) / npsum(F[:, 1])
+    .. rubric:: Parameters
+    
+    y : numpy (..., n) shaped array
+        
+        Sorted points, in ascending order along the last axis.
+    
+    first : numpy (..., n) shaped array
+        
+        Weights of the points before the switch point.
+    
+    second : numpy (..., n) shaped array
+        
+        Weights of the points after the switch point.
+    
+    .. rubric:: Returns
+    
+    output : Tuple (a, b)
+        
+        Two numpy (..., n + 1) shaped arrays of the numerators and the 
+        denominators. The weighted average for the switch point k is 
+        a[..., k] / b[..., k].
+    """
+    zero = zeros(y.shape[:-1] + (1, ))
+    a_first = concatenate((zero, cumsum(y * first, axis=-1)), axis=-1)
+    b_first = concatenate((zero, cumsum(first, axis=-1)), axis=-1)
+    # The sums after the switch points are accumulated backward, since the 
+    # total minus a running sum loses the small weights to cancellation.
+    a_second = concatenate((cumsum((y * second)[..., ::-1], axis=-1)[..., ::-1], zero), axis=-1)
+    b_second = concatenate((cumsum(second[..., ::-1], axis=-1)[..., ::-1], zero), axis=-1)
+    return a_first + a_second, b_first + b_second
 
 
-def LBMM_algorithm(intervals, params):
+def exact_centroid_bounds(y_l, f_l, y_r, f_r, w_l=1., w_r=1.):
     """
-    LBMM algorithm (BMM extended by Li et al.)
+    Calculates the exact left and right end points of the centroid of 
+    an IT2FS (or a set of rules) by evaluating all the switch points at 
+    once, instead of iterating toward them like the KM algorithm does.
     
-    Ref. An Overview of Alternative Type-ReductionApproaches for 
-    Reducing the Computational Costof Interval Type-2 Fuzzy Logic 
-    Controllers
+    .. rubric:: Parameters
+    
+    y_l : numpy (..., n) shaped array
+        
+        Left points, sorted in ascending order along the last axis.
+    
+    f_l : numpy (..., n, 2) shaped array
+        
+        Lower and upper weights corresponding with the points in y_l.
+    
+    y_r : numpy (..., n) shaped array
+        
+        Right points, sorted in ascending order along the last axis.
+    
+    f_r : numpy (..., n, 2) shaped array
+        
+        Lower and upper weights corresponding with the points in y_r.
+    
+    w_l=1. : float or numpy (..., n) shaped array
+        
+        Extra weights of the left points, used by the WEKM algorithm.
+    
+    w_r=1. : float or numpy (..., n) shaped array
+        
+        Extra weights of the right points, used by the WEKM algorithm.
+    
+    .. rubric:: Returns
+    
+    output : Tuple (l, r)
+        
+        The left and right end points, as floats or numpy (...) shaped 
+        arrays.
+    """
+    a, b = switch_point_sums(y_l, w_l * f_l[..., 1], w_l * f_l[..., 0])
+    positive = b > 0
+    l = where(positive, a / where(positive, b, 1.), inf).min(axis=-1)
+    a, b = switch_point_sums(y_r, w_r * f_r[..., 0], w_r * f_r[..., 1])
+    positive = b > 0
+    r = where(positive, a / where(positive, b, 1.), -inf).max(axis=-1)
+    return l, r
+
+
+def KM_algorithm(intervals, params=[]):  # intervals = [[a1, b1, c1, d1], [a2, b2, c2, d2], ...]
+    """
+    KM algorithm
     
     .. rubric:: Parameters
     
@@ -3125,26 +4252,22 @@ def LBMM_algorithm(intervals, params):
     
     .. rubric:: Returns
     
-    output : float
-    
-        Crisp output
+    output : Tuple (l, r)
     """
-    intervals = intervals[intervals[:,0].argsort()]
     intervals = trim(intervals)
     
     if intervals is False:
-        return 0
+        return 0., 0.
     
-    F = intervals[:, 2:4]
-    Y = intervals[:, 0:2]
-    m = params[0]
-    n = params[1]
-    return m * npsum(F[:, 0] * Y[:, 0]) / npsum(F[:, 0]) + n * npsum(F[:, 1] * Y[:, 1]) / npsum(F[:, 1])
+    left = intervals[intervals[:, 0].argsort(kind="stable")]
+    right = intervals[intervals[:, 1].argsort(kind="stable")]
+    y_l, y_r = exact_centroid_bounds(left[:, 0], left[:, 2:4], right[:, 1], right[:, 2:4])
+    return float(y_l), float(y_r)
 
 
-def NT_algorithm(intervals, params=[]):
+def EKM_algorithm(intervals, params=[]):
     """
-    NT algorithm
+    EKM algorithm
     
     .. rubric:: Parameters
     
@@ -3160,223 +4283,2402 @@ def NT_algorithm(intervals, params=[]):
     
     .. rubric:: Returns
     
-    output : float
-    
-        Crisp output
+    output : Tuple (l, r)
     """
-    intervals = intervals[intervals[:,0].argsort()]
     intervals = trim(intervals)
     
     if intervals is False:
-        return 0
+        return 0, 0
     
-    F = intervals[:, 2:4]
-    Y = (intervals[:, 0] + intervals[:, 1]) / 2.
-    return (npsum(Y * F[:, 1]) + npsum(Y * F[:, 0])) / (npsum(F[:, 0]) + npsum(F[:, 1]))
+    left = intervals[intervals[:, 0].argsort(kind="stable")]
+    right = intervals[intervals[:, 1].argsort(kind="stable")]
+    y_l, y_r = exact_centroid_bounds(left[:, 0], left[:, 2:4], right[:, 1], right[:, 2:4])
+    return float(y_l), float(y_r)
 
 
-def Centroid(it2fs, alg_func, domain, alg_params=[]):
+def WEKM_algorithm(intervals, params=[]):
     """
-    Centroid type reduction for an interval type 2 fuzzy set.
+    WEKM algorithm
     
     .. rubric:: Parameters
     
-    it2fs : IT2FS
-        
-        IT2FS which would be type reduced.
-    
-    alg_func : Function
+    intervals : numpy (n, 4) array
         
-        Type reduction algorithm to be used, one of the list below:
-            
-            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
-            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
-            NT_algorithm
-    
-    domain : numpy (n,) shaped array
+        Y = intervals[:, 0:2]
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        F = intervals[:, 2:4]
     
-    alg_params : List
+    params : List
         
-        List of parameters of type reduction algorithm if it is needed.
+        List of parameters of algorithm, if it is needed.
     
     .. rubric:: Returns
     
-    output : Based on selected type reduction algorithm tuple (l, r) or float
-    
-        Returns Centroid type reduction of the input IT2FS.
+    output : Tuple (l, r)
     """
-    intervals = c_[domain, domain, it2fs.lower, it2fs.upper]
-    return alg_func(intervals, alg_params)
+    intervals = intervals[intervals[:, 0].argsort(kind="stable")]
+    intervals = trim(intervals)
+    
+    if intervals is False:
+        return 0, 0
+    
+    N = len(intervals)
+    params = asarray(params[:N], dtype=float)
+    if len(params) != N:
+        raise IndexError("WEKM algorithm needs a weight for each of the " + 
+                         str(N) + " intervals.")
+    right = intervals[intervals[:, 1].argsort(kind="stable")]
+    y_l, y_r = exact_centroid_bounds(intervals[:, 0], intervals[:, 2:4], 
+                                     right[:, 1], right[:, 2:4], params, params)
+    return float(y_l), float(y_r)
 
 
-def CoSet(firing_array, consequent_array, alg_func, domain, alg_params=[]):
+def TWEKM_algorithm(intervals, params):
     """
-    Center of sets type reduction.
+    TWEKM algorithm
     
     .. rubric:: Parameters
     
-    firing_array : numpy (m, 2) shaped array
-        
-        Firing strength of consequents.
-    
-    consequent_array : List of IT2FS
-        
-        List of consequents corresponding with the rules of IT2FLS
-    
-    alg_func : Function
+    intervals : numpy (n, 4) array
         
-        Type reduction algorithm to be used, one of the list below:
-            
-            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
-            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
-            NT_algorithm
-    
-    domain : numpy (n,) shaped array
+        Y = intervals[:, 0:2]
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        F = intervals[:, 2:4]
     
-    alg_params : List
+    params : List
         
-        List of parameters of type reduction algorithm if it is needed.
+        List of parameters of algorithm, if it is needed.
     
     .. rubric:: Returns
     
-    output : Based on selected type reduction algorithm tuple (l, r) or float
-    
-        Returns Center of sets type reduction of the input IT2FS.
+    output : Tuple (l, r)
     """
-    intervals = []
-    for l in range(len(consequent_array)):
-        tmp = Centroid(consequent_array[l], alg_func, domain)
-        intervals.append([tmp[0], tmp[1], firing_array[l, 0], firing_array[l, 1]])
-    return alg_func(array(intervals), alg_params)
+    params = []
+    N = len(intervals)
+    for i in range(N):
+        if i == 0 or i == N-1:
+            params.append(0.5)
+        else:
+            params.append(1)
+    return WEKM_algorithm(intervals, params)
 
 
-def CoSum(it2fs_array, alg_func, domain, alg_params=[]):
+def EIASC_algorithm(intervals, params=[]):
     """
-    Center of sum type reduction for an interval type 2 fuzzy set.
+    EIASC algorithm
     
     .. rubric:: Parameters
     
-    it2fs_array : List of IT2FSs
-        
-        List of final IT2FSs achieved by evaluating rule base.
-    
-    alg_func : Function
+    intervals : numpy (n, 4) array
         
-        Type reduction algorithm to be used, which is one of these:
-            
-            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
-            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
-            NT_algorithm
-    
-    domain : numpy (n,) shaped array
+        Y = intervals[:, 0:2]
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        F = intervals[:, 2:4]
     
-    alg_params : List
+    params : List
         
-        List of parameters of type reduction algorithm if it is needed.
+        List of parameters of algorithm, if it is needed.
     
     .. rubric:: Returns
     
-    output : Based on selected type reduction algorithm tuple (l, r) or float
-    
-        Returns Center of sum type reduction of the input IT2FS.
+    output : Tuple (l, r)
     """
-    lower_sum = zeros_like(domain)
-    upper_sum = zeros_like(domain)
-    for it2fs in it2fs_array:
-        add(lower_sum, it2fs.lower, out=lower_sum)
-        add(upper_sum, it2fs.lower, out=upper_sum)
-    intervals = c_[domain, domain, lower_sum, upper_sum]
-    return alg_func(intervals, alg_params)
+    
+    # Left calculations
+    
+    intervals = trim(intervals)
+    
+    if intervals is False:
+        return 0, 0
+    
+    N = len(intervals)
+    
+    intervals = intervals[intervals[:, 0].argsort(kind="stable")]
+    a_l = npsum(intervals[:, 0] * intervals[:, 2])
+    b_l = npsum(intervals[:, 2])
+    L = 0
+    while True:
+        d = intervals[L, 3] - intervals[L, 2]
+        a_l += intervals[L, 0] * d
+        b_l += d
+        y_l = a_l / b_l
+        L += 1
+        if (y_l <= intervals[L, 0]) or isclose(y_l, intervals[L, 0]):
+            break 
+    # Right calculations
+    intervals = intervals[intervals[:, 1].argsort(kind="stable")]
+    a_r = npsum(intervals[:, 1] * intervals[:, 2])
+    b_r = npsum(intervals[:, 2])
+    R = N - 1
+    while True:
+        d = intervals[R, 3] - intervals[R, 2]
+        a_r += intervals[R, 1] * d
+        b_r += d
+        y_r = a_r / b_r
+        R -= 1
+        if (y_r >= intervals[R, 1]) or isclose(y_r, intervals[R, 1]):
+            break  
+    return y_l, y_r
 
 
-def Height(it2fs_array, alg_func, domain, alg_params=[]):
+def WM_algorithm(intervals, params=[]):
     """
-    Height type reduction for an interval type 2 fuzzy set.
+    WM algorithm
     
     .. rubric:: Parameters
     
-    it2fs_array : List of IT2FSs
+    intervals : numpy (n, 4) array
         
-        List of final IT2FSs achieved by evaluating rule base.
+        Y = intervals[:, 0:2]
+        
+        F = intervals[:, 2:4]
     
-    alg_func : Function
+    params : List
         
-        Type reduction algorithm to be used, which is one of these:
-            
-            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
-            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
-            NT_algorithm
+        List of parameters of algorithm, if it is needed.
     
-    domain : numpy (n,) shaped array
+    .. rubric:: Returns
+
+    output : Tuple (l, r)
+    """
+    intervals = intervals[intervals[:, 0].argsort(kind="stable")]
+    intervals = trim(intervals)
+    
+    if intervals is False:
+        return 0, 0
+    
+    F = intervals[:, 2:4]
+    Y = intervals[:, 0:2]
+    y_l_sup = min(npsum(F[:, 0] * Y[:, 0]) / npsum(F[:, 0]), 
+                  npsum(F[:, 1] * Y[:, 0]) / npsum(F[:, 1]))
+    y_r_inf = min(npsum(F[:, 1] * Y[:, 1]) / npsum(F[:, 1]), 
+                  npsum(F[:, 0] * Y[:, 1]) / npsum(F[:, 0]))
+    c = npsum(F[:, 1] - F[:, 0]) / (npsum(F[:, 0]) * npsum(F[:, 1]))
+    y_l_inf = y_l_sup - c * (npsum(F[:, 0] * (Y[:, 0] - Y[0, 0])) * 
+                             npsum(F[:, 1] * (Y[-1, 0] - Y[:, 0]))) / (npsum(F[:, 0] * (Y[:, 0] - Y[0, 0])) + npsum(F[:, 1] * (Y[-1, 0] - Y[:, 0])))
+    y_r_sup = y_r_inf + c * (npsum(F[:, 1] * (Y[:, 1] - Y[0, 1])) * 
+                             npsum(F[:, 0] * (Y[-1, 1] - Y[:, 1]))) / (npsum(F[:, 1] * (Y[:, 1] - Y[0, 1])) + npsum(F[:, 0] * (Y[-1, 1] - Y[:, 1])))
+    y_l = (y_l_sup + y_l_inf) / 2
+    y_r = (y_r_sup + y_r_inf) / 2
+    return y_l, y_r
+
+
+def BMM_algorithm(intervals, params):
+    """
+    BMM algorithm
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (n, 4) array
         
-        Indicates the universe of discourse dedicated to the IT2FS.
+        Y = intervals[:, 0:2]
+        
+        F = intervals[:, 2:4]
     
-    alg_params : List
+    params : List
         
-        List of parameters of type reduction algorithm if it is needed.
+        List of parameters of algorithm, if it is needed.
     
     .. rubric:: Returns
     
-    output : Based on selected type reduction algorithm tuple (l, r) or float
+    output : float
     
-        Returns Height type reduction of the input IT2FS.
+        Crisp output
     """
-    intervals = []
-    for it2fs in it2fs_array:
-        index = argmax(it2fs.upper)
-        intervals.append([domain[index], domain[index], it2fs.lower[index], it2fs.upper[index]])
-    return alg_func(array(intervals), alg_params)
+    intervals = intervals[intervals[:, 0].argsort(kind="stable")]
+    intervals = trim(intervals)
+    
+    if intervals is False:
+        return 0
+    
+    F = intervals[:, 2:4]
+    Y = (intervals[:, 0] + intervals[:, 1]) / 2.
+    m = params[0]
+    n = params[1]
+    #Y = Y.reshape((Y.size,))
+    return m * npsum(F[:, 0] * Y) / npsum(F[:, 0]) + n * npsum(F[:, 1] * Y) / npsum(F[:, 1])
+
+
+def LBMM_algorithm(intervals, params):
+    """
+    LBMM algorithm (BMM extended by Li et al.)
+    
+    Ref. An Overview of Alternative Type-ReductionApproaches for 
+    Reducing the Computational Costof Interval Type-2 Fuzzy Logic 
+    Controllers
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (n, 4) array
+        
+        Y = intervals[:, 0:2]
+        
+        F = intervals[:, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    .. rubric:: Returns
+    
+    output : float
+    
+        Crisp output
+    """
+    intervals = intervals[intervals[:, 0].argsort(kind="stable")]
+    intervals = trim(intervals)
+    
+    if intervals is False:
+        return 0
+    
+    F = intervals[:, 2:4]
+    Y = intervals[:, 0:2]
+    m = params[0]
+    n = params[1]
+    return m * npsum(F[:, 0] * Y[:, 0]) / npsum(F[:, 0]) + n * npsum(F[:, 1] * Y[:, 1]) / npsum(F[:, 1])
+
+
+def NT_algorithm(intervals, params=[]):
+    """
+    NT algorithm
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (n, 4) array
+        
+        Y = intervals[:, 0:2]
+        
+        F = intervals[:, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    .. rubric:: Returns
+    
+    output : float
+    
+        Crisp output
+    """
+    intervals = intervals[intervals[:, 0].argsort(kind="stable")]
+    intervals = trim(intervals)
+    
+    if intervals is False:
+        return 0
+    
+    F = intervals[:, 2:4]
+    Y = (intervals[:, 0] + intervals[:, 1]) / 2.
+    return (npsum(Y * F[:, 1]) + npsum(Y * F[:, 0])) / (npsum(F[:, 0]) + npsum(F[:, 1]))
+
+
+def check_intervals_batch(intervals, mask=None):
+    """
+    Verifies a batch of intervals matrices and its validity mask, and sets 
+    the invalid rows to zero.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) shaped array
+        
+        Batch of b intervals matrices.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices. The invalid rows 
+        are ignored, as if they were removed from the matrices. If it is 
+        None, all the rows are valid.
+    
+    .. rubric:: Returns
+    
+    output : Tuple (intervals, valid)
+        
+        The numpy (b, n, 4) shaped intervals with the invalid rows set to 
+        zero, and the numpy (b, n) shaped validity mask.
+    """
+    intervals = asarray(intervals, dtype=float)
+    if intervals.ndim != 3 or intervals.shape[-1] != 4:
+        raise ValueError("The intervals must be a (batch, n, 4) shaped array.")
+    if mask is None:
+        valid = ones(intervals.shape[:2], dtype=bool)
+    else:
+        valid = asarray(mask, dtype=bool)
+        if valid.shape != intervals.shape[:2]:
+            raise ValueError("The mask must be a " + str(intervals.shape[:2]) + 
+                             " shaped array.")
+    return where(valid[..., None], intervals, 0.), valid
+
+
+def trim_mask(intervals):
+    """
+    Batch version of the trim function, which marks the rows kept by trim 
+    instead of slicing them.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (..., n, 4) shaped array
+        
+        Intervals matrices.
+    
+    .. rubric:: Returns
+    
+    output : numpy (..., n) shaped array of bool
+        
+        The rows kept by the trim function. All the rows of a matrix are 
+        False if the trim function returns False for it.
+    """
+    upper = intervals[..., 3] > 0
+    lower = intervals[..., 2] > 0
+    lower = where(lower.any(axis=-1)[..., None], lower, upper)
+    nonzero = upper | lower
+    n = intervals.shape[-2]
+    index = arange(n)
+    start = argmax(nonzero, axis=-1)[..., None]
+    stop = n - argmax(nonzero[..., ::-1], axis=-1)[..., None]
+    return (index >= start) & (index < stop) & upper.any(axis=-1)[..., None]
+
+
+def sort_batch(intervals, valid, column):
+    """
+    Sorts the rows of a batch of intervals matrices by a column, placing 
+    the invalid rows at the end.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) shaped array
+        
+        Batch of intervals matrices.
+    
+    valid : numpy (b, n) shaped array of bool
+        
+        Validity of the rows.
+    
+    column : int
+        
+        Index of the column used as the sorting key.
+    
+    .. rubric:: Returns
+    
+    output : Tuple (intervals, valid)
+        
+        The sorted intervals and validity mask.
+    """
+    order = argsort(where(valid, intervals[..., column], inf), axis=-1, kind="stable")
+    return take_along_axis(intervals, order[..., None], axis=-2), take_along_axis(valid, order, axis=-1)
+
+
+def KM_algorithm_batch(intervals, params=[], mask=None):
+    """
+    KM algorithm for a batch of intervals matrices.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b, 2) shaped array
+        
+        The (l, r) tuples of the intervals matrices.
+    """
+    intervals, valid = check_intervals_batch(intervals, mask)
+    valid = valid & trim_mask(intervals)
+    intervals = where(valid[..., None], intervals, 0.)
+    left, _ = sort_batch(intervals, valid, 0)
+    right, _ = sort_batch(intervals, valid, 1)
+    y_l, y_r = exact_centroid_bounds(left[..., 0], left[..., 2:4], 
+                                     right[..., 1], right[..., 2:4])
+    empty = ~valid.any(axis=-1)
+    output = zeros((len(intervals), 2))
+    output[:, 0] = where(empty, 0., y_l)
+    output[:, 1] = where(empty, 0., y_r)
+    return output
+
+
+def EKM_algorithm_batch(intervals, params=[], mask=None):
+    """
+    EKM algorithm for a batch of intervals matrices. As the EKM algorithm 
+    finds the same switch points as the KM algorithm, this function gives 
+    the same results as the KM_algorithm_batch.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b, 2) shaped array
+        
+        The (l, r) tuples of the intervals matrices.
+    """
+    return KM_algorithm_batch(intervals, params, mask)
+
+
+def WEKM_algorithm_batch(intervals, params=[], mask=None):
+    """
+    WEKM algorithm for a batch of intervals matrices.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List or numpy (b, m) shaped array
+        
+        Weights of the algorithm, shared by all the intervals matrices or 
+        one row per intervals matrix.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b, 2) shaped array
+        
+        The (l, r) tuples of the intervals matrices.
+    """
+    intervals, valid = check_intervals_batch(intervals, mask)
+    intervals, valid = sort_batch(intervals, valid, 0)
+    valid = valid & trim_mask(intervals)
+    intervals = where(valid[..., None], intervals, 0.)
+    left, valid = sort_batch(intervals, valid, 0)
+    right, _ = sort_batch(left, valid, 1)
+    N = npsum(valid, axis=-1).max(initial=0)
+    params = asarray(params, dtype=float)
+    if params.shape[-1] < N:
+        raise IndexError("WEKM algorithm needs a weight for each of the " + 
+                         str(N) + " intervals.")
+    n = intervals.shape[1]
+    weights = zeros(valid.shape)
+    weights[..., :min(n, params.shape[-1])] = params[..., :n]
+    weights = where(valid, weights, 0.)
+    y_l, y_r = exact_centroid_bounds(left[..., 0], left[..., 2:4], 
+                                     right[..., 1], right[..., 2:4], 
+                                     weights, weights)
+    empty = ~valid.any(axis=-1)
+    output = zeros((len(intervals), 2))
+    output[:, 0] = where(empty, 0., y_l)
+    output[:, 1] = where(empty, 0., y_r)
+    return output
+
+
+def TWEKM_algorithm_batch(intervals, params=[], mask=None):
+    """
+    TWEKM algorithm for a batch of intervals matrices.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b, 2) shaped array
+        
+        The (l, r) tuples of the intervals matrices.
+    """
+    intervals, valid = check_intervals_batch(intervals, mask)
+    N = npsum(valid, axis=-1)[:, None]
+    index = arange(intervals.shape[1])
+    weights = where((index == 0) | (index == N - 1), 0.5, 1.)
+    return WEKM_algorithm_batch(intervals, weights, valid)
+
+
+def EIASC_algorithm_batch(intervals, params=[], mask=None):
+    """
+    EIASC algorithm for a batch of intervals matrices. The running sums of 
+    all the iterations are computed at once, and the stopping iteration is 
+    selected for each intervals matrix.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b, 2) shaped array
+        
+        The (l, r) tuples of the intervals matrices.
+    """
+    intervals, valid = check_intervals_batch(intervals, mask)
+    valid = valid & trim_mask(intervals)
+    intervals = where(valid[..., None], intervals, 0.)
+    N = npsum(valid, axis=-1)[:, None]
+    n = intervals.shape[1]
+    index = arange(n)
+    with errstate(divide="ignore", invalid="ignore"):
+        # Left calculations
+        left, left_valid = sort_batch(intervals, valid, 0)
+        y = left[..., 0]
+        d = left[..., 3] - left[..., 2]
+        # The running sums are accumulated in the order of the iterations, 
+        # as in the EIASC_algorithm function.
+        a = cumsum(concatenate((npsum(y * left[..., 2], axis=-1)[:, None], y * d), axis=-1), axis=-1)[:, 1:]
+        b = cumsum(concatenate((npsum(left[..., 2], axis=-1)[:, None], d), axis=-1), axis=-1)[:, 1:]
+        y_l = a / b
+        following = concatenate((y[:, 1:], y[:, -1:]), axis=-1)
+        stop = (y_l <= following) | \
+               (npabs(y_l - following) <= 1e-9 * maximum(npabs(y_l), npabs(following))) | \
+               (index >= N - 1)
+        L = argmax(stop, axis=-1)
+        y_l = take_along_axis(y_l, L[:, None], axis=-1)[:, 0]
+        # Right calculations
+        right, _ = sort_batch(left, left_valid, 1)
+        y = right[..., 1]
+        d = right[..., 3] - right[..., 2]
+        # The sums of the right calculations run backward, and are not 
+        # taken as the total minus a running sum, which loses the small 
+        # weights to cancellation.
+        a = cumsum(concatenate((npsum(y * right[..., 2], axis=-1)[:, None], (y * d)[:, ::-1]), 
+                               axis=-1), axis=-1)[:, :0:-1]
+        b = cumsum(concatenate((npsum(right[..., 2], axis=-1)[:, None], d[:, ::-1]), 
+                               axis=-1), axis=-1)[:, :0:-1]
+        y_r = a / b
+        preceding = concatenate((y[:, :1], y[:, :-1]), axis=-1)
+        stop = (((y_r >= preceding) | 
+                 (npabs(y_r - preceding) <= 1e-9 * maximum(npabs(y_r), npabs(preceding)))) & 
+                (index < N)) | (index == 0)
+        R = n - 1 - argmax(stop[:, ::-1], axis=-1)
+        y_r = take_along_axis(y_r, R[:, None], axis=-1)[:, 0]
+    empty = N[:, 0] == 0
+    output = zeros((len(intervals), 2))
+    output[:, 0] = where(empty, 0., y_l)
+    output[:, 1] = where(empty, 0., y_r)
+    return output
+
+
+def WM_algorithm_batch(intervals, params=[], mask=None):
+    """
+    WM algorithm for a batch of intervals matrices.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b, 2) shaped array
+        
+        The (l, r) tuples of the intervals matrices.
+    """
+    intervals, valid = check_intervals_batch(intervals, mask)
+    intervals, valid = sort_batch(intervals, valid, 0)
+    valid = valid & trim_mask(intervals)
+    intervals = where(valid[..., None], intervals, 0.)
+    intervals, valid = sort_batch(intervals, valid, 0)
+    last = maximum(npsum(valid, axis=-1) - 1, 0)[:, None, None]
+    F = intervals[..., 2:4]
+    Y = intervals[..., 0:2]
+    Y_first = Y[:, :1, :]
+    Y_last = take_along_axis(Y, last, axis=-2)
+    with errstate(divide="ignore", invalid="ignore"):
+        S_0 = npsum(F[..., 0], axis=-1)
+        S_1 = npsum(F[..., 1], axis=-1)
+        y_l_sup = minimum(npsum(F[..., 0] * Y[..., 0], axis=-1) / S_0, 
+                          npsum(F[..., 1] * Y[..., 0], axis=-1) / S_1)
+        y_r_inf = minimum(npsum(F[..., 1] * Y[..., 1], axis=-1) / S_1, 
+                          npsum(F[..., 0] * Y[..., 1], axis=-1) / S_0)
+        c = npsum(F[..., 1] - F[..., 0], axis=-1) / (S_0 * S_1)
+        p = npsum(F[..., 0] * (Y[..., 0] - Y_first[..., 0]), axis=-1)
+        q = npsum(F[..., 1] * (Y_last[..., 0] - Y[..., 0]), axis=-1)
+        y_l_inf = y_l_sup - c * (p * q) / (p + q)
+        p = npsum(F[..., 1] * (Y[..., 1] - Y_first[..., 1]), axis=-1)
+        q = npsum(F[..., 0] * (Y_last[..., 1] - Y[..., 1]), axis=-1)
+        y_r_sup = y_r_inf + c * (p * q) / (p + q)
+    empty = ~valid.any(axis=-1)
+    output = zeros((len(intervals), 2))
+    output[:, 0] = where(empty, 0., (y_l_sup + y_l_inf) / 2)
+    output[:, 1] = where(empty, 0., (y_r_sup + y_r_inf) / 2)
+    return output
+
+
+def BMM_algorithm_batch(intervals, params=[], mask=None):
+    """
+    BMM algorithm for a batch of intervals matrices.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b,) shaped array
+    
+        Crisp outputs
+    """
+    intervals, _ = check_intervals_batch(intervals, mask)
+    m = params[0]
+    n = params[1]
+    F = intervals[..., 2:4]
+    Y = (intervals[..., 0] + intervals[..., 1]) / 2.
+    with errstate(divide="ignore", invalid="ignore"):
+        output = m * npsum(F[..., 0] * Y, axis=-1) / npsum(F[..., 0], axis=-1) + \
+                 n * npsum(F[..., 1] * Y, axis=-1) / npsum(F[..., 1], axis=-1)
+    return where(trim_mask(intervals).any(axis=-1), output, 0.)
+
+
+def LBMM_algorithm_batch(intervals, params=[], mask=None):
+    """
+    LBMM algorithm (BMM extended by Li et al.) for a batch of intervals 
+    matrices.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b,) shaped array
+    
+        Crisp outputs
+    """
+    intervals, _ = check_intervals_batch(intervals, mask)
+    m = params[0]
+    n = params[1]
+    F = intervals[..., 2:4]
+    Y = intervals[..., 0:2]
+    with errstate(divide="ignore", invalid="ignore"):
+        output = m * npsum(F[..., 0] * Y[..., 0], axis=-1) / npsum(F[..., 0], axis=-1) + \
+                 n * npsum(F[..., 1] * Y[..., 1], axis=-1) / npsum(F[..., 1], axis=-1)
+    return where(trim_mask(intervals).any(axis=-1), output, 0.)
+
+
+def NT_algorithm_batch(intervals, params=[], mask=None):
+    """
+    NT algorithm for a batch of intervals matrices.
+    
+    .. rubric:: Parameters
+    
+    intervals : numpy (b, n, 4) array
+        
+        Y = intervals[:, :, 0:2]
+        
+        F = intervals[:, :, 2:4]
+    
+    params : List
+        
+        List of parameters of algorithm, if it is needed.
+    
+    mask=None : numpy (b, n) shaped array of bool
+        
+        Validity of the rows of the intervals matrices, if needed.
+    
+    .. rubric:: Returns
+    
+    output : numpy (b,) shaped array
+    
+        Crisp outputs
+    """
+    intervals, _ = check_intervals_batch(intervals, mask)
+    F = intervals[..., 2:4]
+    Y = (intervals[..., 0] + intervals[..., 1]) / 2.
+    with errstate(divide="ignore", invalid="ignore"):
+        output = (npsum(Y * F[..., 1], axis=-1) + npsum(Y * F[..., 0], axis=-1)) / \
+                 (npsum(F[..., 0], axis=-1) + npsum(F[..., 1], axis=-1))
+    return where(trim_mask(intervals).any(axis=-1), output, 0.)
+
+
+TR_algorithms = {"KM": (KM_algorithm, KM_algorithm_batch), 
+                 "EKM": (EKM_algorithm, EKM_algorithm_batch), 
+                 "WEKM": (WEKM_algorithm, WEKM_algorithm_batch), 
+                 "TWEKM": (TWEKM_algorithm, TWEKM_algorithm_batch), 
+                 "EIASC": (EIASC_algorithm, EIASC_algorithm_batch), 
+                 "WM": (WM_algorithm, WM_algorithm_batch), 
+                 "BMM": (BMM_algorithm, BMM_algorithm_batch), 
+                 "LBMM": (LBMM_algorithm, LBMM_algorithm_batch), 
+                 "NT": (NT_algorithm, NT_algorithm_batch), }
+
+
+def available_backends():
+    """
+    Returns the type reduction backends which can be used in this 
+    environment.
+    
+    .. rubric:: Returns
+    
+    output : List of str
+        
+        The "python" backend, and the "c" backend if the typereduction 
+        library is installed.
+    """
+    if isThereTypereduction:
+        return ["python", "c", ]
+    return ["python", ]
+
+
+def get_backend():
+    """
+    Returns the active type reduction backend.
+    
+    .. rubric:: Returns
+    
+    output : str
+        
+        Name of the active backend, "python" or "c".
+    """
+    return _backend
+
+
+def set_backend(backend):
+    """
+    Selects the type reduction backend used by the IT2FLS, IT2Mamdani, and 
+    IT2TSK classes. By default, the "c" backend is selected if the 
+    typereduction library is installed.
+    
+    .. rubric:: Parameters
+    
+    backend : str
+        
+        Name of the backend, one of the values returned by the 
+        available_backends function.
+    
+    .. rubric:: Examples
+    
+    >>> set_backend("python")
+    """
+    global _backend
+    if backend not in available_backends():
+        raise ValueError("The " + str(backend) + " backend is not available!")
+    _backend = backend
+
+
+def get_precision():
+    """
+    Returns the name of the active floating point precision.
+    
+    .. rubric:: Returns
+    
+    output : str
+        
+        Name of the active precision, "float64" or "float32".
+    """
+    return _precision.__name__
+
+
+def set_precision(precision):
+    """
+    Selects the floating point precision of the sampled membership 
+    values of the T1FS and IT2FS classes, and of the firing strengths, 
+    interval matrices, and batch outputs of the fuzzy logic systems. The 
+    float32 precision halves the memory traffic of large batches, with an 
+    accuracy which is enough for most control outputs. The type reduction 
+    algorithms of both backends accumulate their sums in float64. By 
+    default, the float64 precision is selected.
+    
+    .. rubric:: Parameters
+    
+    precision : str
+        
+        Name of the precision, "float64" or "float32".
+    
+    .. rubric:: Examples
+    
+    >>> set_precision("float32")
+    """
+    global _precision
+    if precision not in precisions:
+        raise ValueError("The " + str(precision) + " precision is not supported!")
+    _precision = precisions[precision]
+
+
+def algorithm_name(alg_func):
+    """
+    Returns the name of a built-in type reduction algorithm function of 
+    either backend.
+    
+    .. rubric:: Parameters
+    
+    alg_func : Function
+        
+        Type reduction algorithm.
+    
+    .. rubric:: Returns
+    
+    output : str or None
+        
+        Name of the algorithm, or None if alg_func is not a built-in 
+        algorithm.
+    """
+    for name in TR_algorithms:
+        if alg_func is TR_algorithms[name][0]:
+            return name
+        if isThereTypereduction and alg_func is getattr(typereduction, name + "_algorithm", None):
+            return name
+    return None
+
+
+def algorithm_function(algorithm, batch=False):
+    """
+    Resolves a type reduction algorithm on the active backend. All the 
+    IT2 FLS classes resolve their type reduction algorithms through this 
+    function at evaluation time, so changing the backend affects them 
+    consistently.
+    
+    .. rubric:: Parameters
+    
+    algorithm : str or Function
+        
+        Name of the algorithm, one of the KM, EKM, WEKM, TWEKM, EIASC, WM, 
+        BMM, LBMM, and NT, or a type reduction function. The built-in 
+        functions of both backends are mapped to the active backend, and 
+        the other functions are used as they are.
+    
+    batch=False : bool
+        
+        If True, the batch version of the algorithm is returned.
+    
+    .. rubric:: Returns
+    
+    output : Function
+        
+        Type reduction algorithm.
+    
+    .. rubric:: Examples
+    
+    >>> alg_func = algorithm_function("EIASC", batch=True)
+    """
+    if callable(algorithm):
+        name = algorithm_name(algorithm)
+        if name is None:
+            return batch_algorithm(algorithm) if batch else algorithm
+    elif algorithm in TR_algorithms:
+        name = algorithm
+    else:
+        raise ValueError("The " + str(algorithm) + " algorithm is not implemented, yet!")
+    if _backend == "c":
+        function = getattr(typereduction, name + ("_algorithm_batch" if batch else "_algorithm"), None)
+        if function is not None:
+            return function
+    return TR_algorithms[name][1 if batch else 0]
+
+
+def batch_algorithm(alg_func):
+    """
+    Returns the batch version of a type reduction algorithm.
+    
+    .. rubric:: Parameters
+    
+    alg_func : Function
+        
+        Type reduction algorithm, accepting one intervals matrix. For the 
+        algorithms without a batch version, a function which calls 
+        alg_func for the intervals matrices one by one is returned.
+    
+    .. rubric:: Returns
+    
+    output : Function
+        
+        Type reduction algorithm with the (intervals, params=[], mask=None) 
+        signature, accepting a (b, n, 4) shaped array of intervals.
+    
+    .. rubric:: Examples
+    
+    >>> alg_func = batch_algorithm(EIASC_algorithm)
+    >>> tr = alg_func(random.rand(100, 10, 4))
+    """
+    name = algorithm_name(alg_func)
+    if name is not None:
+        if alg_func is TR_algorithms[name][0]:
+            return TR_algorithms[name][1]
+        function = getattr(typereduction, name + "_algorithm_batch", None)
+        if function is not None:
+            return function
+    
+    def alg_func_batch(intervals, params=[], mask=None):
+        intervals, valid = check_intervals_batch(intervals, mask)
+        return array([alg_func(intervals[i][valid[i]], params) 
+                      for i in range(len(intervals))], dtype=float)
+    return alg_func_batch
+
+
+# The type reduction algorithms which calculate the exact centroid of the 
+# sampled IT2FS, and can be replaced by the closed form centroids on request.
+exact_centroid_algorithms = ["KM", "EKM", "TWEKM", "EIASC", ]
+
+
+# The type reduction algorithms whose outputs do not change by leaving the 
+# intervals with zero weights out, so they can skip the rules not firing.
+sparse_algorithms = ["KM", "EKM", "EIASC", "BMM", "LBMM", "NT", ]
+
+
+def _sparse(method, algorithm):
+    # The Centroid and CoSum methods join the rule outputs, to which the 
+    # rules not firing add nothing, whatever the algorithm is.
+    if method in ("Centroid", "CoSum", ):
+        return True
+    name = algorithm if isinstance(algorithm, str) else algorithm_name(algorithm)
+    return name in sparse_algorithms
+
+
+def _centroid_piece(lo, hi, m, s, h, k):
+    # Integrals of (x - k) f(x) and f(x) over [lo, hi], where f is the 
+    # Gaussian with mean m, standard deviation s, and height h, or the 
+    # constant h if s is None.
+    if hi <= lo:
+        return 0., 0.
+    if s is None:
+        return h * ((hi - k) ** 2 - (lo - k) ** 2) / 2., h * (hi - lo)
+    a = (lo - m) / s
+    b = (hi - m) / s
+    # The complementary error function keeps the precision in the tails.
+    if a >= 0.:
+        mass = erfc(a / msqrt(2.)) - erfc(b / msqrt(2.))
+    else:
+        mass = erfc(-b / msqrt(2.)) - erfc(-a / msqrt(2.))
+    mass = h * s * msqrt(pi / 2.) * mass
+    return h * s * s * (mexp(-a * a / 2.) - mexp(-b * b / 2.)) + (m - k) * mass, mass
+
+
+def _left_centroid(low, high, m1, m2, su, sl, hu, hl):
+    # Left end point of the centroid of the IT2FS on [low, high], whose 
+    # UMF is the Gaussian (m1, su, hu) before m1, hu between m1 and m2, 
+    # and the Gaussian (m2, su, hu) after m2, and whose LMF is the 
+    # Gaussian (m2, sl, hl) before (m1 + m2) / 2 and the Gaussian 
+    # (m1, sl, hl) after it. It is the root of 
+    # F(k) = int_low^k (x - k) UMF(x) dx + int_k^high (x - k) LMF(x) dx, 
+    # which is decreasing and concave, so the Newton iterations started at 
+    # the centroid of the UMF, on the right side of the root, decrease to 
+    # it monotonically.
+    c = (m1 + m2) / 2.
+    def moments(k, upper_end, lower_start):
+        pieces = [(low, min(m1, upper_end), m1, su, hu), 
+                  (max(low, m1), min(m2, upper_end), m1, None, hu), 
+                  (max(low, m2), upper_end, m2, su, hu), 
+                  (lower_start, min(c, high), m2, sl, hl), 
+                  (max(c, lower_start), high, m1, sl, hl), ]
+        first = 0.
+        mass = 0.
+        for lo, hi, m, s, h in pieces:
+            piece_first, piece_mass = _centroid_piece(lo, hi, m, s, h, k)
+            first += piece_first
+            mass += piece_mass
+        return first, mass
+    first, mass = moments(0., high, high)
+    if not mass > 0.:
+        return None
+    k = first / mass
+    for i in range(100):
+        first, mass = moments(k, k, k)
+        if not mass > 0.:
+            return None
+        step = first / mass
+        k += step
+        if abs(step) <= 1e-13 * (high - low):
+            break
+    return k
+
+
+def closed_form_centroid(it2fs, domain=None):
+    """
+    Calculates the centroid of an IT2FS in closed form, without sampling 
+    its membership functions. The Gaussian IT2FSs with uncertain standard 
+    deviation and uncertain mean, i.e., the sets with the 
+    gauss_uncert_std_umf and gauss_uncert_std_lmf, or the 
+    gauss_uncert_mean_umf and gauss_uncert_mean_lmf membership functions, 
+    are supported. The left end point is found by a few Newton iterations 
+    on the exact integrals over the domain, and the right end point follows 
+    from the symmetry of the set when the domain is symmetric around it, or 
+    covers it completely. The result is the limit of the Centroid type 
+    reduction with the KM, EKM, TWEKM, or EIASC algorithm as the domain is 
+    sampled more finely.
+    
+    .. rubric:: Parameters
+    
+    it2fs : IT2FS
+        
+        IT2FS whose centroid is calculated.
+    
+    domain=None : numpy (n,) shaped array
+        
+        The sorted universe of discourse. Only its first and last values 
+        are used. If not given, the domain of the IT2FS is used.
+    
+    .. rubric:: Returns
+    
+    output : tuple (l, r) or None
+        
+        Returns the centroid of the IT2FS, or None if the IT2FS is not 
+        supported.
+    
+    .. rubric:: Examples
+    
+    >>> domain = linspace(0., 1., 100)
+    >>> mySet = IT2FS_Gaussian_UncertStd(domain, [0.5, 0.2, 0.05, 1.])
+    >>> l, r = closed_form_centroid(mySet)
+    """
+    if domain is None:
+        domain = it2fs.domain
+    if len(domain) < 2:
+        return None
+    low = float(domain[0])
+    high = float(domain[-1])
+    if it2fs.umf is gauss_uncert_std_umf and it2fs.lmf is gauss_uncert_std_lmf:
+        m1, _, su, hu = map(float, it2fs.umf_params[:4])
+        m2, sl, _, hl = map(float, it2fs.lmf_params[:4])
+        if m1 != m2:
+            return None
+    elif it2fs.umf is gauss_uncert_mean_umf and it2fs.lmf is gauss_uncert_mean_lmf:
+        m1, m2, su, hu = map(float, it2fs.umf_params[:4])
+        ml, mr, sl, hl = map(float, it2fs.lmf_params[:4])
+        if ml != m1 or mr != m2 or abs(sl) != abs(su) or m1 > m2:
+            return None
+    else:
+        return None
+    su = abs(su)
+    sl = abs(sl)
+    if not (low < high and 0. < sl <= su and 0. < hl <= hu):
+        return None
+    l = _left_centroid(low, high, m1, m2, su, sl, hu, hl)
+    if l is None:
+        return None
+    if abs((low + high) - (m1 + m2)) <= 1e-12 * (high - low) or \
+        (low <= m1 - 9. * su and m2 + 9. * su <= high):
+        return l, (m1 + m2) - l
+    # The right end point is the left one of the mirrored set.
+    r = _left_centroid(-high, -low, -m2, -m1, su, sl, hu, hl)
+    if r is None:
+        return None
+    return l, -r
+
+
+def _interval_matrix(*columns):
+    # The (..., n, 4) shaped intervals matrix of a type reduction, built 
+    # from its four columns in the active precision.
+    columns = [asarray(column) for column in columns]
+    output = zeros(shape(columns[0]) + (4, ), dtype=_precision)
+    for i, column in enumerate(columns):
+        output[..., i] = column
+    return output
+
+
+def _centroids(it2fs_array, alg_func, domain, closed_form=False):
+    # Centroids of the IT2FSs, as a (k, 2) or (k, 1) shaped array. If 
+    # closed_form is True, the closed form centroids are used for the 
+    # supported sets if alg_func calculates the exact centroid, and the other 
+    # sets are type reduced together.
+    exact = [None, ] * len(it2fs_array)
+    if closed_form and algorithm_name(alg_func) in exact_centroid_algorithms:
+        exact = [closed_form_centroid(it2fs, domain) for it2fs in it2fs_array]
+    rest = [i for i in range(len(it2fs_array)) if exact[i] is None]
+    if not rest:
+        return array(exact, dtype=float).reshape(len(it2fs_array), 2)
+    centroids = batch_algorithm(alg_func)(array([_interval_matrix(domain, domain, 
+                                                                  it2fs_array[i].lower, 
+                                                                  it2fs_array[i].upper) 
+                                                 for i in rest]))
+    centroids = asarray(centroids, dtype=float).reshape(len(rest), -1)
+    output = zeros(shape=(len(it2fs_array), centroids.shape[1]))
+    output[rest] = centroids
+    for i in range(len(it2fs_array)):
+        if exact[i] is not None:
+            output[i] = exact[i]
+    return output
+
+
+def _domain_estimates(sets, domain, alg_func):
+    # The sampled centroids of the IT2FSs and centers of gravity of the 
+    # T1FSs on the domain, which are used for estimating the discretization 
+    # error.
+    estimates = []
+    it2fs_array = []
+    for fs in sets:
+        if isinstance(fs, IT2FS):
+            it2fs_array.append(c_[domain, domain, 
+                                  fs.lmf(domain, fs.lmf_params) * ones_like(domain), 
+                                  fs.umf(domain, fs.umf_params) * ones_like(domain)])
+        else:
+            values = fs.mf(domain, fs.params) * ones_like(domain)
+            area = trapz(values, domain)
+            estimates.append(trapz(domain * values, domain) / area if area > 0. else 0.)
+    if it2fs_array:
+        centroids = batch_algorithm(alg_func)(array(it2fs_array))
+        estimates.extend(asarray(centroids, dtype=float).ravel())
+    return array(estimates, dtype=float)
+
+
+def _curvature_domain(sets, low, high, n):
+    # A domain of n points whose density follows the cube root of the 
+    # largest curvature of the membership functions, which is the optimal 
+    # density for the trapezoidal rule, mixed with a uniform density so the 
+    # flat regions are not left empty.
+    pilot = linspace(low, high, 8 * (n - 1) + 1)
+    step = pilot[1] - pilot[0]
+    curvature = zeros_like(pilot)
+    for fs in sets:
+        values = fs.mf(pilot, fs.params) * ones_like(pilot)
+        curvature[1:-1] = maximum(curvature[1:-1], 
+                                  npabs(values[2:] - 2. * values[1:-1] + values[:-2]) / step ** 2)
+    density = curvature ** (1. / 3.)
+    density = density + max(density.mean(), 1. / (high - low))
+    cumulative = concatenate([[0.], cumsum((density[1:] + density[:-1]) * step / 2.)])
+    domain = interp(linspace(0., cumulative[-1], n), cumulative, pilot)
+    domain[0] = low
+    domain[-1] = high
+    return domain
+
+
+def adaptive_domain(sets, low=None, high=None, tolerance=1e-3, algorithm="EIASC", 
+                    min_points=11, max_points=100001, uniform=True):
+    """
+    Creates a domain with as few points as needed for type reducing or 
+    defuzzifying the given fuzzy sets with a target discretization error. 
+    The number of points is doubled until the sampled centroids of the 
+    IT2FSs and centers of gravity of the T1FSs change by at most 
+    tolerance * (high - low) in two successive steps, which guards against 
+    the sets whose centroids are accidentally exact on a coarse domain, and 
+    the middle domain of the two steps is returned.
+    
+    .. rubric:: Parameters
+    
+    sets : list of IT2FS or T1FS
+        
+        The fuzzy sets which would be sampled on the domain. Only their 
+        membership functions and parameters are used, and the sets are 
+        not changed.
+    
+    low=None : float
+        
+        Lower limit of the domain. If not given, the smallest first value 
+        of the domains of the sets is used.
+    
+    high=None : float
+        
+        Upper limit of the domain. If not given, the largest last value 
+        of the domains of the sets is used.
+    
+    tolerance=1e-3 : float
+        
+        Target error of the centroids, relative to the width of the domain.
+    
+    algorithm="EIASC" : str or Function
+        
+        Type reduction algorithm used for the centroids of the IT2FSs.
+    
+    min_points=11 : int
+        
+        Number of points the search starts with.
+    
+    max_points=100001 : int
+        
+        Largest number of points. If the target error is not met with it, 
+        the domain with max_points points is returned.
+    
+    uniform=True : bool
+        
+        If False, the points are concentrated where the membership 
+        functions have high curvature. Only T1FSs can be used with 
+        non-uniform domains, because the type reduction algorithms weigh 
+        the samples of IT2FSs equally.
+    
+    .. rubric:: Returns
+    
+    output : numpy (n,) shaped array
+        
+        The domain.
+    
+    .. rubric:: Examples
+    
+    >>> sets = [IT2FS_Gaussian_UncertStd(linspace(0., 1., 100), [0.5, 0.2, 0.05, 1.]), 
+    >>>         IT2FS_Gaussian_UncertStd(linspace(0., 1., 100), [0.8, 0.1, 0.05, 1.])]
+    >>> domain = adaptive_domain(sets, tolerance=1e-4)
+    """
+    if len(sets) == 0:
+        raise ValueError("At least one fuzzy set is needed for creating the domain.")
+    if not uniform and any(isinstance(fs, IT2FS) for fs in sets):
+        raise ValueError("Non-uniform domains can be used only with type 1 fuzzy sets.")
+    if low is None:
+        low = min(fs.domain[0] for fs in sets)
+    if high is None:
+        high = max(fs.domain[-1] for fs in sets)
+    if not low < high:
+        raise ValueError("The lower limit of the domain must be less than the upper limit.")
+    if min_points < 3 or max_points < min_points:
+        raise ValueError("The number of points must satisfy 3 <= min_points <= max_points.")
+    alg_func = algorithm_function(algorithm)
+    def create(n):
+        if uniform:
+            return linspace(low, high, n)
+        return _curvature_domain(sets, low, high, n)
+    n = min_points
+    domain = create(n)
+    estimates = _domain_estimates(sets, domain, alg_func)
+    converged = False
+    while n < max_points:
+        n = min(2 * n - 1, max_points)
+        previous_domain = domain
+        previous = estimates
+        domain = create(n)
+        estimates = _domain_estimates(sets, domain, alg_func)
+        # The estimates which are not defined on any domain are ignored.
+        changes = npabs(estimates - previous)
+        changes[isnan(estimates) & isnan(previous)] = 0.
+        if (changes <= tolerance * (high - low)).all():
+            if converged:
+                return previous_domain
+            converged = True
+        else:
+            converged = False
+    return domain
+
+
+def Centroid(it2fs, alg_func, domain, alg_params=[], closed_form=False):
+    """
+    Centroid type reduction for an interval type 2 fuzzy set.
+    
+    .. rubric:: Parameters
+    
+    it2fs : IT2FS
+        
+        IT2FS which would be type reduced.
+    
+    alg_func : Function
+        
+        Type reduction algorithm to be used, one of the list below:
+            
+            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
+            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
+            NT_algorithm
+    
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    alg_params : List
+        
+        List of parameters of type reduction algorithm if it is needed.
+    
+    closed_form=False : bool
+        
+        If True, the closed form centroid is returned for the supported sets.
+    
+    .. rubric:: Returns
+    
+    output : Based on selected type reduction algorithm tuple (l, r) or float
+    
+        Returns Centroid type reduction of the input IT2FS.
+    
+    .. rubric:: Notes
+    
+    If closed_form is True and no alg_params are given, for the Gaussian 
+    IT2FSs with uncertain standard deviation or mean, and the KM, EKM, 
+    TWEKM, and EIASC algorithms, the exact centroid on the domain is 
+    returned by the closed_form_centroid function, without sampling the 
+    set. It is the limit of the sampled centroid as the domain gets finer, 
+    and differs from it by about 2e-4 to 4e-3 on the domains with 100 
+    points, so it is not used by default.
+    """
+    if closed_form and not alg_params and \
+        algorithm_name(alg_func) in exact_centroid_algorithms:
+        centroid = closed_form_centroid(it2fs, domain)
+        if centroid is not None:
+            return centroid
+    intervals = _interval_matrix(domain, domain, it2fs.lower, it2fs.upper)
+    return alg_func(intervals, alg_params)
+
+
+def CoSet(firing_array, consequent_array, alg_func, domain, alg_params=[], 
+          closed_form=False):
+    """
+    Center of sets type reduction.
+    
+    .. rubric:: Parameters
+    
+    firing_array : numpy (m, 2) shaped array
+        
+        Firing strength of consequents.
+    
+    consequent_array : List of IT2FS
+        
+        List of consequents corresponding with the rules of IT2FLS
+    
+    alg_func : Function
+        
+        Type reduction algorithm to be used, one of the list below:
+            
+            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
+            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
+            NT_algorithm
+    
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    alg_params : List
+        
+        List of parameters of type reduction algorithm if it is needed.
+    
+    closed_form=False : bool
+        
+        If True and no alg_params are given, the centroids of the supported 
+        consequents are calculated by the closed_form_centroid function, as 
+        in the Centroid function.
+    
+    .. rubric:: Returns
+    
+    output : Based on selected type reduction algorithm tuple (l, r) or float
+    
+        Returns Center of sets type reduction of the input IT2FS.
+    """
+    centroids = _centroids(consequent_array, alg_func, domain, 
+                           closed_form and not alg_params)
+    intervals = _interval_matrix(centroids[:, 0], centroids[:, 1], 
+                                 firing_array[:, 0], firing_array[:, 1])
+    return alg_func(intervals, alg_params)
+
+
+def CoSum(it2fs_array, alg_func, domain, alg_params=[]):
+    """
+    Center of sum type reduction for an interval type 2 fuzzy set.
+    
+    .. rubric:: Parameters
+    
+    it2fs_array : List of IT2FSs
+        
+        List of final IT2FSs achieved by evaluating rule base.
+    
+    alg_func : Function
+        
+        Type reduction algorithm to be used, which is one of these:
+            
+            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
+            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
+            NT_algorithm
+    
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    alg_params : List
+        
+        List of parameters of type reduction algorithm if it is needed.
+    
+    .. rubric:: Returns
+    
+    output : Based on selected type reduction algorithm tuple (l, r) or float
+    
+        Returns Center of sum type reduction of the input IT2FS.
+    """
+    lower_sum = zeros_like(domain, dtype=_precision)
+    upper_sum = zeros_like(domain, dtype=_precision)
+    for it2fs in it2fs_array:
+        add(lower_sum, it2fs.lower, out=lower_sum)
+        add(upper_sum, it2fs.upper, out=upper_sum)
+    intervals = _interval_matrix(domain, domain, lower_sum, upper_sum)
+    return alg_func(intervals, alg_params)
+
+
+def Height(it2fs_array, alg_func, domain, alg_params=[]):
+    """
+    Height type reduction for an interval type 2 fuzzy set.
+    
+    .. rubric:: Parameters
+    
+    it2fs_array : List of IT2FSs
+        
+        List of final IT2FSs achieved by evaluating rule base.
+    
+    alg_func : Function
+        
+        Type reduction algorithm to be used, which is one of these:
+            
+            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
+            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
+            NT_algorithm
+    
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    alg_params : List
+        
+        List of parameters of type reduction algorithm if it is needed.
+    
+    .. rubric:: Returns
+    
+    output : Based on selected type reduction algorithm tuple (l, r) or float
+    
+        Returns Height type reduction of the input IT2FS.
+    """
+    intervals = []
+    for it2fs in it2fs_array:
+        index = argmax(it2fs.upper)
+        intervals.append([domain[index], domain[index], it2fs.lower[index], it2fs.upper[index]])
+    return alg_func(array(intervals, dtype=_precision), alg_params)
+
+
+def ModiHe(it2fs_array, spread_array, alg_func, domain, alg_params=[]):
+    """
+    Modified height type reduction for an interval type 2 fuzzy set.
+    
+    .. rubric:: Parameters
+    
+    it2fs_array : List of IT2FSs
+        
+        List of final IT2FSs achieved by evaluating rule base.
+    
+    spread_array : List of spread values corresponding with IT2FSs in it2fs_array. 
+    
+    alg_func: Function
+        
+        Type reduction algorithm to be used, which is one of these:
+            
+            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
+            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
+            NT_algorithm
+    
+    domain : numpy (n,) shaped array
+        
+        Indicates the universe of discourse dedicated to the IT2FS.
+    
+    alg_params : List
+        
+        List of parameters of type reduction algorithm if it is needed.
+    
+    .. rubric:: Returns
+    
+    output : Based on selected type reduction algorithm tuple (l, r) or float
+    
+        Returns Modified height type reduction of the input IT2FS.
+    """
+    intervals = []
+    j = 0
+    for it2fs in it2fs_array:
+        index = argmax(it2fs.upper)
+        intervals.append([domain[index], domain[index],
+                          it2fs.lower[index]/(spread_array[j] ** 2),
+                          it2fs.upper[index]/(spread_array[j] ** 2)])
+        j += 1
+    return alg_func(array(intervals, dtype=_precision), alg_params)
+
+
+class IT2RuleBase:
+    """
+    Compiled, array-backed form of an interval type 2 rule base.
+
+    The rule base of an IT2 FLS is kept by the engines as a list of
+    (antecedent, consequent) tuples. Evaluating it directly means walking
+    these nested tuples and calling the membership functions one scalar at
+    a time for every antecedent of every rule. The IT2RuleBase freezes such
+    a list into dense NumPy arrays, so that the firing intervals of all the
+    rules are computed with a few vectorized calls. Each distinct
+    antecedent term (an input variable paired with an IT2FS) is evaluated
+    only once, no matter how many rules share it, and the terms sharing a
+    membership function are evaluated together by one call of its
+    vectorized implementation (see evaluate_mf).
+
+    .. rubric:: Parameters
+
+    Parameters of the constructor function:
+
+    inputs : List of str
+
+        List of the inputs name as str.
+
+    outputs : List of str
+
+        List of the outputs name as str.
+
+    rules : List of tuples (antecedent, consequent)
+
+        The rule base to be compiled, in the same format used by IT2FLS,
+        IT2TSK, and IT2Mamdani. Consequents can be IT2FSs (Mamdani) or
+        any other object, like the coefficient dictionaries of IT2TSK.
+
+    .. rubric:: Members
+
+    terms : List of tuples (int, IT2FS)
+
+        Distinct antecedent terms of the rule base. Each term is a tuple
+        of the input variable index and the IT2FS assigned to it.
+
+    families : List of tuples (umf, lmf)
+
+        Distinct pairs of upper and lower membership functions used by
+        the antecedent terms.
+
+    term_family : numpy (t,) shaped array
+
+        Index of the membership function family of each term.
+
+    umf_params : numpy (t, p) shaped array
+
+        Parameters of the UMF of each term, padded with nan.
+
+    lmf_params : numpy (t, q) shaped array
+
+        Parameters of the LMF of each term, padded with nan.
+
+    antecedents : numpy (r, n) shaped array
+
+        Rule by input matrix of term indices. The value -1 shows that the
+        input variable is not used in the antecedent of the rule.
+
+    mf_ids : numpy (r, n) shaped array
+
+        Rule by input matrix of membership function family indices, with
+        -1 for the input variables not used in the antecedent of the rule.
+
+    consequent_terms : dictionary
+
+        The keys are output variable names and the values are lists of
+        the distinct consequents assigned to each output.
+
+    consequent_index : numpy (r, m) shaped array
+
+        Rule by output matrix of indices into the consequent_terms list of
+        each output. The value -1 shows that the output variable is not
+        used in the consequent of the rule.
+
+    .. rubric:: Functions
+
+    is_valid:
+
+        Checks if the compiled rule base still represents a rule list.
+
+    input_vector:
+
+        Converts a dictionary of crisp inputs to an input vector.
+
+    active_rules:
+
+        Returns the rules which can fire for a crisp input vector.
+
+    firing:
+
+        Calculates the firing intervals of all the rules.
+
+    consequent_rules:
+
+        Returns the indices of the rules having a consequent for an output.
+
+    active_rows:
+
+        Selects the active rules among the rules having a consequent for 
+        an output.
+
+    consequent_sets:
+
+        Returns the consequents of an output in the order of the rules.
+
+    sample_consequents:
+
+        Returns the raw UMF and LMF values of the consequents of an output.
+
+    implication:
+
+        Calculates the rule outputs of an output by meeting the consequents
+        with the firing intervals.
+
+    aggregate:
+
+        Joins the rule outputs of an output to an IT2FS.
+
+    consequent_centroids:
+
+        Returns the centroids of the consequents of an output, which are 
+        used by the CoSet type reduction.
+
+    .. rubric:: Notes
+
+    The compiled rule base keeps a reference to the rules list it was made
+    from. Adding rules through the add_rule function of the engines makes
+    them compile the rule base again, but modifying a rule in place does not
+    and needs an explicit call to the compile function of the engine.
+    """
+    def __init__(self, inputs, outputs, rules):
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.rules = rules
+        self.size = len(rules)
+
+        self.terms = []
+        self.families = []
+        term_family = []
+        term_index = {}
+        self.antecedents = full((self.size, len(self.inputs)), -1, dtype=int)
+        for r, rule in enumerate(rules):
+            for input_statement in rule[0]:
+                if input_statement[0] not in self.inputs:
+                    raise ValueError("The input variable, " + str(input_statement[0]) +
+                                     ", used in the rule " + str(r) + " is not defined!")
+                j = self.inputs.index(input_statement[0])
+                if self.antecedents[r, j] != -1:
+                    raise ValueError("The input variable, " + str(input_statement[0]) +
+                                     ", is used more than once in the rule " + str(r) + "!")
+                key = (j, id(input_statement[1]))
+                if key not in term_index:
+                    term_index[key] = len(self.terms)
+                    self.terms.append((j, input_statement[1]))
+                    family = (input_statement[1].umf, input_statement[1].lmf)
+                    if family not in self.families:
+                        self.families.append(family)
+                    term_family.append(self.families.index(family))
+                self.antecedents[r, j] = term_index[key]
+        self.term_family = array(term_family, dtype=int).reshape((len(self.terms), ))
+        self.umf_params = self.__pad([term[1].umf_params for term in self.terms])
+        self.lmf_params = self.__pad([term[1].lmf_params for term in self.terms])
+        self.mf_ids = where(self.antecedents == -1, -1,
+                            self.term_family[self.antecedents] if self.terms else -1)
+        self.used_inputs = (self.antecedents != -1).any(axis=0)
+
+        self.consequent_terms = {out: [] for out in self.outputs}
+        consequent_index = {out: {} for out in self.outputs}
+        self.consequent_index = full((self.size, len(self.outputs)), -1, dtype=int)
+        for r, rule in enumerate(rules):
+            for consequent in rule[1]:
+                if consequent[0] not in self.outputs:
+                    raise ValueError("The output variable, " + str(consequent[0]) +
+                                     ", used in the rule " + str(r) + " is not defined!")
+                k = self.outputs.index(consequent[0])
+                index = consequent_index[consequent[0]]
+                if id(consequent[1]) not in index:
+                    index[id(consequent[1])] = len(self.consequent_terms[consequent[0]])
+                    self.consequent_terms[consequent[0]].append(consequent[1])
+                self.consequent_index[r, k] = index[id(consequent[1])]
+        self.__samples = {}
+        self.__centroids = {}
+        self.__index = None
+
+    def __repr__(self):
+        return "Compiled interval type 2 rule base with " + str(self.size) + \
+               " rules, " + str(len(self.terms)) + " antecedent terms, and " + \
+               str(len(self.families)) + " membership function families"
+
+    @staticmethod
+    def __pad(params_list):
+        width = max([len(params) for params in params_list], default=0)
+        output = full((len(params_list), width), nan)
+        for i, params in enumerate(params_list):
+            output[i, :len(params)] = params
+        return output
+
+    def is_valid(self, inputs, outputs, rules):
+        """
+        Checks if the compiled rule base still represents the rules list,
+        and the input and output variables of an engine.
+
+        .. rubric:: Parameters
+
+        inputs : List of str
+
+            List of the inputs name as str.
+
+        outputs : List of str
+
+            List of the outputs name as str.
+
+        rules : List of tuples (antecedent, consequent)
+
+            The rules list of the engine.
+
+        .. rubric:: Returns
+
+        output : bool
+
+            False if the rule base must be compiled again.
+        """
+        return rules is self.rules and len(rules) == self.size and \
+               inputs == self.inputs and outputs == self.outputs
+
+    def input_vector(self, inputs):
+        """
+        Converts a dictionary of crisp inputs to an input vector ordered
+        as the input variables. The input variables which are not used by
+        any rule are not required to be in the dictionary.
+
+        .. rubric:: Parameters
+
+        inputs : dictionary
+
+            The keys are input variable names as str and the values are
+            the crisp value of the inputs.
+
+        .. rubric:: Returns
+
+        output : numpy (n,) shaped array
+        """
+        return array([inputs[name] if used else 0.
+                      for name, used in zip(self.inputs, self.used_inputs)], dtype=float)
+
+    def input_matrix(self, inputs):
+        """
+        Converts a dictionary of crisp input columns to an input matrix
+        with one sample per row and the columns ordered as the input
+        variables. The input variables which are not used by any rule are
+        not required to be in the dictionary.
+
+        .. rubric:: Parameters
+
+        inputs : dictionary
+
+            The keys are input variable names as str and the values are
+            lists or numpy (s,) shaped arrays of the crisp value of the
+            inputs.
+
+        .. rubric:: Returns
+
+        output : numpy (s, n) shaped array
+        """
+        sizes = [len(column) for column in inputs.values()]
+        if sizes.count(sizes[0]) != len(sizes):
+            raise ValueError("All input lists must contain same number of values.")
+        X = zeros((sizes[0], len(self.inputs)))
+        for j, (name, used) in enumerate(zip(self.inputs, self.used_inputs)):
+            if used:
+                X[:, j] = inputs[name]
+        return X
+
+    def active_rules(self, x):
+        """
+        Returns the rules which can fire for a crisp input vector, found by 
+        an ActiveRuleIndex of the supports of the UMFs of the antecedent 
+        terms. The index is built on the first call, and again if the UMF 
+        or the UMF parameters of a term with a compact support change.
+
+        .. rubric:: Parameters
+
+        x : numpy (n,) shaped array
+
+            Crisp value of the inputs, ordered as the input variables.
+
+        .. rubric:: Returns
+
+        output : numpy (r,) shaped array of bool or None
+
+            True for the rules which can fire, or None if the rules can 
+            not be narrowed.
+        """
+        if self.__index is None or \
+           [(it2fs.umf, list(it2fs.umf_params)) for it2fs in self.__index[0]] != self.__index[1]:
+            statements, bounded = _support_statements([(j, it2fs.umf, it2fs.umf_params) 
+                                                       for j, it2fs in self.terms], 
+                                                      self.antecedents)
+            terms = [self.terms[t][1] for t in bounded]
+            self.__index = (terms, [(it2fs.umf, list(it2fs.umf_params)) for it2fs in terms], 
+                            ActiveRuleIndex(self.size, statements))
+        return self.__index[2].active(x)
+
+    def firing(self, X, t_norm, active=None):
+        """
+        Calculates the firing intervals of all the rules.
+
+        .. rubric:: Parameters
+
+        X : numpy (n,) or (s, n) shaped array
+
+            Crisp value of the inputs for one or s samples, ordered as the
+            input variables.
+
+        t_norm : function
+
+            T-norm operator used for combining the antecedents.
+
+        active=None : numpy (r,) shaped array of bool
+
+            The rules which can fire, as returned by the active_rules 
+            function. Only the terms used by these rules are evaluated, 
+            and the other rules get zero firing intervals.
+
+        .. rubric:: Returns
+
+        output : tuple (l, u)
+
+            Lower and upper firing strengths of the rules as numpy (r,)
+            shaped arrays for a single sample, or as (r, s) shaped arrays
+            for s samples.
+        """
+        X = asarray(X, dtype=_precision)
+        antecedents = self.antecedents
+        if active is not None:
+            rules = flatnonzero(active)
+            antecedents = antecedents[rules]
+        # The extra last row is used by the -1 entries of the antecedents
+        # matrix, so the absent input variables do not change the result.
+        U = ones((len(self.terms) + 1, ) + X.shape[:-1], dtype=X.dtype)
+        L = ones((len(self.terms) + 1, ) + X.shape[:-1], dtype=X.dtype)
+        used = zeros((len(self.terms) + 1, ), dtype=bool)
+        used[antecedents] = True
+        terms = [(t, j, it2fs) for t, (j, it2fs) in enumerate(self.terms) if used[t]]
+        _evaluate_terms(U, X, [(t, j, it2fs.umf, it2fs.umf_params) for t, j, it2fs in terms])
+        _evaluate_terms(L, X, [(t, j, it2fs.lmf, it2fs.lmf_params) for t, j, it2fs in terms])
+        u = _reduce_norm(t_norm, 1., [U[antecedents[:, j]] for j in range(len(self.inputs))])
+        l = _reduce_norm(t_norm, 1., [L[antecedents[:, j]] for j in range(len(self.inputs))])
+        u = u * ones((len(antecedents), ) + X.shape[:-1], dtype=X.dtype)
+        l = l * ones((len(antecedents), ) + X.shape[:-1], dtype=X.dtype)
+        if active is None:
+            return l, u
+        upper = zeros((self.size, ) + X.shape[:-1], dtype=X.dtype)
+        lower = zeros((self.size, ) + X.shape[:-1], dtype=X.dtype)
+        upper[rules] = u
+        lower[rules] = l
+        return lower, upper
+
+    def consequent_rules(self, out):
+        """
+        Returns the indices of the rules having a consequent for an output
+        variable, in the order of the rules.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        .. rubric:: Returns
+
+        output : numpy (k,) shaped array
+        """
+        rows, = where(self.consequent_index[:, self.outputs.index(out)] != -1)
+        return rows
+
+    def active_rows(self, out, active):
+        """
+        Selects the active rules among the rules having a consequent for 
+        an output variable.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        active : numpy (r,) shaped array of bool or None
+
+            The rules which can fire, as returned by the active_rules 
+            function.
+
+        .. rubric:: Returns
+
+        output : numpy (k,) shaped array of bool or None
+
+            True for the active rows of the consequent_rules output. None 
+            shows that all the rows are kept, which is also the case if 
+            none of them is active.
+        """
+        if active is None:
+            return None
+        keep = active[self.consequent_rules(out)]
+        if keep.all() or not keep.any():
+            return None
+        return keep
+
+    def consequent_sets(self, out):
+        """
+        Returns the consequents assigned to an output variable, in the
+        order of the rules.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        .. rubric:: Returns
+
+        output : List
+        """
+        index = self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]
+        return [self.consequent_terms[out][i] for i in index]
+
+    def sample_consequents(self, out, domain, cache=True):
+        """
+        Returns the raw (not clipped) UMF and LMF values of the IT2FS
+        consequents of an output variable. Each distinct consequent is
+        evaluated once, and the values are stored for the later calls
+        with the same domain.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        domain : numpy (n,) shaped array
+
+            Points at which the consequents are evaluated.
+
+        cache : bool
+
+            If False, the values are neither stored nor read from the store.
+
+        .. rubric:: Returns
+
+        output : tuple (upper, lower)
+
+            Two numpy (k, n) shaped arrays, with one row for each rule
+            having a consequent for the output variable.
+        """
+        key = (out, id(domain), _precision)
+        if cache and key in self.__samples:
+            return self.__samples[key][1:]
+        terms = self.consequent_terms[out]
+        upper = array([term.umf(domain, term.umf_params) * ones_like(domain, dtype=float)
+                       for term in terms], 
+                      dtype=_precision).reshape((len(terms), ) + shape(domain))
+        lower = array([term.lmf(domain, term.lmf_params) * ones_like(domain, dtype=float)
+                       for term in terms], 
+                      dtype=_precision).reshape((len(terms), ) + shape(domain))
+        index = self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]
+        upper = upper[index]
+        lower = lower[index]
+        if cache:
+            self.__samples[key] = (domain, upper, lower)
+        return upper, lower
+
+    def consequent_centroids(self, out, alg_func=EIASC_algorithm, closed_form=False):
+        """
+        Returns the centroids of the IT2FS consequents of an output variable. 
+        Each distinct consequent is type reduced once, and the centroids are 
+        stored for the later calls. The stored centroids are calculated again 
+        if the type reduction algorithm or the backend changes, or if the 
+        sampled values of a consequent change, e.g., by setting its 
+        parameters. Adding rules through the engines compiles a new rule 
+        base, which starts with no stored centroids.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        alg_func=EIASC_algorithm : function
+
+            Type reduction algorithm.
+
+        closed_form=False : bool
+
+            If True, the centroids of the Gaussian consequents with uncertain 
+            standard deviation or mean are calculated by the 
+            closed_form_centroid function, if the algorithm calculates the 
+            exact centroid.
+
+        .. rubric:: Returns
+
+        output : numpy (r, 2) shaped array
+
+            The (l, r) centroids, with one row for each rule having a 
+            consequent for the output variable.
+        """
+        alg_func = algorithm_function(alg_func)
+        terms = self.consequent_terms[out]
+        domain = terms[0].domain
+        samples = [(term.upper, term.lower) for term in terms]
+        key = (out, alg_func, bool(closed_form))
+        stored = self.__centroids.get(key)
+        if stored is not None and stored[0] is domain and \
+            all(upper is stored_upper and lower is stored_lower 
+                for (upper, lower), (stored_upper, stored_lower) in zip(samples, stored[1])):
+            centroids = stored[2]
+        else:
+            centroids = _centroids(terms, alg_func, domain, closed_form)
+            self.__centroids[key] = (domain, samples, centroids)
+        return centroids[self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]]
+
+    def implication(self, out, domain, l, u, t_norm, active=None):
+        """
+        Meets the IT2FS consequents of an output variable with the firing
+        intervals of their rules.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        domain : numpy (n,) shaped array
+
+            Points at which the consequents are evaluated.
+
+        l : numpy (r,) or (r, s) shaped array
+
+            Lower firing strengths of all the rules, for one or s samples.
+
+        u : numpy (r,) or (r, s) shaped array
+
+            Upper firing strengths of all the rules, for one or s samples.
+
+        t_norm : function
+
+            T-norm operator used for the implication.
+
+        active=None : numpy (r,) shaped array of bool
+
+            If given, only the rows of the active rules are returned, as 
+            selected by the active_rows function.
+
+        .. rubric:: Returns
+
+        output : tuple (upper, lower)
+
+            Two numpy (k, n) or (k, s, n) shaped arrays of the raw (not 
+            clipped) UMF and LMF values of the rule outputs.
+        """
+        rows = self.consequent_rules(out)
+        upper, lower = self.sample_consequents(out, domain)
+        keep = self.active_rows(out, active)
+        if keep is not None:
+            rows = rows[keep]
+            upper = upper[keep]
+            lower = lower[keep]
+        if u.ndim == 2:
+            upper = upper[:, None, :]
+            lower = lower[:, None, :]
+        return t_norm(upper, u[rows][..., None]), t_norm(lower, l[rows][..., None])
+
+    def aggregate(self, out, domain, l, u, t_norm, s_norm, active=None):
+        """
+        Joins the rule outputs of an output variable to a single IT2FS. The
+        membership values of the resulting set on the domain are computed
+        once, and it is evaluated from the consequents at other points.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        domain : numpy (n,) shaped array
+
+            Universe of discourse of the resulting IT2FS.
+
+        l : numpy (r,) shaped array
+
+            Lower firing strengths of all the rules.
+
+        u : numpy (r,) shaped array
+
+            Upper firing strengths of all the rules.
+
+        t_norm : function
+
+            T-norm operator used for the implication.
+
+        s_norm : function
+
+            S-norm operator used for the aggregation.
+
+        active=None : numpy (r,) shaped array of bool
+
+            If given, only the active rules are joined on the domain. The 
+            other rules must have zero firing intervals.
+
+        .. rubric:: Returns
+
+        output : SampledIT2FS
+        """
+        upper, lower = self.implication(out, domain, l, u, t_norm, active)
+        rows = self.consequent_rules(out)
+
+        def mf(x, upper_mf, firing):
+            x = asarray(x, dtype=float)
+            samples = self.sample_consequents(out, x, cache=False)[0 if upper_mf else 1]
+            return _reduce_norm(s_norm, zeros_like(x), 
+                                t_norm(samples, firing[rows].reshape((-1, ) + (1, ) * x.ndim)))
+
+        return SampledIT2FS(domain, 
+                            _reduce_norm(s_norm, zeros_like(domain, dtype=u.dtype), upper), 
+                            _reduce_norm(s_norm, zeros_like(domain, dtype=l.dtype), lower), 
+                            umf=lambda x, params: mf(x, True, u), 
+                            lmf=lambda x, params: mf(x, False, l))
+
+    def coefficients(self, out):
+        """
+        Returns the coefficients of the polynomial (TSK) consequents of an 
+        output variable, in the order of the rules. Each consequent is a 
+        dictionary like {"const":5., "x1":2., "x2":4.}.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        .. rubric:: Returns
+
+        output : numpy (k, n + 1) shaped array
+
+            The first column holds the constant terms and the other columns 
+            hold the coefficients of the input variables.
+        """
+        terms = array([[term["const"]] + [term[name] for name in self.inputs] 
+                       for term in self.consequent_terms[out]], dtype=float)
+        terms = terms.reshape((len(self.consequent_terms[out]), len(self.inputs) + 1))
+        return terms[self.consequent_index[self.consequent_rules(out), self.outputs.index(out)]]
+
+    def intervals(self, out, l, u, t_norm, s_norm, method="Centroid", 
+                  method_params=[], alg_func=EIASC_algorithm, active=None):
+        """
+        Builds the intervals passed to the type reduction algorithm for an 
+        output variable of a Mamdani system.
+
+        .. rubric:: Parameters
+
+        out : str
+
+            Name of the output variable.
+
+        l : numpy (r,) or (r, s) shaped array
+
+            Lower firing strengths of all the rules, for one or s samples.
+
+        u : numpy (r,) or (r, s) shaped array
+
+            Upper firing strengths of all the rules, for one or s samples.
+
+        t_norm : function
+
+            T-norm operator used for the implication.
+
+        s_norm : function
+
+            S-norm operator used for the aggregation.
+
+        method="Centroid" : str
+
+            Type reduction method, one of the Centroid, CoSet, CoSum, 
+            Height, and ModiHe.
+
+        method_params=[] : List
+
+            Parameters of the type reduction method, if needed.
+
+        alg_func=EIASC_algorithm : function
+
+            Type reduction algorithm, which is needed by the CoSet method 
+            for calculating the centroids of the consequents.
+
+        active=None : numpy (r,) shaped array of bool
+
+            If given, only the active rules are used, as selected by the 
+            active_rows function. The other rules must have zero firing 
+            intervals, and the CoSet, Height, and ModiHe methods need a 
+            type reduction algorithm which ignores the zero weights.
+
+        .. rubric:: Returns
+
+        output : numpy (m, 4) or (s, m, 4) shaped array
+        """
+        keep = self.active_rows(out, active)
+        if method == "CoSet":
+            centroids = self.consequent_centroids(out, alg_func)
+            rows = self.consequent_rules(out)
+            if keep is not None:
+                centroids = centroids[keep]
+                rows = rows[keep]
+            f_l = l[rows].T
+            f_u = u[rows].T
+            output = ones(f_l.shape + (4, ), dtype=f_l.dtype)
+            output[..., 0] = centroids[:, 0]
+            output[..., 1] = centroids[:, 1]
+            output[..., 2] = f_l
+            output[..., 3] = f_u
+            return output
+        elif method == "Centroid":
+            domain = self.consequent_sets(out)[-1].domain
+            upper, lower = self.implication(out, domain, l, u, t_norm, active)
+            upper = clip(_reduce_norm(s_norm, zeros_like(domain, dtype=u.dtype), upper), 0., 1.)
+            lower = clip(_reduce_norm(s_norm, zeros_like(domain, dtype=l.dtype), lower), 0., 1.)
+        elif method in ("CoSum", "Height", "ModiHe"):
+            domain = self.consequent_sets(out)[0].domain
+            upper, lower = self.implication(out, domain, l, u, t_norm, active)
+            upper = clip(upper, 0., 1.)
+            lower = clip(lower, 0., 1.)
+            if method == "CoSum":
+                upper = npsum(upper, axis=0)
+                lower = npsum(lower, axis=0)
+            else:
+                index = argmax(upper, axis=-1)
+                upper = take_along_axis(upper, index[..., None], axis=-1)[..., 0].T
+                lower = take_along_axis(lower, index[..., None], axis=-1)[..., 0].T
+                domain = domain[index].T
+                if method == "ModiHe":
+                    rows = self.consequent_rules(out)
+                    spread = array(method_params[:len(rows)], dtype=upper.dtype) ** 2
+                    if keep is not None and spread.shape == keep.shape:
+                        spread = spread[keep]
+                    upper = upper / spread
+                    lower = lower / spread
+        else:
+            raise ValueError("The method, " + method + ", is not implemented yet!")
+        output = ones(upper.shape + (4, ), dtype=u.dtype)
+        output[..., 0] = domain
+        output[..., 1] = domain
+        output[..., 2] = lower
+        output[..., 3] = upper
+        return output
+
+    def evaluate_batch(self, X, t_norm, s_norm, method="Centroid", method_params=[], 
+                       alg_func=EIASC_algorithm, alg_params=[], batch_size=1024):
+        """
+        Evaluates a Mamdani system for a batch of crisp inputs. The firing 
+        intervals, the implication, and the aggregation are computed for 
+        batch_size samples at a time with vectorized calls.
+
+        .. rubric:: Parameters
+
+        X : numpy (s, n) shaped array
+
+            Crisp value of the inputs for s samples, with the columns ordered 
+            as the input variables.
+
+        t_norm : function
+
+            T-norm operator.
+
+        s_norm : function
+
+            S-norm operator.
+
+        method="Centroid" : str
+
+            Type reduction method, one of the Centroid, CoSet, CoSum, 
+            Height, and ModiHe.
+
+        method_params=[] : List
+
+            Parameters of the type reduction method, if needed.
+
+        alg_func=EIASC_algorithm : function
 
+            Type reduction algorithm.
 
-def ModiHe(it2fs_array, spread_array, alg_func, domain, alg_params=[]):
-    """
-    Modified height type reduction for an interval type 2 fuzzy set.
-    
-    .. rubric:: Parameters
-    
-    it2fs_array : List of IT2FSs
-        
-        List of final IT2FSs achieved by evaluating rule base.
-    
-    spread_array : List of spread values corresponding with IT2FSs in it2fs_array. 
-    
-    alg_func: Function
-        
-        Type reduction algorithm to be used, which is one of these:
-            
-            KM_algorithm, EKM_algorithm, WEKM_algorithm, TWEKM_algorithm, 
-            EIASC_algorithm, WM_algorithm, BMM_algorithm, LBMM_algorithm, and 
-            NT_algorithm
-    
-    domain : numpy (n,) shaped array
-        
-        Indicates the universe of discourse dedicated to the IT2FS.
-    
-    alg_params : List
-        
-        List of parameters of type reduction algorithm if it is needed.
-    
-    .. rubric:: Returns
-    
-    output : Based on selected type reduction algorithm tuple (l, r) or float
-    
-        Returns Modified height type reduction of the input IT2FS.
-    """
-    intervals = []
-    j = 0
-    for it2fs in it2fs_array:
-        index = argmax(it2fs.upper)
-        intervals.append([domain[index], domain[index],
-                          it2fs.lower[index]/(spread_array[j] ** 2),
-                          it2fs.upper[index]/(spread_array[j] ** 2)])
-        j += 1
-    return alg_func(array(intervals), alg_params)
+        alg_params=[] : List
+
+            Parameters of the type reduction algorithm, if needed.
+
+        batch_size=1024 : int
+
+            Number of samples processed together, which bounds the memory 
+            used by the (rules, samples, domain) shaped implication arrays.
+
+        .. rubric:: Returns
+
+        output : tuple (y, l, r)
+
+            Three numpy (s, m) shaped arrays of the crisp outputs, and the 
+            left and right ends of the type reduced sets, with the columns 
+            ordered as the output variables.
+        """
+        X = self.check_batch(X)
+        alg_func_batch = algorithm_function(alg_func, batch=True)
+        left = zeros((X.shape[0], len(self.outputs)), dtype=_precision)
+        right = zeros((X.shape[0], len(self.outputs)), dtype=_precision)
+        for start in range(0, X.shape[0], batch_size):
+            stop = min(start + batch_size, X.shape[0])
+            l, u = self.firing(X[start:stop], t_norm)
+            for k, out in enumerate(self.outputs):
+                intervals = self.intervals(out, l, u, t_norm, s_norm, 
+                                           method, method_params, alg_func)
+                tr = alg_func_batch(intervals, alg_params).reshape(stop - start, -1)
+                left[start:stop, k] = tr[:, 0]
+                right[start:stop, k] = tr[:, -1]
+        return (left + right) / 2, left, right
+
+    def check_batch(self, X):
+        """
+        Verifies the shape of a batch of crisp inputs.
+
+        .. rubric:: Parameters
+
+        X : numpy (s, n) shaped array
+
+            Crisp value of the inputs for s samples.
+
+        .. rubric:: Returns
+
+        output : numpy (s, n) shaped array of float
+        """
+        X = asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != len(self.inputs):
+            raise ValueError("The inputs must be a (n_samples, " + str(len(self.inputs)) + 
+                             ") shaped array.")
+        return X
 
 
 class IT2FLS:
@@ -3426,6 +6728,15 @@ class IT2FLS:
         
         Evaluates the IT2FLS's output for a specified crisp input.
     
+    evaluate_batch:
+        
+        Evaluates the IT2FLS's outputs for a batch of crisp inputs given 
+        as an array with one sample per row.
+    
+    compile:
+        
+        Compiles the rule base into dense arrays used by the evaluate functions.
+    
     .. rubric:: Examples
     
     Assume that we are going to simulate an IT2FLS with two inputs and 
@@ -3480,6 +6791,7 @@ class IT2FLS:
         self.inputs = []
         self.outputs = []
         self.rules = []
+        self.rulebase = None
 
     def __repr__(self):
         return "Interval type 2 Mamdani fuzzy logic system!"
@@ -3530,6 +6842,7 @@ class IT2FLS:
             
         """
         self.rules.append((antecedent, consequent))
+        self.rulebase = None
 
     def copy(self):
         """
@@ -3541,19 +6854,125 @@ class IT2FLS:
         o.rules = self.rules.copy()
         return o
     
+    def __algorithm_function(self, algorithm):
+        return algorithm_function(algorithm)
+    
+    def compile(self):
+        """
+        Compiles the rule base into an array-backed IT2RuleBase, which is 
+        used by the evaluate functions. The rule base is compiled 
+        automatically after adding new rules, so this function needs to be 
+        called explicitly only if the rules are modified in place.
+        
+        .. rubric:: Returns
+        
+        output : IT2RuleBase
+            
+            The compiled rule base.
+        """
+        self.rulebase = IT2RuleBase(self.inputs, self.outputs, self.rules)
+        return self.rulebase
+    
+    def evaluate_batch(self, X, t_norm, s_norm, domain, method="Centroid", 
+                       method_params=[], algorithm="EIASC", algorithm_params=[], 
+                       batch_size=1024):
+        """
+        Evaluates the IT2FLS for a batch of crisp inputs. The firing 
+        strengths, the implication, and the aggregation are computed for 
+        many samples at once with vectorized calls.
+        
+        .. rubric:: Parameters
+        
+        X : numpy (n_samples, n_inputs) shaped array
+            
+            Crisp value of the inputs, one sample per row, with the columns 
+            ordered as the inputs list.
+            
+        t_norm : function
+            
+            Indicates the t-norm operator to be used, and should be chosen 
+            between min_t_norm, product_t_norm, or other user defined 
+            t-norms.
+        
+        s_norm : function
+            
+            Indicates the s-norm operator to be used, and should be chosen 
+            between max_s_norm or other user defined s-norms.
+        
+        domain : numpy (n,) shaped array
+            
+            Indicates the universe of discourse dedicated to the IT2FS.
+        
+        method="Centroid" : str
+            
+            Indicates the type reduction method name and should be one 
+            of the methods listed below:
+
+                Centroid, CoSet, CoSum, Height, and ModiHe.
+        
+        method_params=[] : List
+            
+            Parameters of the type reduction method, if needed.
+        
+        algorithm="EIASC" : str
+
+            Indicates the type reduction algorithm name and should be 
+            one of the algorithms listed below:
+
+                KM, EKM, WEKM, TWEKM, EIASC, WM, BMM, LBMM, and NT.
+        
+        algorithm_params=[] : List
+            
+            Parameters of the type reduction algorithm, if needed.
+        
+        batch_size=1024 : int
+            
+            Number of samples which are processed together.
+        
+        .. rubric:: Returns
+        
+        output : tuple (y, l, r)
+            
+            Three numpy (n_samples, n_outputs) shaped arrays of the crisp 
+            outputs and the left and right ends of the type reduced sets, 
+            with the columns ordered as the outputs list. For the type 
+            reduction algorithms which return a crisp number, l and r are 
+            equal to y.
+        
+        .. rubric:: Examples
+        
+        >>> X = random.rand(1000, 2)
+        >>> y, l, r = myIT2FLS.evaluate_batch(X, min_t_norm, max_s_norm, domain)
+        """
+        alg_func = self.__algorithm_function(algorithm)
+        return self.__rulebase().evaluate_batch(X, t_norm, s_norm, method, method_params, 
+                                                alg_func, algorithm_params, batch_size)
+    
+    def __rulebase(self):
+        if self.rulebase is None or \
+           not self.rulebase.is_valid(self.inputs, self.outputs, self.rules):
+            self.compile()
+        return self.rulebase
+    
     def evaluate_list(self, inputs, t_norm, s_norm, domain, 
                       method="Centroid", method_params=[], 
-                      algorithm="EIASC", algorithm_params=[]):
+                      algorithm="EIASC", algorithm_params=[], batch_size=1024):
         """
-        Evaluates the IT2FLS based on list of crisp inputs given by user.
+        Evaluates the IT2FLS based on list of crisp inputs given by user. 
+        The inputs are processed column-wise: the firing intervals of all 
+        the rules are computed for batch_size samples at a time, and the 
+        resulting intervals are passed to the batched type reduction 
+        algorithm.
         
         .. rubric:: Parameters
         
-        inputs : dictionary
+        inputs : dictionary or numpy (n_samples, n_inputs) shaped array
             
             Inputs is a dictionary in which the keys are input variable 
-            names as str and the values are the list of crisp values 
-            corresponded with the inputs to be evaluated.
+            names as str and the values are the lists (or numpy arrays) of 
+            crisp values corresponded with the inputs to be evaluated. It 
+            can also be given as an array with one sample per row and the 
+            columns ordered as the inputs list.
             
         t_norm : function
             
@@ -3592,20 +7011,33 @@ class IT2FLS:
             
             Parameters of the type reduction algorithm, if needed.
         
+        batch_size=1024 : int
+            
+            Number of samples which are processed together.
+        
         .. rubric:: Returns
         
-        output : tuple or list
+        output : tuple or dict
 
             It depends on which method and algorithm for type reduction is 
             chosen. If Centroid type reduction method is chosen the output 
             is a tuple with two elements. First element is the overall IT2FS 
-            outputs of the system as a list of dictionaries with output names as keys 
-            and sets as values. The second output is outputs of the 
-            selected type reduction algorithm as a list of dictionaries with 
-            output names as keys and type reduction algorithm function output 
-            as value. For other type reduction methods the only output is a list of  
-            dictionaries of the type reduction algorithm function outputs for 
-            each output variable name as a key.
+            outputs of the system as a dictionary with output names as keys 
+            and tuples (upper, lower) of numpy (n_samples, n) shaped arrays, 
+            sampled on the domain of the consequents, as values. The second 
+            output is outputs of the selected type reduction algorithm as a 
+            dictionary with output names as keys and numpy (n_samples, 2) 
+            shaped arrays of the (l, r) type reduced sets as values. For the 
+            algorithms which return a crisp number, i.e., BMM, LBMM, and NT, 
+            the values are numpy (n_samples, ) shaped arrays. For other type 
+            reduction methods the only output is the dictionary of the type 
+            reduction algorithm outputs.
+        
+        .. rubric:: Examples
+        
+        >>> it2out, tr = myIT2FLS.evaluate_list({"x1":[0.1, 0.9], "x2":[0.2, 0.9]}, 
+        >>>                                     min_t_norm, max_s_norm, domain)
+        >>> print(crisp_list(tr, "y1"))
         
         .. rubric:: Notes
         
@@ -3615,147 +7047,35 @@ class IT2FLS:
             * The inputs must be lay in the defined universe of discourse.
             * The type reduction method and the type reduction algorithm must be selected from the lists provided in docstrings.
         """
-        inputs_list = []
-        
-        l = len(inputs[self.inputs[0]])
-        for i in inputs.values():
-            if len(i) != l:
-                raise ValueError("All input lists must contain same number of values.")
-        
-        for i in range(l):
-            inputs_list.append({})
-            for j in self.inputs:
-                inputs_list[-1][j] = inputs[j][i]
-        
-        if algorithm == "KM":
-            alg_func = KM_algorithm
-        elif algorithm == "EKM":
-            alg_func = EKM_algorithm
-        elif algorithm == "WEKM":
-            alg_func = WEKM_algorithm
-        elif algorithm == "TWEKM":
-            alg_func = TWEKM_algorithm
-        elif algorithm == "WM":
-            alg_func = WM_algorithm
-        elif algorithm == "LBMM":
-            alg_func = LBMM_algorithm
-        elif algorithm == "BMM":
-            alg_func = BMM_algorithm        
-        elif algorithm == "NT":
-            alg_func = NT_algorithm       
-        elif algorithm == "EIASC":
-            alg_func = EIASC_algorithm
+        if method not in ("Centroid", "CoSet", "CoSum", "Height", "ModiHe"):
+            raise ValueError("The method " + method + " is not implemented yet!")
+        alg_func = self.__algorithm_function(algorithm)
+        alg_func_batch = algorithm_function(alg_func, batch=True)
+        rulebase = self.__rulebase()
+        if isinstance(inputs, dict):
+            X = rulebase.input_matrix(inputs)
         else:
-            raise ValueError("The " + algorithm + " algorithm is not implemented, yet!")
-        
-        outputs = []
+            X = rulebase.check_batch(inputs)
         
+        upper = {out: [] for out in self.outputs}
+        lower = {out: [] for out in self.outputs}
+        TR = {out: [] for out in self.outputs}
+        for start in range(0, X.shape[0], batch_size):
+            l, u = rulebase.firing(X[start:start + batch_size], t_norm)
+            for out in self.outputs:
+                intervals = rulebase.intervals(out, l, u, t_norm, s_norm, 
+                                               method, method_params, alg_func)
+                if method == "Centroid":
+                    upper[out].append(intervals[..., 3])
+                    lower[out].append(intervals[..., 2])
+                TR[out].append(alg_func_batch(intervals, algorithm_params))
+        for out in self.outputs:
+            TR[out] = concatenate(TR[out])
         if method == "Centroid":
-            Cs = []
-            TRs = []
-            for inputs in inputs_list:
-                B = {out: [] for out in self.outputs}
-                for rule in self.rules:
-                    u = 1
-                    l = 1
-                    for input_statement in rule[0]:
-                        u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                        l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                    for consequent in rule[1]:
-                        B_l = meet(consequent[1].domain, 
-                                   IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                                   consequent[1], t_norm)
-                        B[consequent[0]].append(B_l)
-                C = {out: IT2FS(B[out][0].domain) for out in self.outputs}
-                TR = {}
-                for out in self.outputs:
-                    for B_l in B[out]:
-                        C[out] = join(B_l.domain, C[out], B_l, s_norm)
-                    TR[out] = Centroid(C[out], alg_func, B_l.domain, alg_params=algorithm_params)
-                Cs.append(C)
-                TRs.append(TR)
-            return Cs, TRs
-        elif method == "CoSet":
-            for inputs in inputs_list:
-                F = []
-                G = {out: [] for out in self.outputs}
-                for rule in self.rules:
-                    u = 1
-                    l = 1
-                    for input_statement in rule[0]:
-                        u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                        l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                    F.append([l, u])
-                    for consequent in rule[1]:
-                        G[consequent[0]].append(consequent[1])
-                TR = {}
-                for out in self.outputs:
-                    TR[out] = CoSet(array(F), G[out], alg_func, 
-                                    G[out][0].domain, alg_params=algorithm_params)
-                outputs.append(TR)
-            return outputs
-        elif method == "CoSum":
-            for inputs in inputs_list:
-                B = {out: [] for out in self.outputs}
-                for rule in self.rules:
-                    u = 1
-                    l = 1
-                    for input_statement in rule[0]:
-                        u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                        l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                    for consequent in rule[1]:
-                        B_l = meet(consequent[1].domain, 
-                                   IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                                   consequent[1], t_norm)
-                        B[consequent[0]].append(B_l)
-                TR = {}
-                for out in self.outputs:
-                    TR[out] = CoSum(B[out], alg_func, B[out][0].domain, alg_params=algorithm_params)
-                outputs.append(TR)
-            return outputs
-        elif method == "Height":
-            for inputs in inputs_list:
-                B = {out: [] for out in self.outputs}
-                for rule in self.rules:
-                    u = 1
-                    l = 1
-                    for input_statement in rule[0]:
-                        u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                        l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                    for consequent in rule[1]:
-                        B_l = meet(consequent[1].domain, 
-                                   IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                                   consequent[1], t_norm)
-                        B[consequent[0]].append(B_l)
-                TR = {}
-                for out in self.outputs:
-                    TR[out] = Height(B[out], alg_func, 
-                                     B[out][0].domain, alg_params=algorithm_params)
-                outputs.append(TR)
-            return outputs
-        elif method == "ModiHe":
-            for inputs in inputs_list:
-                B = {out: [] for out in self.outputs}
-                for rule in self.rules:
-                    u = 1
-                    l = 1
-                    for input_statement in rule[0]:
-                        u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                        l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                    for consequent in rule[1]:
-                        B_l = meet(consequent[1].domain, 
-                                   IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                                   consequent[1], t_norm)
-                        B[consequent[0]].append(B_l)
-                TR = {}
-                for out in self.outputs:
-                    TR[out] = ModiHe(B[out], method_params, alg_func, 
-                                     B[out][0].domain, alg_params=algorithm_params)
-                outputs.append(TR)
-            return outputs
-        else:
-            raise ValueError("The method " + method + " is not implemented yet!")
-    
+            C = {out: (concatenate(upper[out]), concatenate(lower[out])) 
+                 for out in self.outputs}
+            return C, TR
+        return TR
     
     def evaluate(self, inputs, t_norm, s_norm, domain, method="Centroid", 
                  method_params=[], algorithm="EIASC", algorithm_params=[]):
@@ -3830,117 +7150,27 @@ class IT2FLS:
             * The inputs must be lay in the defined universe of discourse.
             * The type reduction method and the type reduction algorithm must be selected from the lists provided in docstrings.
         """
-        if algorithm == "KM":
-            alg_func = KM_algorithm
-        elif algorithm == "EKM":
-            alg_func = EKM_algorithm
-        elif algorithm == "WEKM":
-            alg_func = WEKM_algorithm
-        elif algorithm == "TWEKM":
-            alg_func = TWEKM_algorithm
-        elif algorithm == "WM":
-            alg_func = WM_algorithm
-        elif algorithm == "LBMM":
-            alg_func = LBMM_algorithm
-        elif algorithm == "BMM":
-            alg_func = BMM_algorithm        
-        elif algorithm == "NT":
-            alg_func = NT_algorithm       
-        elif algorithm == "EIASC":
-            alg_func = EIASC_algorithm
-        else:
-            raise ValueError("The " + algorithm + " algorithm is not implemented, yet!")
-
+        alg_func = self.__algorithm_function(algorithm)
+        rulebase = self.__rulebase()
+        X = rulebase.input_vector(inputs)
+        active = rulebase.active_rules(X)
+        l, u = rulebase.firing(X, t_norm, active)
+        if not _sparse(method, alg_func):
+            active = None
         if method == "Centroid":
-            B = {out: [] for out in self.outputs}
-            for rule in self.rules:
-                u = 1
-                l = 1
-                for input_statement in rule[0]:
-                    u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                    l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                for consequent in rule[1]:
-                    B_l = meet(consequent[1].domain, 
-                               IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                               consequent[1], t_norm)
-                    B[consequent[0]].append(B_l)
-            C = {out: IT2FS(B[out][0].domain) for out in self.outputs}
+            C = {}
             TR = {}
             for out in self.outputs:
-                for B_l in B[out]:
-                    C[out] = join(B_l.domain, C[out], B_l, s_norm)
-                TR[out] = Centroid(C[out], alg_func, B_l.domain, alg_params=algorithm_params)
+                out_domain = rulebase.consequent_sets(out)[-1].domain
+                C[out] = rulebase.aggregate(out, out_domain, l, u, t_norm, s_norm, active)
+                TR[out] = Centroid(C[out], alg_func, out_domain, alg_params=algorithm_params)
             return C, TR
-        elif method == "CoSet":
-            F = []
-            G = {out: [] for out in self.outputs}
-            for rule in self.rules:
-                u = 1
-                l = 1
-                for input_statement in rule[0]:
-                    u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                    l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                F.append([l, u])
-                for consequent in rule[1]:
-                    G[consequent[0]].append(consequent[1])
-            TR = {}
-            for out in self.outputs:
-                TR[out] = CoSet(array(F), G[out], alg_func, 
-                                G[out][0].domain, alg_params=algorithm_params)
-            return TR
-        elif method == "CoSum":
-            B = {out: [] for out in self.outputs}
-            for rule in self.rules:
-                u = 1
-                l = 1
-                for input_statement in rule[0]:
-                    u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                    l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                for consequent in rule[1]:
-                    B_l = meet(consequent[1].domain, 
-                               IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                               consequent[1], t_norm)
-                    B[consequent[0]].append(B_l)
-            TR = {}
-            for out in self.outputs:
-                TR[out] = CoSum(B[out], alg_func, 
-                                B[out][0].domain, alg_params=algorithm_params)
-            return TR
-        elif method == "Height":
-            B = {out: [] for out in self.outputs}
-            for rule in self.rules:
-                u = 1
-                l = 1
-                for input_statement in rule[0]:
-                    u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                    l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                for consequent in rule[1]:
-                    B_l = meet(consequent[1].domain, 
-                               IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                               consequent[1], t_norm)
-                    B[consequent[0]].append(B_l)
-            TR = {}
-            for out in self.outputs:
-                TR[out] = Height(B[out], alg_func, 
-                                 B[out][0].domain, alg_params=algorithm_params)
-            return TR
-        elif method == "ModiHe":
-            B = {out: [] for out in self.outputs}
-            for rule in self.rules:
-                u = 1
-                l = 1
-                for input_statement in rule[0]:
-                    u = t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                    l = t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-                for consequent in rule[1]:
-                    B_l = meet(consequent[1].domain, 
-                               IT2FS(consequent[1].domain, const_mf, [u], const_mf, [l]), 
-                               consequent[1], t_norm)
-                    B[consequent[0]].append(B_l)
+        elif method in ("CoSet", "CoSum", "Height", "ModiHe"):
             TR = {}
             for out in self.outputs:
-                TR[out] = ModiHe(B[out], method_params, alg_func, 
-                                 B[out][0].domain, alg_params=algorithm_params)
+                intervals = rulebase.intervals(out, l, u, t_norm, s_norm, 
+                                               method, method_params, alg_func, active)
+                TR[out] = alg_func(intervals, algorithm_params)
             return TR
         else:
             raise ValueError("The method " + method + " is not implemented yet!")
@@ -4014,6 +7244,15 @@ class IT2TSK:
 
         Evaluates the IT2 TSK FLS based on the crisp inputs given by the user.
 
+    evaluate_batch:
+
+        Evaluates the IT2 TSK FLS for a batch of crisp inputs given as an 
+        array with one sample per row.
+
+    compile:
+
+        Compiles the rule base into dense arrays used by the evaluate functions.
+
     .. rubric:: Notes
     
     While using the IT2TSK class the user must take care of the items listed below:
@@ -4026,12 +7265,10 @@ class IT2TSK:
         self.inputs = []
         self.outputs = []
         self.rules = []
+        self.rulebase = None
         self.__t_norm = t_norm
         self.__s_norm = s_norm
-        if isThereTypereduction:
-            self.algorithm = typereduction.EIASC_algorithm
-        else:
-            self.algorithm = EIASC_algorithm
+        self.algorithm = EIASC_algorithm
     
     def __repr__(self):
         return "Interval type 2 TSK fuzzy logic system!"
@@ -4111,6 +7348,7 @@ class IT2TSK:
         
         """
         self.rules.append((antecedent, consequent))
+        self.rulebase = None
     
     def copy(self):
         """
@@ -4142,29 +7380,96 @@ class IT2TSK:
             names as str and the values are the crisp output of the system.
 
         """
-        F = []
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            u = 1
-            l = 1
-            for input_statement in rule[0]:
-                u = self.__t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                l = self.__t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-            F.append([l, u])
-            for consequent in rule[1]:
-                B[consequent[0]].append(consequent[1]["const"])
-                for input in self.inputs:
-                    # self.inputs -> Name of the input variables ...
-                    # inputs -> Dict of input and value pairs ...
-                    # consequent[1] -> dict of input and coefficient pairs ...
-                    B[consequent[0]][-1] += consequent[1][input] * inputs[input]
+        rulebase = self.__rulebase()
+        X = array([inputs[name] for name in self.inputs], dtype=float)
+        active = rulebase.active_rules(X)
+        l, u = rulebase.firing(X, self.__t_norm, active)
+        algorithm = algorithm_function(self.algorithm)
+        if algorithm_name(algorithm) not in sparse_algorithms:
+            active = None
         O = {}
         for output in self.outputs:
-            y = array(B[output]).reshape((len(B[output]), 1))
-            intervals = hstack([y, y, array(F)])
-            o = self.algorithm(intervals)
-            O[output] = crisp(o)
+            O[output] = crisp(algorithm(self.__intervals(rulebase, output, X, l, u, active)))
         return O
+    
+    def compile(self):
+        """
+        Compiles the rule base into an array-backed IT2RuleBase, which is 
+        used by the evaluate and evaluate_batch functions. The rule base is 
+        compiled automatically after adding new rules, so this function 
+        needs to be called explicitly only if the rules are modified in place.
+        
+        .. rubric:: Returns
+        
+        output : IT2RuleBase
+            
+            The compiled rule base.
+        """
+        self.rulebase = IT2RuleBase(self.inputs, self.outputs, self.rules)
+        return self.rulebase
+    
+    def __rulebase(self):
+        if self.rulebase is None or \
+           not self.rulebase.is_valid(self.inputs, self.outputs, self.rules):
+            self.compile()
+        return self.rulebase
+    
+    def __intervals(self, rulebase, output, X, l, u, active=None):
+        rows = rulebase.consequent_rules(output)
+        coefficients = rulebase.coefficients(output)
+        keep = rulebase.active_rows(output, active)
+        if keep is not None:
+            rows = rows[keep]
+            coefficients = coefficients[keep]
+        y = X @ coefficients[:, 1:].T + coefficients[:, 0]
+        intervals = ones(y.shape + (4, ), dtype=l.dtype)
+        intervals[..., 0] = y
+        intervals[..., 1] = y
+        intervals[..., 2] = l[rows].T
+        intervals[..., 3] = u[rows].T
+        return intervals
+    
+    def evaluate_batch(self, X, batch_size=1024):
+        """
+        Evaluates the IT2 TSK FLS for a batch of crisp inputs.
+        
+        .. rubric:: Parameters
+        
+        X : numpy (n_samples, n_inputs) shaped array
+            
+            Crisp value of the inputs, one sample per row, with the columns 
+            ordered as the inputs list.
+        
+        batch_size=1024 : int
+            
+            Number of samples which are processed together.
+        
+        .. rubric:: Returns
+        
+        output : tuple (y, l, r)
+            
+            Three numpy (n_samples, n_outputs) shaped arrays of the crisp 
+            outputs and the left and right ends of the type reduced sets, 
+            with the columns ordered as the outputs list.
+        
+        .. rubric:: Examples
+        
+        >>> X = random.rand(1000, 2)
+        >>> y, l, r = myIT2FLS.evaluate_batch(X)
+        """
+        rulebase = self.__rulebase()
+        X = rulebase.check_batch(X)
+        left = zeros((X.shape[0], len(self.outputs)), dtype=_precision)
+        right = zeros((X.shape[0], len(self.outputs)), dtype=_precision)
+        algorithm = algorithm_function(self.algorithm, batch=True)
+        for start in range(0, X.shape[0], batch_size):
+            stop = min(start + batch_size, X.shape[0])
+            l, u = rulebase.firing(X[start:stop], self.__t_norm)
+            for k, output in enumerate(self.outputs):
+                tr = algorithm(self.__intervals(rulebase, output, X[start:stop], l, u))
+                left[start:stop, k] = tr[:, 0]
+                right[start:stop, k] = tr[:, 1]
+        return (left + right) / 2, left, right
 
 
 class IT2Mamdani:
@@ -4223,6 +7528,11 @@ class IT2Mamdani:
         First element of the tuple must be variable name (input or output) 
         as a str, and the second element must be an IT2FS. 
     
+    rulebase : IT2RuleBase
+        
+        The compiled form of the rules list used by the evaluate function, 
+        or None if the rule base is not compiled yet.
+    
     .. rubric:: Functions
     
     add_input_variable:
@@ -4241,6 +7551,18 @@ class IT2Mamdani:
         
         Returns a copy of the interval type 2 mamdani fuzzy logic system.
     
+    compile:
+        
+        Compiles the rule base into dense arrays, which let the evaluate 
+        function calculate the firing intervals of all rules with a few 
+        vectorized calls.
+    
+    evaluate_batch:
+        
+        Evaluates the IT2 Mamdani FLS for a batch of crisp inputs given as 
+        an array with one sample per row. The output is a tuple of the 
+        crisp outputs and the left and right ends of the type reduced sets.
+    
     evaluate:
         
         Evaluates the IT2FLS's output for a specified crisp input. This function 
@@ -4269,41 +7591,12 @@ class IT2Mamdani:
         self.inputs = []
         self.outputs = []
         self.rules = []
+        self.rulebase = None
         self.__t_norm = t_norm
         self.__s_norm = s_norm
         self.__method = method
         self.__method_params = method_params
-        if algorithm == "KM":
-            if isThereTypereduction:
-                self.__algorithm = typereduction.KM_algorithm
-            else:
-                self.__algorithm = KM_algorithm
-        elif algorithm == "EKM":
-            if isThereTypereduction:
-                self.__algorithm = typereduction.EKM_algorithm
-            else:
-                self.__algorithm = EKM_algorithm
-        elif algorithm == "WEKM":
-            self.__algorithm = WEKM_algorithm
-        elif algorithm == "TWEKM":
-            self.__algorithm = TWEKM_algorithm
-        elif algorithm == "EIASC":
-            if isThereTypereduction:
-                self.__algorithm = typereduction.EIASC_algorithm
-            else:
-                self.__algorithm = EIASC_algorithm
-        elif algorithm == "WM":
-            if isThereTypereduction:
-                self.__algorithm = typereduction.WM_algorithm
-            else:
-                self.__algorithm = WM_algorithm
-        elif algorithm == "BMM":
-            self.__algorithm = BMM_algorithm
-        elif algorithm == "LBMM":
-            self.__algorithm = LBMM_algorithm
-        elif algorithm == "NT":
-            self.__algorithm = NT_algorithm
-        elif callable(algorithm):
+        if callable(algorithm) or algorithm in TR_algorithms:
             self.__algorithm = algorithm
         else:
             raise ValueError("The algorithm, " + algorithm + ", is not implemented yet!")
@@ -4322,6 +7615,17 @@ class IT2Mamdani:
         else:
             raise ValueError("The method, " + method + ", is not implemented yet!")
 
+    def __getstate__(self):
+        # The evaluate function is bound to a private function, which can 
+        # not be pickled by name, so it is bound again while unpickling.
+        state = self.__dict__.copy()
+        del state["evaluate"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.evaluate = getattr(self, "_IT2Mamdani__Mamdani_" + self.__method)
+
     def __repr__(self):
         # TODO!
         pass
@@ -4372,6 +7676,7 @@ class IT2Mamdani:
             
         """
         self.rules.append((antecedent, consequent))
+        self.rulebase = None
     
     def copy(self):
         """
@@ -4385,106 +7690,106 @@ class IT2Mamdani:
         o.rules = self.rules.copy()
         return o
     
-    def __meet(self, domain, it2fs1, l, u, t_norm):
-        umf = lambda x, params: t_norm(it2fs1.umf(x, it2fs1.umf_params), u)
-        lmf = lambda x, params: t_norm(it2fs1.lmf(x, it2fs1.lmf_params), l)
-        it2fs = IT2FS(domain, umf, [], lmf, [])
-        return it2fs
-    
-    def __join(self, domain, it2fs1, l, u, s_norm):
-        umf = lambda x, params: s_norm(it2fs1.umf(x, it2fs1.umf_params), u)
-        lmf = lambda x, params: s_norm(it2fs1.lmf(x, it2fs1.lmf_params), l)
-        it2fs = IT2FS(domain, umf, [], lmf, [])
-        return it2fs
+    def compile(self):
+        """
+        Compiles the rule base into an array-backed IT2RuleBase, which is 
+        used by the evaluate function. The rule base is compiled 
+        automatically on the first call to evaluate after adding new rules, 
+        so this function needs to be called explicitly only if the rules 
+        are modified in place.
+        
+        .. rubric:: Returns
+        
+        output : IT2RuleBase
+            
+            The compiled rule base.
+        """
+        self.rulebase = IT2RuleBase(self.inputs, self.outputs, self.rules)
+        return self.rulebase
+    
+    def __rulebase(self):
+        if self.rulebase is None or \
+           not self.rulebase.is_valid(self.inputs, self.outputs, self.rules):
+            self.compile()
+        return self.rulebase
+    
+    def __firing(self, inputs):
+        rulebase = self.__rulebase()
+        X = rulebase.input_vector(inputs)
+        active = rulebase.active_rules(X)
+        l, u = rulebase.firing(X, self.__t_norm, active)
+        return rulebase, l, u, active
     
     def __Mamdani_Centroid(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            u = 1
-            l = 1
-            for input_statement in rule[0]:
-                u = self.__t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                l = self.__t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-            for consequent in rule[1]:
-                B_l = self.__meet(consequent[1].domain, consequent[1], l, u, self.__t_norm)
-                B[consequent[0]].append(B_l)
-        C = {out: IT2FS(B[out][0].domain) for out in self.outputs}
+        rulebase, l, u, active = self.__firing(inputs)
+        C = {}
         TR = {}
         for out in self.outputs:
-            for B_l in B[out]:
-                C[out] = join(B_l.domain, C[out], B_l, self.__s_norm)
-            TR[out] = Centroid(C[out], self.__algorithm, B_l.domain, 
+            domain = rulebase.consequent_sets(out)[-1].domain
+            C[out] = rulebase.aggregate(out, domain, l, u, 
+                                        self.__t_norm, self.__s_norm, active)
+            TR[out] = Centroid(C[out], algorithm_function(self.__algorithm), domain, 
                                alg_params=self.__algorithm_params)
         return C, TR
     
-    def __Mamdani_CoSet(self, inputs):
-        F = []
-        G = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            u = 1
-            l = 1
-            for input_statement in rule[0]:
-                u = self.__t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                l = self.__t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-            F.append([l, u])
-            for consequent in rule[1]:
-                G[consequent[0]].append(consequent[1])
+    def __type_reduce(self, inputs, method):
+        rulebase, l, u, active = self.__firing(inputs)
+        if not _sparse(method, self.__algorithm):
+            active = None
         TR = {}
         for out in self.outputs:
-            TR[out] = CoSet(array(F), G[out], self.__algorithm, 
-                            G[out][0].domain, alg_params=self.__algorithm_params)
+            intervals = rulebase.intervals(out, l, u, self.__t_norm, self.__s_norm, 
+                                           method, self.__method_params, self.__algorithm, 
+                                           active)
+            TR[out] = algorithm_function(self.__algorithm)(intervals, self.__algorithm_params)
         return TR
     
+    def __Mamdani_CoSet(self, inputs):
+        return self.__type_reduce(inputs, "CoSet")
+    
     def __Mamdani_CoSum(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            u = 1
-            l = 1
-            for input_statement in rule[0]:
-                u = self.__t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                l = self.__t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-            for consequent in rule[1]:
-                B_l = meet(consequent[1].domain, consequent[1], l, u, self.__t_norm)
-                B[consequent[0]].append(B_l)
-        TR = {}
-        for out in self.outputs:
-            TR[out] = CoSum(B[out], self.__algorithm, 
-                            B[out][0].domain, alg_params=self.__algorithm_params)
-        return TR
+        return self.__type_reduce(inputs, "CoSum")
     
     def __Mamdani_Height(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            u = 1
-            l = 1
-            for input_statement in rule[0]:
-                u = self.__t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                l = self.__t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-            for consequent in rule[1]:
-                B_l = self.__meet(consequent[1].domain, consequent[1], l, u, self.__t_norm)
-                B[consequent[0]].append(B_l)
-        TR = {}
-        for out in self.outputs:
-            TR[out] = Height(B[out], self.__algorithm, 
-                             B[out][0].domain, alg_params=self.__algorithm_params)
-        return TR
+        return self.__type_reduce(inputs, "Height")
     
     def __Mamdani_ModiHe(self, inputs):
-        B = {out: [] for out in self.outputs}
-        for rule in self.rules:
-            u = 1
-            l = 1
-            for input_statement in rule[0]:
-                u = self.__t_norm(u, input_statement[1].umf(inputs[input_statement[0]], input_statement[1].umf_params))
-                l = self.__t_norm(l, input_statement[1].lmf(inputs[input_statement[0]], input_statement[1].lmf_params))
-            for consequent in rule[1]:
-                B_l = self.__meet(consequent[1].domain, consequent[1], l, u, self.__t_norm)                           
-                B[consequent[0]].append(B_l)
-        TR = {}
-        for out in self.outputs:
-            TR[out] = ModiHe(B[out], self.__method_params, self.__algorithm, 
-                             B[out][0].domain, alg_params=self.__algorithm_params)
-        return TR
+        return self.__type_reduce(inputs, "ModiHe")
+    
+    def evaluate_batch(self, X, batch_size=1024):
+        """
+        Evaluates the IT2 Mamdani FLS for a batch of crisp inputs.
+        
+        .. rubric:: Parameters
+        
+        X : numpy (n_samples, n_inputs) shaped array
+            
+            Crisp value of the inputs, one sample per row, with the columns 
+            ordered as the inputs list.
+        
+        batch_size=1024 : int
+            
+            Number of samples which are processed together.
+        
+        .. rubric:: Returns
+        
+        output : tuple (y, l, r)
+            
+            Three numpy (n_samples, n_outputs) shaped arrays of the crisp 
+            outputs and the left and right ends of the type reduced sets, 
+            with the columns ordered as the outputs list. For the type 
+            reduction algorithms which return a crisp number, l and r are 
+            equal to y.
+        
+        .. rubric:: Examples
+        
+        >>> X = random.rand(1000, 2)
+        >>> y, l, r = myIT2FLS.evaluate_batch(X)
+        """
+        return self.__rulebase().evaluate_batch(X, self.__t_norm, self.__s_norm, 
+                                                self.__method, self.__method_params, 
+                                                self.__algorithm, self.__algorithm_params, 
+                                                batch_size)
     
     
 TSK = IT2TSK
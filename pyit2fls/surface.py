@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Control surfaces, which interpolate the outputs of a fuzzy logic system 
+evaluated once over a grid of its inputs.
+"""
+
+from numpy import (asarray, meshgrid, stack, searchsorted, clip, diff,
+                   zeros, ones, ndarray, broadcast_arrays, )
+from numpy import abs as npabs
+from numpy import all as npall
+from bisect import (bisect_right, )
+from .parallel import (ParallelEvaluator, )
+from .pyit2fls import (get_precision, precisions, )
+
+
+def _lookup(grid, x):
+    # Index of the cell containing x, and the position of x in the cell.
+    # The points out of the grid are clamped to its ends.
+    i = bisect_right(grid, x) - 1
+    if i < 0:
+        return 0, 0.
+    if i >= len(grid) - 1:
+        return len(grid) - 2, 1.
+    return i, (x - grid[i]) / (grid[i + 1] - grid[i])
+
+
+def _arguments(X):
+    # A single list, dictionary, or array argument holds all the inputs.
+    if len(X) == 1 and (isinstance(X[0], (list, tuple, dict)) or 
+                        (isinstance(X[0], ndarray) and X[0].ndim > 0)):
+        return X[0]
+    return X
+
+
+class ControlSurface:
+    """
+    Lookup table of a fuzzy logic system, which is evaluated once over a
+    tensor grid of its inputs, and answers with the multilinear
+    interpolation of the stored outputs. It is created by the
+    compile_surface function. The inputs out of the grid are clamped to
+    its ends.
+
+    .. rubric:: Parameters
+
+    inputs : list of str
+
+        Names of the input variables.
+
+    outputs : list of str
+
+        Names of the output variables.
+
+    grids : list of numpy (n_i,) shaped arrays
+
+        Strictly increasing grid of each input, with at least two points.
+
+    values : numpy (n_1, ..., n_d, n_outputs) shaped array
+
+        The crisp outputs at the points of the grid.
+
+    lower=None : numpy (n_1, ..., n_d, n_outputs) shaped array
+
+        The left ends of the type reduced sets, for IT2 systems.
+
+    upper=None : numpy (n_1, ..., n_d, n_outputs) shaped array
+
+        The right ends of the type reduced sets, for IT2 systems.
+
+    error=None : numpy (n_outputs,) shaped array
+
+        Largest interpolation error of the crisp outputs, which is measured
+        at the centers of the cells of the grid.
+
+    The stored outputs are kept in the precision selected by the 
+    set_precision function when the surface is created.
+
+    .. rubric:: Functions
+
+    __call__:
+
+        Returns the interpolated crisp outputs.
+
+    bounds:
+
+        Returns the interpolated ends of the type reduced sets.
+
+    .. rubric:: Examples
+
+    >>> surface = compile_surface(myIT2FLS, [linspace(-1., 1., 101),
+    >>>                                      linspace(-1., 1., 101)])
+    >>> surface.error
+    >>> y = surface(0.2, -0.3)
+    """
+    def __init__(self, inputs, outputs, grids, values, lower=None, upper=None,
+                 error=None):
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.grids = [asarray(grid, dtype=float) for grid in grids]
+        for grid in self.grids:
+            if grid.ndim != 1 or len(grid) < 2 or not npall(diff(grid) > 0.):
+                raise ValueError("Each grid must be a strictly increasing array " +
+                                 "with at least two points.")
+        shape = tuple(len(grid) for grid in self.grids) + (len(self.outputs), )
+        dtype = precisions[get_precision()]
+        self.values = asarray(values, dtype=dtype).reshape(shape)
+        self.lower = None if lower is None else asarray(lower, dtype=dtype).reshape(shape)
+        self.upper = None if upper is None else asarray(upper, dtype=dtype).reshape(shape)
+        self.error = error
+        # Python lists for the interpolation of single samples, which is
+        # faster than numpy for a few inputs.
+        self.__grids = [grid.tolist() for grid in self.grids]
+        self.__strides = [1, ] * len(self.grids)
+        for j in range(len(self.grids) - 2, -1, -1):
+            self.__strides[j] = self.__strides[j + 1] * len(self.grids[j + 1])
+        self.__tables = {"values": self.values.reshape(-1, len(self.outputs)).tolist(), }
+        if self.lower is not None:
+            self.__tables["lower"] = self.lower.reshape(-1, len(self.outputs)).tolist()
+            self.__tables["upper"] = self.upper.reshape(-1, len(self.outputs)).tolist()
+
+    def __repr__(self):
+        return "Control surface with " + \
+               " x ".join(str(len(grid)) for grid in self.grids) + " grid!"
+
+    def __inputs(self, X):
+        if isinstance(X, dict):
+            X = [X[name] for name in self.inputs]
+        return X
+
+    def __sample(self, table, x):
+        # Multilinear interpolation of one sample over the 2^d corners.
+        base = 0
+        cells = []
+        for grid, stride, xi in zip(self.__grids, self.__strides, x):
+            i, t = _lookup(grid, xi)
+            base += i * stride
+            cells.append((stride, t))
+        output = [0., ] * len(self.outputs)
+        for corner in range(1 << len(cells)):
+            weight = 1.
+            index = base
+            for j, (stride, t) in enumerate(cells):
+                if (corner >> j) & 1:
+                    weight *= t
+                    index += stride
+                else:
+                    weight *= 1. - t
+            if weight != 0.:
+                row = table[index]
+                for k in range(len(output)):
+                    output[k] += weight * row[k]
+        return output
+
+    def __batch(self, table, X):
+        X = asarray(X, dtype=float)
+        output = zeros(shape=(len(X), len(self.outputs)), dtype=table.dtype)
+        indices = []
+        positions = []
+        for j, grid in enumerate(self.grids):
+            i = clip(searchsorted(grid, X[:, j], side="right") - 1, 0, len(grid) - 2)
+            indices.append(i)
+            positions.append(clip((X[:, j] - grid[i]) / (grid[i + 1] - grid[i]), 
+                                  0., 1.).astype(table.dtype))
+        for corner in range(1 << len(self.grids)):
+            weights = ones(shape=(len(X), ), dtype=table.dtype)
+            index = []
+            for j in range(len(self.grids)):
+                if (corner >> j) & 1:
+                    weights = weights * positions[j]
+                    index.append(indices[j] + 1)
+                else:
+                    weights = weights * (1. - positions[j])
+                    index.append(indices[j])
+            output += weights[:, None] * table[tuple(index)]
+        return output
+
+    def __interpolate(self, name, table, X):
+        X = self.__inputs(X)
+        if isinstance(X, ndarray) and X.ndim == 1 and len(self.grids) == 1:
+            # A 1-D array holds a batch of samples of the only input.
+            X = X.reshape(-1, 1)
+        if isinstance(X, ndarray) and X.ndim == 2:
+            return self.__batch(table, X)
+        if len(X) != len(self.grids):
+            raise ValueError("The control surface has " + str(len(self.grids)) +
+                             " inputs.")
+        if any(isinstance(xi, ndarray) and xi.ndim > 0 for xi in X):
+            # The scalar inputs are broadcast against the input columns.
+            X = stack(broadcast_arrays(*X), axis=-1)
+            return self.__batch(table, X.reshape(-1, len(self.grids)))
+        return asarray(self.__sample(self.__tables[name], [float(xi) for xi in X]))
+
+    def __call__(self, *X):
+        """
+        Returns the interpolated crisp outputs.
+
+        .. rubric:: Parameters
+
+        X : floats, numpy (n_samples, n_inputs) shaped array, or dictionary
+
+            The inputs of one sample as separate arguments, a list, or a
+            dictionary of the input variables, or a batch of samples as a
+            2-D array or a dictionary of input columns. The batch of a
+            surface with one input can also be a 1-D array. The scalars
+            among the input columns are broadcast against the others.
+
+        .. rubric:: Returns
+
+        output : numpy (n_outputs,) or (n_samples, n_outputs) shaped array
+
+            The crisp outputs, with the columns ordered as the outputs list.
+        """
+        X = _arguments(X)
+        return self.__interpolate("values", self.values, X)
+
+    def bounds(self, *X):
+        """
+        Returns the interpolated left and right ends of the type reduced
+        sets of an IT2 system.
+
+        .. rubric:: Parameters
+
+        X : floats, numpy (n_samples, n_inputs) shaped array, or dictionary
+
+            The inputs, as in the __call__ function.
+
+        .. rubric:: Returns
+
+        output : tuple (l, r)
+
+            Two numpy (n_outputs,) or (n_samples, n_outputs) shaped arrays.
+        """
+        if self.lower is None:
+            raise ValueError("The control surface has no type reduced sets.")
+        X = _arguments(X)
+        return (self.__interpolate("lower", self.lower, X),
+                self.__interpolate("upper", self.upper, X))
+
+
+def compile_surface(system, grids, function="evaluate_batch", args=(), kwargs=None,
+                    workers=1, chunk_size=4096, check=True):
+    """
+    Evaluates a fuzzy logic system once over a tensor grid of its inputs,
+    and returns a ControlSurface, which answers with the multilinear
+    interpolation of the outputs in constant time. The system can be
+    evaluated by a pool of worker processes, as in the parallel_evaluate
+    function.
+
+    .. rubric:: Parameters
+
+    system : T1Mamdani, T1TSK, IT2Mamdani, IT2TSK, IT2FLS, or any object with a batch evaluation function
+
+        The fuzzy logic system to be compiled.
+
+    grids : list or dictionary of numpy (n_i,) shaped arrays
+
+        Strictly increasing grid of each input, ordered as the inputs of
+        the system, or keyed by their names.
+
+    function="evaluate_batch" : str
+
+        Name of the batch evaluation function of the system. It must return
+        a (n_samples, n_outputs) shaped array of the crisp outputs, or a
+        (y, l, r) tuple of such arrays for the IT2 systems.
+
+    args=() : tuple
+
+        Other positional arguments of the function, e.g., the t-norm,
+        s-norm, and domain of an IT2FLS.
+
+    kwargs=None : dict
+
+        Keyword arguments of the function.
+
+    workers=1 : int
+
+        Number of the worker processes. The system is evaluated in the
+        current process by default.
+
+    chunk_size=4096 : int
+
+        Number of samples which are sent to a worker at a time.
+
+    check=True : bool
+
+        If True, the system is also evaluated at the centers of the cells
+        of the grid, and the largest interpolation error of each output is
+        stored in the error attribute of the surface.
+
+    .. rubric:: Returns
+
+    output : ControlSurface
+
+        The compiled control surface.
+
+    .. rubric:: Examples
+
+    >>> surface = compile_surface(myIT2Mamdani, [linspace(-1., 1., 101),
+    >>>                                          linspace(-1., 1., 101)],
+    >>>                           workers=4)
+    >>> print(surface.error)
+    >>> y = surface(0.2, -0.3)[0]
+    """
+    inputs = list(getattr(system, "inputs", []))
+    if isinstance(grids, dict):
+        grids = [grids[name] for name in inputs]
+    grids = [asarray(grid, dtype=float) for grid in grids]
+    if inputs and len(grids) != len(inputs):
+        raise ValueError("A grid is needed for each of the " + str(len(inputs)) +
+                         " inputs.")
+    with ParallelEvaluator(system, function, args, kwargs, workers,
+                           chunk_size) as evaluator:
+        X = stack(meshgrid(*grids, indexing="ij"), axis=-1).reshape(-1, len(grids))
+        output = evaluator(X)
+        if isinstance(output, tuple):
+            values, lower, upper = output
+        else:
+            values, lower, upper = output, None, None
+        outputs = list(getattr(system, "outputs", range(asarray(values).shape[-1])))
+        surface = ControlSurface(inputs or range(len(grids)), outputs, grids,
+                                 values, lower, upper)
+        if check:
+            centers = [(grid[1:] + grid[:-1]) / 2. for grid in surface.grids]
+            X = stack(meshgrid(*centers, indexing="ij"), axis=-1).reshape(-1, len(grids))
+            exact = evaluator(X)
+            if isinstance(exact, tuple):
+                exact = exact[0]
+            surface.error = npabs(surface(X) - asarray(exact, dtype=float).reshape(len(X), -1)).max(axis=0)
+    return surface
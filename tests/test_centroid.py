@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regression tests for the closed form centroids, which are only used on 
+request.
+"""
+
+from numpy import (linspace, array, )
+from numpy.testing import (assert_allclose, )
+from pyit2fls import (IT2FS_Gaussian_UncertStd, Centroid, CoSet, KM_algorithm, 
+                      TWEKM_algorithm, closed_form_centroid, )
+
+
+domain = linspace(0., 1., 101)
+Medium = IT2FS_Gaussian_UncertStd(domain, [0.5, 0.15, 0.05, 1.])
+Large = IT2FS_Gaussian_UncertStd(domain, [1., 0.15, 0.05, 1.])
+intervals = array([[domain, domain, Large.lower, Large.upper]])[0].T
+
+
+def test_centroid_sampled_by_default():
+    assert_allclose(Centroid(Large, KM_algorithm, domain), 
+                    KM_algorithm(intervals), rtol=0., atol=1e-12)
+    assert_allclose(Centroid(Large, KM_algorithm, domain, closed_form=True), 
+                    closed_form_centroid(Large, domain), rtol=0., atol=1e-12)
+
+
+def test_centroid_closed_form_ignored_with_params():
+    params = [[0.5, 0.5], ]
+    assert_allclose(Centroid(Large, TWEKM_algorithm, domain, params, closed_form=True), 
+                    TWEKM_algorithm(intervals, params), rtol=0., atol=1e-12)
+
+
+def test_coset_sampled_by_default():
+    firing = array([[0.2, 0.6], [0.1, 0.9], ])
+    centroids = array([KM_algorithm(array([[domain, domain, it2fs.lower, it2fs.upper]])[0].T) 
+                       for it2fs in [Medium, Large]])
+    expected = KM_algorithm(array([centroids[:, 0], centroids[:, 1], 
+                                   firing[:, 0], firing[:, 1]]).T)
+    assert_allclose(CoSet(firing, [Medium, Large], KM_algorithm, domain), 
+                    expected, rtol=0., atol=1e-12)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regression tests for the user defined t-norms and s-norms, which accept only 
+two arguments.
+"""
+
+from numpy import (linspace, minimum, maximum, )
+from numpy.testing import (assert_allclose, )
+from pyit2fls import (IT2FLS, IT2Mamdani, IT2TSK, IT2FS_Gaussian_UncertStd, 
+                      min_t_norm, max_s_norm, crisp, crisp_list, MEET, JOIN, )
+
+
+domain = linspace(0., 1., 101)
+Small = IT2FS_Gaussian_UncertStd(domain, [0., 0.15, 0.05, 1.])
+Medium = IT2FS_Gaussian_UncertStd(domain, [0.5, 0.15, 0.05, 1.])
+Large = IT2FS_Gaussian_UncertStd(domain, [1., 0.15, 0.05, 1.])
+
+t_norm = lambda a, b: minimum(a, b)
+s_norm = lambda a, b: maximum(a, b)
+
+
+def test_it2mamdani_binary_norms():
+    systems = []
+    for norms in [(t_norm, s_norm), (min_t_norm, max_s_norm)]:
+        system = IT2Mamdani(*norms, method="Centroid", algorithm="KM")
+        system.add_input_variable("x1")
+        system.add_input_variable("x2")
+        system.add_output_variable("y1")
+        system.add_rule([("x1", Small), ("x2", Small)], [("y1", Small)])
+        system.add_rule([("x1", Medium), ("x2", Medium)], [("y1", Medium)])
+        system.add_rule([("x1", Large), ("x2", Large)], [("y1", Large)])
+        systems.append(system)
+    for x1, x2 in [(0.923, 0.745), (0.1, 0.4)]:
+        outputs = [system.evaluate({"x1":x1, "x2":x2}) for system in systems]
+        assert_allclose(crisp(outputs[0][1]["y1"]), crisp(outputs[1][1]["y1"]))
+        assert_allclose(outputs[0][0]["y1"].upper, outputs[1][0]["y1"].upper)
+
+
+def test_it2tsk_binary_norms():
+    systems = []
+    for norms in [(t_norm, s_norm), (min_t_norm, max_s_norm)]:
+        system = IT2TSK(*norms)
+        system.add_input_variable("x1")
+        system.add_input_variable("x2")
+        system.add_output_variable("y1")
+        system.add_rule([("x1", Small), ("x2", Small)], 
+                        [("y1", {"const":0.5, "x1":1., "x2":2.3})])
+        system.add_rule([("x1", Medium), ("x2", Medium)], 
+                        [("y1", {"const":1., "x1":2.7, "x2":1.9})])
+        system.add_rule([("x1", Large), ("x2", Large)], 
+                        [("y1", {"const":1., "x1":2., "x2":3.})])
+        systems.append(system)
+    for x1, x2 in [(0.9, 0.9), (0.1, 0.4)]:
+        outputs = [system.evaluate({"x1":x1, "x2":x2})["y1"] for system in systems]
+        assert_allclose(outputs[0], outputs[1])
+
+
+def test_it2fls_binary_norms():
+    system = IT2FLS()
+    system.add_input_variable("x1")
+    system.add_input_variable("x2")
+    system.add_output_variable("y1")
+    system.add_rule([("x1", Small), ("x2", Small)], [("y1", Small)])
+    system.add_rule([("x1", Medium), ("x2", Medium)], [("y1", Medium)])
+    system.add_rule([("x1", Large), ("x2", Large)], [("y1", Large)])
+    for x1, x2 in [(0.923, 0.745), (0.1, 0.4)]:
+        outputs = [system.evaluate({"x1":x1, "x2":x2}, *norms, domain, algorithm="KM") 
+                   for norms in [(t_norm, s_norm), (min_t_norm, max_s_norm)]]
+        assert_allclose(crisp(outputs[0][1]["y1"]), crisp(outputs[1][1]["y1"]))
+    inputs = {"x1":linspace(0., 1., 5), "x2":linspace(1., 0., 5)}
+    outputs = [system.evaluate_list(inputs, *norms, domain, algorithm="KM") 
+               for norms in [(t_norm, s_norm), (min_t_norm, max_s_norm)]]
+    assert_allclose(crisp_list(outputs[0][1], "y1"), crisp_list(outputs[1][1], "y1"))
+
+
+def test_meet_join_binary_norms():
+    for sampled in [False, True]:
+        assert_allclose(MEET(domain, t_norm, Small, Medium, Large, sampled=sampled).upper, 
+                        MEET(domain, min_t_norm, Small, Medium, Large, sampled=sampled).upper)
+        assert_allclose(JOIN(domain, s_norm, Small, Medium, Large, sampled=sampled).lower, 
+                        JOIN(domain, max_s_norm, Small, Medium, Large, sampled=sampled).lower)
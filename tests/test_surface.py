@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regression tests for the batches of query points passed to the control 
+surfaces, as a 1-D array for one input, or as separate input columns mixing 
+scalars and arrays.
+"""
+
+from numpy import (linspace, array, stack, meshgrid, full_like, )
+from numpy.testing import (assert_allclose, )
+from pyit2fls import (ControlSurface, )
+
+
+grid = linspace(0., 1., 11)
+surface = ControlSurface(["x", ], ["y1", "y2", ], [grid, ], 
+                         stack([grid ** 2, 1. - grid], axis=-1), 
+                         lower=stack([grid ** 2 - 0.1, 0.9 - grid], axis=-1), 
+                         upper=stack([grid ** 2 + 0.1, 1.1 - grid], axis=-1))
+X = array([-0.5, 0., 0.13, 0.5, 0.77, 1., 1.5, ])
+
+
+def test_one_input_batch():
+    expected = array([surface(x) for x in X])
+    assert_allclose(surface(X), expected)
+    assert_allclose(surface(X.reshape(-1, 1)), expected)
+    assert_allclose(surface({"x": X, }), expected)
+
+
+def test_one_input_batch_bounds():
+    l, r = surface.bounds(X)
+    assert_allclose(l, array([surface.bounds(x)[0] for x in X]))
+    assert_allclose(r, array([surface.bounds(x)[1] for x in X]))
+
+
+def test_scalar_broadcast_columns():
+    x1, x2 = meshgrid(grid, grid, indexing="ij")
+    surface2 = ControlSurface(["x1", "x2", ], ["y", ], [grid, grid, ], 
+                              (x1 + 2. * x2)[..., None])
+    expected = surface2(full_like(X, 0.3), X)
+    assert_allclose(surface2(0.3, X), expected)
+    assert_allclose(surface2({"x1": 0.3, "x2": X, }), expected)
@@ -1,37 +1,36 @@
 #include <stdlib.h>
 #include <math.h>
 
-#define epsilon 0.0000001
+#define rel_tolerance 0.000000001
 
 struct INTERVAL{
 	double a;
 	double b;
 	double c;
 	double d;
+	int index;
 };
 
 typedef struct INTERVAL Interval;
 
+typedef void (*Algorithm)(double *, double *, int, double *);
+
+/*
+ * The ties are broken by the index of the intervals, which makes the
+ * sorting stable like the one used by PyIT2FLS.
+ */
 int compare_a (const void * in1, const void * in2)
 {
 	if(((Interval*)in1)->a < ((Interval*)in2)->a) return -1;
-	else return 1;
+	else if(((Interval*)in1)->a > ((Interval*)in2)->a) return 1;
+	else return ((Interval*)in1)->index - ((Interval*)in2)->index;
 }
 
 int compare_b (const void * in1, const void * in2)
 {
 	if(((Interval*)in1)->b < ((Interval*)in2)->b) return -1;
-	else return 1;
-}
-
-int sign(double x) { 
-	if (x < 0) {
-		return -1;
-	}else if (x > 0) {
-		return +1;
-	}else{
-		return  0;
-	}
+	else if(((Interval*)in1)->b > ((Interval*)in2)->b) return 1;
+	else return ((Interval*)in1)->index - ((Interval*)in2)->index;
 }
 
 int min(int x1, int x2) {
@@ -58,390 +57,616 @@ double minf(double x1, double x2) {
 	}
 }
 
-double maxf(double x1, double x2) {
-	if (x1 > x2) {
-		return x1;
-	}else{
-		return x2;
-	}
+int isclose(double x1, double x2) {
+	return fabs(x1 - x2) <= rel_tolerance * fmax(fabs(x1), fabs(x2));
 }
 
-
-void WM_algorithm(double *data, double *params, int size, double *result)
+/*
+ * Copies the intervals, so the algorithms can sort them without modifying
+ * the array passed by the caller.
+ */
+Interval *copy_intervals(double *data, int size)
 {
-	double *rawData = data;
-	Interval *intervalArray = (Interval *)(data);
-	
-	char allZero = 1;
-	
-	double sumF0 = 0., sumF1 = 0., sumF0Y0 = 0., sumF1Y0 = 0., sumF0Y1 = 0., sumF1Y1 = 0.;
-	double c = 0., y_l_sup = 0., y_l_inf = 0., y_r_sup = 0., y_r_inf = 0.;
-	double s1, s2;
-	
-	for(int i = 0; i < size; i++)
-	{
-		if (rawData[2] != 0 || rawData[3] != 0) 
-		{
-			allZero = 0;
-		}
-		rawData += 4;
-	}
-	if(allZero)
+	Interval *intervalArray = (Interval *)malloc((size > 0 ? size : 1) * sizeof(Interval));
+	if (intervalArray != NULL)
 	{
-		result[0] = 0.;
-		result[1] = 0.;
-		return;
-	}else{
-		qsort(intervalArray, size, sizeof(Interval), compare_a);
-		
 		for (int i = 0; i < size; i++)
 		{
-			sumF0 += intervalArray[i].c;
-			sumF1 += intervalArray[i].d;
-			sumF0Y0 += intervalArray[i].a * intervalArray[i].c;
-			sumF0Y1 += intervalArray[i].b * intervalArray[i].c;
-			sumF1Y0 += intervalArray[i].a * intervalArray[i].d;
-			sumF1Y1 += intervalArray[i].b * intervalArray[i].d;
+			intervalArray[i].a = data[4 * i];
+			intervalArray[i].b = data[4 * i + 1];
+			intervalArray[i].c = data[4 * i + 2];
+			intervalArray[i].d = data[4 * i + 3];
 		}
-		c = (sumF1 - sumF0) / (sumF0 * sumF1);
-		y_l_sup = minf(sumF0Y0 / sumF0, sumF1Y0 / sumF1);
-		y_r_inf = minf(sumF1Y1 / sumF1, sumF0Y1 / sumF0);
-		
-		s1 = sumF0Y0 - sumF0 * intervalArray[0].a;
-		s2 = sumF1 * intervalArray[size - 1].a - sumF1Y0;
-		y_l_inf = y_l_sup - c * (s1 * s2) / (s1 + s2);
-		
-		s1 = sumF1Y1 - sumF1 * intervalArray[0].b;
-		s2 = sumF0 * intervalArray[size - 1].b - sumF0Y1;
-		y_r_sup = y_r_inf + c * (s1 * s2) / (s1 + s2);
-		
-		result[0] = (y_l_sup + y_l_inf) / 2;
-		result[1] = (y_r_sup + y_r_inf) / 2;
 	}
-	return;
+	return intervalArray;
 }
 
+/*
+ * Stable sorting of the intervals, keeping the current order of the ties.
+ */
+void sort_intervals(Interval *intervalArray, int size, int (*compare)(const void *, const void *))
+{
+	for (int i = 0; i < size; i++)
+	{
+		intervalArray[i].index = i;
+	}
+	qsort(intervalArray, size, sizeof(Interval), compare);
+}
 
-void EKM_algorithm(double *data, double *params, int size, double *result)
+/*
+ * Same as the trim function of PyIT2FLS. Returns the number of the kept
+ * intervals, which is zero if all the upper firing strengths are zero,
+ * and stores the index of the first kept interval in start.
+ */
+int trim(Interval *intervalArray, int size, int *start)
 {
-	double *rawData = data;
-	Interval *intervalArray = (Interval *)(data);
-	
-	char allZero = 1;
-	int k_l = 0, k_r = 0, k_l_prime = 0, k_r_prime = 0;
-	int s_l = 0, s_r = 0;
-	int imin = 0, imax = 0;
-	double a_l = 0., b_l = 0., a_r = 0., b_r = 0.;
-	double a_l_prime = 0., b_l_prime = 0.;
-	double a_r_prime = 0., b_r_prime = 0.;
-	double y_l = 0., y_l_prime = 0., y_r = 0., y_r_prime = 0.;
-	
-	
-	k_l = (int)(size / 2.4);
-	k_r = (int)(size / 1.7);
-	
-	for(int i = 0; i < size; i++)
-	{
-		if (rawData[2] != 0 || rawData[3] != 0) 
+	int min1 = -1, max1 = -1, min2 = -1, max2 = -1;
+
+	for (int i = 0; i < size; i++)
+	{
+		if (intervalArray[i].d > 0)
 		{
-			allZero = 0;
+			if (min1 < 0) min1 = i;
+			max1 = i + 1;
 		}
-		if (i < k_l)
+		if (intervalArray[i].c > 0)
 		{
-			a_l += rawData[0] * rawData[3];
-			b_l += rawData[3];
-		}else{
-			a_l += rawData[0] * rawData[2];
-			b_l += rawData[2];
+			if (min2 < 0) min2 = i;
+			max2 = i + 1;
 		}
-		if (i < k_r)
+	}
+	if (min1 < 0)
+	{
+		*start = 0;
+		return 0;
+	}
+	if (min2 < 0)
+	{
+		min2 = min1;
+		max2 = max1;
+	}
+	*start = min(min1, min2);
+	return max(max1, max2) - *start;
+}
+
+/*
+ * Exact left end point. The intervals must be sorted by a. The weighted
+ * averages of all the switch points are evaluated, in which the upper
+ * firing strengths are used before the switch point and the lower ones
+ * after it, and the minimum is returned. weights may be NULL.
+ */
+double left_end(Interval *intervalArray, double *weights, int size)
+{
+	double a_first = 0., b_first = 0., a_second = 0., b_second = 0.;
+	double a_total = 0., b_total = 0.;
+	double w = 1., b = 0., y = 0., y_l = INFINITY;
+
+	for (int i = 0; i < size; i++)
+	{
+		w = weights == NULL ? 1. : weights[i];
+		a_total += w * intervalArray[i].a * intervalArray[i].c;
+		b_total += w * intervalArray[i].c;
+	}
+	for (int k = 0; k <= size; k++)
+	{
+		b = b_first + (b_total - b_second);
+		if (b > 0)
 		{
-			a_r += rawData[0] * rawData[2];
-			b_r += rawData[2];
-		}else{
-			a_r += rawData[0] * rawData[3];
-			b_r += rawData[3];
+			y = (a_first + (a_total - a_second)) / b;
+			if (y < y_l) y_l = y;
+		}
+		if (k < size)
+		{
+			w = weights == NULL ? 1. : weights[k];
+			a_first += w * intervalArray[k].a * intervalArray[k].d;
+			b_first += w * intervalArray[k].d;
+			a_second += w * intervalArray[k].a * intervalArray[k].c;
+			b_second += w * intervalArray[k].c;
 		}
-		rawData += 4;
 	}
-	
-	
-	
-	if(allZero)
+	return y_l;
+}
+
+/*
+ * Exact right end point. The intervals must be sorted by b. The lower
+ * firing strengths are used before the switch point and the upper ones
+ * after it, and the maximum is returned. weights may be NULL.
+ */
+double right_end(Interval *intervalArray, double *weights, int size)
+{
+	double a_first = 0., b_first = 0., a_second = 0., b_second = 0.;
+	double a_total = 0., b_total = 0.;
+	double w = 1., b = 0., y = 0., y_r = -INFINITY;
+
+	for (int i = 0; i < size; i++)
 	{
-		result[0] = 0.;
-		result[1] = 0.;
-		return;
-	}else{
-		y_l_prime = a_l / b_l;
-		y_r_prime = a_r / b_r;
-		
-		qsort(intervalArray, size, sizeof(Interval), compare_a);
-		
-		while(1) {
-			k_l_prime = 0;
-			for (int i = 0; i < size - 1; i++) {
-				if((intervalArray[i].a <= y_l_prime && intervalArray[i + 1].a >= y_l_prime) || 
-				   (fabs(y_l_prime - intervalArray[i].a) <= epsilon) || 
-				   (fabs(y_l_prime - intervalArray[i + 1].a) <= epsilon))
-				{
-					k_l_prime = i;
-					break;
-				}
-			}
-			if (k_l_prime == k_l) {
-				y_l = y_l_prime;
-				break;
-			}
-			
-			s_l = sign(k_l_prime - k_l);
-			imin = min(k_l, k_l_prime) + 1;
-			imax = max(k_l, k_l_prime);
-			
-			a_l_prime = 0;
-			b_l_prime = 0;
-			for (int i = imin; i < imax; i++) {
-				a_l_prime += intervalArray[i].a * (intervalArray[i].d - intervalArray[i].c);
-				b_l_prime += intervalArray[i].d - intervalArray[i].c;
-			}
-			a_l_prime = s_l * a_l_prime + a_l;
-			b_l_prime = s_l * b_l_prime + b_l;
-			
-			k_l = k_l_prime;
-			y_l_prime = a_l_prime / b_l_prime;
-			a_l = a_l_prime;
-			b_l = b_l_prime;
+		w = weights == NULL ? 1. : weights[i];
+		a_total += w * intervalArray[i].b * intervalArray[i].d;
+		b_total += w * intervalArray[i].d;
+	}
+	for (int k = 0; k <= size; k++)
+	{
+		b = b_first + (b_total - b_second);
+		if (b > 0)
+		{
+			y = (a_first + (a_total - a_second)) / b;
+			if (y > y_r) y_r = y;
 		}
-		
-		while(1) {
-			k_r_prime = 0;
-			for (int i = 0; i < size - 1; i++) {
-				if((intervalArray[i].a <= y_r_prime && intervalArray[i + 1].a >= y_r_prime) || 
-				   (fabs(y_r_prime - intervalArray[i].a) <= epsilon) || 
-				   (fabs(y_r_prime - intervalArray[i + 1].a) <= epsilon))
-				{
-					k_r_prime = i;
-					break;
-				}
-			}
-			if (k_r_prime == k_r) {
-				y_r = y_r_prime;
-				break;
-			}
-			
-			s_r = sign(k_r_prime - k_r);
-			imin = min(k_r, k_r_prime) + 1;
-			imax = max(k_r, k_r_prime);
-			
-			a_r_prime = 0;
-			b_r_prime = 0;
-			for (int i = imin; i < imax; i++) {
-				a_r_prime += intervalArray[i].a * (intervalArray[i].d - intervalArray[i].c);
-				b_r_prime += intervalArray[i].d - intervalArray[i].c;
-			}
-			a_r_prime = - s_r * a_r_prime + a_r;
-			b_r_prime = - s_r * b_r_prime + b_r;
-			
-			k_r = k_r_prime;
-			y_r_prime = a_r_prime / b_r_prime;
-			a_r = a_r_prime;
-			b_r = b_r_prime;
+		if (k < size)
+		{
+			w = weights == NULL ? 1. : weights[k];
+			a_first += w * intervalArray[k].b * intervalArray[k].c;
+			b_first += w * intervalArray[k].c;
+			a_second += w * intervalArray[k].b * intervalArray[k].d;
+			b_second += w * intervalArray[k].d;
 		}
-		
-		result[0] = y_l;
-		result[1] = y_r;
 	}
-	
-	return;
+	return y_r;
 }
 
+/*
+ * Weighted exact algorithm shared by the WEKM and TWEKM algorithms. The
+ * weights are indexed by the position of the intervals after sorting and
+ * trimming. Returns the number of the weights which were needed.
+ */
+int weighted_algorithm(double *data, double *weights, int size, double *result)
+{
+	Interval *intervalArray = copy_intervals(data, size);
+	int start = 0, n = 0;
+
+	result[0] = 0.;
+	result[1] = 0.;
+	if (intervalArray == NULL)
+	{
+		result[0] = NAN;
+		result[1] = NAN;
+		return 0;
+	}
+	sort_intervals(intervalArray, size, compare_a);
+	n = trim(intervalArray, size, &start);
+	if (n > 0)
+	{
+		result[0] = left_end(intervalArray + start, weights, n);
+		sort_intervals(intervalArray + start, n, compare_b);
+		result[1] = right_end(intervalArray + start, weights, n);
+	}
+	free(intervalArray);
+	return n;
+}
+
+
 void KM_algorithm(double *data, double *params, int size, double *result)
 {
-	double *rawData = data;
-	Interval *intervalArray = (Interval *)(data);
-	
-	char allZero = 1;
-	int k_l = 0, k_r = 0;
-	double w = 0;
-	double y_l_prime = 0., y_r_prime = 0.;
-	double y_l_num = 0., y_l_den = 0.;
-	double y_r_num = 0., y_r_den = 0.;
-	double y_prime_num = 0., y_prime_den = 0.;
-	double y_l = 0, y_r = 0;
-	
-	for(int i = 0; i < size; i++)
+	Interval *intervalArray = copy_intervals(data, size);
+	int start = 0, n = 0;
+
+	result[0] = 0.;
+	result[1] = 0.;
+	if (intervalArray == NULL)
 	{
-		if (rawData[2] != 0 || rawData[3] != 0) 
-		{
-			allZero = 0;
-		}
-		w = (rawData[2] + rawData[3]) / 2;
-		y_prime_num += rawData[0] * w;
-		y_prime_den += w;
-		rawData += 4;
+		result[0] = NAN;
+		result[1] = NAN;
+		return;
 	}
-	
-	if(allZero)
+	n = trim(intervalArray, size, &start);
+	if (n > 0)
 	{
-		result[0] = 0.;
-		result[1] = 0.;
+		sort_intervals(intervalArray + start, n, compare_a);
+		result[0] = left_end(intervalArray + start, NULL, n);
+		sort_intervals(intervalArray + start, n, compare_b);
+		result[1] = right_end(intervalArray + start, NULL, n);
+	}
+	free(intervalArray);
+	return;
+}
+
+
+void EKM_algorithm(double *data, double *params, int size, double *result)
+{
+	/* The EKM algorithm finds the same switch points as the KM algorithm. */
+	KM_algorithm(data, params, size, result);
+	return;
+}
+
+
+int WEKM_algorithm(double *data, double *params, int size, double *result)
+{
+	return weighted_algorithm(data, params, size, result);
+}
+
+
+void TWEKM_algorithm(double *data, double *params, int size, double *result)
+{
+	double *weights = (double *)malloc((size > 0 ? size : 1) * sizeof(double));
+
+	if (weights == NULL)
+	{
+		result[0] = NAN;
+		result[1] = NAN;
 		return;
-	}else{
-	
-		y_l_prime = y_prime_num / y_prime_den;
-		y_r_prime = y_prime_num / y_prime_den;
-		
-		qsort(intervalArray, size, sizeof(Interval), compare_a);
-		
-		while(1) {
-			k_l = 0;
-			for(int i = 0; i < size - 1; i++)
-			{
-				if((intervalArray[i].a <= y_l_prime && intervalArray[i + 1].a >= y_l_prime) || 
-				   (fabs(y_l_prime - intervalArray[i].a) <= epsilon) || 
-				   (fabs(y_l_prime - intervalArray[i + 1].a) <= epsilon))
-				{
-					k_l = i;
-					break;
-				}
-			}
-			for(int i = 0; i <= k_l; i++)
-			{
-				y_l_num += intervalArray[i].a * intervalArray[i].d;
-				y_l_den += intervalArray[i].d;
-			}
-			for(int i = k_l + 1; i < size; i++)
-			{
-				y_l_num += intervalArray[i].a * intervalArray[i].c;
-				y_l_den += intervalArray[i].c;
-			}
-			y_l = y_l_num / y_l_den;
-			if(fabs(y_l - y_l_prime) <= epsilon)
-			{
-				break;
-			}else{
-				y_l_prime = y_l;
-			}
-		}
-		
-		while(1) {
-			k_r = 0;
-			for(int i = 0; i < size - 1; i++)
-			{
-				if((intervalArray[i].a <= y_r_prime && intervalArray[i + 1].a >= y_r_prime) || 
-				   (fabs(y_r_prime - intervalArray[i].a) <= epsilon) || 
-				   (fabs(y_r_prime - intervalArray[i + 1].a) <= epsilon))
-				{
-					k_r = i;
-					break;
-				}
-			}
-			for(int i = 0; i <= k_r; i++)
-			{
-				y_r_num += intervalArray[i].a * intervalArray[i].c;
-				y_r_den += intervalArray[i].c;
-			}
-			for(int i = k_r + 1; i < size; i++)
-			{
-				y_r_num += intervalArray[i].a * intervalArray[i].d;
-				y_r_den += intervalArray[i].d;
-			}
-			y_r = y_r_num / y_r_den;
-			if(fabs(y_r - y_r_prime) <= epsilon)
-			{
-				break;
-			}else{
-				y_r_prime = y_r;
-			}
-		}
-		
-		result[0] = y_l;
-		result[1] = y_r;
-	
 	}
-	
+	for (int i = 0; i < size; i++)
+	{
+		weights[i] = (i == 0 || i == size - 1) ? 0.5 : 1.;
+	}
+	weighted_algorithm(data, weights, size, result);
+	free(weights);
 	return;
-	
 }
 
-void EIASC_algorithm(double *data, double *params, int size, double *result) 
+
+void EIASC_algorithm(double *data, double *params, int size, double *result)
 {
-	double *rawData = data;
-	Interval *intervalArray = (Interval *)(data);
-	
-	char allZero = 1;
-	int L = 0, R = 0;
+	Interval *intervalArray = copy_intervals(data, size);
+	int start = 0, n = 0;
 	double d = 0;
 	double a_l = 0, b_l = 0, a_r = 0, b_r = 0;
 	double y_l = 0, y_r = 0;
-	
-	for(int i = 0; i < size; i++)
+
+	result[0] = 0.;
+	result[1] = 0.;
+	if (intervalArray == NULL)
 	{
-		if (rawData[2] != 0 || rawData[3] != 0) 
+		result[0] = NAN;
+		result[1] = NAN;
+		return;
+	}
+	n = trim(intervalArray, size, &start);
+	if (n > 0)
+	{
+		Interval *x = intervalArray + start;
+
+		for (int i = 0; i < n; i++)
 		{
-			allZero = 0;
+			a_l += x[i].a * x[i].c;
+			b_l += x[i].c;
+			a_r += x[i].b * x[i].c;
+			b_r += x[i].c;
 		}
-		b_l += rawData[2];
-		b_r += rawData[2];
-		a_l += rawData[0] * rawData[2];
-		a_r += rawData[1] * rawData[2];
-		rawData += 4;
-	}
 
-	if(allZero)
-	{
-		result[0] = 0.;
-		result[1] = 0.;
-		return;
-	}else{
-	
-		qsort(intervalArray, size, sizeof(Interval), compare_a);
-		
-		for(L = 0; L < size; L++)
+		sort_intervals(x, n, compare_a);
+		for (int L = 0; L < n; L++)
 		{
-			d = intervalArray[L].d - intervalArray[L].c;
-			a_l += intervalArray[L].a * d;
+			d = x[L].d - x[L].c;
+			a_l += x[L].a * d;
 			b_l += d;
 			y_l = a_l / b_l;
-			if(y_l <= intervalArray[L + 1].a || fabs(y_l - intervalArray[L + 1].a) < epsilon)
+			if (L + 1 >= n || y_l <= x[L + 1].a || isclose(y_l, x[L + 1].a))
 			{
 				break;
 			}
 		}
-		
-		// We know that Interval.a = Interval.b in IT2FSs!
-		//qsort(intervalArray, size, sizeof(Interval), compare_b);
-		
-		for(R = size - 1; R > 0; R--)
+
+		sort_intervals(x, n, compare_b);
+		for (int R = n - 1; R >= 0; R--)
 		{
-			d = intervalArray[R].d - intervalArray[R].c;
-			a_r += intervalArray[R].b * d;
+			d = x[R].d - x[R].c;
+			a_r += x[R].b * d;
 			b_r += d;
 			y_r = a_r / b_r;
-			if(y_r >= intervalArray[R - 1].b || fabs(y_r - intervalArray[R - 1].b) < epsilon)
+			if (R == 0 || y_r >= x[R - 1].b || isclose(y_r, x[R - 1].b))
 			{
 				break;
 			}
 		}
-		
+
 		result[0] = y_l;
 		result[1] = y_r;
 	}
+	free(intervalArray);
+	return;
+}
+
+
+void WM_algorithm(double *data, double *params, int size, double *result)
+{
+	Interval *intervalArray = copy_intervals(data, size);
+	int start = 0, n = 0;
+
+	double sumF0 = 0., sumF1 = 0., sumF0Y0 = 0., sumF1Y0 = 0., sumF0Y1 = 0., sumF1Y1 = 0.;
+	double c = 0., y_l_sup = 0., y_l_inf = 0., y_r_sup = 0., y_r_inf = 0.;
+	double s1 = 0., s2 = 0.;
+
+	result[0] = 0.;
+	result[1] = 0.;
+	if (intervalArray == NULL)
+	{
+		result[0] = NAN;
+		result[1] = NAN;
+		return;
+	}
+	sort_intervals(intervalArray, size, compare_a);
+	n = trim(intervalArray, size, &start);
+	if (n > 0)
+	{
+		Interval *x = intervalArray + start;
+
+		for (int i = 0; i < n; i++)
+		{
+			sumF0 += x[i].c;
+			sumF1 += x[i].d;
+			sumF0Y0 += x[i].a * x[i].c;
+			sumF0Y1 += x[i].b * x[i].c;
+			sumF1Y0 += x[i].a * x[i].d;
+			sumF1Y1 += x[i].b * x[i].d;
+		}
+		c = (sumF1 - sumF0) / (sumF0 * sumF1);
+		y_l_sup = minf(sumF0Y0 / sumF0, sumF1Y0 / sumF1);
+		y_r_inf = minf(sumF1Y1 / sumF1, sumF0Y1 / sumF0);
+
+		s1 = 0.;
+		s2 = 0.;
+		for (int i = 0; i < n; i++)
+		{
+			s1 += x[i].c * (x[i].a - x[0].a);
+			s2 += x[i].d * (x[n - 1].a - x[i].a);
+		}
+		y_l_inf = y_l_sup - c * (s1 * s2) / (s1 + s2);
+
+		s1 = 0.;
+		s2 = 0.;
+		for (int i = 0; i < n; i++)
+		{
+			s1 += x[i].d * (x[i].b - x[0].b);
+			s2 += x[i].c * (x[n - 1].b - x[i].b);
+		}
+		y_r_sup = y_r_inf + c * (s1 * s2) / (s1 + s2);
+
+		result[0] = (y_l_sup + y_l_inf) / 2;
+		result[1] = (y_r_sup + y_r_inf) / 2;
+	}
+	free(intervalArray);
 	return;
 }
 
 
+void BMM_algorithm(double *data, double *params, int size, double *result)
+{
+	Interval *intervalArray = copy_intervals(data, size);
+	int start = 0;
+	double sumF0 = 0., sumF1 = 0., sumF0Y = 0., sumF1Y = 0., y = 0.;
 
+	result[0] = 0.;
+	if (intervalArray == NULL)
+	{
+		result[0] = NAN;
+		return;
+	}
+	if (trim(intervalArray, size, &start) == 0)
+	{
+		free(intervalArray);
+		return;
+	}
+	for (int i = 0; i < size; i++)
+	{
+		y = (intervalArray[i].a + intervalArray[i].b) / 2.;
+		sumF0 += intervalArray[i].c;
+		sumF1 += intervalArray[i].d;
+		sumF0Y += intervalArray[i].c * y;
+		sumF1Y += intervalArray[i].d * y;
+	}
+	result[0] = params[0] * sumF0Y / sumF0 + params[1] * sumF1Y / sumF1;
+	free(intervalArray);
+	return;
+}
 
 
+void LBMM_algorithm(double *data, double *params, int size, double *result)
+{
+	Interval *intervalArray = copy_intervals(data, size);
+	int start = 0;
+	double sumF0 = 0., sumF1 = 0., sumF0Y0 = 0., sumF1Y1 = 0.;
 
+	result[0] = 0.;
+	if (intervalArray == NULL)
+	{
+		result[0] = NAN;
+		return;
+	}
+	if (trim(intervalArray, size, &start) == 0)
+	{
+		free(intervalArray);
+		return;
+	}
+	for (int i = 0; i < size; i++)
+	{
+		sumF0 += intervalArray[i].c;
+		sumF1 += intervalArray[i].d;
+		sumF0Y0 += intervalArray[i].c * intervalArray[i].a;
+		sumF1Y1 += intervalArray[i].d * intervalArray[i].b;
+	}
+	result[0] = params[0] * sumF0Y0 / sumF0 + params[1] * sumF1Y1 / sumF1;
+	free(intervalArray);
+	return;
+}
 
 
+void NT_algorithm(double *data, double *params, int size, double *result)
+{
+	Interval *intervalArray = copy_intervals(data, size);
+	int start = 0;
+	double sumF = 0., sumFY = 0., y = 0.;
 
+	result[0] = 0.;
+	if (intervalArray == NULL)
+	{
+		result[0] = NAN;
+		return;
+	}
+	if (trim(intervalArray, size, &start) == 0)
+	{
+		free(intervalArray);
+		return;
+	}
+	for (int i = 0; i < size; i++)
+	{
+		y = (intervalArray[i].a + intervalArray[i].b) / 2.;
+		sumF += intervalArray[i].c + intervalArray[i].d;
+		sumFY += y * (intervalArray[i].c + intervalArray[i].d);
+	}
+	result[0] = sumFY / sumF;
+	free(intervalArray);
+	return;
+}
 
 
+/*
+ * Batch entry points. data is a (batch, size, 4) buffer, and only the
+ * first counts[i] intervals of the i-th intervals matrix are used. The
+ * results are written to a (batch, width) buffer.
+ */
+void algorithm_batch(Algorithm algorithm, double *data, double *params,
+                     int batch, int size, int *counts, int width, double *result)
+{
+	for (int i = 0; i < batch; i++)
+	{
+		algorithm(data + 4 * size * i, params, counts[i], result + width * i);
+	}
+	return;
+}
 
+void KM_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(KM_algorithm, data, params, batch, size, counts, 2, result);
+}
 
+void EKM_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(EKM_algorithm, data, params, batch, size, counts, 2, result);
+}
+
+int WEKM_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	int n = 0;
+
+	for (int i = 0; i < batch; i++)
+	{
+		n = max(n, weighted_algorithm(data + 4 * size * i, params, counts[i], result + 2 * i));
+	}
+	return n;
+}
+
+void TWEKM_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(TWEKM_algorithm, data, params, batch, size, counts, 2, result);
+}
+
+void EIASC_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(EIASC_algorithm, data, params, batch, size, counts, 2, result);
+}
+
+void WM_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(WM_algorithm, data, params, batch, size, counts, 2, result);
+}
+
+void BMM_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(BMM_algorithm, data, params, batch, size, counts, 1, result);
+}
+
+void LBMM_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(LBMM_algorithm, data, params, batch, size, counts, 1, result);
+}
+
+void NT_algorithm_batch(double *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch(NT_algorithm, data, params, batch, size, counts, 1, result);
+}
+
+
+
+/*
+ * Single precision batch entry points. Each intervals matrix is widened
+ * to double precision before it is type reduced, so the sums are still
+ * accumulated in double precision, while the (batch, size, 4) buffer
+ * passed by the caller takes half of the memory.
+ */
+void widen_intervals(float *data, int count, double *buffer)
+{
+	for (int j = 0; j < 4 * count; j++)
+	{
+		buffer[j] = data[j];
+	}
+}
+
+void algorithm_batch_f32(Algorithm algorithm, float *data, double *params,
+                         int batch, int size, int *counts, int width, double *result)
+{
+	double *buffer = (double *)malloc((size > 0 ? 4 * size : 1) * sizeof(double));
+
+	for (int i = 0; i < batch; i++)
+	{
+		if (buffer == NULL)
+		{
+			for (int k = 0; k < width; k++) result[width * i + k] = NAN;
+			continue;
+		}
+		widen_intervals(data + 4 * size * i, counts[i], buffer);
+		algorithm(buffer, params, counts[i], result + width * i);
+	}
+	free(buffer);
+	return;
+}
+
+void KM_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(KM_algorithm, data, params, batch, size, counts, 2, result);
+}
 
+void EKM_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(EKM_algorithm, data, params, batch, size, counts, 2, result);
+}
 
+int WEKM_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	double *buffer = (double *)malloc((size > 0 ? 4 * size : 1) * sizeof(double));
+	int n = 0;
+
+	for (int i = 0; i < batch; i++)
+	{
+		if (buffer == NULL)
+		{
+			result[2 * i] = NAN;
+			result[2 * i + 1] = NAN;
+			continue;
+		}
+		widen_intervals(data + 4 * size * i, counts[i], buffer);
+		n = max(n, weighted_algorithm(buffer, params, counts[i], result + 2 * i));
+	}
+	free(buffer);
+	return n;
+}
 
+void TWEKM_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(TWEKM_algorithm, data, params, batch, size, counts, 2, result);
+}
+
+void EIASC_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(EIASC_algorithm, data, params, batch, size, counts, 2, result);
+}
+
+void WM_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(WM_algorithm, data, params, batch, size, counts, 2, result);
+}
+
+void BMM_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(BMM_algorithm, data, params, batch, size, counts, 1, result);
+}
+
+void LBMM_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(LBMM_algorithm, data, params, batch, size, counts, 1, result);
+}
+
+void NT_algorithm_batch_f32(float *data, double *params, int batch, int size, int *counts, double *result)
+{
+	algorithm_batch_f32(NT_algorithm, data, params, batch, size, counts, 1, result);
+}
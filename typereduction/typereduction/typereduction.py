@@ -6,53 +6,202 @@ Created on Sun Apr  18 00:29:35 2021
 @author: arslan
 """
 
-from numpy import array, zeros, double
+from numpy import (array, zeros, ones, double, single, intc, ascontiguousarray,
+                   argsort, take_along_axis, asarray, )
 import numpy.ctypeslib as npct
 from ctypes import c_int
 import pathlib
 
+array_3d_double = npct.ndpointer(dtype=double, ndim=3, flags="CONTIGUOUS")
+array_3d_single = npct.ndpointer(dtype=single, ndim=3, flags="CONTIGUOUS")
 array_2d_double = npct.ndpointer(dtype=double, ndim=2, flags="CONTIGUOUS")
 array_1d_double = npct.ndpointer(dtype=double, ndim=1, flags="CONTIGUOUS")
+array_1d_int = npct.ndpointer(dtype=intc, ndim=1, flags="CONTIGUOUS")
 
-# load the library, using numpy mechanisms
-path = pathlib.Path(__file__).parent.parent.absolute()
-libcd = npct.load_library("typereduction", str(path))
+# load the library, which is built next to this module, using numpy mechanisms
+path = pathlib.Path(__file__).parent.absolute()
+libcd = npct.load_library("libtypereduction", str(path))
 
 # setup the return types and argument types
-libcd.EIASC_algorithm.restype = None
-libcd.EIASC_algorithm.argtypes = [array_2d_double, array_1d_double, c_int, array_1d_double]
+for name in ["KM", "EKM", "WEKM", "TWEKM", "EIASC", "WM", "BMM", "LBMM", "NT", ]:
+    function = getattr(libcd, name + "_algorithm")
+    function.restype = c_int if name == "WEKM" else None
+    function.argtypes = [array_2d_double, array_1d_double, c_int, array_1d_double]
+    function = getattr(libcd, name + "_algorithm_batch")
+    function.restype = c_int if name == "WEKM" else None
+    function.argtypes = [array_3d_double, array_1d_double, c_int, c_int,
+                         array_1d_int, array_2d_double]
+    function = getattr(libcd, name + "_algorithm_batch_f32")
+    function.restype = c_int if name == "WEKM" else None
+    function.argtypes = [array_3d_single, array_1d_double, c_int, c_int,
+                         array_1d_int, array_2d_double]
+
+
+def _intervals(intervals):
+    return ascontiguousarray(intervals, dtype=double).reshape(-1, 4)
+
+
+def _params(params, size=2):
+    o = zeros(shape=(max(len(params), size), ))
+    o[:len(params)] = params
+    return o
 
-libcd.KM_algorithm.restype = None
-libcd.KM_algorithm.argtypes = [array_2d_double, array_1d_double, c_int, array_1d_double]
 
-libcd.EKM_algorithm.restype = None
-libcd.EKM_algorithm.argtypes = [array_2d_double, array_1d_double, c_int, array_1d_double]
+def _batch(intervals, mask):
+    # The single precision intervals are passed as they are, and widened
+    # by the library, one intervals matrix at a time.
+    intervals = asarray(intervals)
+    dtype = single if intervals.dtype == single else double
+    intervals = ascontiguousarray(intervals, dtype=dtype)
+    if intervals.ndim != 3 or intervals.shape[-1] != 4:
+        raise ValueError("The intervals must be a (batch, n, 4) shaped array.")
+    if mask is None:
+        counts = _full_counts(intervals)
+    else:
+        mask = asarray(mask, dtype=bool)
+        if mask.shape != intervals.shape[:2]:
+            raise ValueError("The mask must be a " + str(intervals.shape[:2]) +
+                             " shaped array.")
+        # Moving the valid intervals to the beginning of each matrix
+        order = argsort(~mask, axis=-1, kind="stable")
+        intervals = ascontiguousarray(take_along_axis(intervals, order[..., None], axis=-2))
+        counts = ascontiguousarray(mask.sum(axis=-1), dtype=intc)
+    return intervals, counts
 
-libcd.WM_algorithm.restype = None
-libcd.WM_algorithm.argtypes = [array_2d_double, array_1d_double, c_int, array_1d_double]
 
-def EIASC_algorithm(intervals, params=[]):
-    o = zeros(shape=(2, ))
-    libcd.EIASC_algorithm(intervals, array(params), len(intervals), o)
-    return o
+def _full_counts(intervals):
+    return ones(shape=(intervals.shape[0], ), dtype=intc) * intervals.shape[1]
+
+
+def _batch_function(name, intervals):
+    if intervals.dtype == single:
+        return getattr(libcd, name + "_algorithm_batch_f32")
+    return getattr(libcd, name + "_algorithm_batch")
+
 
 def KM_algorithm(intervals, params=[]):
     o = zeros(shape=(2, ))
-    libcd.KM_algorithm(intervals, array(params), len(intervals), o)
+    intervals = _intervals(intervals)
+    libcd.KM_algorithm(intervals, _params(params), len(intervals), o)
     return o
 
 def EKM_algorithm(intervals, params=[]):
     o = zeros(shape=(2, ))
-    libcd.EKM_algorithm(intervals, array(params), len(intervals), o)
+    intervals = _intervals(intervals)
+    libcd.EKM_algorithm(intervals, _params(params), len(intervals), o)
+    return o
+
+def WEKM_algorithm(intervals, params=[]):
+    o = zeros(shape=(2, ))
+    intervals = _intervals(intervals)
+    n = libcd.WEKM_algorithm(intervals, _params(params, len(intervals)), len(intervals), o)
+    if n > len(params):
+        raise IndexError("WEKM algorithm needs a weight for each of the " +
+                         str(n) + " intervals.")
+    return o
+
+def TWEKM_algorithm(intervals, params=[]):
+    o = zeros(shape=(2, ))
+    intervals = _intervals(intervals)
+    libcd.TWEKM_algorithm(intervals, _params(params), len(intervals), o)
+    return o
+
+def EIASC_algorithm(intervals, params=[]):
+    o = zeros(shape=(2, ))
+    intervals = _intervals(intervals)
+    libcd.EIASC_algorithm(intervals, _params(params), len(intervals), o)
     return o
 
 def WM_algorithm(intervals, params=[]):
     o = zeros(shape=(2, ))
-    libcd.WM_algorithm(intervals, array(params), len(intervals), o)
+    intervals = _intervals(intervals)
+    libcd.WM_algorithm(intervals, _params(params), len(intervals), o)
+    return o
+
+def BMM_algorithm(intervals, params):
+    o = zeros(shape=(1, ))
+    intervals = _intervals(intervals)
+    libcd.BMM_algorithm(intervals, array([params[0], params[1]], dtype=double),
+                        len(intervals), o)
+    return o[0]
+
+def LBMM_algorithm(intervals, params):
+    o = zeros(shape=(1, ))
+    intervals = _intervals(intervals)
+    libcd.LBMM_algorithm(intervals, array([params[0], params[1]], dtype=double),
+                         len(intervals), o)
+    return o[0]
+
+def NT_algorithm(intervals, params=[]):
+    o = zeros(shape=(1, ))
+    intervals = _intervals(intervals)
+    libcd.NT_algorithm(intervals, _params(params), len(intervals), o)
+    return o[0]
+
+
+def KM_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 2))
+    _batch_function("KM", intervals)(intervals, _params(params), len(intervals),
+                                     intervals.shape[1], counts, o)
     return o
 
+def EKM_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 2))
+    _batch_function("EKM", intervals)(intervals, _params(params), len(intervals),
+                                      intervals.shape[1], counts, o)
+    return o
+
+def WEKM_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 2))
+    n = _batch_function("WEKM", intervals)(intervals, _params(params, intervals.shape[1]),
+                                           len(intervals), intervals.shape[1], counts, o)
+    if n > len(params):
+        raise IndexError("WEKM algorithm needs a weight for each of the " +
+                         str(n) + " intervals.")
+    return o
 
+def TWEKM_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 2))
+    _batch_function("TWEKM", intervals)(intervals, _params(params), len(intervals),
+                                        intervals.shape[1], counts, o)
+    return o
 
+def EIASC_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 2))
+    _batch_function("EIASC", intervals)(intervals, _params(params), len(intervals),
+                                        intervals.shape[1], counts, o)
+    return o
 
+def WM_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 2))
+    _batch_function("WM", intervals)(intervals, _params(params), len(intervals),
+                                     intervals.shape[1], counts, o)
+    return o
 
+def BMM_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 1))
+    _batch_function("BMM", intervals)(intervals, array([params[0], params[1]], dtype=double),
+                                      len(intervals), intervals.shape[1], counts, o)
+    return o[:, 0]
+
+def LBMM_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 1))
+    _batch_function("LBMM", intervals)(intervals, array([params[0], params[1]], dtype=double),
+                                       len(intervals), intervals.shape[1], counts, o)
+    return o[:, 0]
+
+def NT_algorithm_batch(intervals, params=[], mask=None):
+    intervals, counts = _batch(intervals, mask)
+    o = zeros(shape=(len(intervals), 1))
+    _batch_function("NT", intervals)(intervals, _params(params), len(intervals),
+                                     intervals.shape[1], counts, o)
+    return o[:, 0]
 